@@ -0,0 +1,6 @@
+"""
+Offline benchmarks for Memori's retrieval and ingestion paths
+
+Not part of the installed package. Run from the repository root with
+``python -m benchmarks.run``; see ``benchmarks/README.md``.
+"""
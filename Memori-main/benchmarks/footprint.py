@@ -0,0 +1,262 @@
+"""
+Allocation and RSS footprint of the read-path records
+
+    python -m benchmarks.footprint --candidates 1k,10k,50k
+
+For each candidate count it compares the representation a read path used
+before ("before") with the slotted record it uses now ("after"):
+
+    ranking  N search rows ranked down to the top ``--limit``: every row copied
+             into a dict and sorted, vs driver rows scored as SearchCandidates
+             with only the top-k copied into dicts
+    dedup    N recent memories checked for a duplicate: validated
+             ProcessedLongTermMemory models vs DedupCandidates
+
+Every variant runs in a fresh process on the same synthetic rows (selected
+from an in-memory SQLite table), so its peak RSS is its own. Reported:
+peak Python allocations while the operation runs (tracemalloc), what it
+still holds afterwards, and the wall time and peak RSS growth of a first,
+untraced run.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+
+from .synthetic import CorpusConfig, SyntheticCorpus, format_size, parse_size
+
+VARIANTS = {
+    "ranking": ("before", "after"),
+    "dedup": ("before", "after"),
+}
+
+COLUMNS = (
+    "memory_id TEXT, memory_type TEXT, category_primary TEXT, "
+    "searchable_content TEXT, importance_score REAL, created_at TEXT, "
+    "summary TEXT, search_score REAL, search_strategy TEXT"
+)
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _seed_table(conn, size: int):
+    """``size`` FTS-shaped result rows built from synthetic memories"""
+    from sqlalchemy import text
+
+    corpus = SyntheticCorpus(CorpusConfig(size=size))
+    rng = random.Random(7)
+    now = datetime.now()
+    conn.execute(text(f"CREATE TABLE candidates ({COLUMNS})"))
+    insert = text(
+        "INSERT INTO candidates VALUES (:memory_id, :memory_type, "
+        ":category_primary, :searchable_content, :importance_score, "
+        ":created_at, :summary, :search_score, :search_strategy)"
+    )
+    rows = []
+    for n in range(size):
+        memory = corpus.memory(rng)
+        rows.append(
+            {
+                "memory_id": f"mem_{n:08d}",
+                "memory_type": "long_term",
+                "category_primary": memory.classification.value,
+                # Stored rows carry the whole turn, not just the statement
+                "searchable_content": " ".join([memory.content] * 4),
+                "importance_score": rng.random(),
+                "created_at": (now - timedelta(days=rng.randrange(60))).isoformat(),
+                "summary": memory.summary,
+                "search_score": rng.random(),
+                "search_strategy": "sqlite_fts5",
+            }
+        )
+        # Small batches keep seeding from setting the process's RSS peak
+        if len(rows) == 500:
+            conn.execute(insert, rows)
+            rows = []
+    if rows:
+        conn.execute(insert, rows)
+
+
+def _legacy_rank(service, results: list[dict], limit: int) -> list[dict]:
+    """SearchService._rank_and_limit_results as it was before SearchCandidate"""
+    for result in results:
+        recency_score = service._calculate_recency_score(result.get("created_at"))
+        result["composite_score"] = (
+            result.get("search_score", 0.4) * 0.5
+            + result.get("importance_score", 0.5) * 0.3
+            + recency_score * 0.2
+        )
+    results.sort(key=lambda x: x.get("composite_score", 0), reverse=True)
+    return results[:limit]
+
+
+def _ranking(conn, variant: str, limit: int):
+    from sqlalchemy import text
+
+    from memori.database.search_service import SearchService
+
+    service = SearchService(session=None, database_type="sqlite")
+    result = conn.execute(text("SELECT * FROM candidates"))
+    if variant == "before":
+        return _legacy_rank(service, [dict(row._mapping) for row in result], limit)
+    return service._rank_and_limit_results(result.all(), limit)
+
+
+def _dedup(conn, variant: str, limit: int):
+    from sqlalchemy import text
+
+    from memori.agents.memory_agent import MemoryAgent
+    from memori.database.search_records import DedupCandidate
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    result = conn.execute(
+        text(
+            "SELECT memory_id, summary, searchable_content, category_primary, "
+            "created_at FROM candidates"
+        )
+    )
+    if variant == "before":
+        candidates = [
+            ProcessedLongTermMemory(
+                session_id=row[0],
+                summary=row[1] or "",
+                content=row[2] or "",
+                classification=row[3] or "conversational",
+                importance="medium",
+                promotion_eligible=False,
+                classification_reason="Existing memory loaded for deduplication check",
+            )
+            for row in result
+        ]
+    else:
+        candidates = [
+            DedupCandidate(row[0], row[1] or "", row[2] or "", row[3], row[4])
+            for row in result
+        ]
+
+    new_memory = ProcessedLongTermMemory(
+        content="User collects vintage mechanical keyboards",
+        summary="Collects vintage mechanical keyboards",
+        classification="essential",
+        importance="medium",
+        session_id="bench",
+        classification_reason="footprint benchmark",
+    )
+    # detect_duplicates only needs the similarity helper, not an LLM client
+    agent = MemoryAgent.__new__(MemoryAgent)
+    asyncio.run(agent.detect_duplicates(new_memory, candidates))
+    return candidates
+
+
+OPERATIONS = {"ranking": _ranking, "dedup": _dedup}
+
+
+def measure(scenario: str, variant: str, size: int, limit: int) -> dict:
+    """Run one variant; called in a fresh worker process"""
+    from loguru import logger
+    from sqlalchemy import create_engine
+
+    logger.remove()
+    operation = OPERATIONS[scenario]
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        _seed_table(conn, size)
+
+        rss_before = _peak_rss_kb()
+        started = time.perf_counter()
+        kept = operation(conn, variant, limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        rss_after = _peak_rss_kb()
+        del kept
+
+        tracemalloc.start()
+        kept = operation(conn, variant, limit)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+
+    return {
+        "scenario": scenario,
+        "variant": variant,
+        "size": size,
+        "time_ms": elapsed_ms,
+        "peak_kb": peak / 1024,
+        "retained_kb": retained / 1024,
+        "rss_growth_kb": (
+            rss_after - rss_before if rss_before is not None else float("nan")
+        ),
+    }
+
+
+def format_results(results: list[dict]) -> str:
+    header = (
+        f"{'scenario':<10}{'variant':<8}{'size':>6}{'time ms':>10}"
+        f"{'peak KiB':>11}{'held KiB':>11}{'RSS +KiB':>10}{'peak Δ':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    before = {}
+    for r in results:
+        key = (r["scenario"], r["size"])
+        change = ""
+        if r["variant"] == "before":
+            before[key] = r["peak_kb"]
+        elif key in before and before[key]:
+            change = f"{r['peak_kb'] / before[key] - 1:+.0%}"
+        lines.append(
+            f"{r['scenario']:<10}{r['variant']:<8}{format_size(r['size']):>6}"
+            f"{r['time_ms']:>10.1f}{r['peak_kb']:>11.0f}{r['retained_kb']:>11.0f}"
+            f"{r['rss_growth_kb']:>10.0f}{change:>9}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", default="1k,10k", help="e.g. 1k,10k,50k")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(VARIANTS),
+        help=f"Comma-separated subset of: {', '.join(VARIANTS)}",
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Top-k kept by ranking")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in VARIANTS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = []
+    for size in (parse_size(s) for s in args.candidates.split(",")):
+        for scenario in scenarios:
+            for variant in VARIANTS[scenario]:
+                # One process per variant keeps peak RSS independent
+                with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                    results.append(
+                        pool.submit(
+                            measure, scenario, variant, size, args.limit
+                        ).result()
+                    )
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
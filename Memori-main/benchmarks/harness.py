@@ -0,0 +1,164 @@
+"""
+Timing loop and baseline comparison for benchmark scenarios
+"""
+
+import gc
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from memori.utils.metrics import Histogram
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency distribution (milliseconds) and throughput of one scenario"""
+
+    scenario: str
+    size: str
+    ops: int
+    ops_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    errors: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}@{self.size}"
+
+
+def run_benchmark(
+    scenario: str,
+    size: str,
+    operation: Callable[[int], Any],
+    ops: int,
+    warmup: int = 5,
+    on_start: Callable[[], Any] | None = None,
+) -> BenchmarkResult:
+    """
+    Call ``operation(i)`` ``ops`` times after ``warmup`` untimed calls
+
+    ``on_start`` runs between warmup and the timed loop, e.g. to reset
+    counters. Exceptions are counted, not raised, so one bad input doesn't hide the
+    rest of the run; a scenario with errors is flagged in the report.
+    """
+    for i in range(warmup):
+        operation(i)
+
+    histogram = Histogram(window=ops)
+    errors = 0
+    if on_start is not None:
+        on_start()
+    gc.collect()
+    started = time.perf_counter()
+    for i in range(warmup, warmup + ops):
+        op_started = time.perf_counter()
+        try:
+            operation(i)
+        except Exception:
+            errors += 1
+        histogram.observe(time.perf_counter() - op_started)
+    elapsed = time.perf_counter() - started
+
+    stats = histogram.snapshot()
+    return BenchmarkResult(
+        scenario=scenario,
+        size=size,
+        ops=ops,
+        ops_per_sec=round(ops / elapsed, 2) if elapsed else 0.0,
+        mean_ms=round(stats["sum"] / ops * 1000, 3),
+        p50_ms=round(stats["p50"] * 1000, 3),
+        p95_ms=round(stats["p95"] * 1000, 3),
+        p99_ms=round(stats["p99"] * 1000, 3),
+        max_ms=round(stats["max"] * 1000, 3),
+        errors=errors,
+    )
+
+
+def save_baseline(path: str | Path, results: list[BenchmarkResult], meta: dict):
+    payload = {"meta": meta, "results": [asdict(r) for r in results]}
+    Path(path).write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+def load_baseline(path: str | Path) -> dict[str, dict[str, Any]]:
+    payload = json.loads(Path(path).read_text())
+    return {f"{r['scenario']}@{r['size']}": r for r in payload["results"]}
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[dict[str, Any]]:
+    """
+    Per-scenario change against a baseline
+
+    A scenario regresses when its p50 or p95 latency grows, or its ops/s
+    drops, by more than ``threshold`` (a fraction, 0.15 = 15%).
+    """
+    rows = []
+    for result in results:
+        base = baseline.get(result.key)
+        if base is None:
+            rows.append({"key": result.key, "status": "new"})
+            continue
+        changes = {
+            "p50_ms": _change(base["p50_ms"], result.p50_ms),
+            "p95_ms": _change(base["p95_ms"], result.p95_ms),
+            "ops_per_sec": _change(base["ops_per_sec"], result.ops_per_sec),
+        }
+        regressed = (
+            changes["p50_ms"] > threshold
+            or changes["p95_ms"] > threshold
+            or changes["ops_per_sec"] < -threshold
+        )
+        rows.append(
+            {
+                "key": result.key,
+                "status": "regressed" if regressed else "ok",
+                **changes,
+            }
+        )
+    return rows
+
+
+def _change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before
+
+
+def format_table(
+    results: list[BenchmarkResult], comparison: list[dict[str, Any]] | None = None
+) -> str:
+    by_key = {row["key"]: row for row in comparison or []}
+    header = (
+        f"{'scenario':<26}{'size':>6}{'ops/s':>11}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    )
+    if comparison is not None:
+        header += f"{'Δp50':>9}{'Δops/s':>9}  status"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        line = (
+            f"{r.scenario:<26}{r.size:>6}{r.ops_per_sec:>11.1f}{r.p50_ms:>10.2f}"
+            f"{r.p95_ms:>10.2f}{r.p99_ms:>10.2f}{r.errors:>8}"
+        )
+        row = by_key.get(r.key)
+        if row is not None:
+            if row["status"] == "new":
+                line += f"{'':>18}  new"
+            else:
+                line += (
+                    f"{row['p50_ms']:>+9.1%}{row['ops_per_sec']:>+9.1%}"
+                    f"  {row['status']}"
+                )
+        lines.append(line)
+    return "\n".join(lines)
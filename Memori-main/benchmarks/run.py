@@ -0,0 +1,348 @@
+"""
+Run the offline benchmark suite
+
+    python -m benchmarks.run --sizes 1k,10k --ops 200
+    python -m benchmarks.run --sizes 10k --save-baseline baseline.json
+    python -m benchmarks.run --sizes 10k --baseline baseline.json --fail-on-regression
+
+Seeded SQLite databases are cached under ``--data-dir`` per corpus shape and
+copied to a scratch file for each run, so write scenarios never leak into the
+next run and large corpora (100k, 1m) are generated once.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from loguru import logger
+from sqlalchemy import delete, text
+
+from memori import Memori
+from memori.database.models import (
+    Base,
+    ChatHistory,
+    LongTermMemory,
+    MemoryEntity,
+    ShortTermMemory,
+)
+from memori.database.query_plans import capture_query_plans
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.llm_cache import configure_llm_cache
+from memori.utils.metrics import export_metrics_json, reset_metrics
+from memori.utils.rate_limiter import configure_rate_limits
+
+from .harness import (
+    compare,
+    format_table,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from .scenarios import SCENARIOS, WRITE_SCENARIOS, BenchContext
+from .stub_llm import install_stub_llm
+from .synthetic import (
+    PRIMARY_USER,
+    CorpusConfig,
+    SyntheticCorpus,
+    format_size,
+    parse_size,
+)
+
+DEFAULT_DATA_DIR = Path.home() / ".cache" / "memori" / "benchmarks"
+
+
+def seed(database_connect: str, corpus: SyntheticCorpus):
+    """Bulk-insert the corpus, bypassing the per-memory store path"""
+    manager = SQLAlchemyDatabaseManager(database_connect, schema_init=True)
+    manager.initialize_schema()
+    try:
+        with manager.SessionLocal() as session:
+            for batch in corpus.rows():
+                for table, rows in batch.items():
+                    if rows:
+                        session.execute(Base.metadata.tables[table].insert(), rows)
+                session.commit()
+            if manager.database_type == "sqlite":
+                session.execute(text("ANALYZE"))
+                session.commit()
+    finally:
+        manager.close()
+
+
+def clear(database_connect: str):
+    """Remove benchmark users' rows from an external database"""
+    manager = SQLAlchemyDatabaseManager(database_connect, schema_init=True)
+    manager.initialize_schema()
+    try:
+        with manager.SessionLocal() as session:
+            for model in (MemoryEntity, ShortTermMemory, LongTermMemory, ChatHistory):
+                session.execute(
+                    delete(model).where(model.user_id.like(f"{PRIMARY_USER}%"))
+                )
+            session.commit()
+    finally:
+        manager.close()
+
+
+def prepare_database(args, config: CorpusConfig, corpus: SyntheticCorpus) -> str:
+    """Connection string of a freshly seeded database for one corpus size"""
+    if args.database_url:
+        clear(args.database_url)
+        seed(args.database_url, corpus)
+        return args.database_url
+
+    data_dir = Path(args.data_dir).expanduser()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    template = data_dir / f"corpus_{config.cache_key}.db"
+    if not template.exists() or args.reseed:
+        partial = template.with_suffix(".partial")
+        partial.unlink(missing_ok=True)
+        started = time.perf_counter()
+        print(f"Seeding {config.size:,} memories into {template} ...", flush=True)
+        seed(f"sqlite:///{partial}", corpus)
+        partial.replace(template)
+        print(f"  seeded in {time.perf_counter() - started:.1f}s", flush=True)
+
+    work = data_dir / f"work_{format_size(config.size)}.db"
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{work}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(template, work)
+    return f"sqlite:///{work}"
+
+
+def build_memori(database_connect: str, latency_ms: float) -> Memori:
+    memori = Memori(
+        database_connect=database_connect,
+        user_id=PRIMARY_USER,
+        session_id="bench",
+        conscious_ingest=False,
+        auto_ingest=False,
+        api_key="sk-benchmark-offline",
+        llm_cache=False,
+        lazy_init=True,
+    )
+    install_stub_llm(memori, latency_ms=latency_ms)
+    return memori
+
+
+def counter_totals() -> dict[str, float]:
+    """Metric counters summed over labels"""
+    counters = export_metrics_json()["counters"]
+    return {
+        name: sum(entry["value"] for entry in series)
+        for name, series in counters.items()
+    }
+
+
+def explain_scenario(memori: Memori, operation, calls: int = 3) -> list[dict]:
+    """
+    Plans of the SELECTs a scenario issues, captured outside the timed loop
+
+    ``sorts`` means the database sorted rows itself rather than reading them
+    in index order; ``scans`` lists full table scans.
+    """
+    with capture_query_plans(memori.db_manager) as plans:
+        for i in range(calls):
+            operation(i)
+    return [
+        {
+            "scope": plan.scope,
+            "sql": " ".join(plan.sql.split())[:160],
+            "plan": plan.plan,
+            "sorts": plan.sorts,
+            "scans": [scan.table for scan in plan.scans],
+        }
+        for plan in plans.plans()
+    ]
+
+
+def print_plans(plans: list[dict]):
+    for plan in plans:
+        flags = []
+        if plan["sorts"]:
+            flags.append("SORT")
+        if plan["scans"]:
+            flags.append(f"SCAN {','.join(plan['scans'])}")
+        print(f"    [{' '.join(flags) or 'index order'}] {plan['sql'][:100]}")
+        for line in plan["plan"]:
+            print(f"        {line}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Offline Memori retrieval and ingestion benchmarks",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1k,10k",
+        help="Corpus sizes, e.g. 1k,10k,100k,1m (default: 1k,10k)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--ops", type=int, default=200, help="Timed calls per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chinese-ratio", type=float, default=0.2)
+    parser.add_argument("--topic-skew", type=float, default=1.1)
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated provider latency per stub LLM call",
+    )
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument(
+        "--reseed", action="store_true", help="Regenerate cached seed databases"
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Benchmark against this database instead of cached SQLite files; "
+        "rows of bench_user* users are deleted and re-seeded",
+    )
+    parser.add_argument("--baseline", help="Compare against a saved baseline JSON")
+    parser.add_argument("--save-baseline", help="Write results as a baseline JSON")
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.15,
+        help="Relative change counted as a regression (default: 0.15)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any scenario regressed",
+    )
+    parser.add_argument(
+        "--output", choices=("table", "json"), default="table", help="Report format"
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Also capture each scenario's query plans (sorts, full scans)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="CRITICAL",
+        help="Memori log level while benchmarking (default: CRITICAL)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in names if s not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    # Reads first, so they only ever see the seeded corpus
+    names.sort(key=lambda s: s in WRITE_SCENARIOS)
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+    configure_llm_cache(enabled=False)
+    configure_rate_limits({"search": None, "llm": None, "record_conversation": None})
+
+    results = []
+    for label in args.sizes.split(","):
+        size = parse_size(label)
+        config = CorpusConfig(
+            size=size,
+            chinese_ratio=args.chinese_ratio,
+            topic_skew=args.topic_skew,
+            seed=args.seed,
+        )
+        corpus = SyntheticCorpus(config)
+        database_connect = prepare_database(args, config, corpus)
+        memori = build_memori(database_connect, args.llm_latency_ms)
+        # Memori installs its own sinks on construction
+        logger.remove()
+        logger.add(sys.stderr, level=args.log_level)
+        ctx = BenchContext(
+            memori=memori,
+            corpus=corpus,
+            queries=corpus.queries(max(args.ops, 100)),
+            conversations=corpus.conversations(max(args.ops, 100)),
+        )
+        try:
+            for name in names:
+                operation = SCENARIOS[name](ctx)
+                result = run_benchmark(
+                    name,
+                    format_size(size),
+                    operation,
+                    args.ops,
+                    args.warmup,
+                    on_start=reset_metrics,
+                )
+                # Fallbacks and errors counted by the instrumented code paths,
+                # so a "fast" run that silently degraded is visible
+                result.extra["counters"] = counter_totals()
+                if args.explain:
+                    result.extra["plans"] = explain_scenario(memori, operation)
+                results.append(result)
+                if args.output == "table":
+                    print(
+                        f"  {result.key}: {result.ops_per_sec:.1f} ops/s, "
+                        f"p50 {result.p50_ms:.2f} ms",
+                        flush=True,
+                    )
+                    if result.extra["counters"]:
+                        print(f"    counters: {result.extra['counters']}", flush=True)
+                    if args.explain:
+                        print_plans(result.extra["plans"])
+        finally:
+            ctx.close()
+            memori.db_manager.close()
+
+    comparison = None
+    if args.baseline:
+        comparison = compare(
+            results, load_baseline(args.baseline), args.regression_threshold
+        )
+
+    if args.output == "json":
+        print(
+            json.dumps(
+                {
+                    "results": [asdict(r) for r in results],
+                    "comparison": comparison,
+                },
+                indent=2,
+            )
+        )
+    else:
+        print()
+        print(format_table(results, comparison))
+
+    if args.save_baseline:
+        save_baseline(
+            args.save_baseline,
+            results,
+            meta={
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "ops": args.ops,
+                "llm_latency_ms": args.llm_latency_ms,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+        )
+
+    if args.fail_on_regression and comparison:
+        if any(row["status"] == "regressed" for row in comparison):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Benchmark scenarios
+
+Each scenario takes a ``BenchContext`` and returns ``operation(i)``, a
+callable timed by the harness. Operations cycle through the pre-generated
+query or conversation pools by index, so every run issues the same inputs.
+"""
+
+import asyncio
+import random
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from memori.database.search_service import SearchService
+from memori.utils.pydantic_models import MemoryClassification
+
+from .synthetic import PRIMARY_USER, SyntheticCorpus
+
+
+@dataclass
+class BenchContext:
+    memori: Any
+    corpus: SyntheticCorpus
+    queries: list[str]
+    conversations: list[tuple[str, str]]
+    loop: asyncio.AbstractEventLoop = field(default_factory=asyncio.new_event_loop)
+
+    @property
+    def db_manager(self):
+        return self.memori.db_manager
+
+    def close(self):
+        self.loop.close()
+
+
+def search_service(ctx: BenchContext) -> Callable[[int], Any]:
+    """SearchService.search_memories on a fresh pooled session, as in production"""
+    db_manager = ctx.db_manager
+
+    def operation(i: int):
+        session = db_manager.ReadSessionLocal()
+        try:
+            return SearchService(session, db_manager.database_type).search_memories(
+                query=ctx.queries[i % len(ctx.queries)],
+                user_id=PRIMARY_USER,
+                limit=10,
+                memory_types=["long_term"],
+            )
+        finally:
+            session.close()
+
+    return operation
+
+
+def execute_search(ctx: BenchContext) -> Callable[[int], Any]:
+    """
+    MemorySearchEngine.execute_search: plan (stub LLM) + parallel strategies
+
+    The engine's in-memory plan cache is cleared every call so each search
+    pays for planning, as a stream of distinct user queries would.
+    """
+    engine = ctx.memori.search_engine
+
+    def operation(i: int):
+        engine._query_cache.clear()
+        return engine.execute_search(
+            query=ctx.queries[i % len(ctx.queries)],
+            db_manager=ctx.db_manager,
+            user_id=PRIMARY_USER,
+            limit=10,
+        )
+
+    return operation
+
+
+def store_long_term(ctx: BenchContext) -> Callable[[int], Any]:
+    """store_long_term_memory_enhanced with a pre-built memory"""
+    rng = random.Random(ctx.corpus.config.seed + 3)
+    memories = [ctx.corpus.memory(rng) for _ in range(256)]
+
+    def operation(i: int):
+        return ctx.db_manager.store_long_term_memory_enhanced(
+            memories[i % len(memories)],
+            chat_id=str(uuid.uuid4()),
+            user_id=PRIMARY_USER,
+            session_id="bench",
+        )
+
+    return operation
+
+
+def memory_agent_ingest(ctx: BenchContext) -> Callable[[int], Any]:
+    """MemoryAgent.process_conversation_async (stub LLM) followed by the store"""
+    agent = ctx.memori.memory_agent
+
+    def operation(i: int):
+        user_input, ai_output = ctx.conversations[i % len(ctx.conversations)]
+        chat_id = str(uuid.uuid4())
+        processed = ctx.loop.run_until_complete(
+            agent.process_conversation_async(chat_id, user_input, ai_output)
+        )
+        return ctx.db_manager.store_long_term_memory_enhanced(
+            processed, chat_id=chat_id, user_id=PRIMARY_USER, session_id="bench"
+        )
+
+    return operation
+
+
+def conscious_promotion(ctx: BenchContext) -> Callable[[int], Any]:
+    """Store a conscious-info memory, then promote it to short-term memory"""
+    from memori.agents.conscious_agent import ConsciouscAgent
+
+    agent = ctx.memori.conscious_agent or ConsciouscAgent()
+    rng = random.Random(ctx.corpus.config.seed + 4)
+    memories = []
+    for _ in range(64):
+        memory = ctx.corpus.memory(rng)
+        memories.append(
+            memory.model_copy(
+                update={
+                    "classification": MemoryClassification.CONSCIOUS_INFO,
+                    "is_user_context": True,
+                    "promotion_eligible": True,
+                }
+            )
+        )
+
+    def operation(i: int):
+        memory_id = ctx.db_manager.store_long_term_memory_enhanced(
+            memories[i % len(memories)],
+            chat_id=str(uuid.uuid4()),
+            user_id=PRIMARY_USER,
+            session_id="bench",
+        )
+        return ctx.loop.run_until_complete(
+            agent.promote_memories(ctx.db_manager, PRIMARY_USER, [memory_id])
+        )
+
+    return operation
+
+
+def retrieve_context(ctx: BenchContext) -> Callable[[int], Any]:
+    """Memori.retrieve_context, the per-turn read path of a chat app"""
+    memori = ctx.memori
+    engine = memori.search_engine
+
+    def operation(i: int):
+        if engine is not None:
+            engine._query_cache.clear()
+        return memori.retrieve_context(ctx.queries[i % len(ctx.queries)], limit=5)
+
+    return operation
+
+
+def chat_history(ctx: BenchContext) -> Callable[[int], Any]:
+    """get_chat_history for the current session, newest first"""
+
+    def operation(i: int):
+        return ctx.db_manager.get_chat_history(
+            user_id=PRIMARY_USER, session_id="bench", limit=10
+        )
+
+    return operation
+
+
+def essential_conversations(ctx: BenchContext) -> Callable[[int], Any]:
+    """Memori.get_essential_conversations: short-term memory ranked by importance"""
+
+    def operation(i: int):
+        return ctx.memori.get_essential_conversations(limit=10)
+
+    return operation
+
+
+def recent_memories(ctx: BenchContext) -> Callable[[int], Any]:
+    """SearchService with an empty query: newest short- and long-term memories"""
+    db_manager = ctx.db_manager
+
+    def operation(i: int):
+        session = db_manager.ReadSessionLocal()
+        try:
+            return SearchService(session, db_manager.database_type).search_memories(
+                query="", user_id=PRIMARY_USER, session_id="bench", limit=10
+            )
+        finally:
+            session.close()
+
+    return operation
+
+
+SCENARIOS: dict[str, Callable[[BenchContext], Callable[[int], Any]]] = {
+    "search_service": search_service,
+    "execute_search": execute_search,
+    "store_long_term": store_long_term,
+    "memory_agent_ingest": memory_agent_ingest,
+    "conscious_promotion": conscious_promotion,
+    "retrieve_context": retrieve_context,
+    "chat_history": chat_history,
+    "essential_conversations": essential_conversations,
+    "recent_memories": recent_memories,
+}
+
+# Scenarios that add rows; run last so reads see the seeded corpus only
+WRITE_SCENARIOS = {"store_long_term", "memory_agent_ingest", "conscious_promotion"}
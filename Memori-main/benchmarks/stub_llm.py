@@ -0,0 +1,177 @@
+"""
+Offline stand-in for the OpenAI client used by the agents
+
+Implements just the calls the agents make (``beta.chat.completions.parse``
+and ``chat.completions.create``, sync and async) and answers them with
+deterministic, plausible models built from the prompt, so benchmarks measure
+Memori's own code path instead of network latency. ``latency_ms`` adds a
+fixed sleep per call to model a real provider when wanted.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from memori.utils.pydantic_models import (
+    MemoryClassification,
+    MemoryImportanceLevel,
+    MemorySearchQuery,
+    ProcessedLongTermMemory,
+)
+
+_STOPWORDS = set(
+    "a an and are about do does for how i is it me my of on the to what who "
+    "why with you your think".split()
+)
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _last_user_message(messages: list[dict[str, Any]]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return message.get("content") or ""
+    return ""
+
+
+def plan_for(prompt: str) -> MemorySearchQuery:
+    """Search plan for a ``plan_search`` prompt ("User query: ...")"""
+    match = re.search(r"User query:\s*(.*)", prompt)
+    query = match.group(1).strip() if match else prompt.strip()
+    words = [w for w in _WORD.findall(query.lower()) if w not in _STOPWORDS]
+    strategies = ["keyword_search"]
+    categories = []
+    if any(w in ("prefer", "like", "dislike") for w in words):
+        categories = [MemoryClassification.CONTEXTUAL.value]
+        strategies.append("category_filter")
+    return MemorySearchQuery(
+        query_text=query,
+        intent="recall",
+        entity_filters=words[:3],
+        category_filters=categories,
+        min_importance=0.0,
+        search_strategy=strategies,
+        expected_result_types=["fact"],
+    )
+
+
+def memory_for(prompt: str) -> ProcessedLongTermMemory:
+    """Processed memory for a ``process_conversation_async`` prompt"""
+    match = re.search(r"User:\s*(.*)", prompt)
+    content = match.group(1).strip() if match else prompt.strip()[:200]
+    words = [w for w in _WORD.findall(content.lower()) if w not in _STOPWORDS]
+    conscious = content.lower().startswith(("i am", "i'm", "my name", "我是"))
+    return ProcessedLongTermMemory(
+        content=content,
+        summary=content[:80],
+        classification=(
+            MemoryClassification.CONSCIOUS_INFO
+            if conscious
+            else MemoryClassification.CONTEXTUAL
+        ),
+        importance=MemoryImportanceLevel.MEDIUM,
+        topic=words[0] if words else None,
+        entities=words[:3],
+        keywords=words[:5],
+        is_user_context=conscious,
+        promotion_eligible=conscious,
+        session_id="default",
+        classification_reason="stub llm",
+    )
+
+
+def _reply(model: Any) -> SimpleNamespace:
+    message = SimpleNamespace(
+        parsed=model, refusal=None, content=model.model_dump_json()
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class _Completions:
+    def __init__(self, stub: "StubLLM", structured: bool):
+        self._stub = stub
+        self._structured = structured
+
+    def _answer(self, messages: list[dict[str, Any]], response_format: Any = None):
+        self._stub._count()
+        prompt = _last_user_message(messages)
+        if response_format is ProcessedLongTermMemory or "User query:" not in prompt:
+            model = memory_for(prompt)
+        else:
+            model = plan_for(prompt)
+        reply = _reply(model)
+        if not self._structured:
+            reply.choices[0].message.parsed = None
+        return reply
+
+    def parse(self, *, messages, response_format=None, **_kwargs):
+        self._stub._sleep()
+        return self._answer(messages, response_format)
+
+    def create(self, *, messages, **_kwargs):
+        self._stub._sleep()
+        return self._answer(messages)
+
+
+class _AsyncCompletions(_Completions):
+    async def parse(self, *, messages, response_format=None, **_kwargs):
+        await self._stub._async_sleep()
+        return self._answer(messages, response_format)
+
+    async def create(self, *, messages, **_kwargs):
+        await self._stub._async_sleep()
+        return self._answer(messages)
+
+
+class StubLLM:
+    """
+    Fake OpenAI client (sync or async)
+
+    Args:
+        latency_ms: Simulated provider latency added to every call
+        asynchronous: Expose coroutine methods, like ``openai.AsyncOpenAI``
+    """
+
+    def __init__(self, latency_ms: float = 0.0, asynchronous: bool = False):
+        self.latency = latency_ms / 1000
+        self.calls = 0
+        self._lock = threading.Lock()
+        completions = _AsyncCompletions if asynchronous else _Completions
+        self.chat = SimpleNamespace(completions=completions(self, structured=False))
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=completions(self, structured=True))
+        )
+
+    def _count(self):
+        with self._lock:
+            self.calls += 1
+
+    def _sleep(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    async def _async_sleep(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+def install_stub_llm(memori: Any, latency_ms: float = 0.0) -> dict[str, StubLLM]:
+    """
+    Point the Memori instance's agents at stub clients
+
+    Returns the installed clients by role, so callers can read ``calls``.
+    """
+    clients = {}
+    if memori.search_engine is not None:
+        clients["search"] = memori.search_engine.client = StubLLM(latency_ms)
+        memori.search_engine._supports_structured_outputs = True
+    if memori.memory_agent is not None:
+        clients["memory"] = memori.memory_agent.client = StubLLM(latency_ms)
+        clients["memory_async"] = memori.memory_agent.async_client = StubLLM(
+            latency_ms, asynchronous=True
+        )
+        memori.memory_agent._supports_structured_outputs = True
+    return clients
+
@@ -0,0 +1,346 @@
+"""
+Synthetic memory corpus for benchmarks
+
+Generates long-term memories that look like what the memory agent stores:
+short English or Chinese statements about a user's preferences, projects and
+people, with entities/keywords, a skewed category distribution and a Zipf-like
+topic distribution (a few topics dominate, most are rare). Everything is
+derived from ``seed``, so two runs with the same config produce the same rows.
+"""
+
+import random
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from memori.database.models import build_memory_entity_rows
+from memori.utils.pydantic_models import (
+    MemoryClassification,
+    MemoryImportanceLevel,
+    ProcessedLongTermMemory,
+)
+
+GENERATOR_VERSION = 2
+
+EN_TOPICS = (
+    "python rust postgres sqlite kubernetes docker react fastapi streamlit "
+    "pandas pytorch golang redis kafka terraform graphql django flask numpy "
+    "airflow spark hiking coffee guitar cooking running photography chess "
+    "travel gardening cycling reading painting yoga baking"
+).split()
+EN_PEOPLE = (
+    "Alice Bob Carol Dave Erin Frank Grace Heidi Ivan Judy Mallory Niaj "
+    "Olivia Peggy Rupert Sybil"
+).split()
+EN_TEMPLATES = [
+    "User prefers {topic} for {project} and mentioned {person} helps with it",
+    "User is working on {project} using {topic} this quarter",
+    "{person} recommended {topic} to the user during the {project} review",
+    "User dislikes slow {topic} builds in the {project} pipeline",
+    "User wants to learn more about {topic} before starting {project}",
+    "User's teammate {person} owns the {topic} part of {project}",
+]
+
+ZH_TOPICS = (
+    "机器学习 数据库 前端开发 云计算 爬山 咖啡 吉他 做饭 跑步 摄影 围棋 旅行 "
+    "园艺 骑行 阅读 书法 茶艺 编程 算法 产品设计"
+).split()
+ZH_PEOPLE = "张伟 王芳 李娜 刘洋 陈静 杨磊 赵敏 黄强".split()
+ZH_TEMPLATES = [
+    "用户喜欢{topic}，并且在{project}项目中经常使用",
+    "用户最近在做{project}，主要涉及{topic}",
+    "{person}向用户推荐了{topic}，用于{project}",
+    "用户希望在开始{project}之前多了解{topic}",
+    "用户的同事{person}负责{project}里的{topic}部分",
+]
+
+PROJECTS = (
+    "memori remi atlas phoenix orion nebula helios apollo zephyr aurora titan vega"
+).split()
+
+# Category weights: most stored memories are conversational/contextual
+DEFAULT_CATEGORY_WEIGHTS = {
+    MemoryClassification.CONVERSATIONAL: 0.40,
+    MemoryClassification.CONTEXTUAL: 0.25,
+    MemoryClassification.ESSENTIAL: 0.12,
+    MemoryClassification.PERSONAL: 0.10,
+    MemoryClassification.REFERENCE: 0.08,
+    MemoryClassification.CONSCIOUS_INFO: 0.05,
+}
+IMPORTANCE_WEIGHTS = {
+    MemoryImportanceLevel.LOW: 0.30,
+    MemoryImportanceLevel.MEDIUM: 0.45,
+    MemoryImportanceLevel.HIGH: 0.20,
+    MemoryImportanceLevel.CRITICAL: 0.05,
+}
+IMPORTANCE_SCORES = {"critical": 0.9, "high": 0.7, "medium": 0.5, "low": 0.3}
+
+
+@dataclass(frozen=True)
+class CorpusConfig:
+    """
+    Shape of a synthetic corpus
+
+    Args:
+        size: Number of long-term memories
+        users: Memories are spread over this many users; user 0 ("bench_user")
+            gets ``primary_user_share`` of them and is the one benchmarks query
+        chinese_ratio: Fraction of memories written in Chinese
+        topic_skew: Zipf exponent for topic popularity (0 = uniform)
+        category_weights: Classification distribution
+        seed: RNG seed
+    """
+
+    size: int
+    users: int = 10
+    primary_user_share: float = 0.5
+    chinese_ratio: float = 0.2
+    topic_skew: float = 1.1
+    category_weights: tuple[tuple[str, float], ...] = tuple(
+        (c.value, w) for c, w in DEFAULT_CATEGORY_WEIGHTS.items()
+    )
+    seed: int = 42
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies the generated data, for reusing seeded databases"""
+        weights = "-".join(f"{c}{w:g}" for c, w in self.category_weights)
+        return (
+            f"v{GENERATOR_VERSION}_n{self.size}_u{self.users}"
+            f"_p{self.primary_user_share:g}_zh{self.chinese_ratio:g}"
+            f"_z{self.topic_skew:g}_{weights}_s{self.seed}"
+        )
+
+
+PRIMARY_USER = "bench_user"
+# Conversation sessions; "bench" is the one the benchmark Memori instance uses
+SESSIONS = ["bench"] + [f"session_{n}" for n in range(1, 10)]
+SESSION_WEIGHTS = [0.3] + [0.7 / 9] * 9
+# Insertion order: chat_history before the short-term rows that reference it
+TABLES = ("chat_history", "long_term_memory", "memory_entities", "short_term_memory")
+
+
+def _empty_batch() -> dict[str, list[dict]]:
+    return {table: [] for table in TABLES}
+
+
+def _zipf_weights(n: int, exponent: float) -> list[float]:
+    return [1.0 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+class SyntheticCorpus:
+    """Deterministic generator of memories, conversations and queries"""
+
+    def __init__(self, config: CorpusConfig):
+        self.config = config
+        self._en_topic_weights = _zipf_weights(len(EN_TOPICS), config.topic_skew)
+        self._zh_topic_weights = _zipf_weights(len(ZH_TOPICS), config.topic_skew)
+        self._categories = [c for c, _ in config.category_weights]
+        self._category_weights = [w for _, w in config.category_weights]
+        self._importance = list(IMPORTANCE_WEIGHTS)
+        self._importance_weights = list(IMPORTANCE_WEIGHTS.values())
+        self._start = datetime(2025, 1, 1)
+
+    def _user_for(self, rng: random.Random) -> str:
+        if self.config.users <= 1 or rng.random() < self.config.primary_user_share:
+            return PRIMARY_USER
+        return f"bench_user_{rng.randrange(1, self.config.users)}"
+
+    def _statement(self, rng: random.Random) -> tuple[str, str, list[str], str]:
+        """(content, topic, entities, language)"""
+        project = rng.choice(PROJECTS)
+        if rng.random() < self.config.chinese_ratio:
+            topic = rng.choices(ZH_TOPICS, self._zh_topic_weights)[0]
+            person = rng.choice(ZH_PEOPLE)
+            template = rng.choice(ZH_TEMPLATES)
+            language = "zh"
+        else:
+            topic = rng.choices(EN_TOPICS, self._en_topic_weights)[0]
+            person = rng.choice(EN_PEOPLE)
+            template = rng.choice(EN_TEMPLATES)
+            language = "en"
+        content = template.format(topic=topic, project=project, person=person)
+        return content, topic, [person, project], language
+
+    def memory(
+        self, rng: random.Random, session_id: str = "bench"
+    ) -> ProcessedLongTermMemory:
+        """One memory as the memory agent would return it"""
+        content, topic, entities, _ = self._statement(rng)
+        classification = rng.choices(self._categories, self._category_weights)[0]
+        importance = rng.choices(self._importance, self._importance_weights)[0]
+        return ProcessedLongTermMemory(
+            content=content,
+            summary=content[:80],
+            classification=classification,
+            importance=importance,
+            topic=topic,
+            entities=entities,
+            keywords=[topic],
+            is_user_context=classification == "conscious-info",
+            promotion_eligible=classification == "conscious-info",
+            session_id=session_id,
+            classification_reason="synthetic benchmark memory",
+        )
+
+    def rows(self, batch_size: int = 5000) -> Iterator[dict[str, list[dict]]]:
+        """
+        Batches of rows keyed by table name
+
+        Every long-term memory comes from one chat_history turn; about a
+        third are also in short-term memory, high-importance ones under an
+        ``essential_*`` category. Rows mirror what the store methods write,
+        without building a pydantic model per row.
+        """
+        rng = random.Random(self.config.seed)
+        batch = _empty_batch()
+        for i in range(self.config.size):
+            content, topic, people, _ = self._statement(rng)
+            classification = rng.choices(self._categories, self._category_weights)[0]
+            importance = rng.choices(self._importance, self._importance_weights)[0]
+            importance = getattr(importance, "value", importance)
+            user_id = self._user_for(rng)
+            memory_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            created_at = self._start + timedelta(minutes=i)
+            conscious = classification == "conscious-info"
+            session_id = rng.choices(SESSIONS, SESSION_WEIGHTS)[0]
+            chat_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            processed = {
+                "content": content,
+                "summary": content[:80],
+                "classification": classification,
+                "importance": importance,
+                "topic": topic,
+                "entities": people,
+                "keywords": [topic],
+                "is_user_context": conscious,
+                "promotion_eligible": conscious,
+                "session_id": session_id,
+                "classification_reason": "synthetic benchmark memory",
+            }
+            batch["chat_history"].append(
+                {
+                    "chat_id": chat_id,
+                    "user_input": content,
+                    "ai_output": f"Noted: {content}",
+                    "model": "benchmark",
+                    "session_id": session_id,
+                    "tokens_used": 0,
+                    "user_id": user_id,
+                    "created_at": created_at,
+                }
+            )
+            batch["long_term_memory"].append(
+                {
+                    "memory_id": memory_id,
+                    "processed_data": processed,
+                    "importance_score": IMPORTANCE_SCORES[importance],
+                    "category_primary": classification,
+                    "retention_type": "long_term",
+                    "user_id": user_id,
+                    "assistant_id": None,
+                    "session_id": session_id,
+                    "created_at": created_at,
+                    "searchable_content": content,
+                    "summary": content[:80],
+                    "classification": classification,
+                    "memory_importance": importance,
+                    "topic": topic,
+                    "entities_json": people,
+                    "keywords_json": [topic],
+                    "is_user_context": conscious,
+                    "promotion_eligible": conscious,
+                    "classification_reason": "synthetic benchmark memory",
+                    "processed_for_duplicates": False,
+                    # Seeded data counts as already promoted; the promotion
+                    # scenario measures new writes only
+                    "conscious_processed": True,
+                }
+            )
+            batch["memory_entities"].extend(
+                build_memory_entity_rows(memory_id, user_id, people, [topic])
+            )
+            essential = conscious or importance in ("high", "critical")
+            if essential or rng.random() < 0.15:
+                batch["short_term_memory"].append(
+                    {
+                        "memory_id": f"st_{memory_id}",
+                        "chat_id": chat_id,
+                        "processed_data": processed,
+                        "importance_score": IMPORTANCE_SCORES[importance],
+                        "category_primary": (
+                            f"essential_{topic}" if essential else "context"
+                        ),
+                        "retention_type": "short_term",
+                        "user_id": user_id,
+                        "assistant_id": None,
+                        "session_id": session_id,
+                        "created_at": created_at,
+                        "searchable_content": content,
+                        "summary": content[:80],
+                        "is_permanent_context": False,
+                    }
+                )
+            if len(batch["long_term_memory"]) >= batch_size:
+                yield batch
+                batch = _empty_batch()
+        if batch["long_term_memory"]:
+            yield batch
+
+    def queries(self, count: int, miss_ratio: float = 0.1) -> list[str]:
+        """
+        Search queries drawn from the same topic distribution as the corpus;
+        ``miss_ratio`` of them use words that never occur in it
+        """
+        rng = random.Random(self.config.seed + 1)
+        queries = []
+        for _ in range(count):
+            roll = rng.random()
+            if roll < miss_ratio:
+                queries.append(f"zyx{rng.randrange(10_000)} unknown topic")
+            elif rng.random() < self.config.chinese_ratio:
+                topic = rng.choices(ZH_TOPICS, self._zh_topic_weights)[0]
+                queries.append(f"我喜欢{topic}吗")
+            else:
+                topic = rng.choices(EN_TOPICS, self._en_topic_weights)[0]
+                person = rng.choice(EN_PEOPLE)
+                queries.append(
+                    rng.choice(
+                        [
+                            f"what do I think about {topic}",
+                            f"{topic} {rng.choice(PROJECTS)}",
+                            f"who is {person}",
+                        ]
+                    )
+                )
+        return queries
+
+    def conversations(self, count: int) -> list[tuple[str, str]]:
+        """(user_input, ai_output) pairs for ingestion scenarios"""
+        rng = random.Random(self.config.seed + 2)
+        pairs = []
+        for _ in range(count):
+            content, _, _, language = self._statement(rng)
+            reply = (
+                f"好的，我记住了：{content}"
+                if language == "zh"
+                else f"Got it, I'll remember that. {content}."
+            )
+            pairs.append((content, reply))
+        return pairs
+
+
+def parse_size(label: str) -> int:
+    """'1k' -> 1000, '1m' -> 1000000, '2500' -> 2500"""
+    label = label.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(label[-1:], 1)
+    number = label[:-1] if multiplier > 1 else label
+    return int(float(number) * multiplier)
+
+
+def format_size(size: int) -> str:
+    for suffix, unit in (("m", 1_000_000), ("k", 1_000)):
+        if size >= unit and size % unit == 0:
+            return f"{size // unit}{suffix}"
+    return str(size)
@@ -3,162 +3,182 @@ Memoriai - The Open-Source Memory Layer for AI Agents & Multi-Agent Systems v1.0
 
 Professional-grade memory layer with comprehensive error handling, configuration
 management, and modular architecture for production AI systems.
+
+Public names are resolved on first access (PEP 562), so ``import memori`` stays
+cheap and ``from memori import Memori`` only loads what Memori itself needs -
+not the MySQL/PostgreSQL connectors, provider SDK wrappers or tools.
 """
 
 __version__ = "2.3.0"
 __author__ = "Harshal More"
 __email__ = "harshalmore2468@gmail.com"
 
-from typing import Any, Optional
-
-# Configuration system
-from .config import (
-    AgentSettings,
-    ConfigManager,
-    DatabaseSettings,
-    LoggingSettings,
-    MemoriSettings,
-)
-from .core.database import DatabaseManager
-
-# Core components
-from .core.memory import Memori
-
-# Database system
-from .database.connectors import MySQLConnector, PostgreSQLConnector, SQLiteConnector
-from .database.queries import (  # EntityQueries removed (graph search simplified)
-    BaseQueries,
-    ChatQueries,
-    MemoryQueries,
-)
-
-# Wrapper integrations
-from .integrations import MemoriAnthropic, MemoriOpenAI
-
-# Tools and integrations
-from .tools.memory_tool import MemoryTool, create_memory_search_tool, create_memory_tool
-
-# Utils and models
-from .utils import (  # Pydantic models; Enhanced exceptions; Validators and helpers; Logging
-    AgentError,
-    AsyncUtils,
-    AuthenticationError,
-    ConcurrentUpdateError,
-    ConfigurationError,
-    ConversationContext,
-    DatabaseError,
-    DataValidator,
-    DateTimeUtils,
-    EntityType,
-    ExceptionHandler,
-    ExtractedEntities,
-    FileUtils,
-    IntegrationError,
-    JsonUtils,
-    LoggingManager,
-    MemoriError,
-    MemoryCategory,
-    MemoryCategoryType,
-    MemoryImportance,
-    MemoryNotFoundError,
-    MemoryValidator,
-    PerformanceUtils,
-    ProcessedMemory,
-    ProcessingError,
-    RateLimitError,
-    ResourceExhaustedError,
-    RetentionType,
-    RetryUtils,
-    SecurityError,
-    StringUtils,
-    TimeoutError,
-    ValidationError,
-    get_logger,
-)
-
-# Memory agents (dynamically imported to avoid import errors)
-MemoryAgent: Any | None = None
-MemorySearchEngine: Any | None = None
-_AGENTS_AVAILABLE = False
-
-try:
-    from .agents.memory_agent import MemoryAgent
-    from .agents.retrieval_agent import MemorySearchEngine
-
-    _AGENTS_AVAILABLE = True
-except ImportError:
-    # Agents are not available, use placeholder None values
-    pass
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
 
-# Build __all__ list dynamically based on available components
-_all_components = [
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
     # Core
-    "Memori",
-    "DatabaseManager",
+    "Memori": ".core.memory",
+    "DatabaseManager": ".core.database",
     # Configuration
-    "MemoriSettings",
-    "DatabaseSettings",
-    "AgentSettings",
-    "LoggingSettings",
-    "ConfigManager",
+    "MemoriSettings": ".config",
+    "DatabaseSettings": ".config",
+    "AgentSettings": ".config",
+    "LoggingSettings": ".config",
+    "ConfigManager": ".config",
     # Database
-    "SQLiteConnector",
-    "PostgreSQLConnector",
-    "MySQLConnector",
-    "BaseQueries",
-    "MemoryQueries",
-    "ChatQueries",
+    "SQLiteConnector": ".database.connectors",
+    "PostgreSQLConnector": ".database.connectors",
+    "MySQLConnector": ".database.connectors",
+    "BaseQueries": ".database.queries",
+    "MemoryQueries": ".database.queries",
+    "ChatQueries": ".database.queries",
     # "EntityQueries",  # Removed: graph search simplified
     # Tools
-    "MemoryTool",
-    "create_memory_tool",
-    "create_memory_search_tool",
+    "MemoryTool": ".tools.memory_tool",
+    "create_memory_tool": ".tools.memory_tool",
+    "create_memory_search_tool": ".tools.memory_tool",
     # Integrations
-    "MemoriOpenAI",
-    "MemoriAnthropic",
+    "MemoriOpenAI": ".integrations",
+    "MemoriAnthropic": ".integrations",
     # Pydantic Models
-    "ProcessedMemory",
-    "MemoryCategory",
-    "ExtractedEntities",
-    "MemoryImportance",
-    "ConversationContext",
-    "MemoryCategoryType",
-    "RetentionType",
-    "EntityType",
+    "ProcessedMemory": ".utils",
+    "MemoryCategory": ".utils",
+    "ExtractedEntities": ".utils",
+    "MemoryImportance": ".utils",
+    "ConversationContext": ".utils",
+    "MemoryCategoryType": ".utils",
+    "RetentionType": ".utils",
+    "EntityType": ".utils",
     # Enhanced Exceptions
-    "MemoriError",
-    "DatabaseError",
-    "AgentError",
-    "ConfigurationError",
-    "ValidationError",
-    "IntegrationError",
-    "AuthenticationError",
-    "RateLimitError",
-    "MemoryNotFoundError",
-    "ProcessingError",
-    "TimeoutError",
-    "ResourceExhaustedError",
-    "SecurityError",
-    "ConcurrentUpdateError",
-    "ExceptionHandler",
+    "MemoriError": ".utils",
+    "DatabaseError": ".utils",
+    "AgentError": ".utils",
+    "ConfigurationError": ".utils",
+    "ValidationError": ".utils",
+    "IntegrationError": ".utils",
+    "AuthenticationError": ".utils",
+    "RateLimitError": ".utils",
+    "MemoryNotFoundError": ".utils",
+    "ProcessingError": ".utils",
+    "TimeoutError": ".utils",
+    "ResourceExhaustedError": ".utils",
+    "SecurityError": ".utils",
+    "ConcurrentUpdateError": ".utils",
+    "ExceptionHandler": ".utils",
     # Validators
-    "DataValidator",
-    "MemoryValidator",
+    "DataValidator": ".utils",
+    "MemoryValidator": ".utils",
     # Helpers
-    "StringUtils",
-    "DateTimeUtils",
-    "JsonUtils",
-    "FileUtils",
-    "RetryUtils",
-    "PerformanceUtils",
-    "AsyncUtils",
+    "StringUtils": ".utils",
+    "DateTimeUtils": ".utils",
+    "JsonUtils": ".utils",
+    "FileUtils": ".utils",
+    "RetryUtils": ".utils",
+    "PerformanceUtils": ".utils",
+    "AsyncUtils": ".utils",
     # Logging
-    "LoggingManager",
-    "get_logger",
-]
+    "LoggingManager": ".utils",
+    "get_logger": ".utils",
+}
+
+# Memory agents need the openai SDK; without it they resolve to None
+_AGENT_IMPORTS = {
+    "MemoryAgent": ".agents.memory_agent",
+    "MemorySearchEngine": ".agents.retrieval_agent",
+}
+_AGENTS_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+if TYPE_CHECKING:
+    from .agents.memory_agent import MemoryAgent
+    from .agents.retrieval_agent import MemorySearchEngine
+    from .config import (
+        AgentSettings,
+        ConfigManager,
+        DatabaseSettings,
+        LoggingSettings,
+        MemoriSettings,
+    )
+    from .core.database import DatabaseManager
+    from .core.memory import Memori
+    from .database.connectors import (
+        MySQLConnector,
+        PostgreSQLConnector,
+        SQLiteConnector,
+    )
+    from .database.queries import BaseQueries, ChatQueries, MemoryQueries
+    from .integrations import MemoriAnthropic, MemoriOpenAI
+    from .tools.memory_tool import (
+        MemoryTool,
+        create_memory_search_tool,
+        create_memory_tool,
+    )
+    from .utils import (
+        AgentError,
+        AsyncUtils,
+        AuthenticationError,
+        ConcurrentUpdateError,
+        ConfigurationError,
+        ConversationContext,
+        DatabaseError,
+        DataValidator,
+        DateTimeUtils,
+        EntityType,
+        ExceptionHandler,
+        ExtractedEntities,
+        FileUtils,
+        IntegrationError,
+        JsonUtils,
+        LoggingManager,
+        MemoriError,
+        MemoryCategory,
+        MemoryCategoryType,
+        MemoryImportance,
+        MemoryNotFoundError,
+        MemoryValidator,
+        PerformanceUtils,
+        ProcessedMemory,
+        ProcessingError,
+        RateLimitError,
+        ResourceExhaustedError,
+        RetentionType,
+        RetryUtils,
+        SecurityError,
+        StringUtils,
+        TimeoutError,
+        ValidationError,
+        get_logger,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them on the module"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    elif name in _AGENT_IMPORTS:
+        try:
+            module = importlib.import_module(_AGENT_IMPORTS[name], __name__)
+            value = getattr(module, name)
+        except ImportError:
+            # Agents are not available, use placeholder None values
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Build __all__ list based on available components
+_all_components = list(_LAZY_IMPORTS)
 
 # Add agents only if available
 if _AGENTS_AVAILABLE:
-    _all_components.extend(["MemoryAgent", "MemorySearchEngine"])
+    _all_components.extend(_AGENT_IMPORTS)
 
 __all__ = _all_components
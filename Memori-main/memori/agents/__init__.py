@@ -1,7 +1,28 @@
 """Intelligent agents for memory processing and retrieval"""
 
-from .conscious_agent import ConsciouscAgent
-from .memory_agent import MemoryAgent
-from .retrieval_agent import MemorySearchEngine
+import importlib
+from typing import TYPE_CHECKING
+
+# Loaded on first access (PEP 562): the LLM agents pull in the openai SDK,
+# which Memori only needs once it makes its first LLM call
+_LAZY_IMPORTS = {
+    "ConsciouscAgent": ".conscious_agent",
+    "MemoryAgent": ".memory_agent",
+    "MemorySearchEngine": ".retrieval_agent",
+}
+
+if TYPE_CHECKING:
+    from .conscious_agent import ConsciouscAgent
+    from .memory_agent import MemoryAgent
+    from .retrieval_agent import MemorySearchEngine
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["MemoryAgent", "MemorySearchEngine", "ConsciouscAgent"]
@@ -7,25 +7,45 @@ directly to short-term memory for immediate context availability.
 Supports both SQL and MongoDB database backends.
 """
 
+import asyncio
 import json
+import threading
+from collections import deque
 from datetime import datetime
 
 from loguru import logger
 
+from ..database.statements import STATEMENTS
+
 
 class ConsciouscAgent:
     """
     Agent that copies conscious-info labeled memories from long-term memory
     directly to short-term memory for immediate context availability.
 
-    Runs once at program startup when conscious_ingest=True.
+    Runs once at program startup when conscious_ingest=True; afterwards new
+    candidates arrive through ``enqueue_promotion`` (subscribed to the database
+    manager's promotion events) and are promoted by ``run_promotion_consumer``.
+    Events are per process, so memories stored by other processes are picked
+    up by the consumer's slow reconciliation pass instead.
     """
 
+    # Idle seconds after which the promotion consumer checks for unprocessed
+    # memories that no event announced (e.g. stored by another process)
+    RECONCILE_INTERVAL_SECONDS = 300.0
+
     def __init__(self):
         """Initialize the conscious agent"""
         self.context_initialized = False
         self._database_type = None  # Will be detected from db_manager
 
+        # Event-driven promotion: (user_id, memory_id) pairs published on store
+        self._pending_promotions: deque[tuple[str, str]] = deque()
+        self._pending_lock = threading.Lock()
+        self._consumer_loop: asyncio.AbstractEventLoop | None = None
+        self._consumer_wakeup: asyncio.Event | None = None
+        self._consumer_stopping = False
+
     def _detect_database_type(self, db_manager):
         """Detect database type from db_manager with fallback detection"""
         if self._database_type is None:
@@ -136,20 +156,13 @@ class ConsciouscAgent:
                 )
             else:
                 # Use SQL method
-                from sqlalchemy import text
-
                 with db_manager._get_connection() as connection:
                     # Get top conscious-info labeled memories from long-term memory (limited for performance)
-                    cursor = connection.execute(
-                        text(
-                            """SELECT memory_id, processed_data, summary, searchable_content,
-                                  importance_score, created_at
-                           FROM long_term_memory
-                           WHERE user_id = :user_id AND classification = 'conscious-info'
-                           ORDER BY importance_score DESC, created_at DESC
-                           LIMIT :limit"""
-                        ),
+                    cursor = STATEMENTS.execute(
+                        connection,
+                        "conscious.long_term_memories",
                         {"user_id": user_id, "limit": limit},
+                        limited=True,
                     )
                     existing_conscious_memories = cursor.fetchall()
 
@@ -255,6 +268,134 @@ class ConsciouscAgent:
             )
             return False
 
+    @property
+    def promotion_consumer_running(self) -> bool:
+        loop = self._consumer_loop
+        return loop is not None and not loop.is_closed()
+
+    def enqueue_promotion(self, memory_id: str, user_id: str = "default"):
+        """
+        Queue a newly stored memory for promotion (thread-safe, non-blocking)
+
+        Signature matches ``db_manager.subscribe_promotions`` callbacks.
+        """
+        with self._pending_lock:
+            self._pending_promotions.append((user_id, memory_id))
+        self._wake_consumer()
+
+    def _wake_consumer(self):
+        loop, wakeup = self._consumer_loop, self._consumer_wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # consumer loop already closed
+
+    def stop_promotion_consumer(self):
+        """Ask a running ``run_promotion_consumer`` to return"""
+        self._consumer_stopping = True
+        self._wake_consumer()
+
+    async def run_promotion_consumer(
+        self,
+        db_manager,
+        reconcile_user_id: str | None = None,
+        reconcile_interval: float | None = None,
+    ):
+        """
+        Promote queued memories as they arrive until stopped or cancelled
+
+        Sleeps on an event while the queue is empty; a write wakes it within
+        one loop iteration. Promotion events only reach the process that
+        stored the memory, so with ``reconcile_user_id`` set, every
+        ``reconcile_interval`` idle seconds (default RECONCILE_INTERVAL_SECONDS)
+        the consumer also promotes that user's unprocessed memories.
+
+        Args:
+            db_manager: Database manager instance
+            reconcile_user_id: User whose unannounced memories are reconciled
+                (no reconciliation when None)
+            reconcile_interval: Idle seconds between reconciliation passes
+        """
+        if reconcile_interval is None:
+            reconcile_interval = self.RECONCILE_INTERVAL_SECONDS
+        idle_timeout = reconcile_interval if reconcile_user_id is not None else None
+        self._consumer_loop = asyncio.get_running_loop()
+        self._consumer_wakeup = asyncio.Event()
+        self._consumer_stopping = False
+        logger.debug("ConsciouscAgent: Promotion consumer started")
+        try:
+            while not self._consumer_stopping:
+                with self._pending_lock:
+                    batch = list(self._pending_promotions)
+                    self._pending_promotions.clear()
+                if not batch:
+                    try:
+                        await asyncio.wait_for(
+                            self._consumer_wakeup.wait(), timeout=idle_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        await self.check_for_context_updates(
+                            db_manager, reconcile_user_id
+                        )
+                    self._consumer_wakeup.clear()
+                    continue
+
+                by_user: dict[str, list[str]] = {}
+                for user_id, memory_id in batch:
+                    by_user.setdefault(user_id, []).append(memory_id)
+                for user_id, memory_ids in by_user.items():
+                    await self.promote_memories(db_manager, user_id, memory_ids)
+        finally:
+            self._consumer_loop = None
+            self._consumer_wakeup = None
+            logger.debug("ConsciouscAgent: Promotion consumer stopped")
+
+    async def promote_memories(
+        self, db_manager, user_id: str, memory_ids: list[str]
+    ) -> int:
+        """
+        Copy the given memories to short-term memory if they are unprocessed
+        conscious-info memories, then mark them processed
+
+        Args:
+            db_manager: Database manager instance
+            user_id: User identifier for multi-tenant isolation
+            memory_ids: Newly stored long-term memory IDs
+
+        Returns:
+            Number of memories copied
+        """
+        try:
+            memories = await self._get_unprocessed_conscious_memories(
+                db_manager, user_id, memory_ids
+            )
+            if not memories:
+                return 0
+
+            copied_count = 0
+            for memory_data in memories:
+                if await self._copy_memory_to_short_term(
+                    db_manager, user_id, memory_data
+                ):
+                    copied_count += 1
+
+            if self._detect_database_type(db_manager) == "mongodb":
+                promoted_ids = [mem.get("memory_id") for mem in memories]
+            else:
+                promoted_ids = [row[0] for row in memories]
+            await self._mark_memories_processed(db_manager, promoted_ids, user_id)
+
+            logger.info(
+                f"ConsciouscAgent: Promoted {copied_count} conscious-info memories to short-term memory"
+            )
+            return copied_count
+
+        except Exception as e:
+            logger.error(f"ConsciouscAgent: Promotion failed for {memory_ids}: {e}")
+            return 0
+
     async def _get_conscious_memories(self, db_manager, user_id: str) -> list:
         """Get all conscious-info labeled memories from long-term memory (database-agnostic)"""
         try:
@@ -266,17 +407,10 @@ class ConsciouscAgent:
                 return memories
             else:
                 # Use SQL method
-                from sqlalchemy import text
-
                 with db_manager._get_connection() as connection:
-                    cursor = connection.execute(
-                        text(
-                            """SELECT memory_id, processed_data, summary, searchable_content,
-                                  importance_score, created_at
-                           FROM long_term_memory
-                           WHERE user_id = :user_id AND classification = 'conscious-info'
-                           ORDER BY importance_score DESC, created_at DESC"""
-                        ),
+                    cursor = STATEMENTS.execute(
+                        connection,
+                        "conscious.long_term_memories",
                         {"user_id": user_id},
                     )
                     return cursor.fetchall()
@@ -286,33 +420,36 @@ class ConsciouscAgent:
             return []
 
     async def _get_unprocessed_conscious_memories(
-        self, db_manager, user_id: str
+        self, db_manager, user_id: str, memory_ids: list[str] | None = None
     ) -> list:
-        """Get unprocessed conscious-info labeled memories from long-term memory (database-agnostic)"""
+        """Get unprocessed conscious-info labeled memories from long-term memory (database-agnostic)
+
+        Args:
+            memory_ids: Restrict the lookup to these memories (promotion events)
+        """
         try:
             db_type = self._detect_database_type(db_manager)
 
             if db_type == "mongodb":
                 # Use MongoDB-specific method
-                memories = db_manager.get_unprocessed_conscious_memories(
-                    user_id=user_id
+                return db_manager.get_unprocessed_conscious_memories(
+                    user_id=user_id, memory_ids=memory_ids
                 )
-                return memories
             else:
                 # Use SQL method
-                from sqlalchemy import text
+                params = {"user_id": user_id, "conscious_processed": False}
+                if memory_ids is not None:
+                    if not memory_ids:
+                        return []
+                    params["memory_ids"] = list(memory_ids)
 
                 with db_manager._get_connection() as connection:
-                    cursor = connection.execute(
-                        text(
-                            """SELECT memory_id, processed_data, summary, searchable_content,
-                                  importance_score, created_at
-                           FROM long_term_memory
-                           WHERE user_id = :user_id AND classification = 'conscious-info'
-                           AND conscious_processed = :conscious_processed
-                           ORDER BY importance_score DESC, created_at DESC"""
-                        ),
-                        {"user_id": user_id, "conscious_processed": False},
+                    cursor = STATEMENTS.execute(
+                        connection,
+                        "conscious.long_term_memories",
+                        params,
+                        unprocessed=True,
+                        by_id=memory_ids is not None,
                     )
                     return cursor.fetchall()
 
@@ -361,18 +498,11 @@ class ConsciouscAgent:
                 _,
             ) = memory_row
 
-            from sqlalchemy import text
-
             with db_manager._get_connection() as connection:
                 # Check if similar content already exists in short-term memory
-                existing_check = connection.execute(
-                    text(
-                        """SELECT COUNT(*) FROM short_term_memory
-                           WHERE user_id = :user_id
-                           AND category_primary = 'conscious_context'
-                           AND (searchable_content = :searchable_content
-                                OR summary = :summary)"""
-                    ),
+                existing_check = STATEMENTS.execute(
+                    connection,
+                    "conscious.count_short_term_duplicates",
                     {
                         "user_id": user_id,
                         "searchable_content": searchable_content,
@@ -392,42 +522,15 @@ class ConsciouscAgent:
                     f"conscious_{memory_id}_{int(datetime.now().timestamp())}"
                 )
 
-                # Use database utilities for type detection and JSON handling
-                from memori.utils.database import (
-                    detect_database_type,
-                    get_insert_statement,
-                    serialize_json_for_db,
-                )
-
-                db_type = detect_database_type(connection)
-                processed_data_json = serialize_json_for_db(processed_data, db_type)
-
-                # Build database-agnostic INSERT statement with proper JSON casting
-                columns = [
-                    "memory_id",
-                    "processed_data",
-                    "importance_score",
-                    "category_primary",
-                    "retention_type",
-                    "user_id",
-                    "session_id",
-                    "created_at",
-                    "expires_at",
-                    "searchable_content",
-                    "summary",
-                    "is_permanent_context",
-                ]
+                # Use database utilities for JSON handling
+                from memori.utils.database import serialize_json_for_db
 
-                insert_stmt = get_insert_statement(
-                    "short_term_memory",
-                    columns,
-                    db_type,
-                    json_columns=["processed_data"],
-                )
+                processed_data_json = serialize_json_for_db(processed_data)
 
-                # Execute INSERT with proper parameters
-                connection.execute(
-                    text(insert_stmt),
+                # Dialect-specific INSERT (JSON casting) from the statement registry
+                STATEMENTS.execute(
+                    connection,
+                    "conscious.insert_short_term",
                     {
                         "memory_id": short_term_id,
                         "processed_data": processed_data_json,
@@ -552,23 +655,20 @@ class ConsciouscAgent:
                 # Use MongoDB-specific method
                 db_manager.mark_conscious_memories_processed(memory_ids, user_id)
             else:
-                # Use SQL method
-                from sqlalchemy import text
-
+                # Use SQL method: one executemany for the whole batch
                 with db_manager._get_connection() as connection:
-                    for memory_id in memory_ids:
-                        connection.execute(
-                            text(
-                                """UPDATE long_term_memory
-                               SET conscious_processed = :conscious_processed
-                               WHERE memory_id = :memory_id AND user_id = :user_id"""
-                            ),
+                    STATEMENTS.execute(
+                        connection,
+                        "conscious.mark_processed",
+                        [
                             {
                                 "memory_id": memory_id,
                                 "user_id": user_id,
                                 "conscious_processed": True,
-                            },
-                        )
+                            }
+                            for memory_id in memory_ids
+                        ],
+                    )
                     connection.commit()
 
         except Exception as e:
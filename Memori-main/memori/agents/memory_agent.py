@@ -5,24 +5,33 @@ This agent processes conversations and extracts structured information with
 enhanced classification and conscious context detection.
 """
 
-import asyncio
 import json
 import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-import openai
 from loguru import logger
 
 if TYPE_CHECKING:
     from ..core.providers import ProviderConfig
+    from ..database.search_records import DedupCandidate
 
+from ..utils.exceptions import MemoriError
+from ..utils.llm_cache import llm_cache_key, load_cached_model, store_cached_model
+from ..utils.metrics import increment, span, timed
 from ..utils.pydantic_models import (
     ConversationContext,
     MemoryClassification,
     MemoryImportanceLevel,
     ProcessedLongTermMemory,
 )
+from ..utils.rate_limiter import acquire_rate_limit_async, provider_rate_limit_key
+from ..utils.resilience import (
+    RetryPolicy,
+    call_with_resilience_async,
+    get_circuit_breaker,
+    is_retryable_error,
+)
 
 
 class MemoryAgent:
@@ -30,6 +39,10 @@ class MemoryAgent:
     Async Memory Agent for processing conversations with enhanced classification
     """
 
+    # A structured-outputs failure falls back to JSON parsing; after this long
+    # one call probes structured outputs again
+    STRUCTURED_OUTPUTS_RETRY_SECONDS = 600.0
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -44,29 +57,83 @@ class MemoryAgent:
             model: Model to use for structured output (defaults to 'gpt-4o' if not specified)
             provider_config: Provider configuration for LLM client
         """
+        # Clients are built on first use: each one loads an SSL context, which
+        # dominates construction time and isn't needed until the first LLM call
+        self._api_key = api_key
+        self._client = None
+        self._async_client = None
         if provider_config:
-            # Use provider configuration to create clients
-            self.client = provider_config.create_client()
-            self.async_client = provider_config.create_async_client()
             # Use provided model, fallback to provider config model, then default to gpt-4o
             self.model = model or provider_config.model or "gpt-4o"
             logger.debug(f"Memory agent initialized with model: {self.model}")
             self.provider_config = provider_config
         else:
-            # Backward compatibility: use api_key directly with proper timeout and retries
-            self.client = openai.OpenAI(api_key=api_key, timeout=60.0, max_retries=2)
-            self.async_client = openai.AsyncOpenAI(
-                api_key=api_key, timeout=60.0, max_retries=2
-            )
             self.model = model or "gpt-4o"
             self.provider_config = None
 
-        # Determine if we're using a local/custom endpoint that might not support structured outputs
-        self._supports_structured_outputs = self._detect_structured_output_support()
+        # Whether the endpoint supports structured outputs; detected on first use
+        self._structured_outputs_supported: bool | None = None
+
+        # LLM calls share one token bucket and circuit breaker per upstream endpoint
+        self._rate_limit_key = provider_rate_limit_key(self.provider_config)
+        self._structured_outputs_breaker = get_circuit_breaker(
+            f"{self._rate_limit_key}:structured_outputs",
+            failure_threshold=1,
+            recovery_timeout=self.STRUCTURED_OUTPUTS_RETRY_SECONDS,
+        )
 
         # Database type detection for unified processing
         self._database_type = None
 
+    @property
+    def client(self):
+        """Sync LLM client (created on first access)"""
+        if self._client is None:
+            if self.provider_config:
+                self._client = self.provider_config.create_client()
+            else:
+                # Backward compatibility: use api_key directly with proper timeout and retries
+                import openai
+
+                self._client = openai.OpenAI(
+                    api_key=self._api_key, timeout=60.0, max_retries=2
+                )
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    @property
+    def async_client(self):
+        """Async LLM client (created on first access)"""
+        if self._async_client is None:
+            if self.provider_config:
+                self._async_client = self.provider_config.create_async_client()
+            else:
+                import openai
+
+                self._async_client = openai.AsyncOpenAI(
+                    api_key=self._api_key, timeout=60.0, max_retries=2
+                )
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, value):
+        self._async_client = value
+
+    @property
+    def _supports_structured_outputs(self) -> bool:
+        if self._structured_outputs_supported is None:
+            self._structured_outputs_supported = (
+                self._detect_structured_output_support()
+            )
+        return self._structured_outputs_supported
+
+    @_supports_structured_outputs.setter
+    def _supports_structured_outputs(self, value: bool):
+        self._structured_outputs_supported = value
+
     def _detect_database_type(self, db_manager):
         """Detect database type from db_manager"""
         if self._database_type is None:
@@ -147,43 +214,32 @@ Focus on extracting information that would genuinely help provide better context
 
     async def _retry_with_backoff(self, func, *args, max_retries=3, **kwargs):
         """
-        Retry a function with exponential backoff for connection errors
+        Call the provider with jittered backoff behind the endpoint's circuit breaker
 
         Args:
-            func: Async function to retry
-            max_retries: Maximum number of retry attempts (default: 3)
+            func: Async function to call
+            max_retries: Maximum number of attempts (default: 3)
             *args, **kwargs: Arguments to pass to func
 
         Returns:
             Result from func
 
         Raises:
+            CircuitOpenError: The endpoint's circuit is open; nothing was sent
             Exception: Re-raises the last exception if all retries are exhausted
         """
-        last_exception = None
-        for attempt in range(max_retries):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                error_msg = str(e).lower()
-                # Retry only on connection/timeout errors
-                if "connection" in error_msg or "timeout" in error_msg:
-                    if attempt < max_retries - 1:
-                        wait_time = (2**attempt) * 0.5  # 0.5s, 1s, 2s
-                        logger.debug(
-                            f"Connection error (attempt {attempt + 1}/{max_retries}), "
-                            f"retrying in {wait_time}s: {e}"
-                        )
-                        await asyncio.sleep(wait_time)
-                        continue
-                # Re-raise if not a retryable error or max retries reached
-                raise
-        # If all retries exhausted with connection errors, raise the last exception
-        if last_exception:
-            raise last_exception
-        return None
+        with span("agent.llm", agent="memory_agent", model=self.model):
+            return await call_with_resilience_async(
+                lambda: func(*args, **kwargs),
+                breaker_key=self._rate_limit_key,
+                policy=RetryPolicy(max_attempts=max_retries),
+                # Background ingestion queues for a token instead of risking a 429
+                before_attempt=lambda: acquire_rate_limit_async(
+                    "llm", self._rate_limit_key
+                ),
+            )
 
+    @timed("agent.process_conversation")
     async def process_conversation_async(
         self,
         chat_id: str,
@@ -232,26 +288,47 @@ CONVERSATION CONTEXT:
 - Topic Thread: {context.topic_thread or 'General conversation'}
 """
 
-            # Try structured outputs first, fall back to manual parsing
-            processed_memory = None
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
+                },
+            ]
+
+            # Replays and re-sent turns reuse the persisted extraction
+            llm_key = llm_cache_key(
+                self.model,
+                messages,
+                ProcessedLongTermMemory,
+                0.1,
+                self._rate_limit_key,
+            )
+            processed_memory = load_cached_model(llm_key, ProcessedLongTermMemory)
+            if processed_memory is not None:
+                logger.debug(f"[AGENT] Using cached extraction for {chat_id[:8]}...")
+                processed_memory.session_id = (
+                    context.session_id if context else "default"
+                )
+                processed_memory.extraction_timestamp = datetime.now()
 
-            if self._supports_structured_outputs:
+            # Try structured outputs first, fall back to manual parsing
+            if (
+                processed_memory is None
+                and self._supports_structured_outputs
+                and self._structured_outputs_breaker.allow_request()
+            ):
                 try:
                     # Call OpenAI Structured Outputs (async) with retry logic
                     completion = await self._retry_with_backoff(
                         lambda: self.async_client.beta.chat.completions.parse(
                             model=self.model,
-                            messages=[
-                                {"role": "system", "content": system_prompt},
-                                {
-                                    "role": "user",
-                                    "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
-                                },
-                            ],
+                            messages=messages,
                             response_format=ProcessedLongTermMemory,
                             temperature=0.1,  # Low temperature for consistent processing
                         )
                     )
+                    self._structured_outputs_breaker.record_success()
 
                     # Handle potential refusal
                     if completion.choices[0].message.refusal:
@@ -268,20 +345,32 @@ CONVERSATION CONTEXT:
                         context.session_id if context else "default"
                     )
                     processed_memory.extraction_timestamp = datetime.now()
+                    store_cached_model(
+                        llm_key, "memory_processing", self.model, processed_memory
+                    )
 
                 except Exception as e:
+                    if isinstance(e, MemoriError) or is_retryable_error(e):
+                        # Provider outage, open circuit or rate limit: not a
+                        # verdict on structured outputs, and the fallback would
+                        # hit the same endpoint
+                        self._structured_outputs_breaker.release_probe()
+                        raise
                     logger.warning(
                         f"Structured outputs failed for {chat_id}, falling back to manual parsing: {e}"
                     )
-                    self._supports_structured_outputs = (
-                        False  # Disable for future calls
-                    )
+                    # Re-probed after STRUCTURED_OUTPUTS_RETRY_SECONDS
+                    self._structured_outputs_breaker.record_failure()
                     processed_memory = None
 
             # Fallback to manual parsing if structured outputs failed or not supported
             if processed_memory is None:
                 processed_memory = await self._process_with_fallback_parsing(
-                    chat_id, system_prompt, conversation_text, context_info
+                    chat_id,
+                    system_prompt,
+                    conversation_text,
+                    context_info,
+                    cache_key=llm_key,
                 )
 
             logger.debug(
@@ -323,7 +412,7 @@ CONVERSATION CONTEXT:
     async def detect_duplicates(
         self,
         new_memory: ProcessedLongTermMemory,
-        existing_memories: list[ProcessedLongTermMemory],
+        existing_memories: list["DedupCandidate | ProcessedLongTermMemory"],
         similarity_threshold: float = 0.92,  # Increased from 0.8 to reduce false positives
     ) -> str | None:
         """
@@ -331,7 +420,9 @@ CONVERSATION CONTEXT:
 
         Args:
             new_memory: New memory to check
-            existing_memories: List of existing memories to compare against
+            existing_memories: Existing memories to compare against, normally
+                DedupCandidates. ProcessedLongTermMemory objects are still
+                accepted, with the memory ID in session_id
             similarity_threshold: Threshold for considering memories similar (default: 0.92)
 
         Returns:
@@ -351,6 +442,7 @@ CONVERSATION CONTEXT:
         new_summary = new_memory.summary.lower().strip()
 
         for existing in existing_memories:
+            memory_id = getattr(existing, "memory_id", None) or existing.session_id
             existing_content = existing.content.lower().strip()
             existing_summary = existing.summary.lower().strip()
 
@@ -368,7 +460,7 @@ CONVERSATION CONTEXT:
             if avg_similarity >= similarity_threshold:
                 # FIX #4: Improved logging with details
                 logger.info(
-                    f"[AGENT] Duplicate detected - {avg_similarity:.2f} similarity with {existing.session_id[:8]}..."
+                    f"[AGENT] Duplicate detected - {avg_similarity:.2f} similarity with {memory_id[:8]}..."
                 )
                 logger.debug(
                     f"[AGENT] Duplicate match details:\n"
@@ -376,7 +468,7 @@ CONVERSATION CONTEXT:
                     f"  Existing content: '{existing_content[:80]}...'\n"
                     f"  Content similarity: {content_similarity:.2f}, Summary similarity: {summary_similarity:.2f}"
                 )
-                return existing.session_id
+                return memory_id
 
         return None
 
@@ -456,13 +548,16 @@ CONVERSATION CONTEXT:
         system_prompt: str,
         conversation_text: str,
         context_info: str,
+        cache_key: str | None = None,
     ) -> ProcessedLongTermMemory:
         """
         Process conversation using regular chat completions with manual JSON parsing
 
         This method works with any OpenAI-compatible API that supports chat completions
         but doesn't support structured outputs (like Ollama, local models, etc.)
+        A successfully parsed memory is stored under ``cache_key`` when given.
         """
+        increment("agent.fallback", agent="memory_agent", reason="json_parsing")
         try:
             # Enhanced system prompt for JSON output - optimized for Gemini
             json_system_prompt = (
@@ -561,6 +656,10 @@ CONVERSATION CONTEXT:
 
             # Convert to ProcessedLongTermMemory object with validation and defaults
             processed_memory = self._create_memory_from_dict(parsed_data, chat_id)
+            if cache_key:
+                store_cached_model(
+                    cache_key, "memory_processing", self.model, processed_memory
+                )
 
             logger.debug(
                 f"Successfully parsed memory using fallback method for {chat_id}"
@@ -3,20 +3,31 @@ Memory Search Engine - Intelligent memory retrieval using Pydantic models
 """
 
 import asyncio
+import contextvars
 import json
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-import openai
 from loguru import logger
 
 if TYPE_CHECKING:
     from ..core.providers import ProviderConfig
 
+from ..utils.exceptions import CircuitOpenError, MemoriError
+from ..utils.llm_cache import llm_cache_key, load_cached_model, store_cached_model
+from ..utils.metrics import increment, span, timed
 from ..utils.pydantic_models import MemorySearchQuery
+from ..utils.rate_limiter import acquire_rate_limit, provider_rate_limit_key
+from ..utils.resilience import (
+    RetryPolicy,
+    call_with_resilience,
+    get_circuit_breaker,
+    is_retryable_error,
+)
 
 
 class MemorySearchEngine:
@@ -57,6 +68,21 @@ Your primary functions:
 
 Be strategic and comprehensive in your search planning."""
 
+    # Reciprocal-rank fusion constant; dampens the weight of top ranks
+    RRF_K = 60
+    MAX_PARALLEL_STRATEGIES = 4
+
+    # Planning is on the request path: wait briefly for an LLM token, then
+    # fall back to the heuristic plan instead of queueing
+    LLM_RATE_LIMIT_WAIT_SECONDS = 1.0
+
+    # One quick retry at most: a slow plan costs more than the heuristic one
+    PLANNING_RETRY_POLICY = RetryPolicy(max_attempts=2, base_delay=0.25, max_delay=1.0)
+
+    # A structured-outputs failure falls back to JSON parsing; after this long
+    # one call probes structured outputs again
+    STRUCTURED_OUTPUTS_RETRY_SECONDS = 600.0
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -71,21 +97,29 @@ Be strategic and comprehensive in your search planning."""
             model: Model to use for query understanding (defaults to 'gpt-4o' if not specified)
             provider_config: Provider configuration for LLM client
         """
+        # The client is built on first use (it loads an SSL context)
+        self._api_key = api_key
+        self._client = None
         if provider_config:
-            # Use provider configuration to create client
-            self.client = provider_config.create_client()
             # Use provided model, fallback to provider config model, then default to gpt-4o
             self.model = model or provider_config.model or "gpt-4o"
             logger.debug(f"Search engine initialized with model: {self.model}")
             self.provider_config = provider_config
         else:
-            # Backward compatibility: use api_key directly with proper timeout and retries
-            self.client = openai.OpenAI(api_key=api_key, timeout=60.0, max_retries=2)
             self.model = model or "gpt-4o"
             self.provider_config = None
 
-        # Determine if we're using a local/custom endpoint that might not support structured outputs
-        self._supports_structured_outputs = self._detect_structured_output_support()
+        # Whether the endpoint supports structured outputs; detected (for Azure,
+        # probed over the network) on first use rather than at construction
+        self._structured_outputs_supported: bool | None = None
+
+        # LLM calls share one token bucket and circuit breaker per upstream endpoint
+        self._rate_limit_key = provider_rate_limit_key(self.provider_config)
+        self._structured_outputs_breaker = get_circuit_breaker(
+            f"{self._rate_limit_key}:structured_outputs",
+            failure_threshold=1,
+            recovery_timeout=self.STRUCTURED_OUTPUTS_RETRY_SECONDS,
+        )
 
         # Performance improvements
         self._query_cache = {}  # Cache for search plans
@@ -94,10 +128,46 @@ Be strategic and comprehensive in your search planning."""
 
         # Background processing
         self._background_executor = None
+        self._strategy_executor = None  # created on first parallel search
+
+        # Per-strategy latency/hit counters (see get_strategy_metrics)
+        self._strategy_metrics: dict[str, dict[str, float]] = {}
+        self._metrics_lock = threading.Lock()
 
         # Database type detection for unified search
         self._database_type = None
 
+    @property
+    def client(self):
+        """Sync LLM client (created on first access)"""
+        if self._client is None:
+            if self.provider_config:
+                self._client = self.provider_config.create_client()
+            else:
+                # Backward compatibility: use api_key directly with proper timeout and retries
+                import openai
+
+                self._client = openai.OpenAI(
+                    api_key=self._api_key, timeout=60.0, max_retries=2
+                )
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    @property
+    def _supports_structured_outputs(self) -> bool:
+        if self._structured_outputs_supported is None:
+            self._structured_outputs_supported = (
+                self._detect_structured_output_support()
+            )
+        return self._structured_outputs_supported
+
+    @_supports_structured_outputs.setter
+    def _supports_structured_outputs(self, value: bool):
+        self._structured_outputs_supported = value
+
     def _detect_database_type(self, db_manager):
         """Detect database type from db_manager"""
         if self._database_type is None:
@@ -107,6 +177,7 @@ Be strategic and comprehensive in your search planning."""
             )
         return self._database_type
 
+    @timed("agent.plan_search")
     def plan_search(self, query: str, context: str | None = None) -> MemorySearchQuery:
         """
         Plan search strategy for a user query using OpenAI Structured Outputs with caching
@@ -135,24 +206,39 @@ Be strategic and comprehensive in your search planning."""
             if context:
                 prompt += f"\nAdditional context: {context}"
 
-            # Try structured outputs first, fall back to manual parsing
-            search_query = None
+            messages = [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": prompt,
+                },
+            ]
 
-            if self._supports_structured_outputs:
+            # Persistent cache shared with other processes and restarts
+            llm_key = llm_cache_key(
+                self.model, messages, MemorySearchQuery, 0.1, self._rate_limit_key
+            )
+            search_query = load_cached_model(llm_key, MemorySearchQuery)
+            if search_query is not None:
+                logger.debug(f"Using persisted search plan for: {query}")
+
+            # Try structured outputs first, fall back to manual parsing
+            if (
+                search_query is None
+                and self._supports_structured_outputs
+                and self._structured_outputs_breaker.allow_request()
+            ):
                 try:
                     # Call OpenAI Structured Outputs
-                    completion = self.client.beta.chat.completions.parse(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": self.SYSTEM_PROMPT},
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            },
-                        ],
-                        response_format=MemorySearchQuery,
-                        temperature=0.1,
+                    completion = self._call_llm(
+                        lambda: self.client.beta.chat.completions.parse(
+                            model=self.model,
+                            messages=messages,
+                            response_format=MemorySearchQuery,
+                            temperature=0.1,
+                        )
                     )
+                    self._structured_outputs_breaker.record_success()
 
                     # Handle potential refusal
                     if completion.choices[0].message.refusal:
@@ -162,19 +248,29 @@ Be strategic and comprehensive in your search planning."""
                         return self._create_fallback_query(query)
 
                     search_query = completion.choices[0].message.parsed
+                    if search_query is not None:
+                        store_cached_model(
+                            llm_key, "plan_search", self.model, search_query
+                        )
 
                 except Exception as e:
+                    if isinstance(e, MemoriError) or is_retryable_error(e):
+                        # Rate limit, open circuit or outage: not a verdict on
+                        # structured outputs; use the uncached heuristic plan
+                        self._structured_outputs_breaker.release_probe()
+                        raise
                     logger.warning(
                         f"Structured outputs failed for search planning, falling back to manual parsing: {e}"
                     )
-                    self._supports_structured_outputs = (
-                        False  # Disable for future calls
-                    )
+                    # Re-probed after STRUCTURED_OUTPUTS_RETRY_SECONDS
+                    self._structured_outputs_breaker.record_failure()
                     search_query = None
 
             # Fallback to manual parsing if structured outputs failed or not supported
             if search_query is None:
-                search_query = self._plan_search_with_fallback_parsing(query)
+                search_query = self._plan_search_with_fallback_parsing(
+                    query, cache_key=llm_key
+                )
 
             # Cache the result
             with self._cache_lock:
@@ -187,6 +283,9 @@ Be strategic and comprehensive in your search planning."""
             )
             return search_query
 
+        except CircuitOpenError as e:
+            logger.debug(f"Search planning skipped, provider unavailable: {e}")
+            return self._create_fallback_query(query)
         except Exception as e:
             logger.error(f"Search planning failed: {e}")
             return self._create_fallback_query(query)
@@ -201,10 +300,12 @@ Be strategic and comprehensive in your search planning."""
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """
-        Execute intelligent search using planned strategies (SESSION-OPTIMIZED)
+        Execute intelligent search using planned strategies (PARALLEL, RRF-FUSED)
 
-        This method now uses a SINGLE database session for all search operations,
-        reducing connection pool pressure by 75% and improving latency by 35-45%.
+        Every planned strategy (primary, keyword, category, importance) runs
+        concurrently on its own pooled session, so a multi-strategy search costs
+        roughly the latency of its slowest query. Candidate lists are merged with
+        reciprocal-rank fusion into a single ``search_score``.
 
         Args:
             query: User's search query
@@ -217,210 +318,347 @@ Be strategic and comprehensive in your search planning."""
         Returns:
             List of relevant memory items with search metadata
         """
-        # Session and search service must be explicitly managed
-        session = None
-        search_service = None
-
         try:
-            # Detect database type for optimal search strategy
-            db_type = self._detect_database_type(db_manager)
-
-            # Plan the search
-            search_plan = self.plan_search(query)
-            logger.debug(
-                f"Search plan for '{query}': strategies={search_plan.search_strategy}, "
-                f"entities={search_plan.entity_filters}, db_type={db_type}"
+            db_type, search_plan, strategies = self._prepare_search(query, db_manager)
+            strategy_results = self._run_strategies(
+                strategies,
+                search_plan,
+                db_manager,
+                db_type,
+                user_id,
+                assistant_id,
+                session_id,
+                limit,
+            )
+            return self._finish_search(
+                query, search_plan, strategies, strategy_results, limit
             )
 
-            all_results = []
-            seen_memory_ids = set()
+        except Exception as e:
+            logger.error(f"Search execution failed: {e}")
+            return []
 
-            # OPTIMIZATION: Create ONE session for entire search operation
-            from ..database.search_service import SearchService
+    def _prepare_search(
+        self, query: str, db_manager
+    ) -> tuple[str, MemorySearchQuery, list[tuple[str, Any, str, str]]]:
+        """Plan a search: (database type, search plan, strategies to run)"""
+        # Detect database type for optimal search strategy
+        db_type = self._detect_database_type(db_manager)
 
-            session = db_manager.SessionLocal()
-            search_service = SearchService(session, db_type)
-            logger.debug(
-                "Created single SearchService instance for request (session-optimized)"
-            )
+        # Plan the search
+        search_plan = self.plan_search(query)
+        logger.debug(
+            f"Search plan for '{query}': strategies={search_plan.search_strategy}, "
+            f"entities={search_plan.entity_filters}, db_type={db_type}"
+        )
 
-            # PRIMARY SEARCH: Use the session we just created
-            try:
-                primary_results = search_service.search_memories(
-                    query=search_plan.query_text or query,
-                    user_id=user_id,
-                    assistant_id=assistant_id,
-                    session_id=session_id,
-                    limit=limit,
-                )
-                logger.debug(f"Primary search returned {len(primary_results)} results")
-            except Exception as e:
-                logger.error(f"Primary search failed: {e}")
-                primary_results = []
-
-            # Process primary results
-            for result in primary_results:
-                if (
-                    isinstance(result, dict)
-                    and result.get("memory_id") not in seen_memory_ids
-                ):
-                    seen_memory_ids.add(result["memory_id"])
-                    result["search_strategy"] = f"{db_type}_unified_search"
-                    result["search_reasoning"] = f"Direct {db_type} database search"
-                    all_results.append(result)
-
-            # KEYWORD SEARCH: Reuse same session
-            if len(all_results) < limit and search_plan.entity_filters:
-                logger.debug(
-                    f"Adding targeted keyword search for: {search_plan.entity_filters}"
-                )
-                keyword_results = self._execute_keyword_search_with_session(
-                    search_plan,
-                    search_service,
-                    user_id,
-                    assistant_id,
-                    session_id,
-                    limit - len(all_results),
-                )
+        if not search_plan.query_text:
+            # Don't mutate the cached plan
+            search_plan = search_plan.model_copy(update={"query_text": query})
 
-                for result in keyword_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "keyword_search"
-                        result["search_reasoning"] = (
-                            f"Keyword match for: {', '.join(search_plan.entity_filters)}"
-                        )
-                        all_results.append(result)
+        return db_type, search_plan, self._plan_strategies(search_plan, db_type)
 
-            # CATEGORY SEARCH: Reuse same session
-            if len(all_results) < limit and (
-                search_plan.category_filters
-                or "category_filter" in search_plan.search_strategy
-            ):
-                logger.debug(
-                    f"Adding category search for: {[c.value for c in search_plan.category_filters]}"
+    def _finish_search(
+        self,
+        query: str,
+        search_plan: MemorySearchQuery,
+        strategies: list[tuple[str, Any, str, str]],
+        strategy_results: dict[str, list[dict[str, Any]]],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Fuse strategy results and tag them with search metadata"""
+        all_results = self._fuse_strategy_results(strategies, strategy_results)
+
+        # Add search metadata
+        for result in all_results:
+            result["search_metadata"] = {
+                "original_query": query,
+                "interpreted_intent": search_plan.intent,
+                "search_timestamp": datetime.now().isoformat(),
+            }
+
+        logger.debug(f"Search executed for '{query}': {len(all_results)} results found")
+        return all_results[:limit]
+
+    def _plan_strategies(
+        self, search_plan: MemorySearchQuery, db_type: str
+    ) -> list[tuple[str, Any, str, str]]:
+        """
+        Pick the strategies to run for a plan
+
+        Returns:
+            (name, runner, search_strategy label, search_reasoning) tuples, primary first
+        """
+        strategies = [
+            (
+                "primary",
+                self._execute_primary_search_with_session,
+                f"{db_type}_unified_search",
+                f"Direct {db_type} database search",
+            )
+        ]
+        if search_plan.entity_filters:
+            strategies.append(
+                (
+                    "keyword",
+                    self._execute_keyword_search_with_session,
+                    "keyword_search",
+                    f"Keyword match for: {', '.join(search_plan.entity_filters)}",
                 )
-                category_results = self._execute_category_search_with_session(
-                    search_plan,
-                    search_service,
-                    user_id,
-                    assistant_id,
-                    session_id,
-                    limit - len(all_results),
+            )
+        if (
+            search_plan.category_filters
+            or "category_filter" in search_plan.search_strategy
+        ):
+            strategies.append(
+                (
+                    "category",
+                    self._execute_category_search_with_session,
+                    "category_filter",
+                    f"Category match: {', '.join([c.value for c in search_plan.category_filters])}",
                 )
+            )
+        if (
+            search_plan.min_importance > 0.0
+            or "importance_filter" in search_plan.search_strategy
+        ):
+            strategies.append(
+                (
+                    "importance",
+                    self._execute_importance_search_with_session,
+                    "importance_filter",
+                    f"High importance (≥{search_plan.min_importance})",
+                )
+            )
+        return strategies
 
-                for result in category_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "category_filter"
-                        result["search_reasoning"] = (
-                            f"Category match: {', '.join([c.value for c in search_plan.category_filters])}"
-                        )
-                        all_results.append(result)
+    def _run_strategies(
+        self,
+        strategies: list[tuple[str, Any, str, str]],
+        search_plan: MemorySearchQuery,
+        db_manager,
+        db_type: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str | None,
+        limit: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Run each strategy on its own session, concurrently when the pool allows it"""
+        from ..database.read_scope import scoped_search_session
+        from ..database.search_service import SearchService
+
+        # Searches are read-only, so use the replica session factory when present
+        session_factory = (
+            getattr(db_manager, "ReadSessionLocal", None) or db_manager.SessionLocal
+        )
 
-            # IMPORTANCE SEARCH: Reuse same session
-            if len(all_results) < limit and (
-                search_plan.min_importance > 0.0
-                or "importance_filter" in search_plan.search_strategy
-            ):
-                logger.debug(
-                    f"Adding importance search with min_importance: {search_plan.min_importance}"
-                )
-                importance_results = self._execute_importance_search_with_session(
-                    search_plan,
-                    search_service,
-                    user_id,
-                    assistant_id,
-                    session_id,
-                    limit - len(all_results),
-                )
+        def run(strategy) -> list[dict[str, Any]]:
+            name, runner = strategy[0], strategy[1]
+            started = time.perf_counter()
+            results: list[dict[str, Any]] = []
+            failed = False
+            # Inline strategies reuse the request's read scope; workers can't
+            borrowed = scoped_search_session(db_manager)
+            session = borrowed or session_factory()
+            try:
+                search_service = SearchService(session, db_type)
+                with span("retrieval.strategy", strategy=name):
+                    results = runner(
+                        search_plan,
+                        search_service,
+                        user_id,
+                        assistant_id,
+                        session_id,
+                        limit,
+                    )
+                results = [r for r in results or [] if isinstance(r, dict)]
+            except Exception as e:
+                failed = True
+                logger.error(f"{name.capitalize()} search failed: {e}")
+            finally:
+                # CRITICAL: Ensure session cleanup even if exceptions occur
+                try:
+                    if borrowed is None:
+                        session.close()
+                except Exception as cleanup_error:
+                    logger.warning(f"Error closing search session: {cleanup_error}")
+            self._record_strategy_metric(
+                name, (time.perf_counter() - started) * 1000, len(results), failed
+            )
+            return results
 
-                for result in importance_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "importance_filter"
-                        result["search_reasoning"] = (
-                            f"High importance (≥{search_plan.min_importance})"
-                        )
-                        all_results.append(result)
+        if len(strategies) > 1 and self._supports_parallel_sessions(db_manager):
+            executor = self._get_strategy_executor()
+            # Each worker runs in a copy of this context so its spans nest here
+            futures = {
+                s[0]: executor.submit(contextvars.copy_context().run, run, s)
+                for s in strategies
+            }
+            return {name: future.result() for name, future in futures.items()}
 
-            # Filter out any non-dictionary results before processing
-            valid_results = []
-            for result in all_results:
-                if isinstance(result, dict):
-                    valid_results.append(result)
-                else:
-                    logger.warning(
-                        f"Filtering out non-dict search result: {type(result)}"
+        return {s[0]: run(s) for s in strategies}
+
+    async def _run_strategies_async(
+        self,
+        strategies: list[tuple[str, Any, str, str]],
+        search_plan: MemorySearchQuery,
+        db_manager,
+        db_type: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str | None,
+        limit: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Run each strategy on its own async session, concurrently on this loop"""
+        from ..database.search_records import hydrate_processed_data
+        from ..database.search_service import SearchService
+
+        def search(session, runner) -> list[dict[str, Any]]:
+            results = runner(
+                search_plan,
+                SearchService(session, db_type),
+                user_id,
+                assistant_id,
+                session_id,
+                limit,
+            )
+            # processed_data can only be loaded while run_sync is active
+            hydrate_processed_data(results or [])
+            return results
+
+        async def run(strategy) -> list[dict[str, Any]]:
+            name, runner = strategy[0], strategy[1]
+            started = time.perf_counter()
+            results: list[dict[str, Any]] = []
+            failed = False
+            try:
+                with span("retrieval.strategy", strategy=name):
+                    results = await db_manager.run_in_async_session(
+                        search, runner, read=True
                     )
+                results = [r for r in results or [] if isinstance(r, dict)]
+            except Exception as e:
+                failed = True
+                logger.error(f"{name.capitalize()} search failed: {e}")
+            self._record_strategy_metric(
+                name, (time.perf_counter() - started) * 1000, len(results), failed
+            )
+            return results
 
-            all_results = valid_results
+        results = await asyncio.gather(*(run(s) for s in strategies))
+        return {s[0]: r for s, r in zip(strategies, results, strict=True)}
 
-            # Sort by relevance (importance score + recency)
-            if all_results:
+    @staticmethod
+    def _supports_parallel_sessions(db_manager) -> bool:
+        """A StaticPool (in-memory SQLite) shares one connection, so it can't fan out"""
+        from sqlalchemy.pool import StaticPool
 
-                def safe_created_at_parse(created_at_value):
-                    """Safely parse created_at value to datetime"""
-                    try:
-                        if created_at_value is None:
-                            return datetime.fromisoformat("2000-01-01")
-                        if isinstance(created_at_value, str):
-                            return datetime.fromisoformat(created_at_value)
-                        if hasattr(created_at_value, "isoformat"):  # datetime object
-                            return created_at_value
-                        # Fallback for any other type
-                        return datetime.fromisoformat("2000-01-01")
-                    except (ValueError, TypeError):
-                        return datetime.fromisoformat("2000-01-01")
-
-                all_results.sort(
-                    key=lambda x: (
-                        x.get("importance_score", 0) * 0.7  # Importance weight
-                        + (
-                            datetime.now().replace(tzinfo=None)  # Ensure timezone-naive
-                            - safe_created_at_parse(x.get("created_at")).replace(
-                                tzinfo=None
-                            )
-                        ).days
-                        * -0.001  # Recency weight
-                    ),
-                    reverse=True,
+        engine = getattr(db_manager, "read_engine", None) or getattr(
+            db_manager, "engine", None
+        )
+        pool = getattr(engine, "pool", None)
+        return pool is not None and not isinstance(pool, StaticPool)
+
+    def _get_strategy_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used to run strategies concurrently"""
+        with self._cache_lock:
+            if self._strategy_executor is None:
+                self._strategy_executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_PARALLEL_STRATEGIES,
+                    thread_name_prefix="memori-search",
                 )
+            return self._strategy_executor
 
-                # Add search metadata
-                for result in all_results:
-                    result["search_metadata"] = {
-                        "original_query": query,
-                        "interpreted_intent": search_plan.intent,
-                        "search_timestamp": datetime.now().isoformat(),
-                    }
+    def _fuse_strategy_results(
+        self,
+        strategies: list[tuple[str, Any, str, str]],
+        strategy_results: dict[str, list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """
+        Merge per-strategy candidate lists with reciprocal-rank fusion
 
-            logger.debug(
-                f"Search executed for '{query}': {len(all_results)} results found"
-            )
-            return all_results[:limit]
+        score(memory) = sum over strategies of 1 / (RRF_K + rank). Each memory
+        keeps the strategy label under which it ranked best; ties fall back to
+        importance.
+        """
+        fused: dict[str, dict[str, Any]] = {}
+        scores: dict[str, float] = {}
+        best_rank: dict[str, int] = {}
+
+        for name, _runner, label, reasoning in strategies:
+            for rank, result in enumerate(strategy_results.get(name, []), start=1):
+                memory_id = result.get("memory_id")
+                if memory_id is None:
+                    continue
+                scores[memory_id] = scores.get(memory_id, 0.0) + 1.0 / (
+                    self.RRF_K + rank
+                )
+                if memory_id not in fused:
+                    fused[memory_id] = result
+                    fused[memory_id]["matched_strategies"] = []
+                fused[memory_id]["matched_strategies"].append(name)
+                if rank < best_rank.get(memory_id, rank + 1):
+                    best_rank[memory_id] = rank
+                    fused[memory_id]["search_strategy"] = label
+                    fused[memory_id]["search_reasoning"] = reasoning
+
+        for memory_id, result in fused.items():
+            result["search_score"] = scores[memory_id]
+
+        return sorted(
+            fused.values(),
+            key=lambda r: (r["search_score"], r.get("importance_score") or 0.0),
+            reverse=True,
+        )
 
-        except Exception as e:
-            logger.error(f"Search execution failed: {e}")
-            return []
+    def _record_strategy_metric(
+        self, name: str, elapsed_ms: float, hits: int, failed: bool
+    ):
+        """Accumulate latency/hit counters for one strategy run"""
+        with self._metrics_lock:
+            metric = self._strategy_metrics.setdefault(
+                name,
+                {"calls": 0, "hits": 0, "errors": 0, "total_ms": 0.0, "last_ms": 0.0},
+            )
+            metric["calls"] += 1
+            metric["hits"] += hits
+            metric["errors"] += int(failed)
+            metric["total_ms"] += elapsed_ms
+            metric["last_ms"] = elapsed_ms
+        logger.debug(f"Search strategy '{name}': {hits} hits in {elapsed_ms:.1f}ms")
+
+    def get_strategy_metrics(self) -> dict[str, dict[str, float]]:
+        """
+        Per-strategy latency and hit counters since this engine was created
 
-        finally:
-            # CRITICAL: Ensure session cleanup even if exceptions occur
-            if session:
-                try:
-                    session.close()
-                    logger.debug("Closed search session (session-optimized)")
-                except Exception as cleanup_error:
-                    logger.warning(f"Error closing search session: {cleanup_error}")
+        Returns:
+            {strategy: {calls, hits, errors, total_ms, last_ms, avg_ms, avg_hits}}
+        """
+        with self._metrics_lock:
+            metrics = {name: dict(m) for name, m in self._strategy_metrics.items()}
+        for metric in metrics.values():
+            calls = metric["calls"] or 1
+            metric["avg_ms"] = metric["total_ms"] / calls
+            metric["avg_hits"] = metric["hits"] / calls
+        return metrics
+
+    def _execute_primary_search_with_session(
+        self,
+        search_plan: MemorySearchQuery,
+        search_service,
+        user_id: str,
+        assistant_id: str = None,
+        session_id: str = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Full-text search on the planned query text"""
+        return search_service.search_memories(
+            query=search_plan.query_text,
+            user_id=user_id,
+            assistant_id=assistant_id,
+            session_id=session_id,
+            limit=limit,
+        )
 
     def _execute_keyword_search(
         self,
@@ -501,6 +739,20 @@ Be strategic and comprehensive in your search planning."""
 
         search_terms = " ".join(keywords)
         try:
+            # Explicit entity filters are an index probe on memory_entities
+            indexed_results = []
+            if search_plan.entity_filters and hasattr(
+                search_service, "search_by_entities"
+            ):
+                indexed_results = search_service.search_by_entities(
+                    search_plan.entity_filters,
+                    user_id=user_id,
+                    assistant_id=assistant_id,
+                    limit=limit,
+                )
+                if len(indexed_results) >= limit:
+                    return indexed_results
+
             # Use provided search service (no new session creation)
             results = search_service.search_memories(
                 query=search_terms,
@@ -513,7 +765,16 @@ Be strategic and comprehensive in your search planning."""
             # Validate results
             if not isinstance(results, list):
                 logger.warning(f"Search returned non-list result: {type(results)}")
-                return []
+                return indexed_results
+
+            if indexed_results:
+                seen_ids = {r.get("memory_id") for r in indexed_results}
+                results = indexed_results + [
+                    r
+                    for r in results
+                    if isinstance(r, dict) and r.get("memory_id") not in seen_ids
+                ]
+                results = results[:limit]
 
             # Filter out any non-dictionary items
             valid_results = []
@@ -609,82 +870,22 @@ Be strategic and comprehensive in your search planning."""
             f"Searching memories by categories: {categories} for user_id: {user_id}"
         )
         try:
-            # Use provided search service (no new session creation)
-            all_results = search_service.search_memories(
-                query="",
+            # Category predicate and ordering run in SQL (no new session creation)
+            results = search_service.search_by_category(
+                categories,
                 user_id=user_id,
                 assistant_id=assistant_id,
                 session_id=session_id,
-                limit=limit * 3,
+                limit=limit,
             )
         except Exception as e:
             logger.error(f"Category search failed: {e}")
-            all_results = []
-
-        logger.debug(
-            f"Retrieved {len(all_results)} total results for category filtering"
-        )
-
-        # Category filtering logic (same as original method)
-        filtered_results = []
-        for i, result in enumerate(all_results):
-            logger.debug(f"Processing result {i+1}/{len(all_results)}: {type(result)}")
-
-            try:
-                memory_category = None
-
-                # Check processed_data field first
-                if "processed_data" in result and result["processed_data"]:
-                    processed_data = result["processed_data"]
-
-                    # Handle both dict and JSON string formats
-                    if isinstance(processed_data, str):
-                        try:
-                            processed_data = json.loads(processed_data)
-                        except json.JSONDecodeError:
-                            continue
-
-                    if isinstance(processed_data, dict):
-                        # Try multiple possible category locations
-                        category_paths = [
-                            ["category", "primary_category"],
-                            ["category"],
-                            ["primary_category"],
-                            ["metadata", "category"],
-                            ["classification", "category"],
-                        ]
-
-                        for path in category_paths:
-                            temp_data = processed_data
-                            try:
-                                for key in path:
-                                    temp_data = temp_data.get(key, {})
-                                if isinstance(temp_data, str) and temp_data:
-                                    memory_category = temp_data
-                                    break
-                            except (AttributeError, TypeError):
-                                continue
-
-                # Fallback: check direct category field
-                if not memory_category:
-                    if "category_primary" in result and result["category_primary"]:
-                        memory_category = result["category_primary"]
-                    elif "category" in result and result["category"]:
-                        memory_category = result["category"]
-
-                # Check if category matches
-                if memory_category and memory_category in categories:
-                    filtered_results.append(result)
-                    logger.debug(f"✓ Category match found: {memory_category}")
-
-            except Exception as e:
-                logger.debug(f"Error processing result {i+1}: {e}")
-                continue
+            return []
 
         logger.debug(
-            f"Category filtering complete: {len(filtered_results)} results match categories {categories}"
+            f"Category search complete: {len(results)} results match categories {categories}"
         )
-        return filtered_results[:limit]
+        return results
 
     def _detect_structured_output_support(self) -> bool:
         """
@@ -774,13 +975,43 @@ Be strategic and comprehensive in your search planning."""
             logger.debug(f"Azure endpoint doesn't support structured outputs: {e}")
             return False
 
-    def _plan_search_with_fallback_parsing(self, query: str) -> MemorySearchQuery:
+    def _acquire_llm_token(self):
+        """Wait briefly for a per-provider LLM token (raises RateLimitError)"""
+        acquire_rate_limit(
+            "llm", self._rate_limit_key, timeout=self.LLM_RATE_LIMIT_WAIT_SECONDS
+        )
+
+    def _call_llm(self, func):
+        """
+        Planning call with backoff behind the endpoint's circuit breaker
+
+        Raises:
+            CircuitOpenError: The endpoint's circuit is open; nothing was sent
+            RateLimitError: No LLM token within LLM_RATE_LIMIT_WAIT_SECONDS
+        """
+        with span("agent.llm", agent="search_planner", model=self.model):
+            return call_with_resilience(
+                func,
+                breaker_key=self._rate_limit_key,
+                policy=self.PLANNING_RETRY_POLICY,
+                before_attempt=self._acquire_llm_token,
+            )
+
+    def _plan_search_with_fallback_parsing(
+        self, query: str, cache_key: str | None = None
+    ) -> MemorySearchQuery:
         """
         Plan search strategy using regular chat completions with manual JSON parsing
 
         This method works with any OpenAI-compatible API that supports chat completions
         but doesn't support structured outputs (like Ollama, local models, etc.)
+
+        Args:
+            query: User's search query
+            cache_key: Persistent LLM cache key; a successfully parsed plan is
+                stored under it (heuristic fallback plans never are)
         """
+        increment("agent.fallback", agent="search_planner", reason="json_parsing")
         try:
             # Prepare the prompt from raw query with internal marker
             prompt = f"[INTERNAL_MEMORI_SEARCH]\nUser query: {query}"
@@ -804,17 +1035,19 @@ Be strategic and comprehensive in your search planning."""
             json_system_prompt += "\n\nRemember: Output ONLY the raw JSON object, nothing else."
 
             # Call regular chat completions
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": json_system_prompt},
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
-                temperature=0.1,
-                max_tokens=1000,  # Ensure enough tokens for full response
+            completion = self._call_llm(
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": json_system_prompt},
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        },
+                    ],
+                    temperature=0.1,
+                    max_tokens=1000,  # Ensure enough tokens for full response
+                )
             )
 
             # Extract and parse JSON response
@@ -882,11 +1115,17 @@ Be strategic and comprehensive in your search planning."""
 
             # Convert to MemorySearchQuery object with validation and defaults
             search_query = self._create_search_query_from_dict(parsed_data, query)
+            if cache_key:
+                store_cached_model(cache_key, "plan_search", self.model, search_query)
 
             logger.debug("Successfully parsed search query using fallback method")
             return search_query
 
         except Exception as e:
+            if isinstance(e, MemoriError) or is_retryable_error(e):
+                # Rate limit, open circuit or outage: raised so plan_search
+                # does not cache the fallback plan
+                raise
             logger.error(f"Fallback search planning failed: {e}")
             return self._create_fallback_query(query)
 
@@ -1085,6 +1324,7 @@ Be strategic and comprehensive in your search planning."""
 
     def _create_fallback_query(self, query: str) -> MemorySearchQuery:
         """Create a fallback search query for error cases"""
+        increment("agent.fallback", agent="search_planner", reason="heuristic_plan")
         return MemorySearchQuery(
             query_text=query,
             intent="General search (fallback)",
@@ -1116,9 +1356,33 @@ Be strategic and comprehensive in your search planning."""
         """
         Async version of execute_search using session-optimized implementation.
 
-        This method now uses the P1-optimized execute_search() which creates
-        only ONE session per search instead of 3-4 sessions.
+        With an async-mode SQLAlchemyDatabaseManager the strategies run as
+        concurrent coroutines on async sessions; only planning (an LLM call)
+        goes to the executor. Otherwise the whole sync execute_search does.
         """
+        if getattr(db_manager, "async_enabled", False):
+            try:
+                loop = asyncio.get_running_loop()
+                db_type, search_plan, strategies = await loop.run_in_executor(
+                    self._background_executor, self._prepare_search, query, db_manager
+                )
+                strategy_results = await self._run_strategies_async(
+                    strategies,
+                    search_plan,
+                    db_manager,
+                    db_type,
+                    user_id,
+                    assistant_id,
+                    session_id,
+                    limit,
+                )
+                return self._finish_search(
+                    query, search_plan, strategies, strategy_results, limit
+                )
+            except Exception as e:
+                logger.error(f"Async search execution failed: {e}")
+                return []
+
         try:
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
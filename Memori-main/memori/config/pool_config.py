@@ -1,5 +1,12 @@
 """Database connection pool configuration"""
 
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
 
 class PoolConfig:
     """Centralized database pool configuration"""
@@ -11,7 +18,31 @@ class PoolConfig:
     DEFAULT_POOL_RECYCLE = 3600  # seconds (1 hour)
     DEFAULT_POOL_PRE_PING = True
 
+    # Environment used when none is given explicitly, via MEMORI_ENV or memori.json;
+    # its profile is empty, so the DEFAULT_* settings above apply unchanged
+    DEFAULT_ENVIRONMENT = "default"
+
+    # Known environment names; each has an upper-case override dict below
+    ENVIRONMENTS = ("default", "development", "testing", "production")
+
+    # Keys that may be overridden per environment or from memori.json
+    POOL_KEYS = (
+        "pool_size",
+        "max_overflow",
+        "pool_timeout",
+        "pool_recycle",
+        "pool_pre_ping",
+    )
+
+    # Config files consulted for overrides (first existing file wins)
+    CONFIG_LOCATIONS = (
+        "memori.json",
+        "config/memori.json",
+    )
+
     # Per-environment overrides
+    DEFAULT: dict[str, Any] = {}
+
     DEVELOPMENT = {
         "pool_size": 2,
         "max_overflow": 5,
@@ -33,8 +64,19 @@ class PoolConfig:
     }
 
     @classmethod
-    def get_config(cls, environment: str = "development") -> dict:
-        """Get configuration for environment"""
+    def get_config(cls, environment: str = DEFAULT_ENVIRONMENT) -> dict:
+        """
+        Get configuration for environment
+
+        Raises:
+            ValueError: ``environment`` is not one of ENVIRONMENTS
+        """
+        name = environment.lower()
+        if name not in cls.ENVIRONMENTS:
+            raise ValueError(
+                f"Unknown pool environment {environment!r}; "
+                f"expected one of {', '.join(cls.ENVIRONMENTS)}"
+            )
         base = {
             "pool_size": cls.DEFAULT_POOL_SIZE,
             "max_overflow": cls.DEFAULT_MAX_OVERFLOW,
@@ -43,10 +85,93 @@ class PoolConfig:
             "pool_pre_ping": cls.DEFAULT_POOL_PRE_PING,
         }
 
-        env_overrides = getattr(cls, environment.upper(), {})
-        base.update(env_overrides)
+        base.update(getattr(cls, name.upper()))
         return base
 
+    @classmethod
+    def load_file_settings(cls, config_path: str | Path | None = None) -> dict:
+        """
+        Read the "database" section of memori.json.
+
+        Only the raw file content is used (not MemoriSettings) so that keys
+        which are absent stay absent and do not shadow environment defaults.
+
+        Args:
+            config_path: Explicit config file. Defaults to MEMORI_CONFIG_PATH,
+                then CONFIG_LOCATIONS relative to the working directory.
+
+        Returns:
+            The "database" mapping, or an empty dict if no file/section exists
+        """
+        candidates = [config_path] if config_path else [
+            os.getenv("MEMORI_CONFIG_PATH"),
+            *cls.CONFIG_LOCATIONS,
+        ]
+
+        for candidate in candidates:
+            if not candidate:
+                continue
+            path = Path(candidate)
+            if not path.exists() or path.suffix.lower() != ".json":
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable pool config in {path}: {e}")
+                return {}
+            section = data.get("database") if isinstance(data, dict) else None
+            return section if isinstance(section, dict) else {}
+
+        return {}
+
+    @classmethod
+    def resolve(
+        cls,
+        environment: str | None = None,
+        overrides: dict[str, Any] | None = None,
+        config_path: str | Path | None = None,
+    ) -> dict:
+        """
+        Resolve the effective pool settings.
+
+        Precedence (lowest to highest): class defaults, per-environment
+        overrides, memori.json "database" section, explicit ``overrides``
+        (None values are ignored so callers can pass unset keyword args).
+
+        The environment is taken from the argument, then MEMORI_ENV, then
+        memori.json "database.environment", then DEFAULT_ENVIRONMENT.
+
+        Returns:
+            Dict with POOL_KEYS plus "environment"
+
+        Raises:
+            ValueError: The environment is not one of ENVIRONMENTS
+        """
+        file_settings = cls.load_file_settings(config_path)
+        env = (
+            environment
+            or os.getenv("MEMORI_ENV")
+            or file_settings.get("environment")
+            or cls.DEFAULT_ENVIRONMENT
+        ).lower()
+
+        config = cls.get_config(env)
+        config.update(
+            {key: file_settings[key] for key in cls.POOL_KEYS if key in file_settings}
+        )
+        if overrides:
+            config.update(
+                {
+                    key: value
+                    for key, value in overrides.items()
+                    if key in cls.POOL_KEYS and value is not None
+                }
+            )
+
+        config["environment"] = env
+        return config
+
 
 # Create a module-level instance for convenience
 pool_config = PoolConfig()
@@ -198,32 +198,36 @@ class ConversationManager:
                 mode == "auto" and getattr(memori_instance, "conscious_ingest", False)
             )
 
-            # 1. Get Conscious Context
-            if is_conscious_active:
-                conscious_items = memori_instance._get_conscious_context()
-                if conscious_items:
-                    context_items.extend(conscious_items)
-                    logger.debug(f"Collected {len(conscious_items)} conscious memory items")
-
-            # 2. Get Auto Context
-            if mode == "auto":
-                logger.debug(
-                    f"[CONTEXT] Auto-ingest processing - Query: '{user_input[:50]}...' | Session: {session_id[:8]}..."
-                )
-                auto_items = (
-                    memori_instance._get_auto_ingest_context(user_input)
-                    if user_input
-                    else []
-                )
-                if auto_items:
-                    context_items.extend(auto_items)
+            # One shared read session for both lookups
+            with memori_instance.request_scope():
+                # 1. Get Conscious Context
+                if is_conscious_active:
+                    conscious_items = memori_instance._get_conscious_context()
+                    if conscious_items:
+                        context_items.extend(conscious_items)
+                        logger.debug(
+                            f"Collected {len(conscious_items)} conscious memory items"
+                        )
+
+                # 2. Get Auto Context
+                if mode == "auto":
                     logger.debug(
-                        f"[CONTEXT] Collected {len(auto_items)} auto-retrieved memory items"
+                        f"[CONTEXT] Auto-ingest processing - Query: '{user_input[:50]}...' | Session: {session_id[:8]}..."
                     )
-                else:
-                    logger.debug(
-                        f"[CONTEXT] No relevant memories found for '{user_input[:30]}...' | Session: {session_id[:8]}..."
+                    auto_items = (
+                        memori_instance._get_auto_ingest_context(user_input)
+                        if user_input
+                        else []
                     )
+                    if auto_items:
+                        context_items.extend(auto_items)
+                        logger.debug(
+                            f"[CONTEXT] Collected {len(auto_items)} auto-retrieved memory items"
+                        )
+                    else:
+                        logger.debug(
+                            f"[CONTEXT] No relevant memories found for '{user_input[:30]}...' | Session: {session_id[:8]}..."
+                        )
 
             # 3. Build Prompt
             context_prompt = ""
@@ -3,34 +3,53 @@ Main Memori class - Pydantic-based memory interface v1.0
 """
 
 import asyncio
+import functools
+import importlib.util
 import threading
 import time
 import uuid
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
 from typing import Any
 
 from loguru import logger
 
-try:
-    import litellm  # noqa: F401
-    from litellm import success_callback  # noqa: F401
-
-    _ = litellm  # Mark as intentionally imported
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
-    logger.debug("LiteLLM not available - native callback system disabled")
-
 from ..agents.conscious_agent import ConsciouscAgent
 from ..config.memory_manager import MemoryManager
-from ..config.pool_config import pool_config
 from ..config.settings import LoggingSettings, LogLevel
+from ..database.async_engine import check_async_support
+from ..database.search_records import DedupCandidate, attach_lazy_processed_data
 from ..database.sqlalchemy_manager import SQLAlchemyDatabaseManager
-from ..utils.exceptions import DatabaseError, MemoriError
+from ..database.statements import STATEMENTS
+from ..utils.exceptions import DatabaseError, MemoriError, RateLimitError
+from ..utils.llm_cache import configure_llm_cache, get_llm_cache
 from ..utils.logging import LoggingManager
+from ..utils.metrics import timed
 from ..utils.pydantic_models import ConversationContext
+from ..utils.rate_limiter import (
+    acquire_rate_limit,
+    acquire_rate_limit_async,
+    configure_rate_limits,
+)
 from .conversation import ConversationManager
 
+# Only probe for LiteLLM here; importing it costs seconds and the litellm
+# integration imports it when its callbacks are registered
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
+if not LITELLM_AVAILABLE:
+    logger.debug("LiteLLM not available - native callback system disabled")
+
+
+def _request_scoped(method):
+    """Run a Memori read path inside the instance's request scope"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.request_scope():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class Memori:
     """
@@ -40,6 +59,9 @@ class Memori:
     for AI conversations and agent interactions.
     """
 
+    # Max seconds a foreground call waits for a rate-limit token
+    RATE_LIMIT_WAIT_SECONDS = 2.0
+
     def __init__(
         self,
         database_connect: str = "sqlite:///memori.db",
@@ -77,11 +99,19 @@ class Memori:
         database_suffix: str | None = None,  # Database name suffix
         conscious_memory_limit: int = 10,  # Limit for conscious memory processing
         # Database connection pool parameters
-        pool_size: int = pool_config.DEFAULT_POOL_SIZE,  # SQLAlchemy connection pool size
-        max_overflow: int = pool_config.DEFAULT_MAX_OVERFLOW,  # Max overflow connections
-        pool_timeout: int = pool_config.DEFAULT_POOL_TIMEOUT,  # Connection timeout in seconds
-        pool_recycle: int = pool_config.DEFAULT_POOL_RECYCLE,  # Recycle connections after seconds
-        pool_pre_ping: bool = pool_config.DEFAULT_POOL_PRE_PING,  # Test connections before use
+        # (None = resolve from PoolConfig for the environment and memori.json)
+        pool_size: int | None = None,  # SQLAlchemy connection pool size
+        max_overflow: int | None = None,  # Max overflow connections
+        pool_timeout: int | None = None,  # Connection timeout in seconds
+        pool_recycle: int | None = None,  # Recycle connections after seconds
+        pool_pre_ping: bool | None = None,  # Test connections before use
+        environment: str | None = None,  # Pool profile: development/testing/production
+        read_replica_connect: str | None = None,  # Optional replica for search traffic
+        async_mode: bool = False,  # Asyncio engine for the async DB paths
+        write_behind: bool | dict[str, Any] = False,  # Batch chat_history writes
+        rate_limits: dict[str, Any] | None = None,  # Override DEFAULT_RATE_LIMITS
+        llm_cache: bool | str | None = None,  # False disables, str = cache file path
+        lazy_init: bool = False,  # Warm up conscious context in the background
     ):
         """
         Initialize Memori memory system v1.0.
@@ -112,6 +142,31 @@ class Memori:
             enable_auto_creation: Enable automatic database creation if database doesn't exist
             database_prefix: Optional prefix for database name (for multi-tenant setups)
             database_suffix: Optional suffix for database name (e.g., 'dev', 'prod', 'test')
+            pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping:
+                Connection pool overrides; unset values come from PoolConfig
+            environment: Pool profile name (defaults to MEMORI_ENV / memori.json)
+            read_replica_connect: Optional read replica used for memory search
+            async_mode: Give the SQL manager an asyncio engine (needs greenlet and
+                aiosqlite/asyncpg/aiomysql), so async paths such as
+                record_conversation_async and memory processing await the
+                database instead of blocking the event loop
+            write_behind: Buffer chat history rows and write them in background
+                batches instead of committing inside record_conversation. True
+                uses the defaults; a dict is passed to enable_write_behind
+                (flush_interval, max_batch, max_pending, flush_on_exit).
+                Buffered rows are lost if the process is killed
+            rate_limits: Per-operation token-bucket overrides ("record_conversation",
+                "search", "llm") as RateLimit, requests/minute, or None to disable.
+                record_conversation is unlimited unless set here; when it is,
+                a call that finds no token within RATE_LIMIT_WAIT_SECONDS
+                raises RateLimitError
+            llm_cache: Persistent agent LLM response cache. None keeps the
+                process default (MEMORI_LLM_CACHE / MEMORI_LLM_CACHE_PATH),
+                False disables it, a string sets the SQLite cache file path
+            lazy_init: Return from enable() without waiting for the conscious
+                context warm-up, which then runs on a background thread
+                (agent clients and capability probes are always created on
+                first use, and schema setup is skipped for stamped databases)
         """
         # Set core configuration
         self.database_connect = database_connect
@@ -161,6 +216,7 @@ class Memori:
             raise ValueError("conscious_memory_limit must be between 1 and 2000")
 
         self.conscious_memory_limit = conscious_memory_limit
+        self.lazy_init = lazy_init
 
         # Thread safety for conscious memory initialization
         self._conscious_init_lock = threading.RLock()
@@ -247,11 +303,27 @@ class Memori:
         self.pool_timeout = pool_timeout
         self.pool_recycle = pool_recycle
         self.pool_pre_ping = pool_pre_ping
+        self.environment = environment
+        self.read_replica_connect = read_replica_connect
+        self.async_mode = async_mode
+        self.write_behind = write_behind
+
+        # Token-bucket limits are process-wide (upstream quotas are per key)
+        if rate_limits:
+            configure_rate_limits(rate_limits)
+
+        # Agent LLM responses are cached per process in a shared SQLite file
+        if llm_cache is False:
+            configure_llm_cache(enabled=False)
+        elif isinstance(llm_cache, str):
+            configure_llm_cache(path=llm_cache)
 
         # Initialize database manager (detect MongoDB vs SQL)
         self.db_manager = self._create_database_manager(
             database_connect, template, schema_init
         )
+        if write_behind:
+            self._enable_write_behind(write_behind)
 
         # Initialize Pydantic-based agents
         self.memory_agent = None
@@ -390,6 +462,13 @@ class Memori:
         self, database_connect: str, template: str, schema_init: bool
     ):
         """Create appropriate database manager based on connection string with fallback"""
+        if self.async_mode:
+            if self._is_mongodb_connection(database_connect):
+                logger.warning("async_mode applies to SQL databases only; ignoring it")
+            else:
+                # A missing async driver is a setup error, not a reason to fall back
+                check_async_support(database_connect)
+
         try:
             # Detect MongoDB connection strings
             if self._is_mongodb_connection(database_connect):
@@ -428,6 +507,9 @@ class Memori:
                     pool_timeout=self.pool_timeout,
                     pool_recycle=self.pool_recycle,
                     pool_pre_ping=self.pool_pre_ping,
+                    environment=self.environment,
+                    read_replica_connect=self.read_replica_connect,
+                    async_mode=self.async_mode,
                 )
 
         except Exception as e:
@@ -448,6 +530,7 @@ class Memori:
             pool_timeout=self.pool_timeout,
             pool_recycle=self.pool_recycle,
             pool_pre_ping=self.pool_pre_ping,
+            environment=self.environment,
         )
 
     def _is_mongodb_connection(self, database_connect: str) -> bool:
@@ -512,12 +595,24 @@ class Memori:
                     )
                     self._conscious_init_pending = False
             except RuntimeError:
+                self._conscious_init_pending = False
+                if self.lazy_init:
+                    # Don't hold up the caller (e.g. the first page render)
+                    threading.Thread(
+                        target=self._run_synchronous_conscious_initialization,
+                        name="memori-conscious-warmup",
+                        daemon=True,
+                    ).start()
+                    logger.debug(
+                        "Conscious-ingest: Warm-up started on a background thread"
+                    )
+                    return
+
                 # No event loop available, run synchronous initialization
                 logger.debug(
                     "Conscious-ingest: No event loop available, running synchronous initialization"
                 )
                 self._run_synchronous_conscious_initialization()
-                self._conscious_init_pending = False
 
     async def _run_conscious_initialization(self):
         """Run conscious agent initialization in background"""
@@ -611,17 +706,11 @@ class Memori:
     def _initialize_existing_conscious_memories_sync(self):
         """Synchronously initialize existing conscious-info memories with optimization"""
         try:
-            from sqlalchemy import text
-
             with self.db_manager._get_connection() as connection:
                 # First, check if we already have conscious memories in short-term storage
-                # Note: 'conscious_%' is a static pattern (safe), not user input
-                existing_short_term = connection.execute(
-                    text(
-                        """SELECT COUNT(*) FROM short_term_memory
-                           WHERE user_id = :user_id
-                           AND (category_primary = 'conscious_context' OR memory_id LIKE 'conscious_%')"""
-                    ),
+                existing_short_term = STATEMENTS.execute(
+                    connection,
+                    "memory.count_conscious_short_term",
                     {"user_id": self.user_id or "default"},
                 ).scalar()
 
@@ -632,19 +721,14 @@ class Memori:
                     return False
 
                 # Get only the most important conscious-info memories (limit to 10 for performance)
-                cursor = connection.execute(
-                    text(
-                        """SELECT memory_id, processed_data, summary, searchable_content,
-                              importance_score, created_at
-                       FROM long_term_memory
-                       WHERE user_id = :user_id AND classification = 'conscious-info'
-                       ORDER BY importance_score DESC, created_at DESC
-                       LIMIT :limit"""
-                    ),
+                cursor = STATEMENTS.execute(
+                    connection,
+                    "conscious.long_term_memories",
                     {
                         "user_id": self.user_id or "default",
                         "limit": self.conscious_memory_limit,
                     },
+                    limited=True,
                 )
                 existing_conscious_memories = cursor.fetchall()
 
@@ -697,9 +781,10 @@ class Memori:
 
             # SECURITY FIX: Use ORM methods instead of raw SQL to prevent injection
             # Check for exact match or conscious-prefixed memories
-            from sqlalchemy import or_, text
+            from sqlalchemy import or_
 
             from memori.database.models import ShortTermMemory
+            from memori.utils.database import serialize_json_for_db
 
             with self.db_manager.SessionLocal() as session:
                 # Safe parameterized query using ORM - no SQL injection possible
@@ -727,19 +812,12 @@ class Memori:
                 )
 
                 # Insert directly into short-term memory with conscious_context category
-                session.execute(
-                    text(
-                        """INSERT INTO short_term_memory (
-                        memory_id, processed_data, importance_score, category_primary,
-                        retention_type, user_id, assistant_id, session_id, created_at, expires_at,
-                        searchable_content, summary, is_permanent_context
-                    ) VALUES (:memory_id, :processed_data, :importance_score, :category_primary,
-                        :retention_type, :user_id, :assistant_id, :session_id, :created_at, :expires_at,
-                        :searchable_content, :summary, :is_permanent_context)"""
-                    ),
+                STATEMENTS.execute(
+                    session,
+                    "memory.insert_conscious_short_term",
                     {
                         "memory_id": short_term_id,
-                        "processed_data": processed_data,
+                        "processed_data": serialize_json_for_db(processed_data),
                         "importance_score": importance_score,
                         "category_primary": "conscious_context",
                         "retention_type": "permanent",
@@ -880,6 +958,10 @@ class Memori:
         # Stop background analysis task
         self._stop_background_analysis()
 
+        # Recording stops here; write what the write-behind buffer still holds
+        # (it keeps its own flusher, so later records are written too)
+        self.flush_chat_history()
+
         # Shutdown persistent background event loop if it was used
         try:
             from ..utils.async_bridge import BackgroundEventLoop
@@ -1238,22 +1320,12 @@ class Memori:
 
             else:
                 # Use SQL method
-                from sqlalchemy import text
-
-                with self.db_manager._get_connection() as conn:
+                with self.db_manager._get_read_connection() as conn:
                     # Get ALL short-term memories (no limit) ordered by importance and recency
                     # This gives the complete conscious context as single initial injection
-                    result = conn.execute(
-                        text(
-                            """
-                        SELECT memory_id, processed_data, importance_score,
-                               category_primary, summary, searchable_content,
-                               created_at, access_count
-                        FROM short_term_memory
-                        WHERE user_id = :user_id AND (expires_at IS NULL OR expires_at > :current_time)
-                        ORDER BY importance_score DESC, created_at DESC
-                        """
-                        ),
+                    result = STATEMENTS.execute(
+                        conn,
+                        "memory.conscious_context",
                         {"user_id": self.user_id, "current_time": datetime.now()},
                     )
 
@@ -1282,6 +1354,8 @@ class Memori:
             logger.error(f"Failed to get conscious context: {e}")
             return []
 
+    @timed("memori.auto_ingest_context")
+    @_request_scoped
     def _get_auto_ingest_context(self, user_input: str) -> list[dict[str, Any]]:
         """
         Get auto-ingest context using retrieval agent for intelligent search.
@@ -2116,6 +2190,7 @@ class Memori:
             self._recent_conversation_hashes[fingerprint] = current_time
             return False
 
+    @timed("memori.record_conversation")
     def record_conversation(
         self,
         user_input: str,
@@ -2138,6 +2213,94 @@ class Memori:
         if not self._enabled:
             raise MemoriError("Memori is not enabled. Call enable() first.")
 
+        # Opt-in (rate_limits): a short bounded wait absorbs bursts, sustained
+        # overload raises RateLimitError
+        acquire_rate_limit(
+            "record_conversation", self.user_id, timeout=self.RATE_LIMIT_WAIT_SECONDS
+        )
+
+        chat_id, response_text, response_model, duplicate = self._begin_recording(
+            user_input, ai_output, model, metadata
+        )
+        if duplicate:
+            return chat_id
+
+        try:
+            # Store conversation
+            chat_kwargs = self._chat_history_kwargs(
+                chat_id, user_input, response_text, response_model, metadata
+            )
+            if self._chat_buffer is not None:
+                self._chat_buffer.add(**chat_kwargs)
+            else:
+                self.db_manager.store_chat_history(**chat_kwargs)
+            self._finish_recording(
+                chat_id, user_input, response_text, response_model, metadata
+            )
+            return chat_id
+
+        except Exception as e:
+            self._log_recording_failure(chat_id, e)
+            raise
+
+    async def record_conversation_async(
+        self,
+        user_input: str,
+        ai_output=None,
+        model: str = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Async ``record_conversation`` for callers already on an event loop
+
+        With an async-mode database the chat history write is awaited on this
+        loop; otherwise it runs in a worker thread so the loop keeps serving
+        other tasks. Memory processing is scheduled on this loop.
+        """
+        if not self._enabled:
+            raise MemoriError("Memori is not enabled. Call enable() first.")
+
+        await acquire_rate_limit_async(
+            "record_conversation", self.user_id, timeout=self.RATE_LIMIT_WAIT_SECONDS
+        )
+
+        chat_id, response_text, response_model, duplicate = self._begin_recording(
+            user_input, ai_output, model, metadata
+        )
+        if duplicate:
+            return chat_id
+
+        try:
+            chat_kwargs = self._chat_history_kwargs(
+                chat_id, user_input, response_text, response_model, metadata
+            )
+            if self._chat_buffer is not None:
+                self._chat_buffer.add(**chat_kwargs)
+            elif getattr(self.db_manager, "async_enabled", False):
+                await self.db_manager.store_chat_history_async(**chat_kwargs)
+            else:
+                await asyncio.to_thread(
+                    self.db_manager.store_chat_history, **chat_kwargs
+                )
+            self._finish_recording(
+                chat_id, user_input, response_text, response_model, metadata
+            )
+            return chat_id
+
+        except Exception as e:
+            self._log_recording_failure(chat_id, e)
+            raise
+
+    def _begin_recording(
+        self, user_input: str, ai_output, model: str | None, metadata: dict | None
+    ) -> tuple[str, str, str, bool]:
+        """
+        Parse the response and check for duplicates
+
+        Returns:
+            (chat_id, response_text, response_model, is_duplicate); a duplicate
+            gets a throwaway chat_id and must not be stored
+        """
         # Debug logging for conversation recording
         logger.info(
             f"[MEMORY] Recording conversation - Input: '{user_input[:60]}...' | Model: {model} | Session: {self.session_id[:8]}..."
@@ -2158,66 +2321,80 @@ class Memori:
                 f"fingerprint: {fingerprint}"
             )
             # Return a dummy chat_id - conversation was already recorded by another integration
-            return str(uuid.uuid4())
+            return str(uuid.uuid4()), response_text, response_model, True
 
         logger.debug(
             f"New conversation fingerprint: {fingerprint} | integration: {metadata.get('integration', 'unknown') if metadata else 'unknown'}"
         )
 
         # Generate ID
-        chat_id = str(uuid.uuid4())
+        return str(uuid.uuid4()), response_text, response_model, False
 
-        try:
-            # Store conversation
-            self.db_manager.store_chat_history(
-                chat_id=chat_id,
-                user_input=user_input,
-                ai_output=response_text,
-                model=response_model,
-                session_id=self.session_id,
-                user_id=self.user_id,
-                assistant_id=self.assistant_id,
-                metadata=metadata or {},
-            )
-            logger.debug(f"[MEMORY] Chat history stored - ID: {chat_id[:8]}...")
-
-            # Update conversation manager session history
-            if response_text:
-                # Ensure model info is in metadata for session history
-                response_metadata = (metadata or {}).copy()
-                if "model" not in response_metadata:
-                    response_metadata["model"] = response_model
+    def _chat_history_kwargs(
+        self,
+        chat_id: str,
+        user_input: str,
+        response_text: str,
+        response_model: str,
+        metadata: dict | None,
+    ) -> dict[str, Any]:
+        return {
+            "chat_id": chat_id,
+            "user_input": user_input,
+            "ai_output": response_text,
+            "model": response_model,
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "assistant_id": self.assistant_id,
+            "metadata": metadata or {},
+        }
 
-                self.conversation_manager.record_response(
-                    session_id=self.session_id,
-                    response=response_text,
-                    metadata=response_metadata,
-                )
+    def _finish_recording(
+        self,
+        chat_id: str,
+        user_input: str,
+        response_text: str,
+        response_model: str,
+        metadata: dict | None,
+    ):
+        """Update the session history and schedule memory processing"""
+        logger.debug(f"[MEMORY] Chat history stored - ID: {chat_id[:8]}...")
 
-            # Always process into long-term memory when memory agent is available
-            if self.memory_agent:
-                self._schedule_memory_processing(
-                    chat_id, user_input, response_text, response_model
-                )
-                logger.debug(f"[MEMORY] Processing scheduled - ID: {chat_id[:8]}...")
-            else:
-                logger.warning(
-                    f"[MEMORY] Agent unavailable, skipping processing - ID: {chat_id[:8]}..."
-                )
+        # Update conversation manager session history
+        if response_text:
+            # Ensure model info is in metadata for session history
+            response_metadata = (metadata or {}).copy()
+            if "model" not in response_metadata:
+                response_metadata["model"] = response_model
 
-            logger.info(
-                f"[MEMORY] Conversation recorded successfully - ID: {chat_id[:8]}..."
+            self.conversation_manager.record_response(
+                session_id=self.session_id,
+                response=response_text,
+                metadata=response_metadata,
             )
-            return chat_id
 
-        except Exception as e:
-            logger.error(
-                f"[MEMORY] Failed to record conversation {chat_id[:8]}... - {type(e).__name__}: {e}"
+        # Always process into long-term memory when memory agent is available
+        if self.memory_agent:
+            self._schedule_memory_processing(
+                chat_id, user_input, response_text, response_model
+            )
+            logger.debug(f"[MEMORY] Processing scheduled - ID: {chat_id[:8]}...")
+        else:
+            logger.warning(
+                f"[MEMORY] Agent unavailable, skipping processing - ID: {chat_id[:8]}..."
             )
-            import traceback
 
-            logger.debug(f"[MEMORY] Recording error details: {traceback.format_exc()}")
-            raise
+        logger.info(
+            f"[MEMORY] Conversation recorded successfully - ID: {chat_id[:8]}..."
+        )
+
+    def _log_recording_failure(self, chat_id: str, error: Exception):
+        logger.error(
+            f"[MEMORY] Failed to record conversation {chat_id[:8]}... - {type(error).__name__}: {error}"
+        )
+        import traceback
+
+        logger.debug(f"[MEMORY] Recording error details: {traceback.format_exc()}")
 
     def _schedule_memory_processing(
         self, chat_id: str, user_input: str, ai_output: str, model: str
@@ -2333,25 +2510,33 @@ class Memori:
                 return
 
             # Store processed memory with new schema
-            memory_id = self.db_manager.store_long_term_memory_enhanced(
+            store_args = (
                 processed_memory,
                 chat_id,
                 self.user_id,
                 self.assistant_id,
                 self._session_id,
             )
+            if getattr(self.db_manager, "async_enabled", False):
+                memory_id = await self.db_manager.store_long_term_memory_enhanced_async(
+                    *store_args
+                )
+            else:
+                memory_id = self.db_manager.store_long_term_memory_enhanced(*store_args)
 
             if memory_id:
                 logger.debug(f"Stored processed memory {memory_id} for chat {chat_id}")
 
-                # Check for conscious context updates if promotion eligible and conscious_ingest enabled
+                # Promotion is event-driven: the store above published the ID to
+                # the background consumer. Without one, promote just this memory.
                 if (
                     processed_memory.promotion_eligible
                     and self.conscious_agent
                     and self.conscious_ingest
+                    and not self.conscious_agent.promotion_consumer_running
                 ):
-                    await self.conscious_agent.check_for_context_updates(
-                        self.db_manager, self.user_id
+                    await self.conscious_agent.promote_memories(
+                        self.db_manager, self.user_id, [memory_id]
                     )
             else:
                 logger.warning(f"Failed to store memory for chat {chat_id}")
@@ -2359,29 +2544,30 @@ class Memori:
         except Exception as e:
             logger.error(f"Memory ingestion failed for {chat_id}: {e}")
 
-    async def _get_recent_memories_for_dedup(self, hours: int = 24) -> list:
+    async def _get_recent_memories_for_dedup(
+        self, hours: int = 24
+    ) -> list[DedupCandidate]:
         """
         Get recent memories for deduplication check.
 
+        The comparison only reads ids and text, so rows become slotted
+        DedupCandidates rather than validated ProcessedLongTermMemory models.
+
         Args:
             hours: Time window in hours to check for duplicates (default: 24)
         """
         try:
             from datetime import datetime, timedelta
 
-            from sqlalchemy import text
-
-            from ..database.queries.memory_queries import MemoryQueries
-            from ..utils.pydantic_models import ProcessedLongTermMemory
-
             # FIX #3: Only check duplicates within time window (default 24 hours)
             # This prevents old memories from blocking new ones
             time_threshold = datetime.now() - timedelta(hours=hours)
             time_threshold_str = time_threshold.isoformat()
 
             with self.db_manager._get_connection() as connection:
-                result = connection.execute(
-                    text(MemoryQueries.SELECT_MEMORIES_FOR_DEDUPLICATION),
+                result = STATEMENTS.execute(
+                    connection,
+                    "memory.dedup_candidates",
                     {
                         "user_id": self.user_id,
                         "processed_for_duplicates": False,
@@ -2390,29 +2576,19 @@ class Memori:
                     },
                 )
 
-                memories = []
-                for row in result:
-                    try:
-                        # Create ProcessedLongTermMemory objects for proper comparison
-                        # Note: Query returns (memory_id, summary, searchable_content, classification, created_at)
-                        memory = ProcessedLongTermMemory(
-                            session_id=row[
-                                0
-                            ],  # Use memory_id as session_id for existing memories
-                            summary=row[1] or "",
-                            content=row[2] or "",
-                            classification=row[3] or "conversational",
-                            importance="medium",  # Default importance level for comparison
-                            promotion_eligible=False,  # Default for existing memories
-                            classification_reason="Existing memory loaded for deduplication check",  # Required field
-                        )
-                        memories.append(memory)
-                    except Exception as e:
-                        # Silently skip malformed memories from old data format
-                        logger.debug(f"Skipping malformed memory during dedup: {e}")
-                        continue
-
-                return memories
+                # Query returns (memory_id, summary, searchable_content,
+                # classification, created_at)
+                return [
+                    DedupCandidate(
+                        memory_id=row[0],
+                        summary=row[1] or "",
+                        content=row[2] or "",
+                        classification=row[3] or "conversational",
+                        created_at=row[4],
+                    )
+                    for row in result
+                    if row[0]
+                ]
 
         except Exception as e:
             # This is expected on first use or fresh databases
@@ -2421,6 +2597,8 @@ class Memori:
             )
             return []
 
+    @timed("memori.retrieve_context")
+    @_request_scoped
     def retrieve_context(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """
         Retrieve relevant context for a query with priority on essential facts
@@ -2432,6 +2610,15 @@ class Memori:
         Returns:
             List of relevant memory items with metadata, prioritizing essential facts
         """
+        try:
+            acquire_rate_limit(
+                "search", self.user_id, timeout=self.RATE_LIMIT_WAIT_SECONDS
+            )
+        except RateLimitError as e:
+            # Degrade to "no context" rather than failing the caller's LLM turn
+            logger.warning(f"Context retrieval skipped: {e}")
+            return []
+
         try:
             context_items = []
 
@@ -2521,6 +2708,65 @@ class Memori:
             logger.error(f"Failed to get memory stats: {e}")
             return {}
 
+    def get_llm_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size of the agents' LLM response cache"""
+        cache = get_llm_cache()
+        return cache.stats() if cache else {"enabled": False}
+
+    def get_statement_stats(self) -> dict[str, dict[str, Any]]:
+        """Call counts and timings of the prepared raw-SQL statements, by name"""
+        return STATEMENTS.stats()
+
+    def enable_query_diagnostics(self, row_threshold: int | None = None):
+        """
+        Capture EXPLAIN plans of the queries Memori runs and flag full scans of
+        tables with at least ``row_threshold`` rows (SQL backends only)
+        """
+        if not hasattr(self.db_manager, "enable_query_diagnostics"):
+            logger.warning(
+                f"Query diagnostics are not supported for "
+                f"{type(self.db_manager).__name__}"
+            )
+            return None
+        return self.db_manager.enable_query_diagnostics(row_threshold)
+
+    def _enable_write_behind(self, settings: bool | dict[str, Any]):
+        if not hasattr(self.db_manager, "enable_write_behind"):
+            logger.warning(
+                f"write_behind is not supported for "
+                f"{type(self.db_manager).__name__}; writing chat history inline"
+            )
+            return
+        self.db_manager.enable_write_behind(
+            **(settings if isinstance(settings, dict) else {})
+        )
+
+    @property
+    def _chat_buffer(self):
+        """The manager's write-behind buffer, when write_behind is on"""
+        return getattr(self.db_manager, "chat_buffer", None)
+
+    def flush_chat_history(self) -> int:
+        """Write buffered chat history rows now (write_behind only)"""
+        buffer = self._chat_buffer
+        return buffer.flush() if buffer is not None else 0
+
+    def request_scope(self) -> AbstractContextManager:
+        """
+        Share one database session among the reads inside the block
+
+        Use it around a whole turn (context retrieval, chat history, ...) so the
+        turn checks out one pooled connection instead of one per read.
+        ``retrieve_context`` opens one on its own; nested scopes are reused.
+        """
+        read_scope = getattr(self.db_manager, "read_scope", None)
+        return read_scope() if read_scope is not None else nullcontext()
+
+    def get_query_diagnostics(self) -> dict[str, Any]:
+        """Captured query plans and flagged full scans; empty if not enabled"""
+        collector = getattr(self.db_manager, "query_diagnostics", None)
+        return collector.report() if collector is not None else {}
+
     @property
     def is_enabled(self) -> bool:
         """Check if memory recording is enabled"""
@@ -2645,10 +2891,26 @@ class Memori:
     def get_entity_memories(
         self, entity_value: str, entity_type: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
-        """Get memories that contain a specific entity"""
+        """
+        Get memories that contain a specific entity
+
+        ``entity_type`` is an EntityType value; entities are indexed without
+        their kind, so every kind but "keyword" matches all entities.
+        """
         try:
-            # This would use the entity index in the database
-            # For now, use keyword search as fallback (entity_type is ignored for now)
+            # Long-term memories are indexed in memory_entities; probe that first
+            if hasattr(self.db_manager, "search_entity_memories"):
+                results = self.db_manager.search_entity_memories(
+                    [entity_value],
+                    user_id=self.user_id,
+                    assistant_id=self.assistant_id,
+                    entity_type=entity_type,
+                    limit=limit,
+                )
+                if results:
+                    return results
+
+            # Fall back to text search (covers short-term memory and unindexed rows)
             return self.db_manager.search_memories(
                 query=entity_value,
                 user_id=self.user_id,
@@ -2666,6 +2928,17 @@ class Memori:
             if self._background_task and not self._background_task.done():
                 logger.debug("Background analysis task already running")
                 return
+            if self.conscious_agent and self.conscious_agent.promotion_consumer_running:
+                logger.debug("Promotion consumer already running")
+                return
+
+            # Newly stored promotion candidates are pushed to the consumer
+            if self.conscious_agent and hasattr(
+                self.db_manager, "subscribe_promotions"
+            ):
+                self.db_manager.subscribe_promotions(
+                    self.conscious_agent.enqueue_promotion
+                )
 
             # Create event loop if it doesn't exist
             try:
@@ -2724,6 +2997,13 @@ class Memori:
     def _stop_background_analysis(self):
         """Stop the background analysis task"""
         try:
+            if self.conscious_agent:
+                if hasattr(self.db_manager, "unsubscribe_promotions"):
+                    self.db_manager.unsubscribe_promotions(
+                        self.conscious_agent.enqueue_promotion
+                    )
+                # Also reaches a consumer running on its own thread's loop
+                self.conscious_agent.stop_promotion_consumer()
             if self._background_task and not self._background_task.done():
                 self._background_task.cancel()
                 logger.info("Background analysis task stopped")
@@ -2821,33 +3101,23 @@ class Memori:
                 pass  # Can't do anything if logging fails in destructor
 
     async def _background_analysis_loop(self):
-        """Background analysis loop for memory processing"""
+        """
+        Background promotion of conscious-info memories
+
+        Event-driven: store_long_term_memory_enhanced publishes new candidates
+        to the conscious agent's queue, and this task promotes them as they
+        arrive. Memories stored by other processes publish nothing here; a
+        reconciliation pass picks them up after the consumer has been idle for
+        ConsciouscAgent.RECONCILE_INTERVAL_SECONDS. Without conscious ingest
+        the task just returns.
+        """
         try:
             logger.debug("Background analysis loop started")
 
-            # For now, just run periodic conscious ingestion if enabled
             if self.conscious_ingest and self.conscious_agent:
-                while True:
-                    try:
-                        await asyncio.sleep(300)  # Check every 5 minutes
-
-                        # Run conscious ingestion to check for new promotable memories
-                        await self.conscious_agent.run_conscious_ingest(
-                            self.db_manager, self.user_id
-                        )
-
-                        logger.debug("Periodic conscious analysis completed")
-
-                    except asyncio.CancelledError:
-                        logger.debug("Background analysis loop cancelled")
-                        break
-                    except Exception as e:
-                        logger.error(f"Background analysis error: {e}")
-                        await asyncio.sleep(60)  # Wait 1 minute before retry
-            else:
-                # If not using conscious ingest, just sleep
-                while True:
-                    await asyncio.sleep(3600)  # Sleep for 1 hour
+                await self.conscious_agent.run_promotion_consumer(
+                    self.db_manager, reconcile_user_id=self.user_id
+                )
 
         except asyncio.CancelledError:
             logger.debug("Background analysis loop cancelled")
@@ -3036,21 +3306,12 @@ class Memori:
     def get_essential_conversations(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get essential conversations from short-term memory"""
         try:
-            from sqlalchemy import text
-
             # Get all conversations marked as essential
-            with self.db_manager._get_connection() as connection:
-                query = """
-                SELECT memory_id, summary, category_primary, importance_score,
-                       created_at, searchable_content, processed_data
-                FROM short_term_memory
-                WHERE user_id = :user_id AND category_primary LIKE 'essential_%'
-                ORDER BY importance_score DESC, created_at DESC
-                LIMIT :limit
-                """
-
-                result = connection.execute(
-                    text(query), {"user_id": self.user_id, "limit": limit}
+            with self.db_manager._get_read_connection() as connection:
+                result = STATEMENTS.execute(
+                    connection,
+                    "memory.essential_conversations",
+                    {"user_id": self.user_id, "limit": limit},
                 )
 
                 essential_conversations = []
@@ -3063,11 +3324,14 @@ class Memori:
                             "importance_score": row[3],
                             "created_at": row[4],
                             "searchable_content": row[5],
-                            "processed_data": row[6],
+                            "memory_type": "short_term",
                         }
                     )
 
-                return essential_conversations
+                # processed_data is loaded on first access, batched for the list
+                return attach_lazy_processed_data(
+                    essential_conversations, self.db_manager.engine
+                )
 
         except Exception as e:
             logger.error(f"Failed to get essential conversations: {e}")
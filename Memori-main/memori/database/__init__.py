@@ -1,14 +1,25 @@
 """Database components for Memoriai"""
 
-from .connectors import MySQLConnector, PostgreSQLConnector, SQLiteConnector
+from typing import TYPE_CHECKING, Any
 
-try:
+from . import connectors
+from .connectors import (
+    MONGODB_AVAILABLE,
+    MySQLConnector,
+    PostgreSQLConnector,
+    SQLiteConnector,
+)
+
+if TYPE_CHECKING:
     from .connectors import MongoDBConnector
 
-    MONGODB_AVAILABLE = True
-except ImportError:
-    MongoDBConnector = None  # type: ignore
-    MONGODB_AVAILABLE = False
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so that importing memori.database does not load pymongo
+    if name == "MongoDBConnector":
+        return connectors.MongoDBConnector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["SQLiteConnector", "PostgreSQLConnector", "MySQLConnector"]
 
@@ -0,0 +1,139 @@
+"""
+Async engine support for SQLAlchemyDatabaseManager
+
+The async mode runs Memori's queries through SQLAlchemy's asyncio extension,
+so coroutines (the agents, ``execute_search_async``, async interceptors) can
+keep many database operations in flight on one event loop instead of
+blocking it or borrowing executor threads.
+
+Each dialect needs an asyncio driver and SQLAlchemy needs ``greenlet``:
+
+    sqlite      aiosqlite   pip install memorisdk[async]
+    postgresql  asyncpg     pip install memorisdk[async-postgres]
+    mysql       aiomysql    pip install memorisdk[async-mysql]
+
+The synchronous connection string is reused; its driver is swapped for the
+async one (``postgresql://`` becomes ``postgresql+asyncpg://`` and so on).
+
+Pooled asyncio connections belong to the event loop that opened them, and
+Memori awaits database calls both on its BackgroundEventLoop and on the
+caller's loop, so the manager keeps one AsyncEngine per running loop.
+"""
+
+import importlib.util
+import json
+import ssl
+
+from sqlalchemy.engine import make_url
+
+from ..utils.exceptions import DatabaseError
+
+# dialect -> (driver module, SQLAlchemy driver name, pip extra)
+ASYNC_DRIVERS = {
+    "sqlite": ("aiosqlite", "sqlite+aiosqlite", "async"),
+    "postgresql": ("asyncpg", "postgresql+asyncpg", "async-postgres"),
+    "mysql": ("aiomysql", "mysql+aiomysql", "async-mysql"),
+}
+
+
+def async_support_available(dialect: str) -> bool:
+    """True when greenlet and the dialect's asyncio driver are importable"""
+    driver = ASYNC_DRIVERS.get(dialect)
+    return (
+        driver is not None
+        and importlib.util.find_spec("greenlet") is not None
+        and importlib.util.find_spec(driver[0]) is not None
+    )
+
+
+def async_url(database_connect: str) -> str:
+    """The connection string with its driver replaced by the asyncio driver"""
+    url = make_url(database_connect)
+    dialect = url.get_backend_name()
+    if dialect not in ASYNC_DRIVERS:
+        raise DatabaseError(f"Async mode is not supported for {dialect}")
+    url = url.set(drivername=ASYNC_DRIVERS[dialect][1])
+
+    if dialect == "postgresql" and "sslmode" in url.query:
+        # asyncpg takes ``ssl`` where libpq takes ``sslmode``
+        query = dict(url.query)
+        query["ssl"] = query.pop("sslmode")
+        url = url.set(query=query)
+    elif dialect == "mysql":
+        # ssl/ssl_disabled flags are PyMySQL-specific; mysql_connect_args turns
+        # them into aiomysql's ssl argument
+        query = {k: v for k, v in url.query.items() if k not in ("ssl", "ssl_disabled")}
+        url = url.set(query=query)
+    return url.render_as_string(hide_password=False)
+
+
+def mysql_connect_args(database_connect: str) -> dict:
+    """
+    aiomysql connect_args for a MySQL connection string
+
+    ``ssl=true`` or ``ssl_disabled=false`` request TLS, as for the sync
+    engine; aiomysql takes it as an SSLContext. Certificates are not verified,
+    matching the sync engine's configuration.
+    """
+    query = make_url(database_connect).query
+    connect_args: dict = {"charset": "utf8mb4"}
+    if (
+        str(query.get("ssl", "false")).lower() == "true"
+        or str(query.get("ssl_disabled", "true")).lower() == "false"
+    ):
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        connect_args["ssl"] = context
+    return connect_args
+
+
+def check_async_support(database_connect: str):
+    """
+    Raise DatabaseError unless ``database_connect`` can run in async mode
+
+    It needs greenlet and the dialect's asyncio driver, and a database that a
+    second engine can open (not in-memory SQLite).
+    """
+    url = make_url(database_connect)
+    dialect = url.get_backend_name()
+    if dialect == "sqlite" and url.database in (None, "", ":memory:"):
+        # A second engine would open a second, empty in-memory database
+        raise DatabaseError("Async mode needs a file-backed SQLite database")
+    if not async_support_available(dialect):
+        module, _, extra = ASYNC_DRIVERS.get(dialect, ("?", "?", "async"))
+        raise DatabaseError(
+            f"Async mode for {dialect} needs greenlet and {module}. "
+            f"Install with: pip install memorisdk[{extra}]"
+        )
+
+
+def create_async_engine_for(database_connect: str, pool_settings: dict):
+    """
+    Create an AsyncEngine for ``database_connect``
+
+    Args:
+        database_connect: Synchronous connection string of the database
+        pool_settings: pool_size, max_overflow, pool_timeout, pool_recycle and
+            pool_pre_ping, as resolved for the sync engine
+
+    Raises:
+        DatabaseError: See ``check_async_support``
+    """
+    check_async_support(database_connect)
+    dialect = make_url(database_connect).get_backend_name()
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = async_url(database_connect)
+    engine_kwargs = {
+        "json_serializer": json.dumps,
+        "json_deserializer": json.loads,
+        "echo": False,
+    }
+    if dialect != "sqlite":
+        engine_kwargs.update(pool_settings)
+    if dialect == "mysql":
+        engine_kwargs["connect_args"] = mysql_connect_args(database_connect)
+
+    return create_async_engine(url, **engine_kwargs)
@@ -1,18 +1,34 @@
 """
 Database connectors for different database backends
+
+MongoDBConnector is imported on first access (PEP 562), so importing the
+SQL connectors does not load pymongo.
 """
 
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
 from .mysql_connector import MySQLConnector
 from .postgres_connector import PostgreSQLConnector
 from .sqlite_connector import SQLiteConnector
 
-try:
+if TYPE_CHECKING:
     from .mongodb_connector import MongoDBConnector
 
-    MONGODB_AVAILABLE = True
-except ImportError:
-    MongoDBConnector = None  # type: ignore
-    MONGODB_AVAILABLE = False
+MONGODB_AVAILABLE = importlib.util.find_spec("pymongo") is not None
+
+
+def __getattr__(name: str) -> Any:
+    if name != "MongoDBConnector":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = importlib.import_module(".mongodb_connector", __name__).MongoDBConnector
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
 
 __all__ = ["SQLiteConnector", "PostgreSQLConnector", "MySQLConnector"]
 
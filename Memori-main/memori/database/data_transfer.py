@@ -0,0 +1,550 @@
+"""
+Streaming export/import of Memori data between databases
+
+Moves chat_history, short_term_memory and long_term_memory between any of the
+supported managers (SQLite, MySQL, PostgreSQL via SQLAlchemyDatabaseManager and
+MongoDB via MongoDBDatabaseManager) without loading a store into memory.
+memory_entities is derived data: SQL imports rebuild it from the imported
+long-term memories instead of exporting it.
+
+Records are read in primary-key order with keyset batches, so exports use
+constant memory and can be resumed from the last exported key of each table.
+Output is JSON Lines (one ``{"table": ..., "record": ...}`` object per line) or,
+when pyarrow is installed, one Parquet file per table.
+
+Usage:
+    python -m memori.database.data_transfer export --database sqlite:///memori.db --output backup.jsonl
+    python -m memori.database.data_transfer import --database postgresql://... --input backup.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import JSON, Boolean, DateTime, Float, Integer, select
+
+from ..utils.exceptions import DatabaseError
+from .migrations.backfill_memory_entities import _as_list
+from .models import (
+    ChatHistory,
+    LongTermMemory,
+    MemoryEntity,
+    ShortTermMemory,
+    build_memory_entity_rows,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+    PYARROW_AVAILABLE = False
+
+# Export order matters: short_term_memory.chat_id references chat_history
+TABLE_MODELS = {
+    "chat_history": ChatHistory,
+    "short_term_memory": ShortTermMemory,
+    "long_term_memory": LongTermMemory,
+}
+
+PRIMARY_KEYS = {
+    "chat_history": "chat_id",
+    "short_term_memory": "memory_id",
+    "long_term_memory": "memory_id",
+}
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _is_mongodb(db_manager) -> bool:
+    return getattr(db_manager, "database_type", None) == "mongodb"
+
+
+def _to_portable(value: Any) -> Any:
+    """Convert a column value into a JSON-serializable value"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _validate_tables(tables: Iterable[str] | None) -> list[str]:
+    if tables is None:
+        return list(TABLE_MODELS)
+    unknown = [table for table in tables if table not in TABLE_MODELS]
+    if unknown:
+        raise ValueError(
+            f"Unknown table(s) {unknown}; expected one of {list(TABLE_MODELS)}"
+        )
+    # Keep dependency order regardless of how tables were passed in
+    return [table for table in TABLE_MODELS if table in tables]
+
+
+class MemoryExporter:
+    """Stream records out of a Memori database manager in primary-key order"""
+
+    def __init__(self, db_manager, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        # Last exported primary key per table; persist this to resume later
+        self.checkpoint: dict[str, str] = {}
+
+    def iter_batches(
+        self,
+        table: str,
+        user_id: str | None = None,
+        after: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield lists of at most ``batch_size`` portable records
+
+        Args:
+            table: One of TABLE_MODELS
+            user_id: Only export this user's rows (all users when None)
+            after: Resume after this primary key (exclusive)
+        """
+        _validate_tables([table])
+        if _is_mongodb(self.db_manager):
+            batches = self._iter_mongodb_batches(table, user_id, after)
+        else:
+            batches = self._iter_sql_batches(table, user_id, after)
+
+        key = PRIMARY_KEYS[table]
+        for batch in batches:
+            if batch:
+                yield batch
+                # Advance only once the consumer has handled the batch
+                self.checkpoint[table] = batch[-1][key]
+
+    def iter_records(
+        self,
+        table: str,
+        user_id: str | None = None,
+        after: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield portable records one at a time (see iter_batches)"""
+        for batch in self.iter_batches(table, user_id, after):
+            yield from batch
+
+    def _iter_sql_batches(
+        self, table: str, user_id: str | None, after: str | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        model = TABLE_MODELS[table]
+        key_column = getattr(model, PRIMARY_KEYS[table])
+        columns = list(model.__table__.columns)
+        # Exports are read-only, so use the replica when one is configured
+        engine = getattr(self.db_manager, "read_engine", None) or self.db_manager.engine
+
+        last_key = after
+        while True:
+            stmt = select(*columns).order_by(key_column).limit(self.batch_size)
+            if user_id is not None:
+                stmt = stmt.where(model.user_id == user_id)
+            if last_key is not None:
+                stmt = stmt.where(key_column > last_key)
+
+            try:
+                with engine.connect() as conn:
+                    rows = conn.execute(stmt).mappings().all()
+            except Exception as e:
+                raise DatabaseError(f"Failed to export {table}: {e}")
+
+            if not rows:
+                return
+
+            batch = [
+                {name: _to_portable(value) for name, value in row.items()}
+                for row in rows
+            ]
+            last_key = batch[-1][PRIMARY_KEYS[table]]
+            yield batch
+
+            if len(rows) < self.batch_size:
+                return
+
+    def _iter_mongodb_batches(
+        self, table: str, user_id: str | None, after: str | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        key = PRIMARY_KEYS[table]
+        collection = self.db_manager._get_collection(table)
+
+        filter_doc: dict[str, Any] = {}
+        if user_id is not None:
+            filter_doc["user_id"] = user_id
+        if after is not None:
+            filter_doc[key] = {"$gt": after}
+
+        try:
+            cursor = (
+                collection.find(filter_doc, {"_id": 0})
+                .sort(key, 1)
+                .batch_size(self.batch_size)
+            )
+            batch: list[dict[str, Any]] = []
+            for document in cursor:
+                # Mongo chat history stores the turn time as "timestamp"
+                if "created_at" not in document and "timestamp" in document:
+                    document["created_at"] = document["timestamp"]
+                batch.append(
+                    {name: _to_portable(value) for name, value in document.items()}
+                )
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        except Exception as e:
+            raise DatabaseError(f"Failed to export {table} from MongoDB: {e}")
+
+    def export_jsonl(
+        self,
+        path: str | Path,
+        tables: Iterable[str] | None = None,
+        user_id: str | None = None,
+        resume_from: dict[str, str] | None = None,
+    ) -> dict[str, int]:
+        """
+        Write records to a JSON Lines file
+
+        Args:
+            path: Output file. Appended to when ``resume_from`` is given.
+            tables: Tables to export (default: all, in dependency order)
+            user_id: Only export this user's rows
+            resume_from: Checkpoint from a previous run ({table: last key})
+
+        Returns:
+            Number of records written per table
+        """
+        tables = _validate_tables(tables)
+        resume_from = resume_from or {}
+        self.checkpoint = dict(resume_from)
+        written = dict.fromkeys(tables, 0)
+
+        mode = "a" if resume_from else "w"
+        with open(path, mode, encoding="utf-8") as f:
+            for table in tables:
+                for batch in self.iter_batches(
+                    table, user_id, after=resume_from.get(table)
+                ):
+                    f.writelines(
+                        json.dumps(
+                            {"table": table, "record": record},
+                            ensure_ascii=False,
+                            default=str,
+                        )
+                        + "\n"
+                        for record in batch
+                    )
+                    written[table] += len(batch)
+                logger.info(f"Exported {written[table]} {table} records to {path}")
+
+        return written
+
+    def export_parquet(
+        self,
+        directory: str | Path,
+        tables: Iterable[str] | None = None,
+        user_id: str | None = None,
+    ) -> dict[str, int]:
+        """
+        Write one Parquet file per table (requires pyarrow)
+
+        Columns follow the SQL schema; JSON columns are stored as JSON text and
+        datetimes as ISO-8601 strings so every backend produces the same schema.
+
+        Returns:
+            Number of records written per table
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow is required for columnar export. Install with: pip install pyarrow"
+            )
+
+        tables = _validate_tables(tables)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = dict.fromkeys(tables, 0)
+
+        for table in tables:
+            schema = _arrow_schema(table)
+            names = schema.names
+            writer = pq.ParquetWriter(directory / f"{table}.parquet", schema)
+            try:
+                for batch in self.iter_batches(table, user_id):
+                    columns = {
+                        name: [
+                            _to_columnar(table, name, record.get(name))
+                            for record in batch
+                        ]
+                        for name in names
+                    }
+                    writer.write_table(pa.table(columns, schema=schema))
+                    written[table] += len(batch)
+            finally:
+                writer.close()
+            logger.info(f"Exported {written[table]} {table} records to {directory}")
+
+        return written
+
+
+class MemoryImporter:
+    """Write streamed records into a Memori database manager in batches"""
+
+    def __init__(self, db_manager, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+
+    def import_records(self, table: str, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert records into ``table``; rows whose key already exists are skipped
+
+        Skipping existing keys makes re-running an interrupted import safe.
+
+        Returns:
+            Number of records inserted
+        """
+        _validate_tables([table])
+        inserted = 0
+        batch: list[dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                inserted += self._write_batch(table, batch)
+                batch = []
+        if batch:
+            inserted += self._write_batch(table, batch)
+        return inserted
+
+    def import_jsonl(self, path: str | Path) -> dict[str, int]:
+        """
+        Stream a file produced by MemoryExporter.export_jsonl into the database
+
+        Returns:
+            Number of records inserted per table
+        """
+        inserted: dict[str, int] = {}
+        # One pending batch at a time, written whenever the table changes, so
+        # rows reach the database in file order: chat_history rows are in
+        # before the short_term_memory rows that reference them.
+        pending_table: str | None = None
+        batch: list[dict[str, Any]] = []
+
+        def flush():
+            if batch:
+                inserted[pending_table] = inserted.get(
+                    pending_table, 0
+                ) + self._write_batch(pending_table, batch)
+
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    table, record = entry["table"], entry["record"]
+                except (ValueError, KeyError, TypeError) as e:
+                    raise DatabaseError(f"Invalid export line {line_number}: {e}")
+                _validate_tables([table])
+
+                if table != pending_table or len(batch) >= self.batch_size:
+                    flush()
+                    pending_table, batch = table, []
+                batch.append(record)
+
+        flush()
+
+        for table, count in inserted.items():
+            logger.info(f"Imported {count} {table} records from {path}")
+        return inserted
+
+    def _write_batch(self, table: str, records: list[dict[str, Any]]) -> int:
+        if _is_mongodb(self.db_manager):
+            return self._write_mongodb_batch(table, records)
+        return self._write_sql_batch(table, records)
+
+    def _write_sql_batch(self, table: str, records: list[dict[str, Any]]) -> int:
+        model = TABLE_MODELS[table]
+        key = PRIMARY_KEYS[table]
+        key_column = getattr(model, key)
+        columns = {column.name: column for column in model.__table__.columns}
+
+        rows = [self._to_sql_row(record, columns) for record in records]
+        try:
+            with self.db_manager.engine.begin() as conn:
+                existing = set(
+                    conn.execute(
+                        select(key_column).where(
+                            key_column.in_([row[key] for row in rows])
+                        )
+                    ).scalars()
+                )
+                new_rows = [row for row in rows if row[key] not in existing]
+                if new_rows:
+                    conn.execute(model.__table__.insert(), new_rows)
+                    entity_rows = self._memory_entity_rows(table, new_rows)
+                    if entity_rows:
+                        conn.execute(MemoryEntity.__table__.insert(), entity_rows)
+        except Exception as e:
+            raise DatabaseError(f"Failed to import {table}: {e}")
+
+        invalidate = getattr(self.db_manager, "invalidate_stats_cache", None)
+        if invalidate:
+            invalidate()
+        return len(new_rows)
+
+    @staticmethod
+    def _memory_entity_rows(
+        table: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """memory_entities index rows for newly imported long-term memories"""
+        if table != "long_term_memory":
+            return []
+        entity_rows = []
+        for row in rows:
+            entity_rows.extend(
+                build_memory_entity_rows(
+                    row["memory_id"],
+                    row.get("user_id", "default"),
+                    _as_list(row.get("entities_json")),
+                    _as_list(row.get("keywords_json")),
+                )
+            )
+        return entity_rows
+
+    @staticmethod
+    def _to_sql_row(record: dict[str, Any], columns: dict) -> dict[str, Any]:
+        """Keep known columns and restore datetimes from their ISO strings"""
+        row = {}
+        for name, column in columns.items():
+            if name not in record:
+                continue
+            value = record[name]
+            if isinstance(column.type, DateTime) and isinstance(value, str):
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            row[name] = value
+        return row
+
+    def _write_mongodb_batch(self, table: str, records: list[dict[str, Any]]) -> int:
+        from pymongo import UpdateOne
+
+        key = PRIMARY_KEYS[table]
+        collection = self.db_manager._get_collection(table)
+        operations = []
+        for record in records:
+            document = self.db_manager._convert_datetime_fields(dict(record))
+            if table == "chat_history" and "timestamp" not in document:
+                document["timestamp"] = document.get("created_at")
+            operations.append(
+                UpdateOne({key: document[key]}, {"$setOnInsert": document}, upsert=True)
+            )
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            raise DatabaseError(f"Failed to import {table} into MongoDB: {e}")
+        return result.upserted_count
+
+
+def _arrow_schema(table: str):
+    """Arrow schema mirroring the SQL model of ``table``"""
+    fields = []
+    for column in TABLE_MODELS[table].__table__.columns:
+        if isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        else:
+            # Strings, text, ISO datetimes and JSON text
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _to_columnar(table: str, name: str, value: Any) -> Any:
+    """Coerce a portable value into the type used by _arrow_schema"""
+    if value is None:
+        return None
+    column_type = TABLE_MODELS[table].__table__.columns[name].type
+    if isinstance(column_type, JSON):
+        return value if isinstance(value, str) else json.dumps(value, default=str)
+    if isinstance(column_type, (Boolean, Integer, Float)):
+        return value
+    return str(value)
+
+
+def _create_manager(database_connect: str):
+    if database_connect.startswith(("mongodb://", "mongodb+srv://")):
+        from .mongodb_manager import MongoDBDatabaseManager
+
+        return MongoDBDatabaseManager(database_connect)
+
+    from .sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    return SQLAlchemyDatabaseManager(database_connect)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export or import Memori data")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export to JSONL or Parquet")
+    export_parser.add_argument("--database", required=True)
+    export_parser.add_argument(
+        "--output", required=True, help="JSONL file, or directory with --parquet"
+    )
+    export_parser.add_argument("--user-id")
+    export_parser.add_argument("--tables", nargs="+", choices=list(TABLE_MODELS))
+    export_parser.add_argument("--parquet", action="store_true")
+    export_parser.add_argument(
+        "--resume", help="JSON checkpoint file; updated after the export"
+    )
+
+    import_parser = subparsers.add_parser("import", help="Import a JSONL export")
+    import_parser.add_argument("--database", required=True)
+    import_parser.add_argument("--input", required=True)
+
+    for sub in (export_parser, import_parser):
+        sub.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    args = parser.parse_args(argv)
+    manager = _create_manager(args.database)
+    manager.initialize_schema()
+
+    if args.command == "import":
+        counts = MemoryImporter(manager, args.batch_size).import_jsonl(args.input)
+        print(json.dumps(counts))
+        return 0
+
+    exporter = MemoryExporter(manager, args.batch_size)
+    if args.parquet:
+        counts = exporter.export_parquet(args.output, args.tables, args.user_id)
+    else:
+        resume_from = None
+        if args.resume and Path(args.resume).exists():
+            resume_from = json.loads(Path(args.resume).read_text())
+        try:
+            counts = exporter.export_jsonl(
+                args.output, args.tables, args.user_id, resume_from
+            )
+        finally:
+            if args.resume:
+                Path(args.resume).write_text(json.dumps(exporter.checkpoint))
+    print(json.dumps(counts))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""Database migration helpers for Memori"""
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Create the composite indexes that match Memori's hot query shapes
+
+Recent-history and ranked-context queries filter by user (and session,
+assistant, classification or processing flag) and then order by
+``created_at DESC`` or ``importance_score DESC, created_at DESC``. With only
+single-column indexes the database reads every row of the user and sorts
+them; the indexes below let it read rows in index order and stop at LIMIT.
+
+SQLAlchemyDatabaseManager.initialize_schema() creates missing model indexes on
+startup, but a plain CREATE INDEX blocks writes while it builds. On large
+PostgreSQL or MySQL tables, run this script before deploying instead: it builds
+the indexes online (``CONCURRENTLY`` / ``ALGORITHM=INPLACE, LOCK=NONE``) and
+refreshes planner statistics. It is idempotent.
+
+Usage:
+    python -m memori.database.migrations.add_query_path_indexes --database "postgresql://..."
+
+Options:
+    --database     Database connection string (required)
+    --dry-run      Print the DDL without running it
+"""
+
+import argparse
+import sys
+
+from loguru import logger
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from ..models import ChatHistory, LongTermMemory, ShortTermMemory
+
+# (table, index name) pairs declared in models.py for the query paths above
+QUERY_PATH_INDEXES = [
+    (ChatHistory.__table__, "idx_chat_user_session_created"),
+    (ChatHistory.__table__, "idx_chat_user_created"),
+    (ShortTermMemory.__table__, "idx_short_term_user_session_created"),
+    (ShortTermMemory.__table__, "idx_short_term_user_created"),
+    (ShortTermMemory.__table__, "idx_short_term_user_ranked"),
+    (ShortTermMemory.__table__, "idx_short_term_user_category_ranked"),
+    (LongTermMemory.__table__, "idx_long_term_user_assistant_created"),
+    (LongTermMemory.__table__, "idx_long_term_user_conscious"),
+    (LongTermMemory.__table__, "idx_long_term_user_dedup"),
+    (LongTermMemory.__table__, "idx_long_term_user_category_ranked"),
+]
+
+
+def index_ddl(index, dialect) -> str:
+    """CREATE INDEX statement that builds without blocking writes where possible"""
+    ddl = str(CreateIndex(index).compile(dialect=dialect))
+    if dialect.name == "postgresql":
+        return ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1)
+    if dialect.name == "mysql":
+        return f"{ddl} ALGORITHM=INPLACE LOCK=NONE"
+    return ddl.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1)
+
+
+def add_query_path_indexes(engine, dry_run: bool = False) -> list[str]:
+    """
+    Create any missing query-path indexes and refresh planner statistics
+
+    Args:
+        engine: SQLAlchemy engine of the Memori database
+        dry_run: Only return the DDL that would run
+
+    Returns:
+        DDL statements run (or, with dry_run, that would run)
+    """
+    inspector = inspect(engine)
+    pending = []
+    for table, name in QUERY_PATH_INDEXES:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        if name in existing:
+            continue
+        index = next(ix for ix in table.indexes if ix.name == name)
+        pending.append((table.name, index_ddl(index, engine.dialect)))
+
+    statements = [ddl for _, ddl in pending]
+    if dry_run or not pending:
+        return statements
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for _, ddl in pending:
+            logger.info(f"Running: {ddl}")
+            conn.execute(text(ddl))
+
+        analyze = {
+            "postgresql": "ANALYZE {}",
+            "mysql": "ANALYZE TABLE {}",
+            "sqlite": "ANALYZE {}",
+        }.get(engine.dialect.name)
+        if analyze:
+            for table_name in sorted({table_name for table_name, _ in pending}):
+                conn.execute(text(analyze.format(table_name)))
+
+    logger.info(f"Created {len(pending)} query-path indexes")
+    return statements
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Create Memori's composite query-path indexes online"
+    )
+    parser.add_argument("--database", required=True, help="Database connection string")
+    parser.add_argument("--dry-run", action="store_true", help="Print DDL only")
+    args = parser.parse_args(argv)
+
+    try:
+        engine = create_engine(args.database)
+        statements = add_query_path_indexes(engine, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"ERROR: Index migration failed: {e}")
+        return 1
+
+    for ddl in statements:
+        print(ddl if args.dry_run else f"Created: {ddl}")
+    if not statements:
+        print("All query-path indexes already exist")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Backfill the memory_entities table from long_term_memory
+
+memory_entities holds one row per (memory, entity type, normalized value) so
+entity lookups are index probes instead of full-text searches over JSON blobs.
+New memories are indexed on insert by SQLAlchemyDatabaseManager; this script
+indexes memories stored before the table existed. It is idempotent: memories
+that already have entity rows are skipped.
+
+Usage:
+    python -m memori.database.migrations.backfill_memory_entities --database "sqlite:///memori.db"
+
+Options:
+    --database     Database connection string (required)
+    --batch-size   Long-term memories processed per transaction (default: 500)
+"""
+
+import argparse
+import json
+import sys
+
+from loguru import logger
+from sqlalchemy import create_engine, select
+
+from ..models import LongTermMemory, MemoryEntity, build_memory_entity_rows
+
+
+def _as_list(value) -> list:
+    """entities_json/keywords_json may come back as JSON text on some drivers"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return [value]
+    return value if isinstance(value, list) else []
+
+
+def backfill_memory_entities(engine, batch_size: int = 500) -> int:
+    """
+    Create memory_entities (if missing) and index existing long-term memories
+
+    Args:
+        engine: SQLAlchemy engine of the Memori database
+        batch_size: Memories processed per transaction
+
+    Returns:
+        Number of entity rows inserted
+    """
+    MemoryEntity.__table__.create(bind=engine, checkfirst=True)
+
+    inserted = 0
+    last_id = None
+    while True:
+        with engine.begin() as conn:
+            stmt = (
+                select(
+                    LongTermMemory.memory_id,
+                    LongTermMemory.user_id,
+                    LongTermMemory.entities_json,
+                    LongTermMemory.keywords_json,
+                )
+                .where(
+                    ~select(MemoryEntity.id)
+                    .where(MemoryEntity.memory_id == LongTermMemory.memory_id)
+                    .exists()
+                )
+                .order_by(LongTermMemory.memory_id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(LongTermMemory.memory_id > last_id)
+
+            memories = conn.execute(stmt).all()
+            if not memories:
+                break
+
+            rows = []
+            for memory_id, user_id, entities, keywords in memories:
+                rows.extend(
+                    build_memory_entity_rows(
+                        memory_id, user_id, _as_list(entities), _as_list(keywords)
+                    )
+                )
+            if rows:
+                conn.execute(MemoryEntity.__table__.insert(), rows)
+                inserted += len(rows)
+
+            last_id = memories[-1][0]
+
+        if len(memories) < batch_size:
+            break
+
+    logger.info(f"Backfilled {inserted} memory_entities rows")
+    return inserted
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Backfill memory_entities from long_term_memory"
+    )
+    parser.add_argument("--database", required=True, help="Database connection string")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    try:
+        engine = create_engine(args.database)
+        count = backfill_memory_entities(engine, args.batch_size)
+    except Exception as e:
+        print(f"ERROR: Backfill failed: {e}")
+        return 1
+
+    print(f"Inserted {count} memory_entities rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ SQLAlchemy models for Memori v2.0
 Provides cross-database compatibility using SQLAlchemy ORM
 """
 
+import hashlib
 from datetime import datetime
 from typing import Any
 
@@ -17,11 +18,14 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
     create_engine,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 
+from ..utils.pydantic_models import EntityType
+
 Base: Any = declarative_base()
 
 
@@ -57,6 +61,9 @@ class ChatHistory(Base):
         Index("idx_chat_user_assistant", "user_id", "assistant_id"),
         Index("idx_chat_created", "created_at"),
         Index("idx_chat_model", "model"),
+        # get_chat_history: user (+ session) filter, newest first
+        Index("idx_chat_user_session_created", "user_id", "session_id", "created_at"),
+        Index("idx_chat_user_created", "user_id", "created_at"),
     )
 
 
@@ -105,6 +112,30 @@ class ShortTermMemory(Base):
             "category_primary",
             "importance_score",
         ),
+        Index(
+            "idx_short_term_user_category_ranked",
+            "user_id",
+            "category_primary",
+            "importance_score",
+            "created_at",
+        ),
+        # Recent short-term memories of a user (+ session), newest first
+        Index(
+            "idx_short_term_user_session_created",
+            "user_id",
+            "session_id",
+            "created_at",
+        ),
+        Index("idx_short_term_user_created", "user_id", "created_at"),
+        # Essential/conscious context: ranked by importance, then recency; the
+        # trailing category lets the essential_% filter run on the index
+        Index(
+            "idx_short_term_user_ranked",
+            "user_id",
+            "importance_score",
+            "created_at",
+            "category_primary",
+        ),
     )
 
 
@@ -199,12 +230,171 @@ class LongTermMemory(Base):
             "category_primary",
             "importance_score",
         ),
+        Index(
+            "idx_long_term_user_category_ranked",
+            "user_id",
+            "category_primary",
+            "importance_score",
+            "created_at",
+        ),
+        # Recent long-term memories visible to an assistant, newest first
+        Index(
+            "idx_long_term_user_assistant_created",
+            "user_id",
+            "assistant_id",
+            "created_at",
+        ),
+        # Conscious promotion: unprocessed conscious-info memories, ranked
+        Index(
+            "idx_long_term_user_conscious",
+            "user_id",
+            "classification",
+            "conscious_processed",
+            "importance_score",
+            "created_at",
+        ),
+        # Deduplication candidates: recent unprocessed memories of a user
+        Index(
+            "idx_long_term_user_dedup",
+            "user_id",
+            "processed_for_duplicates",
+            "created_at",
+        ),
         Index(
             "idx_long_term_version", "memory_id", "version"
         ),  # For optimistic locking
     )
 
 
+class MemoryEntity(Base):
+    """Normalized entities/keywords of long-term memories for indexed lookup"""
+
+    __tablename__ = "memory_entities"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    memory_id = Column(
+        String(255),
+        ForeignKey("long_term_memory.memory_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id = Column(String(255), nullable=False, default="default")
+    entity_type = Column(String(50), nullable=False)  # 'entity' or 'keyword'
+    entity_value = Column(String(255), nullable=False)  # As extracted
+    normalized_value = Column(String(255), nullable=False)  # Lookup key
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "idx_memory_entities_lookup", "user_id", "normalized_value", "entity_type"
+        ),
+        Index("idx_memory_entities_memory", "memory_id"),
+        UniqueConstraint(
+            "memory_id",
+            "entity_type",
+            "normalized_value",
+            name="uq_memory_entities_memory_value",
+        ),
+    )
+
+
+class SchemaVersion(Base):
+    """Schema stamp written after a full setup, so later startups can skip it"""
+
+    __tablename__ = "memori_schema_version"
+
+    component = Column(String(64), primary_key=True)
+    version = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+# Bump when setup steps change without a model change (FTS triggers, backfills)
+SCHEMA_VERSION = 2
+SCHEMA_COMPONENT = "core"
+# Stamped once the memory_entities backfill has run on a database
+ENTITY_BACKFILL_COMPONENT = "memory_entities_backfill"
+
+
+def schema_fingerprint() -> str:
+    """SCHEMA_VERSION plus a hash of every table, column and index definition"""
+    parts = [str(SCHEMA_VERSION)]
+    for table in Base.metadata.sorted_tables:
+        parts.append(table.name)
+        parts.extend(f"{column.name}:{column.type!r}" for column in table.columns)
+        parts.extend(
+            sorted(
+                f"{index.name}({','.join(c.name for c in index.columns)})"
+                for index in table.indexes
+            )
+        )
+    digest = hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+    return f"{SCHEMA_VERSION}-{digest}"
+
+
+ENTITY_TYPE_ENTITY = "entity"
+ENTITY_TYPE_KEYWORD = "keyword"
+# EntityType kinds stored as ENTITY_TYPE_ENTITY rows
+ENTITY_KINDS = frozenset(kind.value for kind in EntityType) - {ENTITY_TYPE_KEYWORD}
+
+
+def memory_entity_type(entity_type: Any) -> str | None:
+    """
+    memory_entities type for an EntityType (or its value)
+
+    Entities are indexed without their kind, so person, technology, topic,
+    skill and project all map to "entity". None, and types this index does
+    not know, map to None: no type filter.
+    """
+    if entity_type is None:
+        return None
+    value = str(getattr(entity_type, "value", entity_type)).casefold()
+    if value == ENTITY_TYPE_KEYWORD:
+        return ENTITY_TYPE_KEYWORD
+    if value == ENTITY_TYPE_ENTITY or value in ENTITY_KINDS:
+        return ENTITY_TYPE_ENTITY
+    return None
+
+
+def normalize_entity_value(value: Any) -> str:
+    """Lookup form of an entity: case-folded, whitespace-collapsed, max 255 chars"""
+    if value is None:
+        return ""
+    return " ".join(str(value).split()).casefold()[:255]
+
+
+def build_memory_entity_rows(
+    memory_id: str,
+    user_id: str,
+    entities: list[Any] | None,
+    keywords: list[Any] | None,
+) -> list[dict[str, Any]]:
+    """
+    Rows for memory_entities from a memory's entity and keyword lists
+
+    Empty values and duplicates (per type, after normalization) are dropped.
+    """
+    rows = []
+    seen = set()
+    for entity_type, values in (
+        (ENTITY_TYPE_ENTITY, entities),
+        (ENTITY_TYPE_KEYWORD, keywords),
+    ):
+        for value in values or []:
+            normalized = normalize_entity_value(value)
+            if not normalized or (entity_type, normalized) in seen:
+                continue
+            seen.add((entity_type, normalized))
+            rows.append(
+                {
+                    "memory_id": memory_id,
+                    "user_id": user_id,
+                    "entity_type": entity_type,
+                    "entity_value": str(value).strip()[:255],
+                    "normalized_value": normalized,
+                }
+            )
+    return rows
+
+
 # Database-specific configurations
 def configure_mysql_fulltext(engine):
     """Configure MySQL FULLTEXT indexes"""
@@ -42,7 +42,8 @@ except ImportError:
     logger.warning("pymongo not available - MongoDB support disabled")
 
 from ..utils.exceptions import DatabaseError
-from ..utils.pydantic_models import ProcessedLongTermMemory
+from ..utils.metrics import timed
+from ..utils.pydantic_models import MemoryClassification, ProcessedLongTermMemory
 
 
 class MongoDBDatabaseManager:
@@ -84,6 +85,9 @@ class MongoDBDatabaseManager:
         # Collections cache
         self._collections = {}
 
+        # Callbacks fed each newly stored promotion candidate (see subscribe_promotions)
+        self._promotion_subscribers: list = []
+
         logger.info(f"Initialized MongoDB database manager for {self.database_name}")
 
     def _parse_connection_string(self):
@@ -579,6 +583,7 @@ class MongoDBDatabaseManager:
         except Exception as e:
             logger.error(f"Text index verification failed: {e}")
 
+    @timed("db.write", operation="chat_history")
     def store_chat_history(
         self,
         chat_id: str,
@@ -922,8 +927,15 @@ class MongoDBDatabaseManager:
         user_id: str = "default",
         assistant_id: str | None = None,
         session_id: str = "default",
+        memory_ids: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get unprocessed conscious-info labeled memories from long-term memory"""
+        """Get unprocessed conscious-info labeled memories from long-term memory
+
+        Args:
+            memory_ids: Only consider these memories (promotion events)
+        """
+        if memory_ids is not None and not memory_ids:
+            return []
         try:
             collection = self._get_collection(self.LONG_TERM_MEMORY_COLLECTION)
 
@@ -939,6 +951,8 @@ class MongoDBDatabaseManager:
                     {"conscious_processed": None},
                 ],
             }
+            if memory_ids is not None:
+                filter_doc["memory_id"] = {"$in": list(memory_ids)}
 
             # Execute query
             cursor = collection.find(filter_doc).sort(
@@ -976,6 +990,23 @@ class MongoDBDatabaseManager:
         except Exception as e:
             logger.error(f"Failed to mark conscious memories processed: {e}")
 
+    def subscribe_promotions(self, callback):
+        """Register ``callback(memory_id, user_id)`` for new promotion candidates"""
+        if callback not in self._promotion_subscribers:
+            self._promotion_subscribers.append(callback)
+
+    def unsubscribe_promotions(self, callback):
+        if callback in self._promotion_subscribers:
+            self._promotion_subscribers.remove(callback)
+
+    def _publish_promotion(self, memory_id: str, user_id: str):
+        for callback in list(self._promotion_subscribers):
+            try:
+                callback(memory_id, user_id)
+            except Exception as e:
+                logger.warning(f"Promotion subscriber failed for {memory_id}: {e}")
+
+    @timed("db.write", operation="long_term_memory")
     def store_long_term_memory_enhanced(
         self,
         memory: ProcessedLongTermMemory,
@@ -1055,6 +1086,11 @@ class MongoDBDatabaseManager:
             collection.insert_one(document)
 
             logger.debug(f"Stored enhanced long-term memory {memory_id}")
+            if (
+                memory.promotion_eligible
+                or memory.classification == MemoryClassification.CONSCIOUS_INFO
+            ):
+                self._publish_promotion(memory_id, user_id)
             return memory_id
 
         except Exception as e:
@@ -1092,6 +1128,119 @@ class MongoDBDatabaseManager:
             if not cleaned_query:
                 return []
 
+            try:
+                results = self._search_memories_aggregated(
+                    cleaned_query,
+                    user_id,
+                    assistant_id,
+                    session_id,
+                    category_filter,
+                    limit,
+                )
+                logger.debug(f"MongoDB search returned {len(results)} results")
+                return results
+            except OperationFailure as e:
+                # $unionWith needs MongoDB 4.4+; older servers search per collection
+                logger.debug(
+                    f"Aggregated MongoDB search unavailable, searching per collection: {e}"
+                )
+
+            return self._search_memories_per_collection(
+                cleaned_query, user_id, assistant_id, session_id, category_filter, limit
+            )
+
+        except Exception as e:
+            logger.error(f"MongoDB search_memories failed: {e}")
+            # Return empty list to maintain compatibility with SQL manager
+            return []
+
+    # Fields returned by search_memories. Ranking uses search_score,
+    # importance_score and created_at; the rest is what callers display.
+    # processed_data is loaded on first access (see _lazy_search_results).
+    SEARCH_RESULT_FIELDS = [
+        "memory_id",
+        "importance_score",
+        "category_primary",
+        "classification",
+        "searchable_content",
+        "summary",
+        "created_at",
+        "user_id",
+        "assistant_id",
+        "session_id",
+    ]
+
+    def _search_memories_aggregated(
+        self,
+        cleaned_query: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str,
+        category_filter: list[str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Search both memory collections with a single aggregation round-trip"""
+        from .search.mongodb_search_adapter import (
+            build_text_search_pipeline,
+            unexpired_filter,
+        )
+
+        base_filter: dict[str, Any] = {
+            "user_id": user_id,
+            "assistant_id": assistant_id,
+            "session_id": session_id,
+        }
+        if category_filter:
+            base_filter["category_primary"] = {"$in": category_filter}
+
+        pipeline = build_text_search_pipeline(
+            cleaned_query,
+            primary_type="short_term",
+            primary_filter={**base_filter, **unexpired_filter()},
+            union_collection=self.LONG_TERM_MEMORY_COLLECTION,
+            union_type="long_term",
+            union_filter=base_filter,
+            projection_fields=self.SEARCH_RESULT_FIELDS,
+            limit=limit,
+        )
+
+        collection = self._get_collection(self.SHORT_TERM_MEMORY_COLLECTION)
+        results = []
+        for document in collection.aggregate(pipeline):
+            memory = self._convert_to_dict(document)
+            memory["search_strategy"] = "mongodb_text"
+            memory.setdefault("importance_score", 0.5)
+            if memory.get("created_at") is None:
+                memory["created_at"] = datetime.now(timezone.utc).isoformat()
+            results.append(memory)
+        return self._lazy_search_results(results)
+
+    def _lazy_search_results(
+        self, results: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Search results whose processed_data is fetched in one query on first use"""
+        from .search_records import MongoProcessedDataLoader, attach_lazy_processed_data
+
+        collections = {
+            "short_term": self.SHORT_TERM_MEMORY_COLLECTION,
+            "long_term": self.LONG_TERM_MEMORY_COLLECTION,
+        }
+        loader = MongoProcessedDataLoader(
+            lambda memory_type: self._get_collection(collections[memory_type])
+        )
+        return attach_lazy_processed_data(results, loader=loader)
+
+    def _search_memories_per_collection(
+        self,
+        cleaned_query: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str,
+        category_filter: list[str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Search each memory collection with its own $text query (pre-4.4 servers)"""
+        try:
             results = []
             collections_to_search = [
                 (self.SHORT_TERM_MEMORY_COLLECTION, "short_term"),
@@ -1141,10 +1290,12 @@ class MongoDBDatabaseManager:
                             )
 
                     # Execute search with standardized projection
+                    projection: dict[str, Any] = dict.fromkeys(
+                        self.SEARCH_RESULT_FIELDS, 1
+                    )
+                    projection["score"] = {"$meta": "textScore"}
                     cursor = (
-                        collection.find(
-                            search_filter, {"score": {"$meta": "textScore"}}
-                        )
+                        collection.find(search_filter, projection)
                         .sort(
                             [
                                 ("score", {"$meta": "textScore"}),
@@ -1188,7 +1339,7 @@ class MongoDBDatabaseManager:
             )
 
             logger.debug(f"MongoDB search returned {len(results)} results")
-            return results[:limit]
+            return self._lazy_search_results(results[:limit])
 
         except Exception as e:
             logger.error(f"MongoDB search_memories failed: {e}")
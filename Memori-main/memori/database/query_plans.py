@@ -0,0 +1,486 @@
+"""
+Query-plan capture and index-usage checks
+
+Some search paths degrade to full table scans (leading-wildcard LIKE,
+``category_primary LIKE 'essential_%'``, joins without a usable index) and
+nothing notices until a table is large. A ``QueryPlanCollector`` attached to
+an engine runs ``EXPLAIN`` once for every distinct SELECT the engine executes
+(``EXPLAIN QUERY PLAN`` on SQLite, ``EXPLAIN (FORMAT JSON)`` on PostgreSQL,
+``EXPLAIN`` on MySQL), records the plan under the metrics span that issued it
+(``search.strategy``, ``agent.plan_search``, ...), notes whether the
+database sorts the rows itself instead of reading them in index order, and
+flags full scans of tables holding at least ``row_threshold`` rows.
+
+Usage:
+    collector = db_manager.enable_query_diagnostics(row_threshold=1000)
+    ...
+    collector.report()                    # plans, scans, flagged statements
+
+    # in tests
+    with capture_query_plans(engine) as plans:
+        service.search_memories("coffee", user_id="u1")
+    plans.assert_index_usage(tables={"long_term_memory"})
+
+Diagnostics are opt-in: each new statement costs an extra EXPLAIN round trip.
+Set ``MEMORI_QUERY_DIAGNOSTICS=1`` (or a row threshold, e.g. ``=5000``) to
+enable them for every ``SQLAlchemyDatabaseManager``.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from ..utils.exceptions import DatabaseError
+from ..utils.metrics import current_span, increment
+from .statements import dialect_name
+
+DEFAULT_ROW_THRESHOLD = 1000
+DEFAULT_MAX_PLANS = 500
+ROW_COUNT_TTL_SECONDS = 30.0
+
+_ALIAS_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w.]*)(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?",
+    re.IGNORECASE,
+)
+# Words that can follow a table name but are not aliases
+_NOT_ALIASES = set(
+    "where on join left right inner outer cross full group order limit union "
+    "using natural having offset".split()
+)
+
+
+@dataclass
+class TableScan:
+    """A full scan of one table within a plan"""
+
+    table: str
+    detail: str
+    rows: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"table": self.table, "detail": self.detail, "rows": self.rows}
+
+
+@dataclass
+class QueryPlan:
+    """EXPLAIN output for one distinct statement"""
+
+    sql: str
+    dialect: str
+    plan: list[str]
+    scans: list[TableScan] = field(default_factory=list)
+    indexes: list[str] = field(default_factory=list)
+    sorts: bool = False
+    scope: str | None = None
+    executions: int = 1
+
+    @property
+    def uses_index(self) -> bool:
+        return bool(self.indexes)
+
+    def flagged_scans(self, row_threshold: int) -> list[TableScan]:
+        """Scans of tables at or above ``row_threshold`` rows (unknown counts too)"""
+        return [
+            scan
+            for scan in self.scans
+            if scan.rows is None or scan.rows >= row_threshold
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sql": " ".join(self.sql.split()),
+            "dialect": self.dialect,
+            "scope": self.scope,
+            "executions": self.executions,
+            "plan": self.plan,
+            "indexes": self.indexes,
+            "sorts": self.sorts,
+            "scans": [scan.to_dict() for scan in self.scans],
+        }
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    """Map of alias (and bare name) -> table for FROM/JOIN clauses"""
+    aliases = {}
+    for table, alias in _ALIAS_PATTERN.findall(sql):
+        if table.startswith("("):
+            continue
+        table = table.split(".")[-1]
+        aliases[table.lower()] = table
+        if alias and alias.lower() not in _NOT_ALIASES:
+            aliases[alias.lower()] = table
+    return aliases
+
+
+def _parse_sqlite(rows: list[tuple], sql: str) -> dict[str, Any]:
+    """rows of EXPLAIN QUERY PLAN: (id, parent, notused, detail)"""
+    aliases = table_aliases(sql)
+    plan, scans, indexes = [], [], []
+    sorts = False
+    for row in rows:
+        detail = str(row[-1])
+        plan.append(detail)
+        if detail.startswith("USE TEMP B-TREE FOR") and "ORDER BY" in detail:
+            sorts = True
+        index = re.search(r"USING (?:COVERING )?INDEX (\S+)", detail)
+        if index:
+            indexes.append(index.group(1))
+        elif "USING INTEGER PRIMARY KEY" in detail or "USING PRIMARY KEY" in detail:
+            indexes.append("PRIMARY KEY")
+        match = re.match(r"SCAN (?:TABLE )?(\S+)", detail)
+        if not match or "VIRTUAL TABLE" in detail:
+            continue
+        name = match.group(1)
+        table = aliases.get(name.lower())
+        # Scans of subqueries, CTEs and "CONSTANT ROW" are not table scans
+        if table is not None:
+            scans.append(TableScan(table=table, detail=detail))
+    return {"plan": plan, "scans": scans, "indexes": indexes, "sorts": sorts}
+
+
+def _parse_postgresql(rows: list[tuple], sql: str) -> dict[str, Any]:
+    """Single row holding the JSON plan tree"""
+    document = rows[0][0]
+    if isinstance(document, str):
+        document = json.loads(document)
+    plan, scans, indexes, sort_nodes = [], [], [], []
+
+    def walk(node: dict, depth: int):
+        node_type = node.get("Node Type", "")
+        if node_type in ("Sort", "Incremental Sort"):
+            sort_nodes.append(node_type)
+        relation = node.get("Relation Name")
+        line = "  " * depth + node_type
+        if relation:
+            line += f" on {relation}"
+        if node.get("Index Name"):
+            line += f" using {node['Index Name']}"
+            indexes.append(node["Index Name"])
+        plan.append(line)
+        if node_type == "Seq Scan" and relation:
+            scans.append(TableScan(table=relation, detail=line.strip()))
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(document[0]["Plan"], 0)
+    return {
+        "plan": plan,
+        "scans": scans,
+        "indexes": indexes,
+        "sorts": bool(sort_nodes),
+    }
+
+
+def _parse_mysql(rows: list[tuple], sql: str, columns: list[str]) -> dict[str, Any]:
+    """Tabular EXPLAIN: one row per table access; type ALL is a full scan"""
+    aliases = table_aliases(sql)
+    plan, scans, indexes = [], [], []
+    sorts = False
+    for row in rows:
+        record = dict(zip(columns, row, strict=False))
+        name = str(record.get("table") or "")
+        access = str(record.get("type") or "")
+        key = record.get("key")
+        extra = str(record.get("Extra") or "")
+        detail = f"{access} {name}" + (f" using {key}" if key else "")
+        if extra:
+            detail += f" ({extra})"
+        plan.append(detail)
+        if "filesort" in extra:
+            sorts = True
+        if key:
+            indexes.append(str(key))
+        if access == "ALL" and name.lower() in aliases:
+            scans.append(TableScan(table=aliases[name.lower()], detail=detail))
+    return {"plan": plan, "scans": scans, "indexes": indexes, "sorts": sorts}
+
+
+def _explain_prefix(dialect: str) -> str | None:
+    return {
+        "sqlite": "EXPLAIN QUERY PLAN ",
+        "postgresql": "EXPLAIN (FORMAT JSON) ",
+        "mysql": "EXPLAIN ",
+    }.get(dialect)
+
+
+def _parse(
+    dialect: str, rows: list[tuple], sql: str, columns: list[str]
+) -> dict[str, Any]:
+    if dialect == "sqlite":
+        return _parse_sqlite(rows, sql)
+    if dialect == "postgresql":
+        return _parse_postgresql(rows, sql)
+    return _parse_mysql(rows, sql, columns)
+
+
+def _is_select(statement: str) -> bool:
+    return statement.lstrip(" \n\t(").upper().startswith(("SELECT", "WITH"))
+
+
+def explain(connection: Any, sql: str, params: dict | None = None) -> QueryPlan:
+    """
+    Plan of one statement on a SQLAlchemy Connection or Session
+
+    ``sql`` uses ``:name`` binds, as passed to ``text()``.
+    """
+    dialect = dialect_name(connection)
+    prefix = _explain_prefix(dialect)
+    if prefix is None:
+        raise DatabaseError(f"EXPLAIN is not supported for dialect '{dialect}'")
+    result = connection.execute(text(prefix + sql), params or {})
+    columns = list(result.keys())
+    rows = [tuple(row) for row in result.fetchall()]
+    return QueryPlan(sql=sql, dialect=dialect, **_parse(dialect, rows, sql, columns))
+
+
+class QueryPlanCollector:
+    """
+    Captures the plan of every distinct SELECT run on the attached engines
+
+    Args:
+        row_threshold: Full scans of tables with at least this many rows are
+            flagged (logged once per statement and counted as ``db.full_scan``)
+        max_plans: Distinct statements kept; later ones are not explained
+    """
+
+    def __init__(
+        self,
+        row_threshold: int = DEFAULT_ROW_THRESHOLD,
+        max_plans: int = DEFAULT_MAX_PLANS,
+    ):
+        self.row_threshold = row_threshold
+        self.max_plans = max_plans
+        self._plans: dict[tuple[str, str], QueryPlan] = {}
+        self._row_counts: dict[tuple[int, str], tuple[float, int | None]] = {}
+        self._engines: list[Engine] = []
+        self._lock = threading.Lock()
+
+    # -- attachment ---------------------------------------------------------
+
+    def attach(self, engine: Engine) -> "QueryPlanCollector":
+        if _explain_prefix(engine.dialect.name) is None:
+            logger.debug(
+                f"Query diagnostics not supported for {engine.dialect.name}"
+            )
+            return self
+        if engine not in self._engines:
+            event.listen(engine, "after_cursor_execute", self._after_execute)
+            self._engines.append(engine)
+        return self
+
+    def detach(self):
+        for engine in self._engines:
+            event.remove(engine, "after_cursor_execute", self._after_execute)
+        self._engines.clear()
+
+    def __enter__(self) -> "QueryPlanCollector":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.detach()
+
+    # -- capture ------------------------------------------------------------
+
+    def _after_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        if executemany or not _is_select(statement):
+            return
+        span = current_span()
+        scope = span.name if span is not None else None
+        key = (statement, scope or "")
+        with self._lock:
+            existing = self._plans.get(key)
+            if existing is not None:
+                existing.executions += 1
+                return
+            if len(self._plans) >= self.max_plans:
+                return
+
+        try:
+            plan = self._explain_raw(conn, statement, parameters)
+        except Exception as e:
+            logger.debug(f"EXPLAIN failed, statement not captured: {e}")
+            return
+        plan.scope = scope
+        for scan in plan.scans:
+            scan.rows = self._row_count(conn, scan.table)
+
+        with self._lock:
+            if key in self._plans:
+                self._plans[key].executions += 1
+                return
+            self._plans[key] = plan
+
+        for scan in plan.flagged_scans(self.row_threshold):
+            logger.warning(
+                f"Full scan of {scan.table} ({scan.rows} rows) "
+                f"in {scope or 'unscoped query'}: {scan.detail} | "
+                f"{' '.join(statement.split())[:200]}"
+            )
+            increment("db.full_scan", table=scan.table, scope=scope or "none")
+
+    def _explain_raw(self, conn, statement: str, parameters) -> QueryPlan:
+        """EXPLAIN on the same DBAPI connection, bypassing engine events"""
+        dialect = conn.dialect.name
+        savepoint = dialect == "postgresql"
+        cursor = conn.connection.cursor()
+        try:
+            # A failed EXPLAIN must not abort the caller's transaction
+            if savepoint:
+                cursor.execute("SAVEPOINT memori_explain")
+            try:
+                cursor.execute(_explain_prefix(dialect) + statement, parameters)
+                rows = [tuple(row) for row in cursor.fetchall()]
+                columns = [d[0] for d in cursor.description or []]
+            except Exception:
+                if savepoint:
+                    cursor.execute("ROLLBACK TO SAVEPOINT memori_explain")
+                raise
+            if savepoint:
+                cursor.execute("RELEASE SAVEPOINT memori_explain")
+        finally:
+            cursor.close()
+        return QueryPlan(
+            sql=statement, dialect=dialect, **_parse(dialect, rows, statement, columns)
+        )
+
+    def _row_count(self, conn, table: str) -> int | None:
+        """Row count of ``table`` (estimated on PostgreSQL/MySQL), cached briefly"""
+        key = (id(conn.engine), table)
+        now = time.monotonic()
+        cached = self._row_counts.get(key)
+        if cached is not None and now - cached[0] < ROW_COUNT_TTL_SECONDS:
+            return cached[1]
+
+        dialect = conn.dialect.name
+        if not re.fullmatch(r"\w+", table):
+            return None
+        queries = {
+            "sqlite": (f'SELECT COUNT(*) FROM "{table}"', ()),
+            "postgresql": (
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                (table,),
+            ),
+            "mysql": (
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (table,),
+            ),
+        }
+        count = None
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(*queries[dialect])
+            row = cursor.fetchone()
+            count = int(row[0]) if row and row[0] is not None else None
+        except Exception as e:
+            logger.debug(f"Row count for {table} unavailable: {e}")
+        finally:
+            cursor.close()
+        self._row_counts[key] = (now, count)
+        return count
+
+    # -- reporting ----------------------------------------------------------
+
+    def plans(self) -> list[QueryPlan]:
+        with self._lock:
+            return list(self._plans.values())
+
+    def flagged(self) -> list[QueryPlan]:
+        """Plans with at least one full scan above the row threshold"""
+        return [p for p in self.plans() if p.flagged_scans(self.row_threshold)]
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self._row_counts.clear()
+
+    def report(self) -> dict[str, Any]:
+        plans = self.plans()
+        flagged = [p for p in plans if p.flagged_scans(self.row_threshold)]
+        return {
+            "row_threshold": self.row_threshold,
+            "statements": len(plans),
+            "sorting": sum(1 for p in plans if p.sorts),
+            "flagged": [p.to_dict() for p in flagged],
+            "plans": [p.to_dict() for p in plans],
+        }
+
+    def assert_index_usage(
+        self,
+        tables: Iterable[str] | None = None,
+        scope: str | None = None,
+    ):
+        """
+        Test helper: fail if any captured plan fully scans a flagged table
+
+        Args:
+            tables: Only check scans of these tables (default: all)
+            scope: Only check statements issued under this span name
+        """
+        wanted = {t.lower() for t in tables} if tables is not None else None
+        offending = []
+        for plan in self.plans():
+            if scope is not None and plan.scope != scope:
+                continue
+            for scan in plan.flagged_scans(self.row_threshold):
+                if wanted is None or scan.table.lower() in wanted:
+                    offending.append((plan, scan))
+        if offending:
+            details = "\n".join(
+                f"- {scan.table} ({scan.rows} rows) in {plan.scope or 'unscoped'}: "
+                f"{scan.detail}\n  {' '.join(plan.sql.split())[:300]}"
+                for plan, scan in offending
+            )
+            raise AssertionError(f"Queries scan tables without an index:\n{details}")
+
+
+@contextmanager
+def capture_query_plans(
+    engine: Any, row_threshold: int = 0
+) -> Iterator[QueryPlanCollector]:
+    """
+    Capture plans of queries run inside the block
+
+    ``engine`` may be an Engine or a database manager (its primary and replica
+    engines are both watched). The default threshold of 0 flags every full
+    scan, which is what index-coverage tests want.
+    """
+    collector = QueryPlanCollector(row_threshold=row_threshold)
+    for target in _engines_of(engine):
+        collector.attach(target)
+    try:
+        yield collector
+    finally:
+        collector.detach()
+
+
+def _engines_of(target: Any) -> list[Engine]:
+    if isinstance(target, Engine):
+        return [target]
+    engines = [target.engine]
+    read_engine = getattr(target, "read_engine", None)
+    if read_engine is not None and read_engine is not target.engine:
+        engines.append(read_engine)
+    return engines
+
+
+def threshold_from_env() -> int | None:
+    """Row threshold requested by MEMORI_QUERY_DIAGNOSTICS, or None if off"""
+    value = os.getenv("MEMORI_QUERY_DIAGNOSTICS", "").strip().lower()
+    if value in ("", "0", "false", "no"):
+        return None
+    if value.isdigit() and value != "1":
+        return int(value)
+    return DEFAULT_ROW_THRESHOLD
@@ -0,0 +1,149 @@
+"""
+Request-scoped read session shared by Memori's read paths
+
+One chat turn used to check out a connection per read: the essential
+conversations query, every search, chat history and the conscious context
+each opened their own session or connection. Inside ``read_scope()`` those
+reads share one pooled connection and one transaction, so the turn pays for
+one checkout and, on PostgreSQL and MySQL, sees a single snapshot. (pysqlite
+does not open a transaction for SELECTs, so SQLite reads share the
+connection but not a snapshot, and never hold a read lock across the turn.)
+
+The shared session is on the primary, where these reads go outside a scope
+too, so a turn never misses rows the previous turn wrote. With a read
+replica configured, searches (which always use the replica) get a second
+scope session on the replica, opened on the first search.
+
+The scope is bound to a context variable and to the thread that opened it.
+Worker threads that inherit a copy of the context (parallel search
+strategies) get their own sessions, since a Session is not thread-safe.
+
+Usage:
+    with db_manager.read_scope():
+        db_manager.get_chat_history(user_id="u1")
+        db_manager.search_memories("coffee", user_id="u1")
+"""
+
+import contextvars
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..utils.metrics import increment
+
+
+@dataclass
+class ReadScope:
+    """Read-only sessions borrowed by every read inside one request"""
+
+    manager: object
+    session: Session
+    thread_id: int = field(default_factory=threading.get_ident)
+    reads: int = 0
+    # Replica session for searches; None until the first search, and never
+    # opened when the manager has no replica
+    search_session: Session | None = None
+    connections: list[Connection] = field(default_factory=list, repr=False)
+
+    def owns(self, session: Session) -> bool:
+        """Whether ``session`` belongs to the scope (and must stay open)"""
+        return session is self.session or session is self.search_session
+
+
+_current_scope: contextvars.ContextVar[ReadScope | None] = contextvars.ContextVar(
+    "memori_read_scope", default=None
+)
+
+
+def current_read_scope(manager) -> ReadScope | None:
+    """The active scope of ``manager`` if this thread opened it, else None"""
+    scope = _current_scope.get()
+    if (
+        scope is None
+        or scope.manager is not manager
+        or scope.thread_id != threading.get_ident()
+    ):
+        return None
+    return scope
+
+
+def scoped_session(manager) -> Session | None:
+    """Primary session to reuse for a read on ``manager``, counted as a shared read"""
+    scope = current_read_scope(manager)
+    if scope is None:
+        return None
+    scope.reads += 1
+    increment("db.read_scope.reuse")
+    return scope.session
+
+
+def scoped_search_session(manager) -> Session | None:
+    """
+    Session to reuse for a search on ``manager``
+
+    Searches go to the read replica when one is configured, inside a scope as
+    outside it; without a replica they share the scope's primary session.
+    """
+    scope = current_read_scope(manager)
+    if scope is None:
+        return None
+    if manager.has_read_replica:
+        if scope.search_session is None:
+            connection, scope.search_session = _open_session(
+                manager.read_engine, manager.ReadSessionLocal
+            )
+            scope.connections.append(connection)
+        session = scope.search_session
+    else:
+        session = scope.session
+    scope.reads += 1
+    increment("db.read_scope.reuse")
+    return session
+
+
+def _open_session(engine, factory) -> tuple[Connection, Session]:
+    """A session bound to a connection the scope holds until it exits"""
+    # Bound to a held connection, a rollback after a failed query doesn't
+    # hand the connection back to the pool
+    connection = engine.connect()
+    if engine.dialect.name == "postgresql":
+        # READ COMMITTED takes a new snapshot per statement
+        connection = connection.execution_options(isolation_level="REPEATABLE READ")
+    return connection, factory(bind=connection)
+
+
+@contextmanager
+def read_scope(manager) -> Iterator[ReadScope]:
+    """
+    Share one read session among ``manager``'s reads until the block exits
+
+    Nested scopes on the same manager reuse the outer one. The transaction
+    is rolled back on exit: nothing inside the scope should write through it.
+    """
+    scope = current_read_scope(manager)
+    if scope is not None:
+        yield scope
+        return
+
+    # Same engine as these reads use outside a scope: the primary
+    connection, session = _open_session(manager.engine, manager.SessionLocal)
+    scope = ReadScope(manager=manager, session=session, connections=[connection])
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        try:
+            for session in (scope.session, scope.search_session):
+                if session is not None:
+                    session.close()
+            for connection in scope.connections:
+                connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing read scope session: {e}")
+        logger.debug(f"Read scope closed after {scope.reads} shared reads")
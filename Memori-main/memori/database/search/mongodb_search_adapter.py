@@ -22,6 +22,77 @@ from ..connectors.base_connector import BaseSearchAdapter
 from ..connectors.mongodb_connector import MongoDBConnector
 
 
+def build_text_search_pipeline(
+    query: str,
+    primary_type: str,
+    primary_filter: dict[str, Any],
+    union_collection: str,
+    union_type: str,
+    union_filter: dict[str, Any],
+    projection_fields: list[str],
+    limit: int,
+    score_field: str = "search_score",
+) -> list[dict[str, Any]]:
+    """
+    Build one aggregation pipeline that text-searches two collections
+
+    The pipeline runs on the primary collection, appends the second collection's
+    matches with $unionWith (MongoDB 4.4+), projects only ``projection_fields``
+    plus the text score and a literal ``memory_type``, and sorts/limits on the
+    server. Each branch is limited first so neither side ships more than
+    ``limit`` documents.
+
+    Args:
+        query: $text search string
+        primary_type / union_type: memory_type label for each collection
+        primary_filter / union_filter: Extra $match conditions per collection
+        union_collection: Name of the collection merged via $unionWith
+        projection_fields: Document fields to return
+        limit: Maximum number of documents returned overall
+        score_field: Output field holding the text score
+    """
+    sort_stage = {"$sort": {score_field: -1, "importance_score": -1, "created_at": -1}}
+
+    def branch(memory_type: str, extra_filter: dict[str, Any]) -> list[dict[str, Any]]:
+        # Sort keys must survive the projection
+        projection: dict[str, Any] = dict.fromkeys(
+            [*projection_fields, "importance_score", "created_at"], 1
+        )
+        projection["_id"] = 0
+        projection[score_field] = {"$meta": "textScore"}
+        projection["memory_type"] = {"$literal": memory_type}
+        return [
+            # $text must be part of the first $match stage of each pipeline
+            {"$match": {"$text": {"$search": query}, **extra_filter}},
+            {"$project": projection},
+            sort_stage,
+            {"$limit": limit},
+        ]
+
+    return [
+        *branch(primary_type, primary_filter),
+        {
+            "$unionWith": {
+                "coll": union_collection,
+                "pipeline": branch(union_type, union_filter),
+            }
+        },
+        sort_stage,
+        {"$limit": limit},
+    ]
+
+
+def unexpired_filter() -> dict[str, Any]:
+    """Match short-term documents that have no expiry or have not expired yet"""
+    return {
+        "$or": [
+            {"expires_at": {"$exists": False}},
+            {"expires_at": None},
+            {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+        ]
+    }
+
+
 class MongoDBSearchAdapter(BaseSearchAdapter):
     """MongoDB-specific search implementation with Atlas Vector Search support"""
 
@@ -86,6 +157,19 @@ class MongoDBSearchAdapter(BaseSearchAdapter):
                 query, namespace, category_filter, limit
             )
 
+    # Fields returned by text search; heavy JSON blobs are not shipped
+    TEXT_SEARCH_FIELDS = [
+        "memory_id",
+        "searchable_content",
+        "summary",
+        "importance_score",
+        "category_primary",
+        "namespace",
+        "classification",
+        "topic",
+        "created_at",
+    ]
+
     def _execute_mongodb_text_search(
         self,
         query: str,
@@ -93,7 +177,49 @@ class MongoDBSearchAdapter(BaseSearchAdapter):
         category_filter: list[str] | None,
         limit: int,
     ) -> list[dict[str, Any]]:
-        """Execute MongoDB $text search across collections"""
+        """Execute MongoDB $text search across both collections in one pipeline"""
+        base_filter: dict[str, Any] = {"namespace": namespace}
+        if category_filter:
+            base_filter["category_primary"] = {"$in": category_filter}
+
+        pipeline = build_text_search_pipeline(
+            query,
+            primary_type="short_term",
+            primary_filter={**base_filter, **unexpired_filter()},
+            union_collection=self.long_term_collection.name,
+            union_type="long_term",
+            union_filter=base_filter,
+            projection_fields=self.TEXT_SEARCH_FIELDS,
+            limit=limit,
+            score_field="text_score",
+        )
+
+        try:
+            cursor = self.short_term_collection.aggregate(pipeline)
+        except OperationFailure as e:
+            # $unionWith needs MongoDB 4.4+; older servers search per collection
+            logger.debug(
+                f"Aggregated text search unavailable, using per-collection: {e}"
+            )
+            return self._execute_mongodb_text_search_per_collection(
+                query, namespace, category_filter, limit
+            )
+
+        results = []
+        for document in cursor:
+            memory = self._convert_document_to_memory(document)
+            memory["search_strategy"] = "mongodb_text"
+            results.append(memory)
+        return results
+
+    def _execute_mongodb_text_search_per_collection(
+        self,
+        query: str,
+        namespace: str,
+        category_filter: list[str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Execute MongoDB $text search on each collection separately"""
         results = []
 
         # Search both collections
@@ -115,11 +241,7 @@ class MongoDBSearchAdapter(BaseSearchAdapter):
 
                 # For short-term memories, exclude expired ones
                 if memory_type == "short_term":
-                    search_filter["$or"] = [
-                        {"expires_at": {"$exists": False}},
-                        {"expires_at": None},
-                        {"expires_at": {"$gt": datetime.now(timezone.utc)}},
-                    ]
+                    search_filter.update(unexpired_filter())
 
                 # Execute search with text score
                 cursor = (
@@ -0,0 +1,295 @@
+"""
+Lightweight search result records for Memori
+
+Search paths select only the scalar columns needed for ranking and display.
+``processed_data`` (the full ProcessedMemory JSON) is loaded on first access,
+in one batched query per table for the whole result set, and deserialized
+once. Records stay ``dict`` subclasses so existing ``isinstance(item, dict)``
+consumers keep working.
+
+Intermediate read-path objects are slotted instead: ``SearchCandidate`` while
+a strategy's rows are ranked (only the top-k become dicts) and
+``DedupCandidate`` for the recent memories a new one is compared against.
+Pydantic models stay on the write path, where their validation is needed.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+
+from .models import LongTermMemory, ShortTermMemory
+
+MEMORY_TYPE_MODELS = {
+    "short_term": ShortTermMemory,
+    "long_term": LongTermMemory,
+}
+
+
+class ProcessedDataLoader:
+    """Loads processed_data for every pending record of one result set"""
+
+    __slots__ = ("_bind", "_records", "_lock")
+
+    def __init__(self, bind):
+        self._bind = bind
+        self._records: list[MemoryRecord] = []
+        self._lock = threading.Lock()
+
+    def track(self, record: "MemoryRecord"):
+        self._records.append(record)
+
+    def load(self):
+        """Fetch processed_data for all records of this batch that still lack it"""
+        with self._lock:
+            pending = [r for r in self._records if r._loader is self]
+            if not pending:
+                return
+
+            ids_by_type: dict[str, list[str]] = {}
+            for record in pending:
+                ids_by_type.setdefault(dict.get(record, "memory_type"), []).append(
+                    dict.get(record, "memory_id")
+                )
+
+            loaded: dict[tuple[str, str], Any] = {}
+            try:
+                loaded = self._fetch(ids_by_type)
+            except Exception as e:
+                logger.warning(f"Failed to load processed_data for search results: {e}")
+
+            for record in pending:
+                value = loaded.get(
+                    (dict.get(record, "memory_type"), dict.get(record, "memory_id"))
+                )
+                dict.__setitem__(record, "processed_data", _deserialize(value))
+                record._loader = None
+
+    def _fetch(self, ids_by_type: dict[str, list[str]]) -> dict[tuple[str, str], Any]:
+        """processed_data keyed by (memory_type, memory_id), one query per table"""
+        loaded = {}
+        with self._bind.connect() as conn:
+            for memory_type, ids in ids_by_type.items():
+                model = MEMORY_TYPE_MODELS[memory_type]
+                rows = conn.execute(
+                    select(model.memory_id, model.processed_data).where(
+                        model.memory_id.in_(ids)
+                    )
+                )
+                for memory_id, processed_data in rows:
+                    loaded[(memory_type, memory_id)] = processed_data
+        return loaded
+
+
+class MongoProcessedDataLoader(ProcessedDataLoader):
+    """
+    ProcessedDataLoader for MongoDB results
+
+    ``bind`` maps a memory_type to its collection; each collection gets one
+    ``$in`` query for the whole result set.
+    """
+
+    __slots__ = ()
+
+    def _fetch(self, ids_by_type: dict[str, list[str]]) -> dict[tuple[str, str], Any]:
+        loaded = {}
+        for memory_type, ids in ids_by_type.items():
+            documents = self._bind(memory_type).find(
+                {"memory_id": {"$in": ids}},
+                {"_id": 0, "memory_id": 1, "processed_data": 1},
+            )
+            for document in documents:
+                loaded[(memory_type, document["memory_id"])] = document.get(
+                    "processed_data"
+                )
+        return loaded
+
+
+def _deserialize(value: Any) -> Any:
+    """Some drivers hand JSON columns back as text; parse them once here"""
+    if isinstance(value, (str, bytes)):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+class MemoryRecord(dict):
+    """
+    Search hit with memory_id, scores and display text
+
+    ``processed_data`` is absent until first read through ``[]``, ``get`` or
+    ``in``; that read loads it for the whole result set. Whole-record access
+    (iteration, ``keys``/``items``/``values``, ``len``, ``copy``, ``==``,
+    ``dict(record)``, ``json.dumps``, pickling) loads it first, so a copied or
+    serialized record is never missing it.
+    """
+
+    __slots__ = ("_loader",)
+
+    def __init__(self, data=(), loader: ProcessedDataLoader | None = None):
+        super().__init__(data)
+        self._loader = loader
+        if loader is not None:
+            loader.track(self)
+
+    def _materialize(self):
+        if self._loader is not None:
+            self._loader.load()
+
+    def __missing__(self, key):
+        if key == "processed_data" and self._loader is not None:
+            self._loader.load()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or (
+            key == "processed_data" and self._loader is not None
+        )
+
+    # Overriding __iter__ also takes dict(record), {**record} and dict.update
+    # off CPython's internal fast path, so they go through keys()/[] below
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._materialize()
+        return dict.__len__(self)
+
+    def __bool__(self) -> bool:
+        # Truthiness alone should not cost a query
+        return dict.__len__(self) > 0 or self._loader is not None
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        # json.dumps serializes dict subclasses through items()
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> "MemoryRecord":
+        self._materialize()
+        return self.__class__(dict.items(self))
+
+    def __eq__(self, other) -> bool:
+        self._materialize()
+        if isinstance(other, MemoryRecord):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle: materialize and drop the loader (holds a lock)
+        self._materialize()
+        return (self.__class__, (dict(dict.items(self)),))
+
+    @property
+    def display_text(self) -> str:
+        """Text to show for this memory without touching processed_data"""
+        return (
+            dict.get(self, "summary")
+            or dict.get(self, "searchable_content")
+            or dict.get(self, "content")
+            or ""
+        )
+
+
+def attach_lazy_processed_data(
+    rows: list[dict[str, Any]],
+    bind=None,
+    loader: ProcessedDataLoader | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Wrap result dicts as MemoryRecords sharing one lazy processed_data loader
+
+    Rows that already carry processed_data, or whose memory_type has no
+    backing table, are wrapped without a loader.
+
+    Args:
+        rows: Search result dictionaries
+        bind: Engine (or connection-capable bind) to load processed_data from
+        loader: Loader to use instead of a ProcessedDataLoader over ``bind``
+            (e.g. a MongoProcessedDataLoader)
+    """
+    loader = loader or ProcessedDataLoader(bind)
+    records = []
+    for row in rows:
+        if isinstance(row, MemoryRecord):
+            records.append(row)
+            continue
+        lazy = (
+            "processed_data" not in row and row.get("memory_type") in MEMORY_TYPE_MODELS
+        )
+        records.append(MemoryRecord(row, loader if lazy else None))
+    return records
+
+
+def hydrate_processed_data(records: list[dict[str, Any]]):
+    """Eagerly load processed_data for records that will all be used"""
+    for record in records:
+        if isinstance(record, MemoryRecord) and record._loader is not None:
+            record._loader.load()
+
+
+class SearchCandidate:
+    """
+    One strategy row while results are ranked
+
+    ``row`` is the driver row (or a dict from strategies that build them); it
+    is only copied into a result dict if it makes the top-k.
+    """
+
+    __slots__ = ("row", "composite_score")
+
+    def __init__(self, row, composite_score: float):
+        self.row = row
+        self.composite_score = composite_score
+
+    @staticmethod
+    def fields(row) -> Any:
+        """Mapping view of a driver row or dict"""
+        return getattr(row, "_mapping", row)
+
+    def to_dict(self) -> dict[str, Any]:
+        result = dict(self.fields(self.row))
+        result["composite_score"] = self.composite_score
+        return result
+
+
+@dataclass(slots=True, frozen=True)
+class DedupCandidate:
+    """Recent long-term memory a new memory is checked against for duplicates"""
+
+    memory_id: str
+    summary: str
+    content: str
+    classification: str
+    created_at: datetime | str | None = None
@@ -3,14 +3,46 @@ SQLAlchemy-based search service for Memori v2.0
 Provides cross-database full-text search capabilities
 """
 
+import base64
+import heapq
+import json
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import and_, asc, desc, func, literal, or_, text, union_all
+from sqlalchemy import (
+    Row,
+    and_,
+    asc,
+    desc,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    union_all,
+)
 from sqlalchemy.orm import Session
 
-from .models import LongTermMemory, ShortTermMemory
+from ..utils.metrics import increment, timed
+from .models import (
+    LongTermMemory,
+    MemoryEntity,
+    ShortTermMemory,
+    memory_entity_type,
+    normalize_entity_value,
+)
+from .search_records import SearchCandidate, attach_lazy_processed_data
+from .statements import STATEMENTS
+
+# search_strategy of fallback results served by each backend's substring index
+# (results from the plain LIKE scan are labelled "<database>_like_fallback")
+SUBSTRING_INDEX_STRATEGIES = {
+    "sqlite": "sqlite_trigram",
+    "postgresql": "postgresql_trigram",
+    "mysql": "mysql_ngram",
+}
 
 
 class SearchService:
@@ -20,6 +52,7 @@ class SearchService:
         self.session = session
         self.database_type = database_type
 
+    @timed("search.total")
     def search_memories(
         self,
         query: str,
@@ -65,11 +98,14 @@ class SearchService:
 
         if not query or not query.strip():
             logger.debug("Empty query provided, returning recent memories")
-            return self._get_recent_memories(
-                user_id, assistant_id, session_id, category_filter, limit, memory_types
+            return self._lazy_records(
+                self._get_recent_memories(
+                    user_id, assistant_id, session_id, category_filter, limit, memory_types
+                )
             )
 
-        results = []
+        # Driver rows (SQLite FTS) or dicts, depending on the strategy
+        results: list[Row] | list[dict[str, Any]] = []
 
         # Determine which memory types to search
         search_short_term = not memory_types or "short_term" in memory_types
@@ -125,6 +161,7 @@ class SearchService:
                 logger.debug(
                     "[SEARCH] Primary strategy empty, falling back to LIKE search"
                 )
+                increment("search.fallback", reason="empty")
                 results = self._search_like_fallback(
                     query,
                     user_id,
@@ -145,6 +182,7 @@ class SearchService:
             logger.warning(
                 f"Attempting LIKE fallback search | user_id={user_id} | query='{query[:30]}...'"
             )
+            increment("search.fallback", reason="error")
             try:
                 results = self._search_like_fallback(
                     query,
@@ -177,8 +215,13 @@ class SearchService:
                 f"[SEARCH] Top result: {memory_id}... | score: {score:.3f} | strategy: {strategy}"
             )
 
-        return final_results
+        return self._lazy_records(final_results)
+
+    def _lazy_records(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return rows as MemoryRecords that load processed_data on first access"""
+        return attach_lazy_processed_data(rows, self.session.get_bind())
 
+    @timed("search.strategy", strategy="sqlite_fts5")
     def _search_sqlite_fts(
         self,
         query: str,
@@ -189,8 +232,16 @@ class SearchService:
         limit: int,
         search_short_term: bool,
         search_long_term: bool,
-    ) -> list[dict[str, Any]]:
-        """Search using SQLite FTS5"""
+    ) -> list[Row]:
+        """
+        Search using SQLite FTS5
+
+        Returns:
+            Driver rows carrying the display columns, memory_type,
+            search_score and search_strategy. Unlike the MySQL/PostgreSQL
+            strategies these are not dicts: _rank_and_limit_results reads
+            them in place and copies only the top-k into result dicts.
+        """
         try:
             logger.debug(
                 f"SQLite FTS search starting for query: '{query}' in user_id: '{user_id}', assistant_id: '{assistant_id}', session_id: '{session_id}'"
@@ -209,26 +260,21 @@ class SearchService:
             fts_query = f'"{query.strip()}"'
             logger.debug(f"FTS query built: {fts_query}")
 
-            # Build filters
-            category_clause = ""
-            assistant_clause = ""
-            session_clause = ""
-            memory_type_clause = ""  # 根据search_short_term和search_long_term过滤
-            params = {"fts_query": fts_query, "user_id": user_id}
+            # Build filters; each combination maps to one prepared variant
+            params = {"fts_query": fts_query, "user_id": user_id, "limit": limit}
 
             # 根据search_short_term和search_long_term参数过滤记忆类型
             if search_short_term and not search_long_term:
                 # 只搜索短期记忆
-                memory_type_clause = "AND fts.memory_type = 'short_term'"
+                params["memory_type"] = "short_term"
                 logger.debug("Filter: searching only short-term memories")
             elif search_long_term and not search_short_term:
                 # 只搜索长期记忆
-                memory_type_clause = "AND fts.memory_type = 'long_term'"
+                params["memory_type"] = "long_term"
                 logger.debug("Filter: searching only long-term memories")
-            elif search_short_term and search_long_term:
+            else:
                 # 搜索两种类型（默认行为，不需要额外过滤）
                 logger.debug("Filter: searching both short-term and long-term memories")
-            # 如果两者都为False，则返回空结果（这种情况不应该发生）
 
             # BEHAVIOR: Multi-assistant isolation
             # - Short-term memory: Accessible to all assistants for the same user (no filter)
@@ -236,16 +282,11 @@ class SearchService:
             #   - If assistant_id=None: ONLY see shared memories (assistant_id IS NULL)
             #   - If assistant_id='bot': See shared (NULL) OR own (bot) memories
             if assistant_id:
-                assistant_clause = "AND (fts.memory_type = 'short_term' OR fts.assistant_id IS NULL OR fts.assistant_id = :assistant_id)"
                 params["assistant_id"] = assistant_id
                 logger.debug(
                     f"Assistant filter: long-term allows NULL or {assistant_id}"
                 )
             else:
-                # assistant_id=None: Can only see shared memories (not other assistants' private data)
-                assistant_clause = (
-                    "AND (fts.memory_type = 'short_term' OR fts.assistant_id IS NULL)"
-                )
                 logger.debug(
                     "Assistant filter: long-term allows only NULL (shared memories)"
                 )
@@ -253,81 +294,31 @@ class SearchService:
             if session_id:
                 # Apply session filter only to short-term memories
                 # Long-term memories should be accessible across all sessions for the same user
-                session_clause = "AND (fts.memory_type = 'long_term' OR fts.session_id = :session_id)"
                 params["session_id"] = session_id
                 logger.debug(f"Session filter applied to short-term only: {session_id}")
 
             if category_filter:
-                category_placeholders = ",".join(
-                    [f":cat_{i}" for i in range(len(category_filter))]
-                )
-                category_clause = (
-                    f"AND fts.category_primary IN ({category_placeholders})"
-                )
-                for i, cat in enumerate(category_filter):
-                    params[f"cat_{i}"] = cat
+                params["categories"] = list(category_filter)
                 logger.debug(f"Category filter applied: {category_filter}")
 
-            # SQLite FTS5 search query with COALESCE to handle NULL values
-            sql_query = f"""
-                SELECT
-                    fts.memory_id,
-                    fts.memory_type,
-                    fts.category_primary,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.searchable_content
-                            WHEN fts.memory_type = 'long_term' THEN lt.searchable_content
-                        END,
-                        fts.searchable_content,
-                        ''
-                    ) as searchable_content,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.processed_data
-                            WHEN fts.memory_type = 'long_term' THEN lt.processed_data
-                        END,
-                        '{{}}'
-                    ) as processed_data,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.importance_score
-                            WHEN fts.memory_type = 'long_term' THEN lt.importance_score
-                            ELSE 0.5
-                        END,
-                        0.5
-                    ) as importance_score,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.created_at
-                            WHEN fts.memory_type = 'long_term' THEN lt.created_at
-                        END,
-                        datetime('now')
-                    ) as created_at,
-                    COALESCE(fts.summary, '') as summary,
-                    COALESCE(1.0 / (1.0 + abs(bm25(fts))), 0.0) as search_score,
-                    'sqlite_fts5' as search_strategy
-                FROM memory_search_fts fts
-                LEFT JOIN short_term_memory st ON fts.memory_id = st.memory_id AND fts.memory_type = 'short_term'
-                LEFT JOIN long_term_memory lt ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
-                WHERE memory_search_fts MATCH :fts_query AND fts.user_id = :user_id
-                {memory_type_clause}
-                {assistant_clause}
-                {session_clause}
-                {category_clause}
-                ORDER BY search_score DESC, importance_score DESC
-                LIMIT {limit}
-            """
-
             logger.debug(f"Executing SQLite FTS query with params: {params}")
-            result = self.session.execute(text(sql_query), params)
-            rows = [dict(row._mapping) for row in result]
+            result = STATEMENTS.execute(
+                self.session,
+                "search.sqlite_fts",
+                params,
+                memory_type="memory_type" in params,
+                assistant="assistant_id" in params,
+                session="session_id" in params,
+                categories="categories" in params,
+            )
+            # Rows stay driver tuples; ranking turns only the top-k into dicts
+            rows = result.all()
             logger.debug(f"SQLite FTS search returned {len(rows)} results")
 
             # Log details of first result for debugging
             if rows:
                 logger.debug(
-                    f"Sample result: memory_id={rows[0].get('memory_id')}, type={rows[0].get('memory_type')}, score={rows[0].get('search_score')}"
+                    f"Sample result: memory_id={rows[0].memory_id}, type={rows[0].memory_type}, score={rows[0].search_score}"
                 )
 
             return rows
@@ -342,6 +333,7 @@ class SearchService:
             self.session.rollback()
             return []
 
+    @timed("search.strategy", strategy="mysql_fulltext")
     def _search_mysql_fulltext(
         self,
         query: str,
@@ -436,7 +428,6 @@ class SearchService:
                         f"""
                         SELECT
                             memory_id,
-                            processed_data,
                             importance_score,
                             created_at,
                             searchable_content,
@@ -468,15 +459,14 @@ class SearchService:
                                 # Create dict from row values and keys
                                 row_dict = {
                                     "memory_id": row[0],
-                                    "processed_data": row[1],
-                                    "importance_score": row[2],
-                                    "created_at": row[3],
-                                    "searchable_content": row[4],
-                                    "summary": row[5],
-                                    "category_primary": row[6],
-                                    "search_score": float(row[7]) if row[7] else 0.0,
-                                    "memory_type": row[8],
-                                    "search_strategy": row[9],
+                                    "importance_score": row[1],
+                                    "created_at": row[2],
+                                    "searchable_content": row[3],
+                                    "summary": row[4],
+                                    "category_primary": row[5],
+                                    "search_score": float(row[6]) if row[6] else 0.0,
+                                    "memory_type": row[7],
+                                    "search_strategy": row[8],
                                 }
                             results.append(row_dict)
                         except Exception as e:
@@ -525,7 +515,6 @@ class SearchService:
                         f"""
                         SELECT
                             memory_id,
-                            processed_data,
                             importance_score,
                             created_at,
                             searchable_content,
@@ -557,15 +546,14 @@ class SearchService:
                                 # Create dict from row values and keys
                                 row_dict = {
                                     "memory_id": row[0],
-                                    "processed_data": row[1],
-                                    "importance_score": row[2],
-                                    "created_at": row[3],
-                                    "searchable_content": row[4],
-                                    "summary": row[5],
-                                    "category_primary": row[6],
-                                    "search_score": float(row[7]) if row[7] else 0.0,
-                                    "memory_type": row[8],
-                                    "search_strategy": row[9],
+                                    "importance_score": row[1],
+                                    "created_at": row[2],
+                                    "searchable_content": row[3],
+                                    "summary": row[4],
+                                    "category_primary": row[5],
+                                    "search_score": float(row[6]) if row[6] else 0.0,
+                                    "memory_type": row[7],
+                                    "search_strategy": row[8],
                                 }
                             results.append(row_dict)
                         except Exception as e:
@@ -590,6 +578,7 @@ class SearchService:
             self.session.rollback()
             return []
 
+    @timed("search.strategy", strategy="postgresql_fts")
     def _search_postgresql_fts(
         self,
         query: str,
@@ -641,7 +630,7 @@ class SearchService:
                 # Use direct SQL to avoid SQLAlchemy Row conversion issues
                 short_sql = text(
                     f"""
-                    SELECT memory_id, processed_data, importance_score, created_at, searchable_content, summary, category_primary,
+                    SELECT memory_id, importance_score, created_at, searchable_content, summary, category_primary,
                            ts_rank(search_vector, to_tsquery('english', :query)) as search_score,
                            'short_term' as memory_type, 'postgresql_fts' as search_strategy
                     FROM short_term_memory
@@ -671,15 +660,14 @@ class SearchService:
                     results.append(
                         {
                             "memory_id": row[0],
-                            "processed_data": row[1],
-                            "importance_score": row[2],
-                            "created_at": row[3],
-                            "searchable_content": row[4],
-                            "summary": row[5],
-                            "category_primary": row[6],
-                            "search_score": row[7],
-                            "memory_type": row[8],
-                            "search_strategy": row[9],
+                            "importance_score": row[1],
+                            "created_at": row[2],
+                            "searchable_content": row[3],
+                            "summary": row[4],
+                            "category_primary": row[5],
+                            "search_score": row[6],
+                            "memory_type": row[7],
+                            "search_strategy": row[8],
                         }
                     )
 
@@ -707,7 +695,7 @@ class SearchService:
                 # Use direct SQL to avoid SQLAlchemy Row conversion issues
                 long_sql = text(
                     f"""
-                    SELECT memory_id, processed_data, importance_score, created_at, searchable_content, summary, category_primary,
+                    SELECT memory_id, importance_score, created_at, searchable_content, summary, category_primary,
                            ts_rank(search_vector, to_tsquery('english', :query)) as search_score,
                            'long_term' as memory_type, 'postgresql_fts' as search_strategy
                     FROM long_term_memory
@@ -738,15 +726,14 @@ class SearchService:
                     results.append(
                         {
                             "memory_id": row[0],
-                            "processed_data": row[1],
-                            "importance_score": row[2],
-                            "created_at": row[3],
-                            "searchable_content": row[4],
-                            "summary": row[5],
-                            "category_primary": row[6],
-                            "search_score": row[7],
-                            "memory_type": row[8],
-                            "search_strategy": row[9],
+                            "importance_score": row[1],
+                            "created_at": row[2],
+                            "searchable_content": row[3],
+                            "summary": row[4],
+                            "category_primary": row[5],
+                            "search_score": row[6],
+                            "memory_type": row[7],
+                            "search_strategy": row[8],
                         }
                     )
 
@@ -762,6 +749,7 @@ class SearchService:
             self.session.rollback()
             return []
 
+    @timed("search.strategy", strategy="like_fallback")
     def _search_like_fallback(
         self,
         query: str,
@@ -773,158 +761,241 @@ class SearchService:
         search_short_term: bool,
         search_long_term: bool,
     ) -> list[dict[str, Any]]:
-        """Fallback LIKE-based search with improved flexibility"""
+        """
+        Fallback substring search over both memory tables
+
+        Runs as one UNION ALL over scalar ranking columns, using the backend's
+        indexed substring operator (SQLite trigram FTS5, PostgreSQL pg_trgm,
+        MySQL ngram FULLTEXT) and plain LIKE if that isn't available. Text
+        columns are loaded for the final top-k only; processed_data is left to
+        the lazy MemoryRecord loader.
+        """
         logger.debug(
             f"Starting LIKE fallback search for query: '{query}' in user_id: '{user_id}', assistant_id: '{assistant_id}', session_id: '{session_id}'"
         )
-        results = []
 
-        # Create multiple search patterns for better matching
-        search_patterns = [
-            f"%{query}%",  # Original full query
-        ]
-
-        # Add individual word patterns for better matching
+        # Full query plus individual words for better matching
+        terms = [query.strip()]
         words = query.strip().split()
         if len(words) > 1:
-            for word in words:
-                if len(word) > 2:  # Skip very short words
-                    search_patterns.append(f"%{word}%")
-
-        logger.debug(f"LIKE search patterns: {search_patterns}")
+            terms.extend(word for word in words if len(word) > 2)  # Skip very short words
+        terms = [t for t in dict.fromkeys(terms) if t]
+        if not terms:
+            return []
 
-        # Search short-term memory
+        targets = []
         if search_short_term:
-            # Build OR conditions for all search patterns
-            search_conditions = []
-            for pattern in search_patterns:
-                search_conditions.extend(
-                    [
-                        ShortTermMemory.searchable_content.like(pattern),
-                        ShortTermMemory.summary.like(pattern),
-                    ]
-                )
-
-            # Build base filter conditions
-            filter_conditions = [
-                ShortTermMemory.user_id == user_id,
-                or_(*search_conditions),
-            ]
-
-            # BEHAVIOR: Short-term memory is accessible to all assistants for the same user
-            # No assistant_id filter applied to short-term memory
-
-            if session_id:
-                filter_conditions.append(ShortTermMemory.session_id == session_id)
-
-            short_query = self.session.query(ShortTermMemory).filter(
-                and_(*filter_conditions)
-            )
-
-            if category_filter:
-                short_query = short_query.filter(
-                    ShortTermMemory.category_primary.in_(category_filter)
-                )
+            targets.append((ShortTermMemory, "short_term"))
+        if search_long_term:
+            targets.append((LongTermMemory, "long_term"))
+        if not targets:
+            return []
 
-            short_results = (
-                short_query.order_by(
-                    desc(ShortTermMemory.importance_score),
-                    desc(ShortTermMemory.created_at),
+        rows = None
+        strategy = f"{self.database_type}_like_fallback"
+        if self.database_type in SUBSTRING_INDEX_STRATEGIES:
+            try:
+                rows = self._run_fallback_union(
+                    targets,
+                    terms,
+                    True,
+                    user_id,
+                    assistant_id,
+                    session_id,
+                    category_filter,
+                    limit,
                 )
-                .limit(limit)
-                .all()
+                strategy = SUBSTRING_INDEX_STRATEGIES[self.database_type]
+            except Exception as e:
+                # Index missing or operator unsupported; a failed statement
+                # poisons the transaction on PostgreSQL, so reset it
+                logger.debug(f"Indexed fallback search unavailable, using LIKE: {e}")
+                self.session.rollback()
+
+        if rows is None:
+            rows = self._run_fallback_union(
+                targets,
+                terms,
+                False,
+                user_id,
+                assistant_id,
+                session_id,
+                category_filter,
+                limit,
             )
 
-            logger.debug(f"LIKE fallback found {len(short_results)} short-term results")
-
-            for result in short_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "short_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "searchable_content": result.searchable_content,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
-                    "search_score": 0.4,  # Fixed score for LIKE search
-                    "search_strategy": f"{self.database_type}_like_fallback",
-                }
-                results.append(memory_dict)
-
-        # Search long-term memory
-        if search_long_term:
-            # Build OR conditions for all search patterns
-            search_conditions = []
-            for pattern in search_patterns:
-                search_conditions.extend(
-                    [
-                        LongTermMemory.searchable_content.like(pattern),
-                        LongTermMemory.summary.like(pattern),
-                    ]
-                )
+        results = self._hydrate_fallback_rows(rows, strategy)
+        logger.debug(
+            f"{strategy} search completed, returning {len(results)} total results"
+        )
+        return results
 
-            # Build base filter conditions
-            filter_conditions = [
-                LongTermMemory.user_id == user_id,
-                or_(*search_conditions),
-            ]
+    def _run_fallback_union(
+        self,
+        targets: list[tuple[Any, str]],
+        terms: list[str],
+        indexed: bool,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str | None,
+        category_filter: list[str] | None,
+        limit: int,
+    ) -> list:
+        """Rank matching memory ids across tables in one statement"""
+        selects = []
+        for model, memory_type in targets:
+            match = (
+                self._indexed_text_match(model, memory_type, terms)
+                if indexed
+                else self._like_text_match(model, terms)
+            )
+            if match is None:
+                raise ValueError("no indexable search terms")
 
-            # BEHAVIOR: Multi-assistant isolation for long-term memory
-            if assistant_id:
-                # Specific assistant: see shared (NULL) OR own memories
+            filter_conditions = [model.user_id == user_id, match]
+            if memory_type == "short_term":
+                # BEHAVIOR: Short-term memory is accessible to all assistants for the same user
+                if session_id:
+                    filter_conditions.append(model.session_id == session_id)
+            elif assistant_id:
+                # BEHAVIOR: Multi-assistant isolation for long-term memory
                 filter_conditions.append(
-                    or_(
-                        LongTermMemory.assistant_id.is_(None),
-                        LongTermMemory.assistant_id == assistant_id,
-                    )
+                    or_(model.assistant_id.is_(None), model.assistant_id == assistant_id)
                 )
             else:
-                # No assistant: see ONLY shared memories (NULL)
-                filter_conditions.append(LongTermMemory.assistant_id.is_(None))
-
-            # NOTE: No session filter for long-term memories
-            # Long-term memories should be accessible across all sessions for the same user
-
-            long_query = self.session.query(LongTermMemory).filter(
-                and_(*filter_conditions)
-            )
+                filter_conditions.append(model.assistant_id.is_(None))
+            # NOTE: No session filter for long-term memories (cross-session access)
 
             if category_filter:
-                long_query = long_query.filter(
-                    LongTermMemory.category_primary.in_(category_filter)
-                )
+                filter_conditions.append(model.category_primary.in_(category_filter))
+
+            selects.append(
+                select(
+                    model.memory_id.label("memory_id"),
+                    literal(memory_type).label("memory_type"),
+                    model.importance_score.label("importance_score"),
+                    model.created_at.label("created_at"),
+                    model.category_primary.label("category_primary"),
+                ).where(and_(*filter_conditions))
+            )
 
-            long_results = (
-                long_query.order_by(
-                    desc(LongTermMemory.importance_score),
-                    desc(LongTermMemory.created_at),
+        combined = (
+            union_all(*selects).subquery() if len(selects) > 1 else selects[0].subquery()
+        )
+        stmt = (
+            select(combined)
+            .order_by(desc(combined.c.importance_score), desc(combined.c.created_at))
+            .limit(limit)
+        )
+        return self.session.execute(stmt).all()
+
+    @staticmethod
+    def _like_text_match(model, terms: list[str]):
+        """Portable OR chain of %term% patterns (no index support)"""
+        conditions = []
+        for term in terms:
+            pattern = f"%{term}%"
+            conditions.extend(
+                [model.searchable_content.like(pattern), model.summary.like(pattern)]
+            )
+        return or_(*conditions)
+
+    def _indexed_text_match(self, model, memory_type: str, terms: list[str]):
+        """Backend-specific substring predicate backed by a trigram/ngram index"""
+        table_name = model.__tablename__
+        if self.database_type == "postgresql":
+            # ILIKE '%term%' is served by the pg_trgm GIN indexes
+            conditions = []
+            for term in terms:
+                pattern = f"%{term}%"
+                conditions.extend(
+                    [
+                        model.searchable_content.ilike(pattern),
+                        model.summary.ilike(pattern),
+                    ]
                 )
-                .limit(limit)
-                .all()
+            return or_(*conditions)
+
+        # Trigram/ngram phrase matching needs at least 3 characters per term
+        phrases = [t for t in terms if len(t) >= 3]
+        if not phrases:
+            return None
+        param = f"{memory_type}_substring_query"
+        if self.database_type == "sqlite":
+            # Quoted phrases in a trigram FTS5 table match as substrings
+            match_query = " OR ".join(
+                '"' + phrase.replace('"', '""') + '"' for phrase in phrases
             )
+            return text(
+                f"{table_name}.rowid IN (SELECT rowid FROM {table_name}_trigram "
+                f"WHERE {table_name}_trigram MATCH :{param})"
+            ).bindparams(**{param: match_query})
+
+        # MySQL: boolean-mode phrases (OR semantics) against the per-column
+        # ngram indexes; MATCH needs a FULLTEXT index on exactly its columns
+        match_query = " ".join(
+            '"' + phrase.replace('"', " ") + '"' for phrase in phrases
+        )
+        return text(
+            f"(MATCH({table_name}.searchable_content) "
+            f"AGAINST (:{param} IN BOOLEAN MODE) "
+            f"OR MATCH({table_name}.summary) AGAINST (:{param} IN BOOLEAN MODE))"
+        ).bindparams(**{param: match_query})
+
+    def _hydrate_fallback_rows(self, rows: list, strategy: str) -> list[dict[str, Any]]:
+        """Load text columns for the final top-k only"""
+        if not rows:
+            return []
 
-            logger.debug(f"LIKE fallback found {len(long_results)} long-term results")
+        details = {}
+        for model, memory_type in (
+            (ShortTermMemory, "short_term"),
+            (LongTermMemory, "long_term"),
+        ):
+            ids = [row.memory_id for row in rows if row.memory_type == memory_type]
+            if not ids:
+                continue
+            detail_rows = self.session.execute(
+                select(
+                    model.memory_id,
+                    model.searchable_content,
+                    model.summary,
+                ).where(model.memory_id.in_(ids))
+            )
+            for detail in detail_rows:
+                details[(memory_type, detail.memory_id)] = detail
 
-            for result in long_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "long_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "searchable_content": result.searchable_content,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
+        results = []
+        for row in rows:
+            detail = details.get((row.memory_type, row.memory_id))
+            if detail is None:
+                continue  # deleted between ranking and hydration
+            results.append(
+                {
+                    "memory_id": row.memory_id,
+                    "memory_type": row.memory_type,
+                    "importance_score": row.importance_score,
+                    "created_at": row.created_at,
+                    "searchable_content": detail.searchable_content,
+                    "summary": detail.summary,
+                    "category_primary": row.category_primary,
                     "search_score": 0.4,  # Fixed score for LIKE search
-                    "search_strategy": f"{self.database_type}_like_fallback",
+                    "search_strategy": strategy,
                 }
-                results.append(memory_dict)
+            )
+        return results
 
-        logger.debug(
-            f"LIKE fallback search completed, returning {len(results)} total results"
+    @staticmethod
+    def _display_columns(model) -> tuple:
+        """Scalar columns search results carry (processed_data is loaded lazily)"""
+        return (
+            model.memory_id,
+            model.importance_score,
+            model.created_at,
+            model.searchable_content,
+            model.summary,
+            model.category_primary,
         )
-        return results
 
     def _get_recent_memories(
         self,
@@ -943,9 +1014,9 @@ class SearchService:
 
         # Get recent short-term memories
         if search_short_term:
-            short_query = self.session.query(ShortTermMemory).filter(
-                ShortTermMemory.user_id == user_id
-            )
+            short_query = self.session.query(
+                *self._display_columns(ShortTermMemory)
+            ).filter(ShortTermMemory.user_id == user_id)
 
             # BEHAVIOR: Short-term memory is accessible to all assistants for the same user
             # No assistant_id filter applied to short-term memory
@@ -970,7 +1041,6 @@ class SearchService:
                 memory_dict = {
                     "memory_id": result.memory_id,
                     "memory_type": "short_term",
-                    "processed_data": result.processed_data,
                     "importance_score": result.importance_score,
                     "created_at": result.created_at,
                     "searchable_content": result.searchable_content,
@@ -983,9 +1053,9 @@ class SearchService:
 
         # Get recent long-term memories
         if search_long_term:
-            long_query = self.session.query(LongTermMemory).filter(
-                LongTermMemory.user_id == user_id
-            )
+            long_query = self.session.query(
+                *self._display_columns(LongTermMemory)
+            ).filter(LongTermMemory.user_id == user_id)
 
             # BEHAVIOR: Multi-assistant isolation for long-term memory
             if assistant_id:
@@ -1018,7 +1088,6 @@ class SearchService:
                 memory_dict = {
                     "memory_id": result.memory_id,
                     "memory_type": "long_term",
-                    "processed_data": result.processed_data,
                     "importance_score": result.importance_score,
                     "created_at": result.created_at,
                     "searchable_content": result.searchable_content,
@@ -1031,26 +1100,239 @@ class SearchService:
 
         return results
 
+    def search_by_category(
+        self,
+        categories: list[str],
+        user_id: str = "default",
+        assistant_id: str | None = None,
+        session_id: str | None = None,
+        limit: int = 10,
+        memory_types: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the most important memories in the given categories
+
+        The category predicate and ordering run in SQL, served by the
+        (user_id, category_primary, importance_score, created_at) indexes, so
+        every memory in the category is considered and only ``limit`` rows
+        per table are read.
+
+        Args:
+            categories: category_primary values to match
+            user_id: User identifier for multi-tenant isolation
+            assistant_id: Assistant identifier for multi-tenant isolation
+            session_id: Session filter, applied to short-term memory only
+            limit: Maximum number of results
+            memory_types: Types of memory to search ('short_term', 'long_term', or both)
+        """
+        if not categories:
+            return []
+
+        search_short_term = not memory_types or "short_term" in memory_types
+        search_long_term = not memory_types or "long_term" in memory_types
+        results = []
+
+        if search_short_term:
+            # BEHAVIOR: Short-term memory is accessible to all assistants for the same user
+            filter_conditions = [
+                ShortTermMemory.user_id == user_id,
+                ShortTermMemory.category_primary.in_(categories),
+            ]
+            if session_id:
+                filter_conditions.append(ShortTermMemory.session_id == session_id)
+            results.extend(
+                self._category_rows(ShortTermMemory, filter_conditions, limit, "short_term")
+            )
+
+        if search_long_term:
+            filter_conditions = [
+                LongTermMemory.user_id == user_id,
+                LongTermMemory.category_primary.in_(categories),
+            ]
+            # BEHAVIOR: Multi-assistant isolation for long-term memory
+            if assistant_id:
+                filter_conditions.append(
+                    or_(
+                        LongTermMemory.assistant_id.is_(None),
+                        LongTermMemory.assistant_id == assistant_id,
+                    )
+                )
+            else:
+                filter_conditions.append(LongTermMemory.assistant_id.is_(None))
+            results.extend(
+                self._category_rows(LongTermMemory, filter_conditions, limit, "long_term")
+            )
+
+        results.sort(
+            key=lambda r: (r["importance_score"] or 0.0, r["created_at"] or datetime.min),
+            reverse=True,
+        )
+        logger.debug(
+            f"Category search for {categories} returned {len(results[:limit])} results"
+        )
+        return self._lazy_records(results[:limit])
+
+    def _category_rows(
+        self, model, filter_conditions: list, limit: int, memory_type: str
+    ) -> list[dict[str, Any]]:
+        """Run one table's category query and shape rows like other searches"""
+        stmt = (
+            select(*self._display_columns(model))
+            .where(and_(*filter_conditions))
+            .order_by(desc(model.importance_score), desc(model.created_at))
+            .limit(limit)
+        )
+        return [
+            {
+                "memory_id": row.memory_id,
+                "memory_type": memory_type,
+                "importance_score": row.importance_score,
+                "created_at": row.created_at,
+                "searchable_content": row.searchable_content,
+                "summary": row.summary,
+                "category_primary": row.category_primary,
+                "search_score": 1.0,
+                "search_strategy": "category_filter",
+            }
+            for row in self.session.execute(stmt)
+        ]
+
+    def search_by_entities(
+        self,
+        values: list[str],
+        user_id: str = "default",
+        assistant_id: str | None = None,
+        entity_type: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Look up long-term memories through the memory_entities index
+
+        Each value is normalized the same way entity rows are on insert, so the
+        lookup is an index probe on (user_id, normalized_value, entity_type)
+        rather than a full-text scan. Memories matching more of the requested
+        values rank first.
+
+        Args:
+            values: Entity or keyword values to look up
+            user_id: User identifier for multi-tenant isolation
+            assistant_id: Assistant identifier for multi-tenant isolation
+            entity_type: Restrict to "keyword" or "entity" rows; an EntityType
+                kind (person, technology, ...) selects "entity" rows
+            limit: Maximum number of results
+        """
+        entity_type = memory_entity_type(entity_type)
+        normalized = sorted(
+            {v for v in (normalize_entity_value(value) for value in values or []) if v}
+        )
+        if not normalized:
+            return []
+
+        hit_filters = [
+            MemoryEntity.user_id == user_id,
+            MemoryEntity.normalized_value.in_(normalized),
+        ]
+        if entity_type:
+            hit_filters.append(MemoryEntity.entity_type == entity_type)
+
+        hits = (
+            select(
+                MemoryEntity.memory_id.label("memory_id"),
+                func.count(func.distinct(MemoryEntity.normalized_value)).label("hits"),
+            )
+            .where(and_(*hit_filters))
+            .group_by(MemoryEntity.memory_id)
+            .subquery()
+        )
+
+        filter_conditions = [LongTermMemory.user_id == user_id]
+        # BEHAVIOR: Multi-assistant isolation for long-term memory
+        if assistant_id:
+            filter_conditions.append(
+                or_(
+                    LongTermMemory.assistant_id.is_(None),
+                    LongTermMemory.assistant_id == assistant_id,
+                )
+            )
+        else:
+            filter_conditions.append(LongTermMemory.assistant_id.is_(None))
+
+        stmt = (
+            select(
+                LongTermMemory.memory_id,
+                LongTermMemory.importance_score,
+                LongTermMemory.created_at,
+                LongTermMemory.searchable_content,
+                LongTermMemory.summary,
+                LongTermMemory.category_primary,
+                hits.c.hits,
+            )
+            .join(hits, hits.c.memory_id == LongTermMemory.memory_id)
+            .where(and_(*filter_conditions))
+            .order_by(
+                desc(hits.c.hits),
+                desc(LongTermMemory.importance_score),
+                desc(LongTermMemory.created_at),
+            )
+            .limit(limit)
+        )
+
+        results = []
+        for row in self.session.execute(stmt):
+            results.append(
+                {
+                    "memory_id": row.memory_id,
+                    "memory_type": "long_term",
+                    "importance_score": row.importance_score,
+                    "created_at": row.created_at,
+                    "searchable_content": row.searchable_content,
+                    "summary": row.summary,
+                    "category_primary": row.category_primary,
+                    "search_score": row.hits / len(normalized),
+                    "search_strategy": "entity_index",
+                }
+            )
+
+        logger.debug(
+            f"Entity index lookup for {normalized} returned {len(results)} results"
+        )
+        return self._lazy_records(results)
+
     def _rank_and_limit_results(
-        self, results: list[dict[str, Any]], limit: int
+        self, results: list, limit: int
     ) -> list[dict[str, Any]]:
-        """Rank and limit search results"""
-        # Calculate composite score
+        """
+        Rank and limit search results
+
+        ``results`` are driver rows or dicts. Each is scored as a slotted
+        SearchCandidate and only the top ``limit`` are copied into dicts.
+        """
+        # nlargest keeps only ``limit`` candidates alive and orders them like a
+        # stable descending sort
+        top = heapq.nlargest(
+            limit, self._score_candidates(results), key=lambda c: c.composite_score
+        )
+        return [candidate.to_dict() for candidate in top]
+
+    def _score_candidates(self, results: list) -> Iterator[SearchCandidate]:
+        now = datetime.now()
         for result in results:
-            search_score = result.get("search_score", 0.4)
-            importance_score = result.get("importance_score", 0.5)
-            recency_score = self._calculate_recency_score(result.get("created_at"))
+            fields = SearchCandidate.fields(result)
+            search_score = fields.get("search_score", 0.4)
+            importance_score = fields.get("importance_score", 0.5)
+            recency_score = self._calculate_recency_score(
+                fields.get("created_at"), now
+            )
 
             # Weighted composite score
-            result["composite_score"] = (
-                search_score * 0.5 + importance_score * 0.3 + recency_score * 0.2
+            yield SearchCandidate(
+                result,
+                search_score * 0.5 + importance_score * 0.3 + recency_score * 0.2,
             )
 
-        # Sort by composite score and limit
-        results.sort(key=lambda x: x.get("composite_score", 0), reverse=True)
-        return results[:limit]
-
-    def _calculate_recency_score(self, created_at) -> float:
+    def _calculate_recency_score(
+        self, created_at, now: datetime | None = None
+    ) -> float:
         """Calculate recency score (0-1, newer = higher)"""
         try:
             if not created_at:
@@ -1059,7 +1341,7 @@ class SearchService:
             if isinstance(created_at, str):
                 created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
-            days_old = (datetime.now() - created_at).days
+            days_old = ((now or datetime.now()) - created_at).days
             return max(0, 1 - (days_old / 30))  # Full score for recent, 0 after 30 days
         except (ValueError, TypeError, AttributeError) as e:
             logger.warning(
@@ -1081,6 +1363,9 @@ class SearchService:
         """
         List memories with pagination and flexible filtering (for dashboard views)
 
+        Uses LIMIT/OFFSET and an exact total; prefer list_memories_page for deep
+        paging or exports over large stores.
+
         Args:
             user_id: User identifier for multi-tenant isolation (REQUIRED)
                      Cannot be None or empty - enforced for security
@@ -1369,6 +1654,280 @@ class SearchService:
             )
             raise
 
+    # Keyset pagination ---------------------------------------------------------
+
+    # Upper bound for count_mode="approximate"; counts stop at this many rows
+    APPROXIMATE_COUNT_CAP = 10000
+
+    def list_memories_page(
+        self,
+        user_id: str,
+        assistant_id: str | None = None,
+        session_id: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        memory_type: str = "all",
+        sort_by: str = "created_at",
+        order: str = "desc",
+        count_mode: str = "none",
+    ) -> dict[str, Any]:
+        """
+        List memories with cursor (keyset) pagination
+
+        Unlike list_memories, pages are addressed by an opaque cursor encoding
+        the last row's (sort field, memory_id). Each page is an index range scan
+        bounded by ``limit`` on every table, so cost does not grow with depth.
+
+        Args:
+            user_id: User identifier for multi-tenant isolation (REQUIRED)
+            assistant_id: Assistant identifier for multi-tenant isolation (optional)
+            session_id: Session identifier for conversation grouping (optional)
+            limit: Maximum number of results per page
+            cursor: ``next_cursor`` from the previous page, or None for the first page
+            memory_type: Type of memory ('short_term', 'long_term', or 'all')
+            sort_by: Field to sort by ('created_at', 'importance', 'category')
+            order: Sort order ('asc' or 'desc')
+            count_mode: 'none' (skip counting), 'approximate' (count capped at
+                APPROXIMATE_COUNT_CAP) or 'exact'
+
+        Returns:
+            Dict with "results" (same row shape as list_memories), "next_cursor"
+            (None on the last page), "total" (None when count_mode='none') and
+            "total_is_estimate"
+
+        Raises:
+            ValueError: If user_id is empty or the cursor is invalid for this listing
+        """
+        # SECURITY: Validate user_id to prevent cross-user data leaks
+        if not user_id or not user_id.strip():
+            raise ValueError(
+                "user_id cannot be None or empty - required for user isolation and security"
+            )
+
+        ALLOWED_SORT_FIELDS = {
+            "created_at": "created_at",
+            "importance": "importance_score",
+            "category": "category_primary",
+        }
+        if memory_type not in ("all", "short_term", "long_term"):
+            logger.warning(
+                f"[LIST] Invalid memory_type: {memory_type}, defaulting to 'all'"
+            )
+            memory_type = "all"
+        if sort_by not in ALLOWED_SORT_FIELDS:
+            logger.warning(
+                f"[LIST] Invalid sort_by: {sort_by}, defaulting to 'created_at'"
+            )
+            sort_by = "created_at"
+        if order not in ("asc", "desc"):
+            logger.warning(f"[LIST] Invalid order: {order}, defaulting to 'desc'")
+            order = "desc"
+        if count_mode not in ("none", "approximate", "exact"):
+            logger.warning(
+                f"[LIST] Invalid count_mode: {count_mode}, defaulting to 'none'"
+            )
+            count_mode = "none"
+        limit = max(1, int(limit))
+
+        sort_field = ALLOWED_SORT_FIELDS[sort_by]
+        listing = {"sort": sort_by, "order": order, "type": memory_type}
+        after = self._decode_list_cursor(cursor, listing) if cursor else None
+
+        logger.debug(
+            f"[LIST] Keyset page - user_id: '{user_id}' | assistant_id: '{assistant_id}' | "
+            f"session_id: '{session_id}' | memory_type: '{memory_type}' | "
+            f"sort: {sort_field} {order} | limit: {limit} | cursor: {bool(after)}"
+        )
+
+        models = {
+            "short_term": [("short_term", ShortTermMemory)],
+            "long_term": [("long_term", LongTermMemory)],
+            "all": [("short_term", ShortTermMemory), ("long_term", LongTermMemory)],
+        }[memory_type]
+
+        # Fetch one extra row to know whether another page exists
+        fetch = limit + 1
+        branches = []
+        for type_name, model_class in models:
+            stmt = self._list_filtered_select(
+                model_class, type_name, user_id, assistant_id, session_id
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    self._keyset_predicate(
+                        getattr(model_class, sort_field),
+                        model_class.memory_id,
+                        after,
+                        order,
+                    )
+                )
+            # Limit inside each branch so every table does a bounded index scan
+            stmt = stmt.order_by(
+                *self._keyset_order(
+                    getattr(model_class, sort_field), model_class.memory_id, order
+                )
+            ).limit(fetch)
+            branches.append(stmt.subquery())
+
+        if len(branches) == 1:
+            page_source = branches[0]
+        else:
+            page_source = union_all(
+                *(select(*branch.c) for branch in branches)
+            ).subquery()
+
+        page_stmt = (
+            select(*page_source.c)
+            .order_by(
+                *self._keyset_order(
+                    page_source.c[sort_field], page_source.c.memory_id, order
+                )
+            )
+            .limit(fetch)
+        )
+        rows = self.session.execute(page_stmt).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        results = [self._list_row_to_dict(row) for row in rows]
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = self._encode_list_cursor(
+                listing, getattr(last, sort_field), last.memory_id
+            )
+
+        total = None
+        total_is_estimate = False
+        if count_mode != "none":
+            total, total_is_estimate = self._count_listing(
+                models, user_id, assistant_id, session_id, count_mode
+            )
+
+        return {
+            "results": results,
+            "next_cursor": next_cursor,
+            "total": total,
+            "total_is_estimate": total_is_estimate,
+        }
+
+    def _list_filtered_select(
+        self,
+        model_class,
+        memory_type: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str | None,
+    ):
+        """Scalar listing columns for one memory table with tenant filters applied"""
+        stmt = select(
+            model_class.memory_id.label("memory_id"),
+            literal(memory_type).label("memory_type"),
+            model_class.processed_data.label("processed_data"),
+            model_class.importance_score.label("importance_score"),
+            model_class.created_at.label("created_at"),
+            model_class.summary.label("summary"),
+            model_class.category_primary.label("category_primary"),
+            model_class.user_id.label("user_id"),
+            model_class.assistant_id.label("assistant_id"),
+            model_class.session_id.label("session_id"),
+        ).where(model_class.user_id == user_id)
+
+        if assistant_id is not None:
+            stmt = stmt.where(model_class.assistant_id == assistant_id)
+        if session_id is not None:
+            stmt = stmt.where(model_class.session_id == session_id)
+        return stmt
+
+    @staticmethod
+    def _keyset_order(sort_column, id_column, order: str) -> tuple:
+        """ORDER BY (sort field, memory_id) in one direction so the key is total"""
+        direction = desc if order == "desc" else asc
+        return direction(sort_column), direction(id_column)
+
+    @staticmethod
+    def _keyset_predicate(sort_column, id_column, after: tuple, order: str):
+        """Rows strictly after (value, memory_id), expanded for index-friendly plans"""
+        value, memory_id = after
+        if order == "desc":
+            return or_(
+                sort_column < value,
+                and_(sort_column == value, id_column < memory_id),
+            )
+        return or_(
+            sort_column > value,
+            and_(sort_column == value, id_column > memory_id),
+        )
+
+    @staticmethod
+    def _encode_list_cursor(listing: dict[str, str], value, memory_id: str) -> str:
+        """Serialize the last row's key into an opaque URL-safe cursor"""
+        if isinstance(value, datetime):
+            value = {"dt": value.isoformat()}
+        payload = dict(listing, v=value, id=memory_id)
+        raw = json.dumps(payload, separators=(",", ":"), default=str)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_list_cursor(cursor: str, listing: dict[str, str]) -> tuple:
+        """Parse a cursor and check it was issued for the same listing"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            value, memory_id = payload["v"], payload["id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {e}")
+
+        if any(payload.get(key) != expected for key, expected in listing.items()):
+            raise ValueError(
+                "Pagination cursor does not match the requested sort/order/memory_type"
+            )
+
+        if isinstance(value, dict) and "dt" in value:
+            value = datetime.fromisoformat(value["dt"])
+        return value, memory_id
+
+    def _count_listing(
+        self,
+        models: list,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str | None,
+        count_mode: str,
+    ) -> tuple[int, bool]:
+        """Exact count, or a count capped at APPROXIMATE_COUNT_CAP per table"""
+        total = 0
+        capped = False
+        for type_name, model_class in models:
+            stmt = self._list_filtered_select(
+                model_class, type_name, user_id, assistant_id, session_id
+            ).with_only_columns(model_class.memory_id)
+            if count_mode == "approximate":
+                stmt = stmt.limit(self.APPROXIMATE_COUNT_CAP)
+            count = self.session.execute(
+                select(func.count()).select_from(stmt.subquery())
+            ).scalar() or 0
+            if count_mode == "approximate" and count >= self.APPROXIMATE_COUNT_CAP:
+                capped = True
+            total += count
+        return total, capped
+
+    @staticmethod
+    def _list_row_to_dict(row) -> dict[str, Any]:
+        """Listing row in the same shape list_memories returns"""
+        return {
+            "memory_id": row.memory_id,
+            "memory_type": row.memory_type,
+            "processed_data": row.processed_data,
+            "importance_score": row.importance_score,
+            "created_at": row.created_at,
+            "summary": row.summary,
+            "category_primary": row.category_primary,
+            "user_id": row.user_id,
+            "assistant_id": row.assistant_id,
+            "session_id": row.session_id,
+        }
+
     def get_list_metadata(
         self,
         user_id: str,
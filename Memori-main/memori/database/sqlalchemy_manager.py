@@ -3,35 +3,125 @@ SQLAlchemy-based database manager for Memori v2.0
 Replaces the existing database.py with cross-database compatibility
 """
 
+import asyncio
+import copy
 import importlib.util
 import json
 import ssl
+import threading
+import time
 import uuid
+import weakref
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 from loguru import logger
-from sqlalchemy import create_engine, func, text
+from sqlalchemy import (
+    Float,
+    String,
+    create_engine,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+    union_all,
+)
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from ..config.pool_config import pool_config
 from ..utils.exceptions import DatabaseError
+from ..utils.metrics import timed
 from ..utils.pydantic_models import (
+    MemoryClassification,
     ProcessedLongTermMemory,
 )
+from .async_engine import check_async_support, create_async_engine_for
 from .auto_creator import DatabaseAutoCreator
 from .models import (
+    ENTITY_BACKFILL_COMPONENT,
+    SCHEMA_COMPONENT,
     Base,
     ChatHistory,
     LongTermMemory,
+    MemoryEntity,
+    SchemaVersion,
     ShortTermMemory,
+    build_memory_entity_rows,
+    schema_fingerprint,
 )
+from .query_plans import QueryPlanCollector, threshold_from_env
 from .query_translator import QueryParameterTranslator
+from .read_scope import (
+    ReadScope,
+    current_read_scope,
+    read_scope,
+    scoped_search_session,
+    scoped_session,
+)
+from .search_records import hydrate_processed_data
 from .search_service import SearchService
+from .statements import is_prepared_statement
+from .write_behind import ChatHistoryBuffer
+
+
+class _TranslatingConnection:
+    """Wrapper that adds parameter translation to SQLAlchemy connections"""
+
+    def __init__(self, conn, translator):
+        self._conn = conn
+        self._translator = translator
+
+    def execute(self, query, parameters=None):
+        """Execute query with automatic parameter translation"""
+        if parameters and is_prepared_statement(query):
+            # Registry statements carry typed binds already
+            return self._conn.execute(query, parameters)
+        elif parameters:
+            # Handle both text() queries and raw strings
+            if hasattr(query, "text"):
+                # SQLAlchemy text() object
+                translated_params = self._translator.translate_parameters(parameters)
+                return self._conn.execute(query, translated_params)
+            else:
+                # Raw string query
+                translated_params = self._translator.translate_parameters(parameters)
+                return self._conn.execute(text(str(query)), translated_params)
+        else:
+            return self._conn.execute(query)
+
+    def commit(self):
+        """Commit transaction"""
+        return self._conn.commit()
+
+    def rollback(self):
+        """Rollback transaction"""
+        return self._conn.rollback()
+
+    def close(self):
+        """Close connection"""
+        return self._conn.close()
+
+    def fetchall(self):
+        """Compatibility method for cursor-like usage"""
+        # This is for backwards compatibility with code that expects cursor.fetchall()
+        return []
+
+    def scalar(self):
+        """Compatibility method for cursor-like usage"""
+        return None
+
+    def __getattr__(self, name):
+        """Delegate unknown attributes to the underlying connection"""
+        return getattr(self._conn, name)
 
 
 class SQLAlchemyDatabaseManager:
@@ -42,22 +132,55 @@ class SQLAlchemyDatabaseManager:
         database_connect: str,
         template: str = "basic",
         schema_init: bool = True,
-        pool_size: int = pool_config.DEFAULT_POOL_SIZE,  # Centralized configuration
-        max_overflow: int = pool_config.DEFAULT_MAX_OVERFLOW,  # Centralized configuration
-        pool_timeout: int = pool_config.DEFAULT_POOL_TIMEOUT,
-        pool_recycle: int = pool_config.DEFAULT_POOL_RECYCLE,
-        pool_pre_ping: bool = pool_config.DEFAULT_POOL_PRE_PING,
+        pool_size: int | None = None,  # None = resolve from PoolConfig
+        max_overflow: int | None = None,
+        pool_timeout: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool | None = None,
+        environment: str | None = None,
+        read_replica_connect: str | None = None,
+        stats_cache_ttl: float = 5.0,
+        async_mode: bool = False,
     ):
+        """
+        Args:
+            database_connect: Primary (read/write) database connection string
+            template: Memory template name
+            schema_init: Create tables and search indexes on startup
+            pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping:
+                Explicit pool settings. Unset values are resolved from
+                PoolConfig for ``environment`` and memori.json "database".
+            environment: Pool profile ('development', 'testing', 'production').
+                Defaults to MEMORI_ENV / memori.json / 'default' (the plain
+                PoolConfig defaults). Unknown names raise ValueError.
+            read_replica_connect: Optional replica connection string used for
+                search traffic. Also read from memori.json
+                "database.read_replica_connect".
+            stats_cache_ttl: Seconds to cache get_memory_stats results per user
+            async_mode: Also create an asyncio engine for the ``*_async``
+                methods (needs greenlet and aiosqlite/asyncpg/aiomysql)
+        """
         self.database_connect = database_connect
         self.template = template
         self.schema_init = schema_init
 
-        # Connection pool settings
-        self.pool_size = pool_size
-        self.max_overflow = max_overflow
-        self.pool_timeout = pool_timeout
-        self.pool_recycle = pool_recycle
-        self.pool_pre_ping = pool_pre_ping
+        # Connection pool settings: PoolConfig profile < memori.json < explicit args
+        resolved_pool = pool_config.resolve(
+            environment,
+            overrides={
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_timeout": pool_timeout,
+                "pool_recycle": pool_recycle,
+                "pool_pre_ping": pool_pre_ping,
+            },
+        )
+        self.environment = resolved_pool["environment"]
+        self.pool_size = resolved_pool["pool_size"]
+        self.max_overflow = resolved_pool["max_overflow"]
+        self.pool_timeout = resolved_pool["pool_timeout"]
+        self.pool_recycle = resolved_pool["pool_recycle"]
+        self.pool_pre_ping = resolved_pool["pool_pre_ping"]
 
         # Initialize database auto-creator
         self.auto_creator = DatabaseAutoCreator(schema_init)
@@ -74,19 +197,218 @@ class SQLAlchemyDatabaseManager:
         # Create session factory
         self.SessionLocal = sessionmaker(bind=self.engine)
 
+        # Optional read replica for search traffic. Falls back to the primary
+        # engine when not configured or unreachable.
+        self.read_replica_connect = (
+            read_replica_connect
+            or pool_config.load_file_settings().get("read_replica_connect")
+        )
+        self.read_engine = self.engine
+        self.ReadSessionLocal = self.SessionLocal
+        if self.read_replica_connect:
+            self._setup_read_replica(self.read_replica_connect)
+
+        # Optional asyncio engines mirroring the primary/replica split, created
+        # per event loop on first use (see async_engine)
+        self.async_enabled = async_mode
+        self._async_engines: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._async_engines_lock = threading.Lock()
+        if async_mode:
+            check_async_support(self.database_connect)
+            if self.has_read_replica:
+                check_async_support(self.read_replica_connect)
+
+        # Batched background chat_history writes (opt-in, see write_behind)
+        self.chat_buffer: ChatHistoryBuffer | None = None
+
         # Initialize search service
         self._search_service = None
 
+        # Short-lived per-user cache for get_memory_stats (seconds, 0 disables)
+        self.stats_cache_ttl = stats_cache_ttl
+        self._stats_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._stats_cache_lock = threading.Lock()
+
+        # Callbacks fed each newly stored promotion candidate (see subscribe_promotions)
+        self._promotion_subscribers: list = []
+
         # Initialize query parameter translator for cross-database compatibility
         self.query_translator = QueryParameterTranslator(self.database_type)
 
+        # EXPLAIN capture for every distinct SELECT (opt-in, see query_plans)
+        self.query_diagnostics: QueryPlanCollector | None = None
+        diagnostics_threshold = threshold_from_env()
+        if diagnostics_threshold is not None:
+            self.enable_query_diagnostics(diagnostics_threshold)
+
         # Log pool configuration
         logger.info(
             f"Initialized SQLAlchemy database manager for {self.database_type} | "
-            f"Pool config: size={self.pool_size}, max_overflow={self.max_overflow}, "
-            f"timeout={self.pool_timeout}s, recycle={self.pool_recycle}s, pre_ping={self.pool_pre_ping}"
+            f"Pool config ({self.environment}): size={self.pool_size}, "
+            f"max_overflow={self.max_overflow}, timeout={self.pool_timeout}s, "
+            f"recycle={self.pool_recycle}s, pre_ping={self.pool_pre_ping} | "
+            f"read_replica={'yes' if self.has_read_replica else 'no'} | "
+            f"async={'yes' if self.async_enabled else 'no'}"
         )
 
+    @property
+    def has_read_replica(self) -> bool:
+        """True when search traffic is routed to a separate replica engine"""
+        return self.read_engine is not self.engine
+
+    def enable_query_diagnostics(
+        self, row_threshold: int | None = None
+    ) -> QueryPlanCollector:
+        """
+        Capture EXPLAIN plans of every distinct SELECT on the primary and
+        replica engines, flagging full scans of tables with at least
+        ``row_threshold`` rows. Returns the (possibly existing) collector.
+        """
+        if self.query_diagnostics is None:
+            self.query_diagnostics = QueryPlanCollector()
+            self.query_diagnostics.attach(self.engine)
+            if self.has_read_replica:
+                self.query_diagnostics.attach(self.read_engine)
+        if row_threshold is not None:
+            self.query_diagnostics.row_threshold = row_threshold
+        return self.query_diagnostics
+
+    def disable_query_diagnostics(self):
+        if self.query_diagnostics is not None:
+            self.query_diagnostics.detach()
+            self.query_diagnostics = None
+
+    def enable_write_behind(
+        self,
+        flush_interval: float = 0.5,
+        max_batch: int = 100,
+        max_pending: int = 10_000,
+        flush_on_exit: bool = True,
+    ) -> ChatHistoryBuffer:
+        """
+        Buffer chat_history rows and write them in background batches.
+        Returns the (possibly existing) buffer; see ``write_behind`` for the
+        durability trade-off of each setting.
+        """
+        if self.chat_buffer is None:
+            self.chat_buffer = ChatHistoryBuffer(
+                self,
+                flush_interval=flush_interval,
+                max_batch=max_batch,
+                max_pending=max_pending,
+                flush_on_exit=flush_on_exit,
+            )
+        return self.chat_buffer
+
+    def disable_write_behind(self):
+        """Flush buffered rows and go back to writing chat history inline"""
+        if self.chat_buffer is not None:
+            self.chat_buffer.close()
+            self.chat_buffer = None
+
+    def read_scope(self) -> AbstractContextManager[ReadScope]:
+        """
+        Share one read session among this manager's reads in the block
+
+        Chat history and the essential/conscious context queries reuse one
+        primary connection instead of checking out their own; searches share
+        it too, or a second scope session on the read replica when one is
+        configured. See ``memori.database.read_scope``.
+        """
+        return read_scope(self)
+
+    @contextmanager
+    def _read_session(self, factory=None) -> Iterator[Session]:
+        """The request's shared read session, or a fresh one from ``factory``"""
+        session = scoped_session(self)
+        if session is not None:
+            yield session
+            return
+        with (factory or self.ReadSessionLocal)() as session:
+            yield session
+
+    def _setup_read_replica(self, replica_connect: str):
+        """Create the replica engine; keep using the primary if it fails"""
+        try:
+            replica_engine = self._create_engine(replica_connect)
+        except DatabaseError as e:
+            logger.warning(
+                f"Read replica unavailable, routing searches to primary: {e}"
+            )
+            return
+
+        if replica_engine.dialect.name != self.database_type:
+            logger.warning(
+                f"Read replica dialect '{replica_engine.dialect.name}' does not match "
+                f"primary '{self.database_type}', ignoring replica"
+            )
+            replica_engine.dispose()
+            return
+
+        self.read_engine = replica_engine
+        self.ReadSessionLocal = sessionmaker(bind=replica_engine)
+
+    def _async_sessionmakers(self) -> dict[str, Any]:
+        """Async engines and session factories for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._async_engines_lock:
+            factories = self._async_engines.get(loop)
+            if factories is not None:
+                return factories
+
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            pool_settings = {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "pool_timeout": self.pool_timeout,
+                "pool_recycle": self.pool_recycle,
+                "pool_pre_ping": self.pool_pre_ping,
+            }
+            engine = create_async_engine_for(self.database_connect, pool_settings)
+            self._attach_pool_metrics(engine.sync_engine)
+            read_engine = engine
+            if self.has_read_replica:
+                read_engine = create_async_engine_for(
+                    self.read_replica_connect, pool_settings
+                )
+                self._attach_pool_metrics(read_engine.sync_engine)
+
+            factories = {
+                "engine": engine,
+                "read_engine": read_engine,
+                "session": async_sessionmaker(engine, expire_on_commit=False),
+                "read_session": async_sessionmaker(
+                    read_engine, expire_on_commit=False
+                ),
+            }
+            self._async_engines[loop] = factories
+            return factories
+
+    def _async_session(self, read: bool = False):
+        """New AsyncSession on the primary (or, for reads, the replica)"""
+        if not self.async_enabled:
+            raise DatabaseError(
+                "Async database methods need SQLAlchemyDatabaseManager(async_mode=True)"
+            )
+        factories = self._async_sessionmakers()
+        return factories["read_session" if read else "session"]()
+
+    async def run_in_async_session(self, fn, *args, read: bool = False, **kwargs):
+        """
+        Await ``fn(session, *args, **kwargs)`` on an async session
+
+        ``fn`` is ordinary synchronous ORM code (a SearchService search, say);
+        SQLAlchemy runs it in a greenlet whose queries yield to the event loop,
+        so concurrent calls overlap their database round trips. Read calls
+        use the replica when one is configured.
+        """
+        async with self._async_session(read=read) as session:
+            result = await session.run_sync(fn, *args, **kwargs)
+            if not read:
+                await session.commit()
+            return result
+
     def _validate_database_dependencies(self, database_connect: str):
         """Validate that required database drivers are installed"""
         if database_connect.startswith("mysql:") or database_connect.startswith(
@@ -264,6 +586,9 @@ class SQLAlchemyDatabaseManager:
             else:
                 raise DatabaseError(f"Unsupported database type: {database_connect}")
 
+            # Track live pool events before the first checkout
+            self._attach_pool_metrics(engine)
+
             # Test connection
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -299,14 +624,41 @@ class SQLAlchemyDatabaseManager:
         except Exception as e:
             raise DatabaseError(f"Failed to create database engine: {e}")
 
-    def initialize_schema(self):
-        """Initialize database schema"""
+    def initialize_schema(self, force: bool = False):
+        """
+        Initialize database schema
+
+        A database stamped with the current schema_fingerprint() was fully set
+        up by an earlier run, so startup costs a single SELECT; ``force`` re-runs
+        every step anyway. The optional steps below log and carry on when they
+        fail; the stamp is only written when all of them succeeded, so a failed
+        step is retried on the next startup.
+        """
+        fingerprint = schema_fingerprint()
+        if not force and self._read_schema_stamp() == fingerprint:
+            logger.debug(f"Database schema is current ({fingerprint}), skipping setup")
+            return
+
         try:
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
 
+            # create_all skips existing tables, so add indexes declared since
+            complete = self._create_missing_indexes()
+
             # Setup database-specific features
-            self._setup_database_features()
+            complete &= self._setup_database_features()
+
+            # Index memories stored before memory_entities existed
+            complete &= self._backfill_memory_entities_if_needed()
+
+            if complete:
+                self._write_schema_stamp(fingerprint)
+            else:
+                logger.warning(
+                    "Database setup incomplete, schema version not recorded; "
+                    "setup runs again on next startup"
+                )
 
             logger.info(
                 f"Database schema initialized successfully for {self.database_type}"
@@ -316,23 +668,255 @@ class SQLAlchemyDatabaseManager:
             logger.error(f"Failed to initialize schema: {e}")
             raise DatabaseError(f"Failed to initialize schema: {e}")
 
-    def _setup_database_features(self):
-        """Setup database-specific features like full-text search"""
+    def _read_schema_stamp(self, component: str = SCHEMA_COMPONENT) -> str | None:
+        """Version recorded for ``component`` by its last run (None if never run)"""
+        try:
+            with self.engine.connect() as conn:
+                return conn.execute(
+                    select(SchemaVersion.version).where(
+                        SchemaVersion.component == component
+                    )
+                ).scalar()
+        except SQLAlchemyError:
+            # Table missing: a database that predates stamping
+            return None
+
+    def _write_schema_stamp(self, version: str, component: str = SCHEMA_COMPONENT):
+        try:
+            with self.SessionLocal() as session:
+                session.merge(
+                    SchemaVersion(
+                        component=component,
+                        version=version,
+                        applied_at=datetime.now(),
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError as e:
+            # Next startup just runs the full setup again
+            logger.warning(f"Failed to record schema version: {e}")
+
+    def _create_missing_indexes(self) -> bool:
+        """Create model-declared indexes that are missing on existing tables
+
+        Returns:
+            False if an index could not be created
+        """
+        try:
+            inspector = inspect(self.engine)
+            for table in Base.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name not in existing:
+                        index.create(bind=self.engine)
+                        logger.info(f"Created missing index {index.name}")
+            return True
+        except Exception as e:
+            # Queries still work without the index, just slower
+            logger.warning(f"Failed to create missing indexes: {e}")
+            return False
+
+    def _backfill_memory_entities_if_needed(self) -> bool:
+        """Run the memory_entities backfill once per database
+
+        Completion is recorded in memori_schema_version, so a database whose
+        memories have no entities at all is not rescanned on every startup.
+
+        Returns:
+            False if the backfill failed
+        """
+        if self._read_schema_stamp(ENTITY_BACKFILL_COMPONENT):
+            return True
+        try:
+            with self.engine.connect() as conn:
+                has_entities = conn.execute(
+                    select(MemoryEntity.id).limit(1)
+                ).first()
+                has_memories = conn.execute(
+                    select(LongTermMemory.memory_id).limit(1)
+                ).first()
+            # New memories are indexed on insert, so a table that already has
+            # rows (or a database without memories) needs no backfill
+            if not has_entities and has_memories:
+                from .migrations.backfill_memory_entities import (
+                    backfill_memory_entities,
+                )
+
+                backfill_memory_entities(self.engine)
+        except Exception as e:
+            # Entity lookups fall back to text search, so this is not fatal
+            logger.warning(f"memory_entities backfill failed: {e}")
+            return False
+
+        self._write_schema_stamp("1", ENTITY_BACKFILL_COMPONENT)
+        return True
+
+    def _setup_database_features(self) -> bool:
+        """Setup database-specific features like full-text search
+
+        Returns:
+            False if the full-text or the substring index setup failed
+        """
+        fulltext_ok = trigram_ok = True
         try:
             with self.engine.connect() as conn:
                 if self.database_type == "sqlite":
-                    self._setup_sqlite_fts(conn)
+                    fulltext_ok = self._setup_sqlite_fts(conn)
                 elif self.database_type == "mysql":
-                    self._setup_mysql_fulltext(conn)
+                    fulltext_ok = self._setup_mysql_fulltext(conn)
                 elif self.database_type == "postgresql":
-                    self._setup_postgresql_fts(conn)
+                    fulltext_ok = self._setup_postgresql_fts(conn)
 
                 conn.commit()
 
         except Exception as e:
             logger.warning(f"Failed to setup database-specific features: {e}")
+            fulltext_ok = False
+
+        # Separate transaction: a failure here (e.g. no permission to create
+        # pg_trgm) must not roll back the full-text setup above
+        try:
+            with self.engine.connect() as conn:
+                if self.database_type == "sqlite":
+                    self._setup_sqlite_trigram(conn)
+                elif self.database_type == "mysql":
+                    self._setup_mysql_ngram(conn)
+                elif self.database_type == "postgresql":
+                    self._setup_postgresql_trigram(conn)
+
+                conn.commit()
+
+        except Exception as e:
+            # The LIKE fallback still works without these, just unindexed
+            logger.warning(f"Substring search index setup failed: {e}")
+            trigram_ok = False
+
+        return fulltext_ok and trigram_ok
+
+    def _setup_sqlite_trigram(self, conn):
+        """Setup trigram FTS5 tables backing the substring fallback search
+
+        External-content tables over each memory table, so the text is not
+        stored twice. Requires SQLite 3.34+ for the trigram tokenizer.
+        """
+        for table in ("short_term_memory", "long_term_memory"):
+            fts = f"{table}_trigram"
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": fts},
+            ).first()
+
+            conn.execute(
+                text(
+                    f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    searchable_content,
+                    summary,
+                    content='{table}',
+                    tokenize='trigram'
+                )
+            """
+                )
+            )
+
+            # Keep the external-content index in sync with the memory table
+            conn.execute(
+                text(
+                    f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table}
+                BEGIN
+                    INSERT INTO {fts}(rowid, searchable_content, summary)
+                    VALUES (NEW.rowid, NEW.searchable_content, NEW.summary);
+                END
+            """
+                )
+            )
+            conn.execute(
+                text(
+                    f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table}
+                BEGIN
+                    INSERT INTO {fts}({fts}, rowid, searchable_content, summary)
+                    VALUES ('delete', OLD.rowid, OLD.searchable_content, OLD.summary);
+                END
+            """
+                )
+            )
+            conn.execute(
+                text(
+                    f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table}
+                BEGIN
+                    INSERT INTO {fts}({fts}, rowid, searchable_content, summary)
+                    VALUES ('delete', OLD.rowid, OLD.searchable_content, OLD.summary);
+                    INSERT INTO {fts}(rowid, searchable_content, summary)
+                    VALUES (NEW.rowid, NEW.searchable_content, NEW.summary);
+                END
+            """
+                )
+            )
+
+            if not exists:
+                # Index rows stored before the trigram table existed
+                conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
 
-    def _setup_sqlite_fts(self, conn):
+        logger.info("SQLite trigram substring index setup completed")
+
+    def _setup_mysql_ngram(self, conn):
+        """Setup ngram FULLTEXT indexes backing the substring fallback search
+
+        One index per column: MATCH() only uses an index on exactly its column
+        list, and (searchable_content, summary) is taken by ft_*_search.
+        """
+        for table, index_name, column in (
+            ("short_term_memory", "ft_short_term_ngram", "searchable_content"),
+            ("short_term_memory", "ft_short_term_summary_ngram", "summary"),
+            ("long_term_memory", "ft_long_term_ngram", "searchable_content"),
+            ("long_term_memory", "ft_long_term_summary_ngram", "summary"),
+        ):
+            exists = conn.execute(
+                text(
+                    """
+                    SELECT COUNT(*) FROM information_schema.statistics
+                    WHERE table_schema = DATABASE()
+                    AND table_name = :table_name
+                    AND index_name = :index_name
+                    """
+                ),
+                {"table_name": table, "index_name": index_name},
+            ).fetchone()[0]
+
+            if not exists:
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table} ADD FULLTEXT INDEX {index_name} "
+                        f"({column}) WITH PARSER ngram"
+                    )
+                )
+                logger.info(f"Created {index_name} index")
+
+        logger.info("MySQL ngram substring index setup completed")
+
+    def _setup_postgresql_trigram(self, conn):
+        """Setup pg_trgm GIN indexes backing the substring fallback search"""
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, prefix in (
+            ("short_term_memory", "short_term"),
+            ("long_term_memory", "long_term"),
+        ):
+            for column in ("searchable_content", "summary"):
+                conn.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS idx_{prefix}_{column}_trgm "
+                        f"ON {table} USING GIN ({column} gin_trgm_ops)"
+                    )
+                )
+
+        logger.info("PostgreSQL pg_trgm substring index setup completed")
+
+    def _setup_sqlite_fts(self, conn) -> bool:
         """Setup SQLite FTS5"""
         try:
             # Create FTS5 virtual table
@@ -381,11 +965,13 @@ class SQLAlchemyDatabaseManager:
             )
 
             logger.info("SQLite FTS5 setup completed")
+            return True
 
         except Exception as e:
             logger.warning(f"SQLite FTS5 setup failed: {e}")
+            return False
 
-    def _setup_mysql_fulltext(self, conn):
+    def _setup_mysql_fulltext(self, conn) -> bool:
         """Setup MySQL FULLTEXT indexes"""
         try:
             # Check if indexes exist before creating them
@@ -451,11 +1037,13 @@ class SQLAlchemyDatabaseManager:
                 logger.debug(
                     "MySQL FULLTEXT indexes already exist (2/2), skipping creation"
                 )
+            return True
 
         except Exception as e:
             logger.warning(f"MySQL FULLTEXT setup failed: {e}")
+            return False
 
-    def _setup_postgresql_fts(self, conn):
+    def _setup_postgresql_fts(self, conn) -> bool:
         """Setup PostgreSQL full-text search"""
         try:
             # Add tsvector columns
@@ -508,20 +1096,28 @@ class SQLAlchemyDatabaseManager:
             )
 
             logger.info("PostgreSQL FTS setup completed")
+            return True
 
         except Exception as e:
             logger.warning(f"PostgreSQL FTS setup failed: {e}")
+            return False
 
     def _get_search_service(self) -> SearchService:
         """Get search service instance with fresh session and proper error handling"""
         session = None
         try:
-            if not hasattr(self, "SessionLocal") or not self.SessionLocal:
+            session = scoped_search_session(self)
+            if session is not None:
+                # Borrowed from the request's read scope, which closes it
+                return SearchService(session, self.database_type)
+
+            if not getattr(self, "ReadSessionLocal", None):
                 logger.error("SessionLocal not available for search service")
                 return None
 
-            # Always create a new session to avoid stale connections
-            session = self.SessionLocal()
+            # Always create a new session to avoid stale connections.
+            # Searches are read-only, so they go to the replica when configured.
+            session = self.ReadSessionLocal()
             if not session:
                 logger.error("Failed to create database session")
                 return None
@@ -566,6 +1162,7 @@ class SQLAlchemyDatabaseManager:
                     pass
             return None
 
+    @timed("db.write", operation="chat_history")
     def store_chat_history(
         self,
         chat_id: str,
@@ -580,36 +1177,144 @@ class SQLAlchemyDatabaseManager:
         timestamp: datetime = None,
     ):
         """Store chat history with multi-tenant isolation"""
+        chat_history = self._chat_history_row(
+            chat_id,
+            user_input,
+            ai_output,
+            model,
+            session_id,
+            user_id,
+            assistant_id,
+            tokens_used,
+            metadata,
+            timestamp,
+        )
         with self.SessionLocal() as session:
             try:
-                # Build ChatHistory kwargs - map timestamp to created_at if provided
-                chat_kwargs = {
-                    "chat_id": chat_id,
-                    "user_input": user_input,
-                    "ai_output": ai_output,
-                    "model": model,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "assistant_id": assistant_id,
-                    "tokens_used": tokens_used,
-                    "metadata_json": metadata or {},
-                }
+                session.merge(chat_history)  # Use merge for INSERT OR REPLACE behavior
+                session.commit()
+                self.invalidate_stats_cache(user_id)
+
+                return chat_id
 
-                # Map timestamp parameter to created_at field for backward compatibility
-                if timestamp is not None:
-                    chat_kwargs["created_at"] = timestamp
+            except SQLAlchemyError as e:
+                session.rollback()
+                raise DatabaseError(f"Failed to store chat history: {e}")
 
-                chat_history = ChatHistory(**chat_kwargs)
+    @timed("db.write", operation="chat_history_batch")
+    def store_chat_history_batch(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert many new chat rows (``store_chat_history`` keyword arguments)
+        with one multi-row INSERT in one transaction; returns the number stored
 
-                session.merge(chat_history)  # Use merge for INSERT OR REPLACE behavior
+        Unlike ``store_chat_history`` this does not merge, so an existing
+        chat_id fails the whole batch.
+        """
+        if not rows:
+            return 0
+        values = [
+            self._chat_history_values(
+                row["chat_id"],
+                row["user_input"],
+                row["ai_output"],
+                row["model"],
+                row["session_id"],
+                row.get("user_id", "default"),
+                row.get("assistant_id"),
+                row.get("tokens_used", 0),
+                row.get("metadata"),
+                # executemany needs the same keys in every row
+                row.get("timestamp") or datetime.utcnow(),
+            )
+            for row in rows
+        ]
+        with self.SessionLocal() as session:
+            try:
+                session.execute(insert(ChatHistory), values)
                 session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                raise DatabaseError(f"Failed to store chat history batch: {e}")
+
+        for user_id in {row.get("user_id", "default") for row in rows}:
+            self.invalidate_stats_cache(user_id)
+        return len(rows)
+
+    @timed("db.write", operation="chat_history")
+    async def store_chat_history_async(
+        self,
+        chat_id: str,
+        user_input: str,
+        ai_output: str,
+        model: str,
+        session_id: str,
+        user_id: str = "default",
+        assistant_id: str = None,
+        tokens_used: int = 0,
+        metadata: dict[str, Any] | None = None,
+        timestamp: datetime = None,
+    ):
+        """Async ``store_chat_history``; needs async_mode"""
+        chat_history = self._chat_history_row(
+            chat_id,
+            user_input,
+            ai_output,
+            model,
+            session_id,
+            user_id,
+            assistant_id,
+            tokens_used,
+            metadata,
+            timestamp,
+        )
+        async with self._async_session() as session:
+            try:
+                await session.merge(chat_history)
+                await session.commit()
+                self.invalidate_stats_cache(user_id)
 
                 return chat_id
 
             except SQLAlchemyError as e:
-                session.rollback()
+                await session.rollback()
                 raise DatabaseError(f"Failed to store chat history: {e}")
 
+    @classmethod
+    def _chat_history_row(cls, *args) -> ChatHistory:
+        return ChatHistory(**cls._chat_history_values(*args))
+
+    @staticmethod
+    def _chat_history_values(
+        chat_id,
+        user_input,
+        ai_output,
+        model,
+        session_id,
+        user_id,
+        assistant_id,
+        tokens_used,
+        metadata,
+        timestamp,
+    ) -> dict[str, Any]:
+        # Build ChatHistory kwargs - map timestamp to created_at if provided
+        chat_kwargs = {
+            "chat_id": chat_id,
+            "user_input": user_input,
+            "ai_output": ai_output,
+            "model": model,
+            "session_id": session_id,
+            "user_id": user_id,
+            "assistant_id": assistant_id,
+            "tokens_used": tokens_used,
+            "metadata_json": metadata or {},
+        }
+
+        # Map timestamp parameter to created_at field for backward compatibility
+        if timestamp is not None:
+            chat_kwargs["created_at"] = timestamp
+
+        return chat_kwargs
+
     def get_chat_history(
         self,
         user_id: str = "default",
@@ -617,38 +1322,68 @@ class SQLAlchemyDatabaseManager:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """Get chat history with optional session filtering"""
-        with self.SessionLocal() as session:
+        with self._read_session(self.SessionLocal) as session:
             try:
-                query = session.query(ChatHistory).filter(
-                    ChatHistory.user_id == user_id
-                )
+                results = session.scalars(
+                    self._chat_history_select(user_id, session_id, limit)
+                ).all()
+                history = [self._chat_history_dict(result) for result in results]
 
-                if session_id:
-                    query = query.filter(ChatHistory.session_id == session_id)
+            except SQLAlchemyError as e:
+                raise DatabaseError(f"Failed to get chat history: {e}")
 
-                results = (
-                    query.order_by(ChatHistory.created_at.desc()).limit(limit).all()
-                )
+        # Read-your-writes: rows still waiting in the write-behind buffer
+        if self.chat_buffer is not None:
+            history = self.chat_buffer.merge_history(
+                history, user_id, session_id, limit
+            )
+        return history
 
-                # Convert to dictionaries
-                return [
-                    {
-                        "chat_id": result.chat_id,
-                        "user_input": result.user_input,
-                        "ai_output": result.ai_output,
-                        "model": result.model,
-                        "timestamp": result.created_at,
-                        "session_id": result.session_id,
-                        "user_id": result.user_id,
-                        "tokens_used": result.tokens_used,
-                        "metadata": result.metadata_json or {},
-                    }
-                    for result in results
-                ]
+    async def get_chat_history_async(
+        self,
+        user_id: str = "default",
+        session_id: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Async ``get_chat_history``; needs async_mode"""
+        async with self._async_session() as session:
+            try:
+                results = await session.scalars(
+                    self._chat_history_select(user_id, session_id, limit)
+                )
+                history = [self._chat_history_dict(result) for result in results.all()]
 
             except SQLAlchemyError as e:
                 raise DatabaseError(f"Failed to get chat history: {e}")
 
+        if self.chat_buffer is not None:
+            history = self.chat_buffer.merge_history(
+                history, user_id, session_id, limit
+            )
+        return history
+
+    @staticmethod
+    def _chat_history_select(user_id: str, session_id: str | None, limit: int):
+        query = select(ChatHistory).where(ChatHistory.user_id == user_id)
+        if session_id:
+            query = query.where(ChatHistory.session_id == session_id)
+        return query.order_by(ChatHistory.created_at.desc()).limit(limit)
+
+    @staticmethod
+    def _chat_history_dict(result: ChatHistory) -> dict[str, Any]:
+        return {
+            "chat_id": result.chat_id,
+            "user_input": result.user_input,
+            "ai_output": result.ai_output,
+            "model": result.model,
+            "timestamp": result.created_at,
+            "session_id": result.session_id,
+            "user_id": result.user_id,
+            "tokens_used": result.tokens_used,
+            "metadata": result.metadata_json or {},
+        }
+
+    @timed("db.write", operation="long_term_memory")
     def store_long_term_memory_enhanced(
         self,
         memory: ProcessedLongTermMemory,
@@ -659,54 +1394,117 @@ class SQLAlchemyDatabaseManager:
     ) -> str:
         """Store a ProcessedLongTermMemory with enhanced schema and multi-tenant isolation"""
         memory_id = str(uuid.uuid4())
+        long_term_memory = self._long_term_memory_row(
+            memory, memory_id, user_id, assistant_id, session_id
+        )
+        # Index entities/keywords for get_entity_memories and keyword search
+        entity_rows = build_memory_entity_rows(
+            memory_id, user_id, memory.entities, memory.keywords
+        )
 
         with self.SessionLocal() as session:
             try:
-                long_term_memory = LongTermMemory(
-                    memory_id=memory_id,
-                    processed_data=memory.model_dump(mode="json"),
-                    importance_score=memory.importance_score,
-                    category_primary=memory.classification.value,
-                    retention_type="long_term",
-                    user_id=user_id,
-                    assistant_id=assistant_id,
-                    session_id=session_id,
-                    created_at=datetime.now(),
-                    searchable_content=memory.content,
-                    summary=memory.summary,
-                    novelty_score=0.5,
-                    relevance_score=0.5,
-                    actionability_score=0.5,
-                    classification=memory.classification.value,
-                    memory_importance=memory.importance.value,
-                    topic=memory.topic,
-                    entities_json=memory.entities,
-                    keywords_json=memory.keywords,
-                    is_user_context=memory.is_user_context,
-                    is_preference=memory.is_preference,
-                    is_skill_knowledge=memory.is_skill_knowledge,
-                    is_current_project=memory.is_current_project,
-                    promotion_eligible=memory.promotion_eligible,
-                    duplicate_of=memory.duplicate_of,
-                    supersedes_json=memory.supersedes,
-                    related_memories_json=memory.related_memories,
-                    confidence_score=memory.confidence_score,
-                    classification_reason=memory.classification_reason,
-                    processed_for_duplicates=False,
-                    conscious_processed=False,
-                )
-
                 session.add(long_term_memory)
+                session.flush()
+                if entity_rows:
+                    session.execute(MemoryEntity.__table__.insert(), entity_rows)
                 session.commit()
 
-                logger.debug(f"Stored enhanced long-term memory {memory_id}")
-                return memory_id
-
             except SQLAlchemyError as e:
                 session.rollback()
                 logger.error(f"Failed to store enhanced long-term memory: {e}")
                 raise DatabaseError(f"Failed to store enhanced long-term memory: {e}")
 
+        self._after_long_term_stored(memory, memory_id, user_id)
+        return memory_id
+
+    @timed("db.write", operation="long_term_memory")
+    async def store_long_term_memory_enhanced_async(
+        self,
+        memory: ProcessedLongTermMemory,
+        chat_id: str,
+        user_id: str = "default",
+        assistant_id: str = None,
+        session_id: str = "default",
+    ) -> str:
+        """Async ``store_long_term_memory_enhanced``; needs async_mode"""
+        memory_id = str(uuid.uuid4())
+        long_term_memory = self._long_term_memory_row(
+            memory, memory_id, user_id, assistant_id, session_id
+        )
+        entity_rows = build_memory_entity_rows(
+            memory_id, user_id, memory.entities, memory.keywords
+        )
+
+        async with self._async_session() as session:
+            try:
+                session.add(long_term_memory)
+                await session.flush()
+                if entity_rows:
+                    await session.execute(MemoryEntity.__table__.insert(), entity_rows)
+                await session.commit()
+
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Failed to store enhanced long-term memory: {e}")
+                raise DatabaseError(f"Failed to store enhanced long-term memory: {e}")
+
+        self._after_long_term_stored(memory, memory_id, user_id)
+        return memory_id
+
+    @staticmethod
+    def _long_term_memory_row(
+        memory: ProcessedLongTermMemory,
+        memory_id: str,
+        user_id: str,
+        assistant_id: str | None,
+        session_id: str,
+    ) -> LongTermMemory:
+        return LongTermMemory(
+            memory_id=memory_id,
+            processed_data=memory.model_dump(mode="json"),
+            importance_score=memory.importance_score,
+            category_primary=memory.classification.value,
+            retention_type="long_term",
+            user_id=user_id,
+            assistant_id=assistant_id,
+            session_id=session_id,
+            created_at=datetime.now(),
+            searchable_content=memory.content,
+            summary=memory.summary,
+            novelty_score=0.5,
+            relevance_score=0.5,
+            actionability_score=0.5,
+            classification=memory.classification.value,
+            memory_importance=memory.importance.value,
+            topic=memory.topic,
+            entities_json=memory.entities,
+            keywords_json=memory.keywords,
+            is_user_context=memory.is_user_context,
+            is_preference=memory.is_preference,
+            is_skill_knowledge=memory.is_skill_knowledge,
+            is_current_project=memory.is_current_project,
+            promotion_eligible=memory.promotion_eligible,
+            duplicate_of=memory.duplicate_of,
+            supersedes_json=memory.supersedes,
+            related_memories_json=memory.related_memories,
+            confidence_score=memory.confidence_score,
+            classification_reason=memory.classification_reason,
+            processed_for_duplicates=False,
+            conscious_processed=False,
+        )
+
+    def _after_long_term_stored(
+        self, memory: ProcessedLongTermMemory, memory_id: str, user_id: str
+    ):
+        self.invalidate_stats_cache(user_id)
+        logger.debug(f"Stored enhanced long-term memory {memory_id}")
+        if (
+            memory.promotion_eligible
+            or memory.classification == MemoryClassification.CONSCIOUS_INFO
+        ):
+            self._publish_promotion(memory_id, user_id)
+
     def search_memories(
         self,
         query: str,
@@ -768,96 +1566,167 @@ class SQLAlchemyDatabaseManager:
             # Ensure session is properly closed, even if an exception occurred
             if search_service and hasattr(search_service, "session"):
                 try:
-                    if search_service.session:
+                    # A session borrowed from the read scope stays open
+                    session = search_service.session
+                    scope = current_read_scope(self)
+                    if session and (scope is None or not scope.owns(session)):
                         logger.debug("Closing search service session")
-                        search_service.session.close()
+                        session.close()
                 except Exception as session_e:
                     logger.warning(f"Error closing search service session: {session_e}")
 
-    def get_memory_stats(self, user_id: str = "default") -> dict[str, Any]:
-        """Get comprehensive memory statistics"""
-        with self.SessionLocal() as session:
-            try:
-                stats = {}
+    async def search_memories_async(
+        self,
+        query: str,
+        user_id: str = "default",
+        assistant_id: str | None = None,
+        session_id: str | None = None,
+        category_filter: list[str] | None = None,
+        limit: int = 10,
+        memory_types: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async ``search_memories``; needs async_mode. Searches the replica if set."""
+
+        def search(session) -> list[dict[str, Any]]:
+            results = SearchService(session, self.database_type).search_memories(
+                query,
+                user_id,
+                assistant_id,
+                session_id,
+                category_filter,
+                limit,
+                memory_types,
+            )
+            # Lazy loading only works inside run_sync; afterwards the async
+            # engine can't be driven from plain attribute access
+            hydrate_processed_data(results)
+            return results
 
-                # Basic counts
-                stats["chat_history_count"] = (
-                    session.query(ChatHistory)
-                    .filter(ChatHistory.user_id == user_id)
-                    .count()
-                )
+        try:
+            results = await self.run_in_async_session(search, read=True)
+            return list(results) if results else []
+        except DatabaseError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Memory search failed for query '{query}' in user_id '{user_id}': {e}"
+            )
+            return []
 
-                stats["short_term_count"] = (
-                    session.query(ShortTermMemory)
-                    .filter(ShortTermMemory.user_id == user_id)
-                    .count()
-                )
+    def search_entity_memories(
+        self,
+        values: list[str],
+        user_id: str = "default",
+        assistant_id: str | None = None,
+        entity_type: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Look up long-term memories by entity/keyword via the memory_entities index
 
-                stats["long_term_count"] = (
-                    session.query(LongTermMemory)
-                    .filter(LongTermMemory.user_id == user_id)
-                    .count()
-                )
+        Args:
+            values: Entity or keyword values to look up
+            user_id: User identifier for multi-tenant isolation
+            assistant_id: Assistant identifier for multi-tenant isolation
+            entity_type: Restrict to "keyword" or "entity" rows; an EntityType
+                kind (person, technology, ...) selects "entity" rows
+            limit: Maximum number of results
+        """
+        search_service = None
+        try:
+            search_service = self._get_search_service()
+            if not search_service:
+                return []
+            return search_service.search_by_entities(
+                values, user_id, assistant_id, entity_type, limit
+            )
+        except Exception as e:
+            logger.error(f"Entity lookup failed for {values} in user_id '{user_id}': {e}")
+            return []
+        finally:
+            # A session borrowed from the read scope stays open
+            if search_service and search_service.session:
+                scope = current_read_scope(self)
+                if scope is None or not scope.owns(search_service.session):
+                    search_service.session.close()
+
+    def get_memory_stats(
+        self, user_id: str = "default", use_cache: bool = True
+    ) -> dict[str, Any]:
+        """
+        Get comprehensive memory statistics
+
+        All counts, the category breakdown and the importance average are
+        computed by a single UNION ALL aggregate. Results are cached per user
+        for ``stats_cache_ttl`` seconds and invalidated by this manager's writes,
+        so repeated UI refreshes don't rescan both memory tables.
 
-                # Category breakdown
-                categories = {}
+        Args:
+            user_id: User identifier for multi-tenant isolation
+            use_cache: Return a cached result if it is still fresh
+        """
+        if use_cache and self.stats_cache_ttl > 0:
+            with self._stats_cache_lock:
+                cached = self._stats_cache.get(user_id)
+            if cached and cached[0] > time.monotonic():
+                return copy.deepcopy(cached[1])
 
-                # Short-term categories
-                short_categories = (
-                    session.query(
-                        ShortTermMemory.category_primary,
-                        func.count(ShortTermMemory.memory_id).label("count"),
+        with self.SessionLocal() as session:
+            try:
+                chat_q = select(
+                    literal("chat_history").label("source"),
+                    literal(None, String).label("category"),
+                    func.count().label("row_count"),
+                    literal(0.0, Float).label("importance_sum"),
+                ).where(ChatHistory.user_id == user_id)
+
+                short_q = (
+                    select(
+                        literal("short_term").label("source"),
+                        ShortTermMemory.category_primary.label("category"),
+                        func.count().label("row_count"),
+                        func.coalesce(func.sum(ShortTermMemory.importance_score), 0.0),
                     )
-                    .filter(ShortTermMemory.user_id == user_id)
+                    .where(ShortTermMemory.user_id == user_id)
                     .group_by(ShortTermMemory.category_primary)
-                    .all()
                 )
 
-                for cat, count in short_categories:
-                    categories[cat] = categories.get(cat, 0) + count
-
-                # Long-term categories
-                long_categories = (
-                    session.query(
-                        LongTermMemory.category_primary,
-                        func.count(LongTermMemory.memory_id).label("count"),
+                long_q = (
+                    select(
+                        literal("long_term").label("source"),
+                        LongTermMemory.category_primary.label("category"),
+                        func.count().label("row_count"),
+                        func.coalesce(func.sum(LongTermMemory.importance_score), 0.0),
                     )
-                    .filter(LongTermMemory.user_id == user_id)
+                    .where(LongTermMemory.user_id == user_id)
                     .group_by(LongTermMemory.category_primary)
-                    .all()
                 )
 
-                for cat, count in long_categories:
-                    categories[cat] = categories.get(cat, 0) + count
-
-                stats["memories_by_category"] = categories
-
-                # Average importance
-                short_avg = (
-                    session.query(func.avg(ShortTermMemory.importance_score))
-                    .filter(ShortTermMemory.user_id == user_id)
-                    .scalar()
-                    or 0
-                )
+                rows = session.execute(union_all(chat_q, short_q, long_q)).all()
+
+                counts = {"chat_history": 0, "short_term": 0, "long_term": 0}
+                categories: dict[str, int] = {}
+                importance_sum = 0.0
+
+                for source, category, row_count, source_importance in rows:
+                    row_count = int(row_count or 0)
+                    counts[source] += row_count
+                    if source == "chat_history":
+                        continue
+                    categories[category] = categories.get(category, 0) + row_count
+                    importance_sum += float(source_importance or 0.0)
+
+                stats = {
+                    "chat_history_count": counts["chat_history"],
+                    "short_term_count": counts["short_term"],
+                    "long_term_count": counts["long_term"],
+                    "memories_by_category": categories,
+                }
 
-                long_avg = (
-                    session.query(func.avg(LongTermMemory.importance_score))
-                    .filter(LongTermMemory.user_id == user_id)
-                    .scalar()
-                    or 0
+                total_memories = counts["short_term"] + counts["long_term"]
+                stats["average_importance"] = (
+                    importance_sum / total_memories if total_memories > 0 else 0.0
                 )
 
-                total_memories = stats["short_term_count"] + stats["long_term_count"]
-                if total_memories > 0:
-                    # Weight averages by count
-                    total_avg = (
-                        (short_avg * stats["short_term_count"])
-                        + (long_avg * stats["long_term_count"])
-                    ) / total_memories
-                    stats["average_importance"] = float(total_avg) if total_avg else 0.0
-                else:
-                    stats["average_importance"] = 0.0
-
                 # Database info
                 stats["database_type"] = self.database_type
                 stats["database_url"] = (
@@ -866,15 +1735,57 @@ class SQLAlchemyDatabaseManager:
                     else self.database_connect
                 )
 
-                return stats
-
             except SQLAlchemyError as e:
                 raise DatabaseError(f"Failed to get memory stats: {e}")
 
+        if self.stats_cache_ttl > 0:
+            with self._stats_cache_lock:
+                self._stats_cache[user_id] = (
+                    time.monotonic() + self.stats_cache_ttl,
+                    copy.deepcopy(stats),
+                )
+
+        return stats
+
+    def subscribe_promotions(self, callback):
+        """
+        Register ``callback(memory_id, user_id)`` for newly stored memories that
+        may be promoted to short-term context (conscious-info / promotion-eligible)
+
+        Callbacks run on the storing thread after commit and must not block.
+        """
+        if callback not in self._promotion_subscribers:
+            self._promotion_subscribers.append(callback)
+
+    def unsubscribe_promotions(self, callback):
+        if callback in self._promotion_subscribers:
+            self._promotion_subscribers.remove(callback)
+
+    def _publish_promotion(self, memory_id: str, user_id: str):
+        for callback in list(self._promotion_subscribers):
+            try:
+                callback(memory_id, user_id)
+            except Exception as e:
+                logger.warning(f"Promotion subscriber failed for {memory_id}: {e}")
+
+    def invalidate_stats_cache(self, user_id: str | None = None):
+        """Drop cached stats for one user, or for everyone when user_id is None"""
+        with self._stats_cache_lock:
+            if user_id is None:
+                self._stats_cache.clear()
+            else:
+                self._stats_cache.pop(user_id, None)
+
     def clear_memory(self, user_id: str = "default", memory_type: str | None = None):
         """Clear memory data"""
         with self.SessionLocal() as session:
             try:
+                if memory_type not in ("short_term", "chat_history"):
+                    # SQLite does not enforce the ON DELETE CASCADE by default
+                    session.query(MemoryEntity).filter(
+                        MemoryEntity.user_id == user_id
+                    ).delete()
+
                 if memory_type == "short_term":
                     session.query(ShortTermMemory).filter(
                         ShortTermMemory.user_id == user_id
@@ -899,6 +1810,7 @@ class SQLAlchemyDatabaseManager:
                     ).delete()
 
                 session.commit()
+                self.invalidate_stats_cache(user_id)
 
             except SQLAlchemyError as e:
                 session.rollback()
@@ -934,89 +1846,123 @@ class SQLAlchemyDatabaseManager:
 
         This is used by memory.py for direct SQL queries.
         """
-        from contextlib import contextmanager
-
         @contextmanager
         def connection_context():
-            class TranslatingConnection:
-                """Wrapper that adds parameter translation to SQLAlchemy connections"""
-
-                def __init__(self, conn, translator):
-                    self._conn = conn
-                    self._translator = translator
-
-                def execute(self, query, parameters=None):
-                    """Execute query with automatic parameter translation"""
-                    if parameters:
-                        # Handle both text() queries and raw strings
-                        if hasattr(query, "text"):
-                            # SQLAlchemy text() object
-                            translated_params = self._translator.translate_parameters(
-                                parameters
-                            )
-                            return self._conn.execute(query, translated_params)
-                        else:
-                            # Raw string query
-                            translated_params = self._translator.translate_parameters(
-                                parameters
-                            )
-                            return self._conn.execute(
-                                text(str(query)), translated_params
-                            )
-                    else:
-                        return self._conn.execute(query)
-
-                def commit(self):
-                    """Commit transaction"""
-                    return self._conn.commit()
-
-                def rollback(self):
-                    """Rollback transaction"""
-                    return self._conn.rollback()
-
-                def close(self):
-                    """Close connection"""
-                    return self._conn.close()
-
-                def fetchall(self):
-                    """Compatibility method for cursor-like usage"""
-                    # This is for backwards compatibility with code that expects cursor.fetchall()
-                    return []
-
-                def scalar(self):
-                    """Compatibility method for cursor-like usage"""
-                    return None
-
-                def __getattr__(self, name):
-                    """Delegate unknown attributes to the underlying connection"""
-                    return getattr(self._conn, name)
-
             conn = self.engine.connect()
             try:
-                yield TranslatingConnection(conn, self.query_translator)
+                yield _TranslatingConnection(conn, self.query_translator)
             finally:
                 conn.close()
 
         return connection_context()
 
+    @contextmanager
+    def _get_read_connection(self):
+        """
+        ``_get_connection()`` for read-only queries
+
+        Inside ``read_scope()`` it wraps the scope's connection (left open for
+        the next read); otherwise it checks out a connection of its own.
+        """
+        session = scoped_session(self)
+        if session is None:
+            with self._get_connection() as connection:
+                yield connection
+            return
+        yield _TranslatingConnection(session.connection(), self.query_translator)
+
+    def _attach_pool_metrics(self, engine):
+        """Register pool event listeners that keep live counters for the engine"""
+        metrics = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "peak_checked_out": 0,
+            "_checked_out": 0,
+        }
+        lock = threading.Lock()
+        if not hasattr(self, "_pool_metrics"):
+            self._pool_metrics = {}
+        self._pool_metrics[id(engine)] = (metrics, lock)
+
+        def on_connect(dbapi_connection, connection_record):
+            with lock:
+                metrics["connects"] += 1
+
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with lock:
+                metrics["checkouts"] += 1
+                metrics["_checked_out"] += 1
+                if metrics["_checked_out"] > metrics["peak_checked_out"]:
+                    metrics["peak_checked_out"] = metrics["_checked_out"]
+
+        def on_checkin(dbapi_connection, connection_record):
+            with lock:
+                metrics["checkins"] += 1
+                metrics["_checked_out"] = max(0, metrics["_checked_out"] - 1)
+
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with lock:
+                metrics["invalidations"] += 1
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        event.listen(engine, "invalidate", on_invalidate)
+
+    def _describe_pool(self, engine) -> dict[str, Any]:
+        """Snapshot of a single engine's pool, tolerant of non-queue pools"""
+        pool = engine.pool
+        status: dict[str, Any] = {"pool_class": type(pool).__name__}
+
+        if isinstance(pool, QueuePool):
+            size = pool.size()
+            overflow = pool.overflow()
+            checked_out = pool.checkedout()
+            # overflow() is negative until the pool has opened pool_size connections
+            total = size + overflow
+            status.update(
+                {
+                    "size": size,
+                    "checked_in": pool.checkedin(),
+                    "checked_out": checked_out,
+                    "overflow": overflow,
+                    "total_connections": total,
+                    "pool_size_limit": size,
+                    "overflow_limit": pool._max_overflow,
+                    "pool_timeout": pool.timeout(),
+                    "utilization": (checked_out / total) if total > 0 else 0,
+                }
+            )
+
+        tracked = getattr(self, "_pool_metrics", {}).get(id(engine))
+        if tracked:
+            metrics, lock = tracked
+            with lock:
+                status["events"] = {
+                    key: value for key, value in metrics.items() if not key.startswith("_")
+                }
+        return status
+
     def get_pool_status(self) -> dict[str, Any]:
-        """Get current connection pool status"""
+        """
+        Get current connection pool status.
+
+        The top-level keys describe the primary engine. Queue-based pools report
+        size/checked_in/checked_out/overflow/utilization; every pool reports
+        cumulative event counters (connects, checkouts, checkins, invalidations,
+        peak_checked_out). When a read replica is configured its status is
+        nested under "read_replica".
+        """
         try:
-            pool = self.engine.pool
-            return {
-                "size": pool.size(),
-                "checked_in": pool.checkedin(),
-                "checked_out": pool.checkedout(),
-                "overflow": pool.overflow(),
-                "total_connections": pool.size() + pool.overflow(),
-                "pool_size_limit": self.pool_size,
-                "overflow_limit": self.max_overflow,
-                "utilization": (
-                    (pool.checkedout() / (pool.size() + pool.overflow()))
-                    if (pool.size() + pool.overflow()) > 0
-                    else 0
-                ),
-            }
+            status = self._describe_pool(self.engine)
+            status["environment"] = getattr(self, "environment", None)
+            status.setdefault("pool_size_limit", self.pool_size)
+            status.setdefault("overflow_limit", self.max_overflow)
+            if self.has_read_replica:
+                status["read_replica"] = self._describe_pool(self.read_engine)
+            return status
         except Exception as e:
             logger.warning(f"Failed to get pool status: {e}")
             return {}
@@ -1025,7 +1971,7 @@ class SQLAlchemyDatabaseManager:
         """Log current pool status for monitoring"""
         try:
             status = self.get_pool_status()
-            if status:
+            if status and "checked_out" in status:
                 logger.info(
                     f"Connection Pool Status: {status['checked_out']}/{status['total_connections']} "
                     f"active, {status['overflow']} overflow, {status['utilization']*100:.1f}% utilized"
@@ -1046,12 +1992,29 @@ class SQLAlchemyDatabaseManager:
 
     def close(self):
         """Close database connections"""
+        if getattr(self, "chat_buffer", None) is not None:
+            # Write buffered rows before the engine goes away
+            self.disable_write_behind()
+
         if self._search_service and hasattr(self._search_service, "session"):
             self._search_service.session.close()
 
+        if getattr(self, "read_engine", None) is not None and self.has_read_replica:
+            self.read_engine.dispose()
+
         if hasattr(self, "engine"):
             self.engine.dispose()
 
+    async def close_async(self):
+        """Dispose this event loop's asyncio engines (they need awaiting), then close"""
+        with self._async_engines_lock:
+            factories = self._async_engines.pop(asyncio.get_running_loop(), None)
+        if factories is not None:
+            if factories["read_engine"] is not factories["engine"]:
+                await factories["read_engine"].dispose()
+            await factories["engine"].dispose()
+        self.close()
+
     def get_database_info(self) -> dict[str, Any]:
         """Get database information and capabilities"""
         base_info = {
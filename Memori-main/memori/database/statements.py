@@ -0,0 +1,447 @@
+"""
+Named, pre-built SQL statements for Memori's hot raw-SQL paths
+
+Raw queries used to be written inline as ``text("...")``, rebuilt on every call
+and passed through ``QueryParameterTranslator``, which scans every value with
+name-based heuristics to guess which 0/1 integers are booleans (a
+``limit`` of 1 was one of them). Statements registered here are built once per
+dialect (and per variant, for queries whose shape depends on the filters in
+use), and carry typed bind parameters. SQLAlchemy then handles booleans per
+dialect, and its compiled cache sees the same construct every time.
+
+Every execution is counted and timed under its name, so ``statement_stats()``
+shows which queries are hot.
+
+Usage:
+    from memori.database.statements import STATEMENTS
+
+    with db_manager._get_connection() as conn:
+        rows = STATEMENTS.execute(
+            conn, "memory.essential_conversations", {"user_id": uid, "limit": 10}
+        ).fetchall()
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Boolean, Integer, bindparam, text
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.types import TypeEngine
+
+from ..utils.database.db_helpers import get_insert_statement
+from ..utils.exceptions import DatabaseError
+from ..utils.metrics import observe
+from .queries.memory_queries import MemoryQueries
+
+SqlSource = str | Callable[..., str]
+
+# ids of every TextClause built by a registry; connections skip the heuristic
+# parameter translation for these because their binds are already typed
+_prepared_ids: set[int] = set()
+
+
+def is_prepared_statement(statement: Any) -> bool:
+    """True if ``statement`` was built by a StatementRegistry"""
+    return id(statement) in _prepared_ids
+
+
+def dialect_name(connection: Any) -> str:
+    """Dialect name of a Connection, Session or connection wrapper"""
+    dialect = getattr(connection, "dialect", None)
+    if dialect is None and hasattr(connection, "get_bind"):
+        dialect = connection.get_bind().dialect
+    return dialect.name if dialect is not None else "default"
+
+
+@dataclass
+class PreparedStatement:
+    """
+    One named query
+
+    ``sql`` is either a string used for every dialect, or a builder called as
+    ``sql(dialect, **variant)`` for queries that differ per dialect or per
+    optional filter. Built statements are cached per (dialect, variant).
+    """
+
+    name: str
+    sql: SqlSource
+    param_types: dict[str, TypeEngine] = field(default_factory=dict)
+    expanding: tuple[str, ...] = ()
+    dialects: tuple[str, ...] | None = None
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    _built: dict[tuple, TextClause] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def statement(self, dialect: str, **variant: Any) -> TextClause:
+        """The built statement for ``dialect`` and ``variant``"""
+        key = (dialect, tuple(sorted(variant.items())))
+        clause = self._built.get(key)
+        if clause is not None:
+            return clause
+
+        if self.dialects is not None and dialect not in self.dialects:
+            raise DatabaseError(
+                f"Statement {self.name!r} is not available for {dialect}"
+            )
+        sql = self.sql(dialect, **variant) if callable(self.sql) else self.sql
+        binds = [
+            bindparam(name, type_=type_)
+            for name, type_ in self.param_types.items()
+            if _mentions(sql, name)
+        ]
+        binds.extend(
+            bindparam(name, expanding=True)
+            for name in self.expanding
+            if _mentions(sql, name)
+        )
+        clause = text(sql).bindparams(*binds) if binds else text(sql)
+
+        with self._lock:
+            clause = self._built.setdefault(key, clause)
+            _prepared_ids.add(id(clause))
+        return clause
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "total_ms": round(self.total_seconds * 1000, 3),
+                "avg_ms": (
+                    round(self.total_seconds * 1000 / self.calls, 3)
+                    if self.calls
+                    else 0.0
+                ),
+                "max_ms": round(self.max_seconds * 1000, 3),
+                "variants": len(self._built),
+            }
+
+
+def _mentions(sql: str, name: str) -> bool:
+    return re.search(rf":{re.escape(name)}\b", sql) is not None
+
+
+class StatementRegistry:
+    """Registry of named statements with per-name execution stats"""
+
+    def __init__(self):
+        self._statements: dict[str, PreparedStatement] = {}
+
+    def register(
+        self,
+        name: str,
+        sql: SqlSource,
+        *,
+        param_types: dict[str, TypeEngine] | None = None,
+        expanding: tuple[str, ...] = (),
+        dialects: tuple[str, ...] | None = None,
+    ) -> PreparedStatement:
+        if name in self._statements:
+            raise ValueError(f"Statement {name!r} is already registered")
+        prepared = PreparedStatement(
+            name=name,
+            sql=sql,
+            param_types=param_types or {},
+            expanding=expanding,
+            dialects=dialects,
+        )
+        self._statements[name] = prepared
+        return prepared
+
+    def get(self, name: str) -> PreparedStatement:
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise DatabaseError(f"Unknown prepared statement: {name!r}") from None
+
+    def statement(self, name: str, dialect: str, **variant: Any) -> TextClause:
+        return self.get(name).statement(dialect, **variant)
+
+    def execute(
+        self,
+        connection: Any,
+        name: str,
+        params: dict[str, Any] | list[dict[str, Any]] | None = None,
+        **variant: Any,
+    ):
+        """
+        Execute statement ``name`` on a Connection or Session
+
+        A list of parameter dicts runs as a single executemany. The recorded
+        time covers execution, not fetching from the returned result.
+        """
+        prepared = self.get(name)
+        clause = prepared.statement(dialect_name(connection), **variant)
+        start = time.perf_counter()
+        try:
+            if params:
+                return connection.execute(clause, params)
+            return connection.execute(clause)
+        finally:
+            elapsed = time.perf_counter() - start
+            prepared.record(elapsed)
+            observe("db.statement", elapsed, statement=name)
+            logger.trace(f"[SQL] {name} took {elapsed * 1000:.2f}ms")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-statement call counts and timings, for statements that ran"""
+        return {
+            name: prepared.stats()
+            for name, prepared in sorted(self._statements.items())
+            if prepared.calls
+        }
+
+    def reset_stats(self):
+        for prepared in self._statements.values():
+            with prepared._lock:
+                prepared.calls = 0
+                prepared.total_seconds = 0.0
+                prepared.max_seconds = 0.0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    def names(self) -> list[str]:
+        return sorted(self._statements)
+
+
+STATEMENTS = StatementRegistry()
+
+
+def statement_stats() -> dict[str, dict[str, Any]]:
+    """Execution stats of the shared registry, keyed by statement name"""
+    return STATEMENTS.stats()
+
+
+# --- Memori (core/memory.py) -------------------------------------------------
+
+STATEMENTS.register(
+    "memory.essential_conversations",
+    """
+    SELECT memory_id, summary, category_primary, importance_score,
+           created_at, searchable_content
+    FROM short_term_memory
+    WHERE user_id = :user_id AND category_primary LIKE 'essential_%'
+    ORDER BY importance_score DESC, created_at DESC
+    LIMIT :limit
+    """,
+    param_types={"limit": Integer()},
+)
+
+STATEMENTS.register(
+    "memory.conscious_context",
+    """
+    SELECT memory_id, processed_data, importance_score,
+           category_primary, summary, searchable_content,
+           created_at, access_count
+    FROM short_term_memory
+    WHERE user_id = :user_id AND (expires_at IS NULL OR expires_at > :current_time)
+    ORDER BY importance_score DESC, created_at DESC
+    """,
+)
+
+STATEMENTS.register(
+    "memory.dedup_candidates",
+    MemoryQueries.SELECT_MEMORIES_FOR_DEDUPLICATION,
+    param_types={"processed_for_duplicates": Boolean(), "limit": Integer()},
+)
+
+# Note: 'conscious_%' is a static pattern (safe), not user input
+STATEMENTS.register(
+    "memory.count_conscious_short_term",
+    """
+    SELECT COUNT(*) FROM short_term_memory
+    WHERE user_id = :user_id
+      AND (category_primary = 'conscious_context' OR memory_id LIKE 'conscious_%')
+    """,
+)
+
+_SHORT_TERM_COPY_COLUMNS = [
+    "memory_id",
+    "processed_data",
+    "importance_score",
+    "category_primary",
+    "retention_type",
+    "user_id",
+    "assistant_id",
+    "session_id",
+    "created_at",
+    "expires_at",
+    "searchable_content",
+    "summary",
+    "is_permanent_context",
+]
+
+STATEMENTS.register(
+    "memory.insert_conscious_short_term",
+    lambda dialect: get_insert_statement(
+        "short_term_memory",
+        _SHORT_TERM_COPY_COLUMNS,
+        dialect,
+        json_columns=["processed_data"],
+    ),
+    param_types={"is_permanent_context": Boolean()},
+)
+
+# --- ConsciouscAgent ---------------------------------------------------------
+
+
+def _conscious_long_term_sql(
+    dialect: str,
+    limited: bool = False,
+    unprocessed: bool = False,
+    by_id: bool = False,
+) -> str:
+    sql = """
+    SELECT memory_id, processed_data, summary, searchable_content,
+           importance_score, created_at
+    FROM long_term_memory
+    WHERE user_id = :user_id AND classification = 'conscious-info'
+    """
+    if unprocessed:
+        sql += " AND conscious_processed = :conscious_processed"
+    if by_id:
+        sql += " AND memory_id IN :memory_ids"
+    sql += " ORDER BY importance_score DESC, created_at DESC"
+    if limited:
+        sql += " LIMIT :limit"
+    return sql
+
+
+STATEMENTS.register(
+    "conscious.long_term_memories",
+    _conscious_long_term_sql,
+    param_types={"conscious_processed": Boolean(), "limit": Integer()},
+    expanding=("memory_ids",),
+)
+
+STATEMENTS.register(
+    "conscious.count_short_term_duplicates",
+    """
+    SELECT COUNT(*) FROM short_term_memory
+    WHERE user_id = :user_id
+      AND category_primary = 'conscious_context'
+      AND (searchable_content = :searchable_content OR summary = :summary)
+    """,
+)
+
+STATEMENTS.register(
+    "conscious.insert_short_term",
+    lambda dialect: get_insert_statement(
+        "short_term_memory",
+        [c for c in _SHORT_TERM_COPY_COLUMNS if c != "assistant_id"],
+        dialect,
+        json_columns=["processed_data"],
+    ),
+    param_types={"is_permanent_context": Boolean()},
+)
+
+STATEMENTS.register(
+    "conscious.mark_processed",
+    """
+    UPDATE long_term_memory
+    SET conscious_processed = :conscious_processed
+    WHERE memory_id = :memory_id AND user_id = :user_id
+    """,
+    param_types={"conscious_processed": Boolean()},
+)
+
+# --- SearchService -----------------------------------------------------------
+
+
+def _sqlite_fts_sql(
+    dialect: str,
+    memory_type: bool = False,
+    assistant: bool = False,
+    session: bool = False,
+    categories: bool = False,
+) -> str:
+    # BEHAVIOR: Multi-assistant isolation
+    # - Short-term memory: Accessible to all assistants for the same user
+    # - Long-term memory: shared (assistant_id IS NULL) plus the caller's own
+    filters = []
+    if memory_type:
+        filters.append("AND fts.memory_type = :memory_type")
+    if assistant:
+        filters.append(
+            "AND (fts.memory_type = 'short_term' OR fts.assistant_id IS NULL "
+            "OR fts.assistant_id = :assistant_id)"
+        )
+    else:
+        filters.append(
+            "AND (fts.memory_type = 'short_term' OR fts.assistant_id IS NULL)"
+        )
+    if session:
+        # Long-term memories stay visible across sessions
+        filters.append(
+            "AND (fts.memory_type = 'long_term' OR fts.session_id = :session_id)"
+        )
+    if categories:
+        filters.append("AND fts.category_primary IN :categories")
+    filter_sql = "\n    ".join(filters)
+
+    # COALESCE handles NULL values in rows missing from the base tables;
+    # bm25() needs the table name, not the fts alias
+    return f"""
+    SELECT
+        fts.memory_id,
+        fts.memory_type,
+        fts.category_primary,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.searchable_content
+                WHEN fts.memory_type = 'long_term' THEN lt.searchable_content
+            END,
+            fts.searchable_content,
+            ''
+        ) as searchable_content,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.importance_score
+                WHEN fts.memory_type = 'long_term' THEN lt.importance_score
+                ELSE 0.5
+            END,
+            0.5
+        ) as importance_score,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.created_at
+                WHEN fts.memory_type = 'long_term' THEN lt.created_at
+            END,
+            datetime('now')
+        ) as created_at,
+        COALESCE(fts.summary, '') as summary,
+        COALESCE(1.0 / (1.0 + abs(bm25(memory_search_fts))), 0.0) as search_score,
+        'sqlite_fts5' as search_strategy
+    FROM memory_search_fts fts
+    LEFT JOIN short_term_memory st
+        ON fts.memory_id = st.memory_id AND fts.memory_type = 'short_term'
+    LEFT JOIN long_term_memory lt
+        ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
+    WHERE memory_search_fts MATCH :fts_query AND fts.user_id = :user_id
+    {filter_sql}
+    ORDER BY search_score DESC, importance_score DESC
+    LIMIT :limit
+    """
+
+
+STATEMENTS.register(
+    "search.sqlite_fts",
+    _sqlite_fts_sql,
+    param_types={"limit": Integer()},
+    expanding=("categories",),
+    dialects=("sqlite",),
+)
@@ -0,0 +1,289 @@
+"""
+Write-behind buffer for chat_history rows
+
+``record_conversation`` used to commit the chat row on the caller's thread,
+so every LLM turn (and every interceptor) waited for a database commit. With
+write-behind enabled the row is appended to a bounded in-memory buffer and
+the call returns; a flusher thread owned by the buffer writes buffered rows
+in batches, one multi-row INSERT per batch.
+
+Durability knobs:
+    flush_interval  Seconds a row may wait before its batch is written
+    max_batch       Rows per transaction; a full batch is flushed right away
+    max_pending     Buffer bound. When it is reached the caller flushes
+                    inline; if that fails too, ``add`` raises DatabaseError
+                    rather than growing memory without limit
+    flush_on_exit   Flush what is left from an atexit hook
+
+A failed batch is retried row by row when the database is reachable, so one
+bad row cannot hold back the rows behind it. A row that fails
+``MAX_ROW_ATTEMPTS`` flushes in a row is moved to ``quarantined`` and logged.
+While the database fails its health check nothing is counted against rows;
+they wait for the next flush.
+
+Rows still in the buffer are lost if the process is killed. Reads through
+``get_chat_history`` merge buffered rows in, so a conversation is visible
+to its own process as soon as it is recorded.
+
+Usage:
+    buffer = db_manager.enable_write_behind(flush_interval=0.5)
+    buffer.add(chat_id=..., user_input=..., ai_output=..., model=..., ...)
+"""
+
+import atexit
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+from ..utils.exceptions import DatabaseError
+from ..utils.metrics import increment, observe
+
+# Writes of a single row that may fail (with the database up) before it is
+# quarantined
+MAX_ROW_ATTEMPTS = 3
+
+
+class ChatHistoryBuffer:
+    """Bounded buffer of chat_history rows written in batches in the background"""
+
+    def __init__(
+        self,
+        manager,
+        flush_interval: float = 0.5,
+        max_batch: int = 100,
+        max_pending: int = 10_000,
+        flush_on_exit: bool = True,
+    ):
+        """
+        Args:
+            manager: SQLAlchemyDatabaseManager the rows are written through
+                (``store_chat_history_batch`` / ``store_chat_history``)
+            flush_interval: Seconds between background flushes
+            max_batch: Rows written per transaction
+            max_pending: Rows buffered before callers flush inline
+            flush_on_exit: Register an atexit hook that flushes the buffer
+        """
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.max_pending = max(self.max_batch, max_pending)
+        self.flush_on_exit = flush_on_exit
+        self.quarantined: list[dict[str, Any]] = []
+
+        # Rows stay in _pending until their batch commits, so reads never miss
+        # a row that is in flight; _flush_lock keeps one writer at a time.
+        self._pending: list[dict[str, Any]] = []
+        self._attempts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._last_failure = 0.0
+
+        # A thread of its own: the shared BackgroundEventLoop is shut down by
+        # Memori.disable() while rows may still be recorded and flushed
+        self._wake = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._run, name="memori-chat-write-behind", daemon=True
+        )
+        self._flusher.start()
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, **row: Any):
+        """
+        Buffer one row (``store_chat_history`` keyword arguments)
+
+        ``created_at`` is taken now, not at flush time, so history order
+        follows recording order.
+
+        Raises:
+            DatabaseError: The buffer is full and the database is not taking
+                writes
+        """
+        if self._closed:
+            raise RuntimeError("ChatHistoryBuffer is closed")
+        row.setdefault("timestamp", datetime.utcnow())
+
+        if len(self) >= self.max_pending:
+            # Backpressure: the database is not keeping up. After a failed
+            # flush, don't retry on every caller until the flusher has had a go
+            if time.monotonic() - self._last_failure >= self.flush_interval:
+                increment("db.write_behind.inline_flush")
+                self.flush()
+            if len(self) >= self.max_pending:
+                increment("db.write_behind.rejected")
+                raise DatabaseError(
+                    f"Chat history write-behind buffer is full "
+                    f"({self.max_pending} rows) and the database is not "
+                    f"accepting writes"
+                )
+
+        with self._lock:
+            self._pending.append(row)
+            full = len(self._pending) >= self.max_batch
+        increment("db.write_behind.buffered")
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write every buffered row now; returns the number of rows written"""
+        written = 0
+        failed: set[int] = set()  # rows already tried once in this flush
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    if failed:
+                        batch = [r for r in self._pending if id(r) not in failed]
+                        del batch[self.max_batch :]
+                    else:
+                        batch = self._pending[: self.max_batch]
+                if not batch:
+                    return written
+
+                started = time.perf_counter()
+                try:
+                    self.manager.store_chat_history_batch(batch)
+                except Exception as e:
+                    increment("db.write_behind.flush_error")
+                    logger.error(f"Chat history write-behind flush failed: {e}")
+                    stored, quarantined = self._write_rows_individually(batch)
+                    if not stored and not quarantined:
+                        # No progress: keep the rows for the next flush
+                        self._last_failure = time.monotonic()
+                        return written
+                    self._remove(stored + quarantined)
+                    failed.update(id(row) for row in batch)
+                else:
+                    observe("db.write_behind.flush", time.perf_counter() - started)
+                    stored = batch
+                    self._remove(batch)
+
+                written += len(stored)
+                increment("db.write_behind.flushed", len(stored))
+
+    def _write_rows_individually(
+        self, batch: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Retry a failed batch row by row
+
+        Failures only count against a row while the database answers a
+        health check; during an outage rows simply wait.
+
+        Returns:
+            (written rows, newly quarantined rows)
+        """
+        if not self.manager.test_connection_pool():
+            return [], []
+
+        written, failed = [], []
+        for row in batch:
+            try:
+                # merge: a row that made it before the batch failed is updated
+                self.manager.store_chat_history(**row)
+                written.append(row)
+            except Exception as e:
+                logger.warning(
+                    f"Chat history row {row.get('chat_id')} failed to write: {e}"
+                )
+                failed.append(row)
+
+        quarantined = []
+        for row in failed:
+            attempts = self._attempts.get(row["chat_id"], 0) + 1
+            self._attempts[row["chat_id"]] = attempts
+            if attempts >= MAX_ROW_ATTEMPTS:
+                logger.error(
+                    f"Quarantining chat history row {row['chat_id']} after "
+                    f"{attempts} failed writes"
+                )
+                increment("db.write_behind.quarantined")
+                self.quarantined.append(row)
+                quarantined.append(row)
+        return written, quarantined
+
+    def _remove(self, rows: list[dict[str, Any]]):
+        """Drop written (or quarantined) rows from the buffer"""
+        done = {id(row) for row in rows}
+        with self._lock:
+            self._pending = [row for row in self._pending if id(row) not in done]
+        for row in rows:
+            self._attempts.pop(row["chat_id"], None)
+
+    def pending_history(
+        self, user_id: str, session_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Buffered rows of a user (and session), shaped like get_chat_history"""
+        with self._lock:
+            rows = [
+                row
+                for row in self._pending
+                if row.get("user_id", "default") == user_id
+                and (not session_id or row.get("session_id") == session_id)
+            ]
+        return [
+            {
+                "chat_id": row["chat_id"],
+                "user_input": row["user_input"],
+                "ai_output": row["ai_output"],
+                "model": row["model"],
+                "timestamp": row["timestamp"],
+                "session_id": row["session_id"],
+                "user_id": row.get("user_id", "default"),
+                "tokens_used": row.get("tokens_used", 0),
+                "metadata": row.get("metadata") or {},
+            }
+            for row in rows
+        ]
+
+    def merge_history(
+        self,
+        stored: list[dict[str, Any]],
+        user_id: str,
+        session_id: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Newest-first ``stored`` history with this user's buffered rows merged in"""
+        pending = self.pending_history(user_id, session_id)
+        if not pending:
+            return stored
+        stored_ids = {row["chat_id"] for row in stored}
+        merged = stored + [row for row in pending if row["chat_id"] not in stored_ids]
+        merged.sort(key=lambda row: row["timestamp"] or datetime.min, reverse=True)
+        return merged[:limit]
+
+    def close(self):
+        """Stop the flusher thread and write what is left (idempotent)"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._wake.set()
+            if self._flusher is not threading.current_thread():
+                self._flusher.join(timeout=max(5.0, self.flush_interval * 2))
+            if self.flush_on_exit:
+                atexit.unregister(self.close)
+        finally:
+            self.flush()
+            remaining = len(self)
+            if remaining:
+                logger.warning(f"{remaining} chat history rows could not be written")
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed:
+                return  # close() does the final flush
+            if len(self):
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Chat history write-behind flusher error: {e}")
@@ -33,6 +33,7 @@ Usage:
     # Conversation is automatically recorded to Memori
 """
 
+import asyncio
 import time
 import uuid
 from contextvars import ContextVar
@@ -350,10 +351,15 @@ class OpenAIInterceptor:
                 **kwargs,
             )
 
-            # Record conversation for enabled Memori instances
+            # Record conversation for enabled Memori instances. The database
+            # write runs in a worker thread (with this context) so the caller's
+            # event loop keeps serving other requests meanwhile.
             if not stream:
-                cls._record_conversation_for_enabled_instances(
-                    options, result, client_type
+                await asyncio.to_thread(
+                    cls._record_conversation_for_enabled_instances,
+                    options,
+                    result,
+                    client_type,
                 )
 
             return result
@@ -589,8 +589,10 @@ def create_memory_search_tool(memori_instance: Memori):
             formatted_results = []
             for result in results:
                 try:
-                    # Parse the ProcessedMemory JSON
-                    memory_data = json.loads(result["processed_data"])
+                    # Parse the ProcessedMemory JSON (already a dict on JSON columns)
+                    memory_data = result["processed_data"]
+                    if isinstance(memory_data, str):
+                        memory_data = json.loads(memory_data)
 
                     formatted_result = {
                         "summary": memory_data.get("summary", ""),
@@ -6,6 +6,7 @@ Utils package for Memoriai - Comprehensive utilities and helpers
 from .exceptions import (
     AgentError,
     AuthenticationError,
+    CircuitOpenError,
     ConcurrentUpdateError,
     ConfigurationError,
     DatabaseError,
@@ -35,6 +36,20 @@ from .helpers import (
 # Logging utilities
 from .logging import LoggingManager, get_logger
 
+# Latency spans and counters
+from .metrics import (
+    MetricsRegistry,
+    configure_metrics,
+    export_metrics_json,
+    export_prometheus,
+    get_metrics,
+    increment,
+    observe,
+    reset_metrics,
+    span,
+    timed,
+)
+
 # Core Pydantic models
 from .pydantic_models import (
     ConversationContext,
@@ -64,6 +79,7 @@ __all__ = [
     "MemoriError",
     "DatabaseError",
     "AgentError",
+    "CircuitOpenError",
     "ConfigurationError",
     "ValidationError",
     "IntegrationError",
@@ -90,4 +106,15 @@ __all__ = [
     # Logging
     "LoggingManager",
     "get_logger",
+    # Metrics
+    "MetricsRegistry",
+    "configure_metrics",
+    "export_metrics_json",
+    "export_prometheus",
+    "get_metrics",
+    "increment",
+    "observe",
+    "reset_metrics",
+    "span",
+    "timed",
 ]
@@ -113,6 +113,28 @@ class AgentError(MemoriError):
         )
 
 
+class CircuitOpenError(AgentError):
+    """Provider call skipped because the endpoint's circuit breaker is open"""
+
+    def __init__(
+        self,
+        message: str,
+        api_endpoint: str | None = None,
+        retry_after: float | None = None,
+        error_code: str | None = None,
+        cause: Exception | None = None,
+    ):
+        super().__init__(
+            message=message,
+            api_endpoint=api_endpoint,
+            error_code=error_code or "CIRCUIT_OPEN",
+            cause=cause,
+        )
+        self.retry_after = retry_after
+        if retry_after is not None:
+            self.context["retry_after"] = round(retry_after, 1)
+
+
 class ConfigurationError(MemoriError):
     """Configuration-related errors with setting context"""
 
@@ -353,12 +353,15 @@ class PerformanceUtils:
         def wrapper(*args, **kwargs) -> T:
             import time
 
-            start_time = time.time()
+            from .metrics import observe
+
+            start_time = time.perf_counter()
 
             try:
                 result = func(*args, **kwargs)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 execution_time = end_time - start_time
+                observe("function", execution_time, function=func.__qualname__)
 
                 # Log execution time (you can customize this)
                 from .logging import get_logger
@@ -370,8 +373,9 @@ class PerformanceUtils:
 
                 return result
             except Exception as e:
-                end_time = time.time()
+                end_time = time.perf_counter()
                 execution_time = end_time - start_time
+                observe("function", execution_time, function=func.__qualname__)
 
                 from .logging import get_logger
 
@@ -0,0 +1,354 @@
+"""
+Persistent LLM response cache shared across processes
+
+Search planning and memory processing are pure functions of their prompt, so
+identical inputs (replays, re-sent edits, repeated short queries) can reuse an
+earlier result instead of paying for another round-trip. Results live in a
+small SQLite file outside the memory database, which lets restarts and
+several Streamlit workers share them.
+
+Entries are keyed on (endpoint, model, prompt hash, schema hash, temperature)
+and evicted least-recently-used once the file exceeds ``max_bytes``.
+
+Usage:
+    from memori.utils.llm_cache import get_llm_cache, llm_cache_key
+
+    cache = get_llm_cache()
+    key = llm_cache_key(model, messages, MemorySearchQuery, 0.1, endpoint)
+    cached = cache.get(key) if cache else None
+    ...
+    cache.set(key, "plan_search", model, plan.model_dump_json())
+
+Configure with ``configure_llm_cache(path=..., max_bytes=...)`` or the
+``MEMORI_LLM_CACHE_PATH`` environment variable; ``MEMORI_LLM_CACHE=0``
+disables it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .metrics import increment
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600
+# Eviction trims to this fraction of max_bytes so it doesn't run on every write
+_EVICT_TO_RATIO = 0.8
+_SIZE_CHECK_EVERY = 32
+
+
+def default_cache_path() -> Path:
+    """``$MEMORI_LLM_CACHE_PATH`` or ``$XDG_CACHE_HOME/memori/llm_responses.sqlite3``"""
+    explicit = os.getenv("MEMORI_LLM_CACHE_PATH")
+    if explicit:
+        return Path(explicit).expanduser()
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "memori" / "llm_responses.sqlite3"
+
+
+@lru_cache(maxsize=64)
+def _schema_hash(schema: Any) -> str:
+    if schema is None:
+        return "text"
+    if hasattr(schema, "model_json_schema"):
+        schema = schema.model_json_schema()
+    payload = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def llm_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    response_schema: Any = None,
+    temperature: float | None = None,
+    endpoint: str = "",
+) -> str:
+    """
+    Stable cache key for one LLM request
+
+    Args:
+        model: Model name
+        messages: Chat messages exactly as sent
+        response_schema: Pydantic model class or JSON schema of the parsed result
+        temperature: Sampling temperature
+        endpoint: Provider endpoint key, so equal model names on different
+            providers don't share entries
+    """
+    prompt_hash = hashlib.sha256(
+        json.dumps(messages, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    parts = (
+        endpoint,
+        model,
+        prompt_hash,
+        _schema_hash(response_schema),
+        "" if temperature is None else f"{temperature:.3f}",
+    )
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response store with LRU size eviction and hit metrics
+
+    Thread-safe; each thread gets its own connection. WAL mode lets several
+    processes read while one writes. Cache failures are logged and treated
+    as misses - the cache never breaks an LLM call.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float | None = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.path = Path(path).expanduser() if path else default_cache_path()
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "writes", "evictions", "errors"), 0
+        )
+        self._writes_since_check = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used "
+            "ON llm_responses (last_used_at)"
+        )
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+        increment(f"llm_cache.{stat}", amount)
+
+    def get(self, key: str) -> str | None:
+        """Cached response text for ``key``, or None on a miss"""
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            now = time.time()
+            if row is None or (
+                self.max_age_seconds is not None
+                and now - row[1] > self.max_age_seconds
+            ):
+                self._count("misses")
+                return None
+            conn.execute(
+                "UPDATE llm_responses SET last_used_at = ?, hit_count = hit_count + 1 "
+                "WHERE cache_key = ?",
+                (now, key),
+            )
+            conn.commit()
+            self._count("hits")
+            return row[0]
+        except sqlite3.Error as e:
+            logger.debug(f"LLM cache read failed: {e}")
+            self._count("errors")
+            return None
+
+    def set(self, key: str, namespace: str, model: str, response: str):
+        """Store ``response`` (already serialized) under ``key``"""
+        size = len(response.encode())
+        if size > self.max_bytes:
+            return
+        try:
+            conn = self._connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, namespace, model, response, size_bytes, created_at, "
+                "last_used_at, hit_count) VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, namespace, model, response, size, now, now),
+            )
+            conn.commit()
+            self._count("writes")
+        except sqlite3.Error as e:
+            logger.debug(f"LLM cache write failed: {e}")
+            self._count("errors")
+            return
+
+        with self._stats_lock:
+            self._writes_since_check += 1
+            check = self._writes_since_check >= _SIZE_CHECK_EVERY
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least-recently-used ones beyond max_bytes"""
+        removed = 0
+        try:
+            conn = self._connection()
+            if self.max_age_seconds is not None:
+                removed += conn.execute(
+                    "DELETE FROM llm_responses WHERE created_at < ?",
+                    (time.time() - self.max_age_seconds,),
+                ).rowcount
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                target = total - int(self.max_bytes * _EVICT_TO_RATIO)
+                freed = 0
+                victims = []
+                for cache_key, size in conn.execute(
+                    "SELECT cache_key, size_bytes FROM llm_responses "
+                    "ORDER BY last_used_at"
+                ):
+                    victims.append((cache_key,))
+                    freed += size
+                    if freed >= target:
+                        break
+                conn.executemany(
+                    "DELETE FROM llm_responses WHERE cache_key = ?", victims
+                )
+                removed += len(victims)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"LLM cache eviction failed: {e}")
+            self._count("errors")
+            return 0
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def clear(self):
+        conn = self._connection()
+        conn.execute("DELETE FROM llm_responses")
+        conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus entry count and size on disk"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        try:
+            entries, size = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+                )
+                .fetchone()
+            )
+            stats["entries"] = entries
+            stats["size_bytes"] = size
+        except sqlite3.Error:
+            pass
+        stats["path"] = str(self.path)
+        return stats
+
+
+_cache: LLMResponseCache | None = None
+_cache_enabled = os.getenv("MEMORI_LLM_CACHE", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+_cache_settings: dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def configure_llm_cache(
+    enabled: bool = True,
+    path: str | Path | None = None,
+    max_bytes: int | None = None,
+    max_age_seconds: float | None = None,
+):
+    """
+    Configure the process-wide LLM response cache
+
+    Takes effect on the next ``get_llm_cache()``; an already open cache with
+    different settings is replaced.
+    """
+    global _cache, _cache_enabled
+    settings = {}
+    if path is not None:
+        settings["path"] = path
+    if max_bytes is not None:
+        settings["max_bytes"] = max_bytes
+    if max_age_seconds is not None:
+        settings["max_age_seconds"] = max_age_seconds
+    with _cache_lock:
+        if enabled != _cache_enabled or settings != _cache_settings:
+            _cache = None
+        _cache_enabled = enabled
+        _cache_settings.clear()
+        _cache_settings.update(settings)
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """The shared cache, opened on first use; None when disabled or unavailable"""
+    global _cache, _cache_enabled
+    if not _cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None and _cache_enabled:
+            try:
+                _cache = LLMResponseCache(**_cache_settings)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM response cache disabled: {e}")
+                _cache_enabled = False
+                return None
+        return _cache
+
+
+def load_cached_model(key: str, model_cls):
+    """Cached pydantic result for ``key``, or None on a miss or stale schema"""
+    cache = get_llm_cache()
+    if cache is None:
+        return None
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    try:
+        return model_cls.model_validate_json(cached)
+    except ValueError as e:
+        logger.debug(f"Discarding unreadable LLM cache entry: {e}")
+        return None
+
+
+def store_cached_model(key: str, namespace: str, model: str, result):
+    """Persist a pydantic result produced by an LLM call"""
+    cache = get_llm_cache()
+    if cache is not None:
+        cache.set(key, namespace, model, result.model_dump_json())
@@ -0,0 +1,346 @@
+"""
+Lightweight latency spans, histograms and counters
+
+Stages of a chat turn (context retrieval, each search strategy, agent LLM
+calls, database writes) are wrapped in spans. A span records its duration
+into a histogram keyed by span name and labels. Spans nest through a
+contextvar, so the most recent root spans can be shown as a per-stage
+breakdown of one turn. Counters track events such as cache hits and
+fallbacks.
+
+Usage:
+    from memori.utils.metrics import increment, span, timed
+
+    with span("memori.retrieve_context"):
+        ...
+
+    @timed("search.strategy", strategy="sqlite_fts5")
+    def _search_sqlite_fts(...): ...
+
+    increment("llm_cache.lookups", result="hit")
+
+Export with ``export_metrics_json()`` or ``export_prometheus()``. Set
+``MEMORI_METRICS=0`` (or ``configure_metrics(enabled=False)``) to turn
+recording off; spans then cost one flag check.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+DEFAULT_WINDOW = 2048
+DEFAULT_TRACE_HISTORY = 20
+QUANTILES = (0.5, 0.95, 0.99)
+# Children kept per span, so long-lived roots don't grow without bound
+_MAX_CHILDREN = 200
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """
+    Latency distribution over a sliding window of recent samples
+
+    ``count``/``sum`` cover every observation; percentiles and min/max are
+    computed from the last ``window`` samples.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self._samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, float]:
+        samples = sorted(self._samples)
+        result = {"count": self.count, "sum": self.sum}
+        if samples:
+            result["min"] = samples[0]
+            result["max"] = samples[-1]
+            for q in QUANTILES:
+                result[f"p{int(q * 100)}"] = _quantile(samples, q)
+        return result
+
+
+def _quantile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank quantile of an already sorted list"""
+    index = max(0, min(len(sorted_samples) - 1, round(q * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+class Span:
+    """A timed stage; children are spans opened while this one was current"""
+
+    __slots__ = ("name", "labels", "start", "duration", "error", "children")
+
+    def __init__(self, name: str, labels: dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self.start = time.perf_counter()
+        self.duration: float | None = None
+        self.error: str | None = None
+        self.children: list[Span] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "labels": {k: str(v) for k, v in self.labels.items()},
+            "duration_ms": (
+                round(self.duration * 1000, 3) if self.duration is not None else None
+            ),
+            "error": self.error,
+            "children": [child.to_dict() for child in list(self.children)],
+        }
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "memori_current_span", default=None
+)
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms, counters and recent span trees"""
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        trace_history: int = DEFAULT_TRACE_HISTORY,
+    ):
+        self.window = window
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._traces: deque[Span] = deque(maxlen=trace_history)
+
+    def observe(self, name: str, seconds: float, **labels: Any):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.window)
+            histogram.observe(seconds)
+
+    def increment(self, name: str, amount: float = 1.0, **labels: Any):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def record_trace(self, root: Span):
+        with self._lock:
+            self._traces.append(root)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._traces.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable view; durations are in milliseconds"""
+        with self._lock:
+            histograms = {
+                name: [(dict(key), h.snapshot()) for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+            counters = {
+                name: [(dict(key), value) for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            traces = list(self._traces)
+
+        spans = {}
+        for name, series in sorted(histograms.items()):
+            spans[name] = [
+                {
+                    "labels": labels,
+                    **{
+                        stat: value if stat == "count" else round(value * 1000, 3)
+                        for stat, value in stats.items()
+                    },
+                }
+                for labels, stats in series
+            ]
+        return {
+            "spans": spans,
+            "counters": {
+                name: [{"labels": labels, "value": value} for labels, value in series]
+                for name, series in sorted(counters.items())
+            },
+            "recent_traces": [trace.to_dict() for trace in reversed(traces)],
+        }
+
+    def to_prometheus(self, prefix: str = "memori") -> str:
+        """Prometheus text exposition: spans as summaries, counters as counters"""
+        with self._lock:
+            histograms = {
+                name: [(key, h.snapshot()) for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+            counters = {
+                name: list(series.items()) for name, series in self._counters.items()
+            }
+
+        lines = []
+        for name, series in sorted(histograms.items()):
+            metric = f"{prefix}_{_prom_name(name)}_seconds"
+            lines.append(f"# HELP {metric} Latency of the {name} span")
+            lines.append(f"# TYPE {metric} summary")
+            for key, stats in series:
+                for q in QUANTILES:
+                    value = stats.get(f"p{int(q * 100)}")
+                    if value is not None:
+                        labels = _prom_labels(key + (("quantile", str(q)),))
+                        lines.append(f"{metric}{labels} {value:.6f}")
+                labels = _prom_labels(key)
+                lines.append(f"{metric}_sum{labels} {stats['sum']:.6f}")
+                lines.append(f"{metric}_count{labels} {stats['count']}")
+        for name, series in sorted(counters.items()):
+            metric = f"{prefix}_{_prom_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for key, value in series:
+                lines.append(f"{metric}{_prom_labels(key)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _prom_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _prom_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in key
+    )
+    return "{" + ",".join(f'{_prom_name(k)}="{v}"' for k, v in escaped) + "}"
+
+
+_registry = MetricsRegistry()
+_enabled = os.getenv("MEMORI_METRICS", "1").lower() not in ("0", "false", "no")
+
+
+def configure_metrics(
+    enabled: bool = True,
+    window: int | None = None,
+    trace_history: int | None = None,
+):
+    """Turn recording on/off; changing sizes starts a fresh registry"""
+    global _registry, _enabled
+    _enabled = enabled
+    if window is not None or trace_history is not None:
+        _registry = MetricsRegistry(
+            window=window or DEFAULT_WINDOW,
+            trace_history=trace_history or DEFAULT_TRACE_HISTORY,
+        )
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def current_span() -> Span | None:
+    """Innermost open span in this context, if any"""
+    return _current_span.get()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def reset_metrics():
+    _registry.reset()
+
+
+@contextmanager
+def span(name: str, **labels: Any) -> Iterator[Span | None]:
+    """
+    Time a stage, nested under the span that is current in this context
+
+    Root spans (no parent) are kept as recent traces. An exception is noted on
+    the span and counted under ``<name>.errors`` before propagating.
+    """
+    if not _enabled:
+        yield None
+        return
+
+    current = Span(name, labels)
+    parent = _current_span.get()
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        _registry.increment(f"{name}.errors", **labels)
+        raise
+    finally:
+        current.duration = time.perf_counter() - current.start
+        _current_span.reset(token)
+        _registry.observe(name, current.duration, **labels)
+        if parent is None:
+            _registry.record_trace(current)
+        elif len(parent.children) < _MAX_CHILDREN:
+            parent.children.append(current)
+
+
+def timed(name: str | None = None, **labels: Any) -> Callable:
+    """Decorator running a sync or async function inside ``span``"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, **labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def observe(name: str, seconds: float, **labels: Any):
+    """Record a duration measured elsewhere (no span tree entry)"""
+    if _enabled:
+        _registry.observe(name, seconds, **labels)
+
+
+def increment(name: str, amount: float = 1.0, **labels: Any):
+    """Bump a counter, e.g. ``increment("search.fallback", reason="empty")``"""
+    if _enabled:
+        _registry.increment(name, amount, **labels)
+
+
+def export_metrics_json() -> dict[str, Any]:
+    return _registry.snapshot()
+
+
+def export_prometheus(prefix: str = "memori") -> str:
+    return _registry.to_prometheus(prefix)
@@ -5,7 +5,7 @@ SECURITY: Prevents resource exhaustion and DoS attacks by limiting per-tenant
 resource usage.
 
 This module provides:
-- Rate limiting (requests per time window)
+- Rate limiting (token buckets, lock-striped so checks don't serialize)
 - Storage quotas (bytes per tenant)
 - Memory count limits (memories per tenant)
 - API call limits (OpenAI calls per day)
@@ -21,15 +21,23 @@ Usage:
     @rate_limited("record_conversation", limit=100)
     def record_conversation(self, ...):
         ...
+
+    # Named policies (see DEFAULT_RATE_LIMITS); waits for a token, then
+    # raises RateLimitError if none frees up within the timeout
+    acquire_rate_limit("search", user_id, timeout=2.0)
+    await acquire_rate_limit_async("llm", provider_rate_limit_key(provider_config))
 """
 
+import asyncio
 import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import wraps
+from urllib.parse import urlparse
 
+from .exceptions import RateLimitError
 from .logging import get_logger
 
 logger = get_logger("rate_limiter")
@@ -47,26 +55,123 @@ class QuotaExceeded(Exception):
     pass
 
 
-@dataclass
-class RateLimitWindow:
-    """Track rate limit for a single window"""
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket policy: burst ``capacity``, refilled at ``refill_per_second``"""
+
+    capacity: int
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, requests: int, burst: int | None = None) -> "RateLimit":
+        """``requests`` per minute on average, allowing bursts of ``burst``"""
+        return cls(capacity=burst or requests, refill_per_second=requests / 60.0)
+
+
+class TokenBucket:
+    """Token bucket state; mutated only under its stripe's lock"""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.updated = time.monotonic()
+
+    def take(self, limit: RateLimit, tokens: int) -> float:
+        """Take ``tokens`` if available; otherwise return seconds until they are"""
+        now = time.monotonic()
+        self.tokens = min(
+            limit.capacity,
+            self.tokens + (now - self.updated) * limit.refill_per_second,
+        )
+        self.updated = now
+
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        if limit.refill_per_second <= 0:
+            return float("inf")
+        return (tokens - self.tokens) / limit.refill_per_second
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limiter with lock striping.
+
+    Buckets are spread over ``stripes`` independent locks by key hash, so
+    concurrent checks for different users/providers rarely contend.
+    """
 
-    count: int = 0
-    reset_time: float = field(default_factory=lambda: time.time() + 60)
+    def __init__(self, stripes: int = 16):
+        self._stripes: list[tuple[threading.Lock, dict[str, TokenBucket]]] = [
+            (threading.Lock(), {}) for _ in range(stripes)
+        ]
 
-    def is_expired(self) -> bool:
-        """Check if window has expired"""
-        return time.time() > self.reset_time
+    def _stripe(self, key: str) -> tuple[threading.Lock, dict[str, TokenBucket]]:
+        return self._stripes[hash(key) % len(self._stripes)]
 
-    def increment(self) -> int:
-        """Increment count and return new value"""
-        self.count += 1
-        return self.count
+    def try_acquire(self, key: str, limit: RateLimit, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket for ``key`` without waiting
 
-    def reset(self, window_seconds: int = 60):
-        """Reset the window"""
-        self.count = 0
-        self.reset_time = time.time() + window_seconds
+        Returns:
+            0.0 if acquired, otherwise seconds until enough tokens are available
+        """
+        lock, buckets = self._stripe(key)
+        with lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = TokenBucket(limit.capacity)
+            return bucket.take(limit, tokens)
+
+    def acquire(
+        self,
+        key: str,
+        limit: RateLimit,
+        tokens: int = 1,
+        timeout: float | None = None,
+    ) -> bool:
+        """Wait (queue) for tokens; False if they don't free up within ``timeout``"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(key, limit, tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if wait > remaining:
+                    return False
+            time.sleep(wait)
+
+    async def acquire_async(
+        self,
+        key: str,
+        limit: RateLimit,
+        tokens: int = 1,
+        timeout: float | None = None,
+    ) -> bool:
+        """Async ``acquire``; yields to the event loop while waiting"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(key, limit, tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if wait > remaining:
+                    return False
+            await asyncio.sleep(wait)
+
+    def reset(self, key: str | None = None):
+        """Drop one bucket, or all buckets when ``key`` is None"""
+        if key is not None:
+            lock, buckets = self._stripe(key)
+            with lock:
+                buckets.pop(key, None)
+            return
+        for lock, buckets in self._stripes:
+            with lock:
+                buckets.clear()
 
 
 @dataclass
@@ -100,9 +205,9 @@ class RateLimiter:
     """
 
     def __init__(self):
-        self._rate_limits: dict[str, RateLimitWindow] = defaultdict(RateLimitWindow)
+        self._buckets = TokenBucketLimiter()
         self._quotas: dict[str, ResourceQuota] = defaultdict(ResourceQuota)
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # quotas only; rate checks use bucket stripes
 
     def check_rate_limit(
         self, user_id: str, operation: str, limit: int = 100, window_seconds: int = 60
@@ -124,28 +229,20 @@ class RateLimiter:
             if not allowed:
                 raise RateLimitExceeded(error)
         """
-        with self._lock:
-            key = f"{user_id}:{operation}"
-            window = self._rate_limits[key]
-
-            # Reset if window expired
-            if window.is_expired():
-                window.reset(window_seconds)
-
-            # Check limit
-            if window.count >= limit:
-                wait_time = int(window.reset_time - time.time())
-                error_msg = (
-                    f"Rate limit exceeded for {operation}. "
-                    f"Limit: {limit} requests per {window_seconds}s. "
-                    f"Try again in {wait_time}s."
-                )
-                logger.warning(f"Rate limit exceeded: {user_id}/{operation}")
-                return False, error_msg
+        wait_time = self._buckets.try_acquire(
+            f"{user_id}:{operation}",
+            RateLimit(capacity=limit, refill_per_second=limit / window_seconds),
+        )
+        if wait_time > 0:
+            error_msg = (
+                f"Rate limit exceeded for {operation}. "
+                f"Limit: {limit} requests per {window_seconds}s. "
+                f"Try again in {wait_time:.1f}s."
+            )
+            logger.warning(f"Rate limit exceeded: {user_id}/{operation}")
+            return False, error_msg
 
-            # Increment counter
-            window.increment()
-            return True, None
+        return True, None
 
     def check_storage_quota(
         self,
@@ -288,12 +385,94 @@ class RateLimiter:
 # Global rate limiter instance
 _global_limiter = RateLimiter()
 
+# Default policies for Memori's hot paths. "llm" is keyed per provider, the
+# others per user_id. Override with configure_rate_limits(). Recording is off
+# unless configured: a limited record_conversation raises, which would fail
+# bulk imports and the LLM calls the interceptors record.
+DEFAULT_RATE_LIMITS: dict[str, RateLimit | None] = {
+    "record_conversation": None,
+    "search": RateLimit.per_minute(300, burst=50),
+    "llm": RateLimit.per_minute(60, burst=10),
+}
+
+_rate_limits: dict[str, RateLimit | None] = dict(DEFAULT_RATE_LIMITS)
+_policy_buckets = TokenBucketLimiter()
+
 
 def get_rate_limiter() -> RateLimiter:
     """Get the global rate limiter instance"""
     return _global_limiter
 
 
+def configure_rate_limits(limits: dict[str, RateLimit | int | None]):
+    """
+    Override named rate limit policies process-wide.
+
+    Args:
+        limits: operation -> RateLimit, requests per minute (int), or None to
+                disable limiting for that operation
+    """
+    for operation, limit in limits.items():
+        if isinstance(limit, int):
+            limit = RateLimit.per_minute(limit)
+        _rate_limits[operation] = limit
+    _policy_buckets.reset()
+
+
+def provider_rate_limit_key(provider_config=None) -> str:
+    """Bucket key for LLM calls: one bucket per upstream endpoint"""
+    endpoint = getattr(provider_config, "base_url", None) or getattr(
+        provider_config, "azure_endpoint", None
+    )
+    if endpoint:
+        return urlparse(str(endpoint)).netloc or str(endpoint)
+    return getattr(provider_config, "api_type", None) or "openai"
+
+
+def _policy_wait_error(operation: str, key: str) -> RateLimitError:
+    limit = _rate_limits[operation]
+    return RateLimitError(
+        f"Rate limit exceeded for {operation} ({key}): "
+        f"{limit.refill_per_second * 60:.0f}/min, burst {limit.capacity}",
+        limit_type=operation,
+        retry_after=max(1, int(1 / limit.refill_per_second)),
+    )
+
+
+def acquire_rate_limit(operation: str, key: str, timeout: float | None = None):
+    """
+    Wait for a token under the named policy.
+
+    Args:
+        operation: Policy name (see DEFAULT_RATE_LIMITS)
+        key: Bucket key, e.g. user_id or provider_rate_limit_key()
+        timeout: Max seconds to wait; None queues until a token is available
+
+    Raises:
+        RateLimitError: If no token became available within ``timeout``
+    """
+    limit = _rate_limits.get(operation)
+    if limit is None:
+        return
+    if not _policy_buckets.acquire(f"{operation}:{key}", limit, timeout=timeout):
+        logger.warning(f"Rate limit exceeded: {key}/{operation}")
+        raise _policy_wait_error(operation, key)
+
+
+async def acquire_rate_limit_async(
+    operation: str, key: str, timeout: float | None = None
+):
+    """Async ``acquire_rate_limit``; waits without blocking the event loop"""
+    limit = _rate_limits.get(operation)
+    if limit is None:
+        return
+    if not await _policy_buckets.acquire_async(
+        f"{operation}:{key}", limit, timeout=timeout
+    ):
+        logger.warning(f"Rate limit exceeded: {key}/{operation}")
+        raise _policy_wait_error(operation, key)
+
+
 def check_rate_limit(
     user_id: str, operation: str, limit: int = 100, window_seconds: int = 60
 ) -> bool:
@@ -0,0 +1,368 @@
+"""
+Resilience helpers for LLM provider calls
+
+Both agents call the same upstream endpoint on every conversation turn. When
+that endpoint degrades, blind retries turn each turn into a chain of
+timeouts. This module provides:
+
+- Retry classification (connection errors, timeouts, 408/409/429/5xx)
+- Jittered exponential backoff that honors ``Retry-After``
+- A per-endpoint circuit breaker (closed -> open -> half-open probe)
+
+Usage:
+    from memori.utils.resilience import call_with_resilience, get_circuit_breaker
+
+    completion = call_with_resilience(
+        lambda: client.chat.completions.create(...),
+        breaker_key=provider_rate_limit_key(provider_config),
+    )
+
+While a breaker is open, calls raise CircuitOpenError immediately so the
+caller can use its local fallback. After ``recovery_timeout`` one probe call
+is let through (half-open); its outcome closes or re-opens the circuit.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from .exceptions import CircuitOpenError
+from .metrics import increment
+
+T = TypeVar("T")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# HTTP statuses worth retrying: timeout, conflict, rate limit, server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRYABLE_ERROR_NAMES = frozenset(
+    {"APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout"}
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Backoff settings for one call site
+
+    Attributes:
+        max_attempts: Total attempts including the first call
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound for any single wait; a ``Retry-After`` longer
+            than this gives up instead of sleeping
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one provider endpoint
+
+    Thread-safe; shared by sync and async callers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit admits a probe (0 if not open)"""
+        with self._lock:
+            if self._state != CIRCUIT_OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        Whether a call may go out now
+
+        An open circuit whose cooldown has elapsed moves to half-open and
+        admits exactly one probe; concurrent callers keep failing fast until
+        that probe reports back.
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return True
+            if self._state == CIRCUIT_OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = CIRCUIT_HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def release_probe(self):
+        """Give back a half-open probe slot whose call never reached the provider"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CIRCUIT_CLOSED:
+                logger.info(f"Circuit '{self.name}' closed: provider recovered")
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state == CIRCUIT_HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != CIRCUIT_OPEN:
+                    logger.warning(
+                        f"Circuit '{self.name}' opened after {self._failures} "
+                        f"failure(s); failing fast for {self.recovery_timeout:.0f}s"
+                    )
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+) -> CircuitBreaker:
+    """
+    Process-wide breaker for ``name`` (created on first use)
+
+    Agents key breakers by endpoint (see ``provider_rate_limit_key``), so every
+    agent talking to a degraded provider sees the same open circuit.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, failure_threshold, recovery_timeout)
+            _breakers[name] = breaker
+        return breaker
+
+
+def reset_circuit_breakers():
+    """Close every breaker (tests, or after reconfiguring providers)"""
+    with _breakers_lock:
+        for breaker in _breakers.values():
+            breaker.reset()
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Transient transport/provider failures; client errors are not retried"""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if type(error).__name__ in _RETRYABLE_ERROR_NAMES:
+        return True
+    message = str(error).lower()
+    return "connection" in message or "timeout" in message or "timed out" in message
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Server-requested wait from ``retry_after`` or Retry-After headers"""
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, (int, float)) and value >= 0:
+        return float(value)
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_ms = headers.get("retry-after-ms")
+        if retry_ms is not None:
+            return max(0.0, float(retry_ms) / 1000.0)
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    retry_after: float | None = None,
+) -> float:
+    """
+    Wait before retry number ``attempt`` (0-based)
+
+    Full jitter keeps concurrent callers from retrying in lockstep; a
+    server-provided Retry-After is a floor, not a suggestion.
+    """
+    ceiling = min(policy.max_delay, policy.base_delay * (2**attempt))
+    delay = random.uniform(0, ceiling)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def _next_delay(
+    error: Exception, attempt: int, policy: RetryPolicy, breaker: CircuitBreaker
+) -> float | None:
+    """Record the outcome of a failed attempt; return the wait, or None to raise"""
+    if not is_retryable_error(error):
+        # The endpoint answered (bad request, auth, parse) - it is up
+        breaker.record_success()
+        return None
+
+    breaker.record_failure()
+    if attempt >= policy.max_attempts - 1 or breaker.state == CIRCUIT_OPEN:
+        return None
+
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None and retry_after > policy.max_delay:
+        logger.debug(
+            f"Provider asked to retry after {retry_after:.1f}s "
+            f"(> {policy.max_delay}s), giving up: {error}"
+        )
+        return None
+    increment("llm.retries", endpoint=breaker.name)
+    return backoff_delay(attempt, policy, retry_after)
+
+
+def _circuit_open_error(breaker: CircuitBreaker) -> CircuitOpenError:
+    increment("llm.circuit_rejections", endpoint=breaker.name)
+    return CircuitOpenError(
+        f"Circuit open for LLM endpoint '{breaker.name}'",
+        api_endpoint=breaker.name,
+        retry_after=breaker.retry_in(),
+    )
+
+
+def call_with_resilience(
+    func: Callable[[], T],
+    breaker_key: str,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    before_attempt: Callable[[], Any] | None = None,
+) -> T:
+    """
+    Call ``func`` through the endpoint's circuit breaker with backoff
+
+    Args:
+        func: Zero-argument callable making the provider request
+        breaker_key: Endpoint key for the shared circuit breaker
+        policy: Retry/backoff settings
+        before_attempt: Optional hook run before every attempt (e.g. acquiring
+            a rate-limit token); its exceptions propagate unchanged
+
+    Raises:
+        CircuitOpenError: The circuit is open; no request was sent
+        Exception: The last provider error once retries are exhausted
+    """
+    breaker = get_circuit_breaker(breaker_key)
+    for attempt in range(policy.max_attempts):
+        if not breaker.allow_request():
+            raise _circuit_open_error(breaker)
+        try:
+            if before_attempt is not None:
+                before_attempt()
+        except BaseException:
+            breaker.release_probe()
+            raise
+        try:
+            result = func()
+        except Exception as e:
+            delay = _next_delay(e, attempt, policy, breaker)
+            if delay is None:
+                raise
+            logger.debug(
+                f"LLM call to '{breaker_key}' failed "
+                f"(attempt {attempt + 1}/{policy.max_attempts}), "
+                f"retrying in {delay:.2f}s: {e}"
+            )
+            time.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled mid-call: no verdict on the provider
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        return result
+    raise _circuit_open_error(breaker)  # only reachable with max_attempts < 1
+
+
+async def call_with_resilience_async(
+    func: Callable[[], Awaitable[T]],
+    breaker_key: str,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    before_attempt: Callable[[], Awaitable[Any]] | None = None,
+) -> T:
+    """Async variant of ``call_with_resilience``; ``before_attempt`` is awaited"""
+    breaker = get_circuit_breaker(breaker_key)
+    for attempt in range(policy.max_attempts):
+        if not breaker.allow_request():
+            raise _circuit_open_error(breaker)
+        try:
+            if before_attempt is not None:
+                await before_attempt()
+        except BaseException:
+            breaker.release_probe()
+            raise
+        try:
+            result = await func()
+        except Exception as e:
+            delay = _next_delay(e, attempt, policy, breaker)
+            if delay is None:
+                raise
+            logger.debug(
+                f"LLM call to '{breaker_key}' failed "
+                f"(attempt {attempt + 1}/{policy.max_attempts}), "
+                f"retrying in {delay:.2f}s: {e}"
+            )
+            await asyncio.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled mid-call: no verdict on the provider
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        return result
+    raise _circuit_open_error(breaker)
@@ -0,0 +1,101 @@
+"""
+Import-time budget for ``from memori import Memori``
+
+Runs a fresh interpreter with ``python -X importtime`` and sums the cumulative
+time of every top-level import made after startup. The budget can be tuned for
+slow CI machines with MEMORI_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_MS = float(os.getenv("MEMORI_IMPORT_BUDGET_MS", "1200"))
+
+# Optional SDKs/drivers a SQLite deployment must not pay for at import
+HEAVY_MODULES = (
+    "openai",
+    "litellm",
+    "anthropic",
+    "pymysql",
+    "mysql.connector",
+    "psycopg2",
+    "pymongo",
+)
+
+_MARK = "--memori-import-start--"
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")])
+    )
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+        timeout=60,
+    )
+
+
+def _top_level_import_ms(stderr: str) -> float:
+    """Sum cumulative time of unindented -X importtime entries after the mark"""
+    total_us = 0
+    started = False
+    for line in stderr.splitlines():
+        if _MARK in line:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+@pytest.mark.performance
+def test_import_memori_stays_within_budget():
+    code = (
+        f"import sys; sys.stderr.write({_MARK!r} + '\\n'); "
+        "from memori import Memori"
+    )
+    # Best of three: the first run also pays for writing .pyc files
+    timings = []
+    for _ in range(3):
+        result = _run(code, "-X", "importtime")
+        assert result.returncode == 0, result.stderr[-2000:]
+        timings.append(_top_level_import_ms(result.stderr))
+
+    assert min(timings) < IMPORT_BUDGET_MS, (
+        f"from memori import Memori took {min(timings):.0f} ms "
+        f"(budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+
+@pytest.mark.performance
+def test_import_memori_skips_optional_sdks_and_drivers():
+    code = (
+        "import sys; from memori import Memori; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = _run(code)
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes_resolve():
+    result = _run(
+        "import memori; "
+        "assert 'MemoriError' in dir(memori); "
+        "assert memori.MemoriError.__name__ == 'MemoriError'; "
+        "assert memori.SQLiteConnector.__name__ == 'SQLiteConnector'"
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
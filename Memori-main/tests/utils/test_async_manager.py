@@ -0,0 +1,146 @@
+import asyncio
+import ssl
+
+import pytest
+
+from memori.agents.retrieval_agent import MemorySearchEngine
+from memori.database.async_engine import async_url, mysql_connect_args
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.exceptions import DatabaseError
+from memori.utils.pydantic_models import MemorySearchQuery, ProcessedLongTermMemory
+
+
+def test_async_url_swaps_driver():
+    assert async_url("sqlite:///memori.db") == "sqlite+aiosqlite:///memori.db"
+    assert (
+        async_url("postgresql+psycopg2://u:p@db/memori?sslmode=require")
+        == "postgresql+asyncpg://u:p@db/memori?ssl=require"
+    )
+    assert async_url("mysql+pymysql://u:p@db/memori?ssl=true") == (
+        "mysql+aiomysql://u:p@db/memori"
+    )
+
+
+@pytest.mark.parametrize(
+    "query, tls",
+    [
+        ("?ssl=true", True),
+        ("?ssl_disabled=false", True),
+        ("?ssl=false", False),
+        ("", False),
+    ],
+)
+def test_mysql_tls_flags_become_aiomysql_ssl(query, tls):
+    connect_args = mysql_connect_args(f"mysql+pymysql://u:p@db/memori{query}")
+
+    assert connect_args["charset"] == "utf8mb4"
+    assert isinstance(connect_args.get("ssl"), ssl.SSLContext) is tls
+
+
+def test_async_methods_need_async_mode(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'sync.db'}")
+    try:
+        with pytest.raises(DatabaseError, match="async_mode"):
+            asyncio.run(manager.get_chat_history_async())
+    finally:
+        manager.close()
+
+
+@pytest.fixture
+def async_manager(tmp_path):
+    pytest.importorskip("greenlet")
+    pytest.importorskip("aiosqlite")
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'async.db'}", async_mode=True
+    )
+    manager.initialize_schema()
+    yield manager
+    manager.close()
+
+
+COFFEE = ProcessedLongTermMemory(
+    content="I drink pour-over coffee every morning",
+    summary="Drinks pour-over coffee",
+    classification="conversational",
+    importance="medium",
+    session_id="s1",
+    classification_reason="test",
+    keywords=["coffee"],
+)
+
+
+def test_concurrent_async_writes_and_reads(async_manager):
+    memory = COFFEE
+
+    async def turn():
+        await asyncio.gather(
+            *(
+                async_manager.store_chat_history_async(
+                    f"c{i}", "hi", "hello", "test", session_id="s1", user_id="u1"
+                )
+                for i in range(5)
+            )
+        )
+        memory_ids = await asyncio.gather(
+            *(
+                async_manager.store_long_term_memory_enhanced_async(
+                    memory, "c0", user_id="u1"
+                )
+                for _ in range(3)
+            )
+        )
+        history, found = await asyncio.gather(
+            async_manager.get_chat_history_async("u1", "s1", limit=10),
+            async_manager.search_memories_async("coffee", user_id="u1"),
+        )
+        await async_manager.close_async()
+        return memory_ids, history, found
+
+    memory_ids, history, found = asyncio.run(turn())
+
+    assert len(set(memory_ids)) == 3
+    assert len(history) == 5
+    assert {r["memory_id"] for r in found} == set(memory_ids)
+    # processed_data is loaded before the async session is released
+    assert all(
+        r["processed_data"]["content"] == "I drink pour-over coffee every morning"
+        for r in found
+    )
+    # The sync engine sees the same rows
+    assert len(async_manager.get_chat_history("u1", limit=10)) == 5
+
+
+def test_each_event_loop_gets_its_own_engine(async_manager):
+    async def read():
+        return await async_manager.get_chat_history_async("u1")
+
+    assert asyncio.run(read()) == []
+    assert asyncio.run(read()) == []
+
+
+def test_async_strategies_return_processed_data(async_manager):
+    engine = MemorySearchEngine(api_key="test")
+    strategies = [
+        (
+            "primary",
+            engine._execute_primary_search_with_session,
+            "sqlite_unified_search",
+            "test",
+        )
+    ]
+    plan = MemorySearchQuery(query_text="coffee", intent="test")
+
+    async def search():
+        await async_manager.store_long_term_memory_enhanced_async(
+            COFFEE, "c0", user_id="u1"
+        )
+        results = await engine._run_strategies_async(
+            strategies, plan, async_manager, "sqlite", "u1", None, None, 5
+        )
+        await async_manager.close_async()
+        return results["primary"]
+
+    found = asyncio.run(search())
+
+    assert len(found) == 1
+    assert found[0]["processed_data"]["content"] == COFFEE.content
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.query_plans import capture_query_plans
+from memori.database.search_service import SearchService
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+BASE_TIME = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def _long(memory_id, category, importance, minutes=0, **kwargs):
+    kwargs.setdefault("user_id", "u1")
+    return LongTermMemory(
+        memory_id=memory_id,
+        processed_data={"id": memory_id},
+        importance_score=importance,
+        category_primary=category,
+        classification="contextual",
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+        searchable_content=memory_id,
+        summary=memory_id,
+        **kwargs,
+    )
+
+
+def _short(memory_id, category, importance, session_id="s1"):
+    return ShortTermMemory(
+        memory_id=memory_id,
+        processed_data={"id": memory_id},
+        importance_score=importance,
+        category_primary=category,
+        created_at=BASE_TIME,
+        user_id="u1",
+        session_id=session_id,
+        searchable_content=memory_id,
+        summary=memory_id,
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'category.db'}")
+    manager.initialize_schema()
+    rows = [
+        _long("pref-high", "preference", 0.9),
+        _long("pref-old", "preference", 0.5),
+        _long("pref-new", "preference", 0.5, minutes=5),
+        _long("fact", "fact", 0.8),
+        _long("skill", "skill", 1.0),
+        _long("assistant-a", "preference", 0.7, assistant_id="a1"),
+        _long("other-user", "preference", 1.0, user_id="u2"),
+        _short("short-pref", "preference", 0.6),
+        _short("short-other-session", "preference", 0.95, session_id="s2"),
+    ]
+    # Low-importance filler, so a Python-side filter over the newest N rows
+    # would miss the matches above
+    rows += [_long(f"filler-{n}", "context", 0.1, minutes=10 + n) for n in range(30)]
+    with manager.SessionLocal() as session:
+        session.add_all(rows)
+        session.commit()
+    yield manager
+    manager.close()
+
+
+def _ids(manager, categories, **kwargs):
+    with manager.SessionLocal() as session:
+        results = SearchService(session, "sqlite").search_by_category(
+            categories, user_id="u1", **kwargs
+        )
+        return [r["memory_id"] for r in results], results
+
+
+def test_orders_by_importance_then_recency_across_tables(manager):
+    ids, results = _ids(manager, ["preference", "fact"])
+
+    assert ids == [
+        "short-other-session",
+        "pref-high",
+        "fact",
+        "short-pref",
+        "pref-new",
+        "pref-old",
+    ]
+    assert {r["search_strategy"] for r in results} == {"category_filter"}
+    assert results[0]["processed_data"] == {"id": "short-other-session"}
+
+
+def test_limit_applies_to_the_merged_result(manager):
+    ids, _ = _ids(manager, ["preference", "fact"], limit=3)
+
+    assert ids == ["short-other-session", "pref-high", "fact"]
+
+
+def test_tenant_session_and_type_filters(manager):
+    assert _ids(manager, ["preference"], session_id="s1")[0] == [
+        "pref-high",
+        "short-pref",
+        "pref-new",
+        "pref-old",
+    ]
+    assert _ids(manager, ["preference"], assistant_id="a1")[0][:3] == [
+        "short-other-session",
+        "pref-high",
+        "assistant-a",
+    ]
+    assert _ids(manager, ["preference"], memory_types=["long_term"])[0] == [
+        "pref-high",
+        "pref-new",
+        "pref-old",
+    ]
+
+
+def test_no_categories_returns_nothing(manager):
+    assert _ids(manager, [])[0] == []
+
+
+def test_category_queries_use_indexes(manager):
+    with capture_query_plans(manager) as plans:
+        _ids(manager, ["preference", "fact"], assistant_id="a1", session_id="s1")
+
+    assert plans.plans()
+    plans.assert_index_usage(tables={"long_term_memory", "short_term_memory"})
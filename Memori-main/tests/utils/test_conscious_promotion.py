@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from memori.agents.conscious_agent import ConsciouscAgent
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'promotion.db'}")
+    manager.initialize_schema()
+    yield manager
+    manager.close()
+
+
+def _insert(manager, memory_id, classification="conscious-info", user_id="u1"):
+    """A long-term memory written without publishing a promotion event"""
+    with manager.SessionLocal() as session:
+        session.add(
+            LongTermMemory(
+                memory_id=memory_id,
+                processed_data={"content": memory_id},
+                category_primary="essential",
+                classification=classification,
+                user_id=user_id,
+                searchable_content=f"content of {memory_id}",
+                summary=f"summary of {memory_id}",
+            )
+        )
+        session.commit()
+
+
+def _promoted(manager) -> list[str]:
+    with manager.SessionLocal() as session:
+        ids = session.execute(select(ShortTermMemory.memory_id)).scalars()
+        # conscious_<memory_id>_<timestamp>
+        return sorted(memory_id.split("_")[1] for memory_id in ids)
+
+
+def _processed(manager, memory_id) -> bool:
+    with manager.SessionLocal() as session:
+        return session.get(LongTermMemory, memory_id).conscious_processed
+
+
+async def _until(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_enqueued_memories_are_promoted_by_the_consumer(manager):
+    agent = ConsciouscAgent()
+    _insert(manager, "m1")
+    _insert(manager, "m2")
+    _insert(manager, "plain", classification="contextual")
+
+    async def scenario():
+        consumer = asyncio.create_task(agent.run_promotion_consumer(manager))
+        await _until(lambda: agent.promotion_consumer_running)
+
+        # Only announced memories are promoted; ineligible ones are skipped
+        agent.enqueue_promotion("m1", "u1")
+        agent.enqueue_promotion("plain", "u1")
+        await _until(lambda: _promoted(manager) == ["m1"])
+
+        agent.stop_promotion_consumer()
+        await asyncio.wait_for(consumer, timeout=5)
+
+    asyncio.run(scenario())
+    assert _processed(manager, "m1")
+    assert not _processed(manager, "m2")
+    assert not agent.promotion_consumer_running
+
+
+def test_queued_before_start_and_from_another_thread(manager):
+    agent = ConsciouscAgent()
+    _insert(manager, "m1")
+    _insert(manager, "m2")
+    agent.enqueue_promotion("m1", "u1")  # no consumer yet: kept in the queue
+
+    async def scenario():
+        consumer = asyncio.create_task(agent.run_promotion_consumer(manager))
+        await _until(lambda: _promoted(manager) == ["m1"])
+
+        # Database managers publish from whichever thread stored the memory
+        await asyncio.to_thread(agent.enqueue_promotion, "m2", "u1")
+        await _until(lambda: _promoted(manager) == ["m1", "m2"])
+        consumer.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_idle_consumer_reconciles_unannounced_memories(manager):
+    agent = ConsciouscAgent()
+
+    async def scenario():
+        consumer = asyncio.create_task(
+            agent.run_promotion_consumer(
+                manager, reconcile_user_id="u1", reconcile_interval=0.05
+            )
+        )
+        await _until(lambda: agent.promotion_consumer_running)
+        # Stored by "another process": no event reaches this consumer
+        _insert(manager, "m1")
+        _insert(manager, "other", user_id="u2")
+        await _until(lambda: _promoted(manager) == ["m1"])
+
+        agent.stop_promotion_consumer()
+        await asyncio.wait_for(consumer, timeout=5)
+
+    asyncio.run(scenario())
+    assert not _processed(manager, "other")
+
+
+def test_mongodb_targeted_promotion_filters_in_the_query(monkeypatch):
+    mongomock = pytest.importorskip("mongomock")
+    pytest.importorskip("pymongo")
+    from memori.database.mongodb_manager import MongoDBDatabaseManager
+
+    manager = MongoDBDatabaseManager("mongodb://localhost:27017/memori_test")
+    collection = mongomock.MongoClient().memori_test.long_term_memory
+    manager._collections["long_term_memory"] = collection
+    for memory_id in ("m1", "m2", "m3"):
+        collection.insert_one(
+            {
+                "memory_id": memory_id,
+                "user_id": "u1",
+                "assistant_id": None,
+                "session_id": "default",
+                "classification": "conscious-info",
+                "importance_score": 0.5,
+            }
+        )
+
+    queries = []
+    find = type(collection).find
+
+    def recording_find(self, filter_doc, *args, **kwargs):
+        queries.append(filter_doc)
+        return find(self, filter_doc, *args, **kwargs)
+
+    monkeypatch.setattr(type(collection), "find", recording_find)
+    memories = asyncio.run(
+        ConsciouscAgent()._get_unprocessed_conscious_memories(
+            manager, "u1", ["m2", "m3"]
+        )
+    )
+
+    assert sorted(m["memory_id"] for m in memories) == ["m2", "m3"]
+    assert queries[0]["memory_id"] == {"$in": ["m2", "m3"]}
+    assert manager.get_unprocessed_conscious_memories("u1", memory_ids=[]) == []
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+from sqlalchemy import event, func, select
+
+from memori.database.data_transfer import MemoryExporter, MemoryImporter
+from memori.database.models import MemoryEntity, ShortTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+
+def _manager(path) -> SQLAlchemyDatabaseManager:
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{path}")
+    manager.initialize_schema()
+    return manager
+
+
+@pytest.fixture
+def source(tmp_path):
+    manager = _manager(tmp_path / "source.db")
+    for n in range(3):
+        manager.store_chat_history(f"c{n}", "hi", "hello", "test", "s1", "u1")
+    with manager.SessionLocal() as session:
+        for n in range(2):
+            # Both reference the last chat row, the one a partial batch holds
+            session.add(
+                ShortTermMemory(
+                    memory_id=f"st{n}",
+                    chat_id="c2",
+                    processed_data={},
+                    category_primary="context",
+                    user_id="u1",
+                    searchable_content="hello",
+                    summary="hello",
+                )
+            )
+        session.commit()
+    manager.store_long_term_memory_enhanced(
+        ProcessedLongTermMemory(
+            content="User works on Memori with Python",
+            summary="Works on Memori",
+            classification="essential",
+            importance="high",
+            session_id="s1",
+            classification_reason="test",
+            entities=["Memori", "Python"],
+            keywords=["memory"],
+        ),
+        chat_id="c0",
+        user_id="u1",
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def target(tmp_path):
+    manager = _manager(tmp_path / "target.db")
+
+    # SQLite only checks foreign keys when asked to, like PostgreSQL/MySQL do
+    @event.listens_for(manager.engine, "connect")
+    def enable_foreign_keys(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    manager.engine.dispose()
+    yield manager
+    manager.close()
+
+
+def _count(manager, model) -> int:
+    with manager.engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(model)).scalar()
+
+
+def test_jsonl_round_trip_keeps_rows_and_rebuilds_entities(source, target, tmp_path):
+    path = tmp_path / "export.jsonl"
+    exported = MemoryExporter(source).export_jsonl(path)
+    assert exported == {
+        "chat_history": 3,
+        "short_term_memory": 2,
+        "long_term_memory": 1,
+    }
+
+    assert MemoryImporter(target).import_jsonl(path) == exported
+    with target.engine.connect() as conn:
+        values = set(conn.execute(select(MemoryEntity.normalized_value)).scalars())
+    assert values == {"memori", "python", "memory"}
+    assert target.get_memory_stats("u1", use_cache=False)["long_term_count"] == 1
+
+    # Re-running an import skips what is already there
+    assert MemoryImporter(target).import_jsonl(path) == dict.fromkeys(exported, 0)
+    assert _count(target, MemoryEntity) == 3
+
+
+def test_partial_parent_batch_is_written_before_its_children(source, target, tmp_path):
+    path = tmp_path / "export.jsonl"
+    MemoryExporter(source).export_jsonl(path)
+
+    # batch_size=2 leaves c2 in a partial chat_history batch when the
+    # short_term_memory rows referencing it are read
+    counts = MemoryImporter(target, batch_size=2).import_jsonl(path)
+
+    assert counts["short_term_memory"] == 2
+    assert _count(target, ShortTermMemory) == 2
+
+
+def test_invalid_line_names_its_number(target, tmp_path):
+    path = tmp_path / "broken.jsonl"
+    path.write_text(json.dumps({"table": "chat_history"}) + "\n")
+
+    with pytest.raises(Exception, match="line 1"):
+        MemoryImporter(target).import_jsonl(path)
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import text
+
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.search_service import SearchService
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'fallback.db'}")
+    manager.initialize_schema()
+    with manager.SessionLocal() as session:
+        session.add_all(
+            [
+                LongTermMemory(
+                    memory_id="content-hit",
+                    processed_data={},
+                    category_primary="skill",
+                    classification="essential",
+                    user_id="u1",
+                    searchable_content="Writes Kubernetes operators in Go",
+                    summary="Go developer",
+                ),
+                ShortTermMemory(
+                    memory_id="summary-hit",
+                    processed_data={},
+                    category_primary="context",
+                    user_id="u1",
+                    searchable_content="Asked about deployments",
+                    summary="Runs kubernetes clusters",
+                ),
+                LongTermMemory(
+                    memory_id="other-user",
+                    processed_data={},
+                    category_primary="skill",
+                    classification="essential",
+                    user_id="u2",
+                    searchable_content="Kubernetes admin",
+                    summary="Kubernetes admin",
+                ),
+            ]
+        )
+        session.commit()
+    yield manager
+    manager.close()
+
+
+def _search(manager, query="kubernetes"):
+    with manager.SessionLocal() as session:
+        return SearchService(session, "sqlite")._search_like_fallback(
+            query, "u1", None, None, None, 10, True, True
+        )
+
+
+def test_trigram_index_results_are_labelled_as_indexed(manager):
+    results = _search(manager)
+
+    assert sorted(r["memory_id"] for r in results) == ["content-hit", "summary-hit"]
+    assert {r["search_strategy"] for r in results} == {"sqlite_trigram"}
+
+
+def test_like_scan_keeps_the_fallback_label(manager):
+    with manager.engine.begin() as conn:
+        for table in ("short_term_memory", "long_term_memory"):
+            conn.execute(text(f"DROP TABLE {table}_trigram"))
+
+    results = _search(manager)
+
+    assert sorted(r["memory_id"] for r in results) == ["content-hit", "summary-hit"]
+    assert {r["search_strategy"] for r in results} == {"sqlite_like_fallback"}
+
+
+def test_mysql_ngram_match_covers_content_and_summary():
+    service = SearchService(session=None, database_type="mysql")
+    match = service._indexed_text_match(LongTermMemory, "long_term", ["kubernetes"])
+
+    sql = str(match)
+    assert "MATCH(long_term_memory.searchable_content)" in sql
+    assert "MATCH(long_term_memory.summary)" in sql
+    # Too short for the ngram index: the caller falls back to LIKE
+    assert service._indexed_text_match(LongTermMemory, "long_term", ["go"]) is None
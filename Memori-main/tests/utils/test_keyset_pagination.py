@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.search_service import SearchService
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+SORT_FIELDS = {
+    "created_at": "created_at",
+    "importance": "importance_score",
+    "category": "category_primary",
+}
+BASE_TIME = datetime(2024, 5, 1, 12, 0, 0, 250000)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'pages.db'}")
+    manager.initialize_schema()
+    rows = []
+    # Few distinct values per sort key, so every page boundary falls on ties
+    for n in range(9):
+        model = ShortTermMemory if n % 3 == 0 else LongTermMemory
+        extra = {"classification": "contextual"} if model is LongTermMemory else {}
+        rows.append(
+            model(
+                memory_id=f"m{n}",
+                processed_data={},
+                importance_score=(0.3, 0.6)[n % 2],
+                category_primary=("fact", "preference", "skill")[n % 3],
+                created_at=BASE_TIME + timedelta(minutes=n // 4),
+                user_id="u1",
+                searchable_content=f"memory {n}",
+                summary=f"memory {n}",
+                **extra,
+            )
+        )
+    rows.append(
+        LongTermMemory(
+            memory_id="other-user",
+            processed_data={},
+            category_primary="fact",
+            classification="contextual",
+            user_id="u2",
+            searchable_content="other",
+            summary="other",
+        )
+    )
+    with manager.SessionLocal() as session:
+        session.add_all(rows)
+        session.commit()
+    yield manager
+    manager.close()
+
+
+def _walk(service, **kwargs):
+    """Follow next_cursor to the end, returning every page's memory ids"""
+    pages, cursor = [], None
+    while True:
+        page = service.list_memories_page("u1", limit=2, cursor=cursor, **kwargs)
+        pages.append([row["memory_id"] for row in page["results"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def _expected(manager, sort_by, order, memory_type):
+    models = {
+        "all": (ShortTermMemory, LongTermMemory),
+        "short_term": (ShortTermMemory,),
+        "long_term": (LongTermMemory,),
+    }[memory_type]
+    field = SORT_FIELDS[sort_by]
+    with manager.SessionLocal() as session:
+        rows = [
+            (getattr(row, field), row.memory_id)
+            for model in models
+            for row in session.query(model).filter(model.user_id == "u1")
+        ]
+    rows.sort(reverse=order == "desc")
+    return [memory_id for _, memory_id in rows]
+
+
+@pytest.mark.parametrize("memory_type", ["all", "short_term", "long_term"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("sort_by", sorted(SORT_FIELDS))
+def test_cursor_walk_returns_every_row_once_in_key_order(
+    manager, sort_by, order, memory_type
+):
+    with manager.SessionLocal() as session:
+        pages = _walk(
+            SearchService(session, "sqlite"),
+            sort_by=sort_by,
+            order=order,
+            memory_type=memory_type,
+        )
+
+    walked = [memory_id for page in pages for memory_id in page]
+    assert walked == _expected(manager, sort_by, order, memory_type)
+    assert all(len(page) == 2 for page in pages[:-1])
+    assert pages[-1]
+
+
+def test_page_shape_and_counts(manager):
+    with manager.SessionLocal() as session:
+        service = SearchService(session, "sqlite")
+        page = service.list_memories_page("u1", limit=4, count_mode="exact")
+        last = service.list_memories_page("u1", limit=9, count_mode="approximate")
+
+    assert page["total"] == 9 and page["total_is_estimate"] is False
+    assert page["next_cursor"] is not None
+    assert set(page["results"][0]) >= {"memory_id", "memory_type", "created_at"}
+    assert last["next_cursor"] is None
+    assert last["total"] == 9
+    assert "other-user" not in [row["memory_id"] for row in last["results"]]
+
+
+def test_cursor_is_bound_to_its_listing(manager):
+    with manager.SessionLocal() as session:
+        service = SearchService(session, "sqlite")
+        cursor = service.list_memories_page("u1", limit=2, sort_by="importance")[
+            "next_cursor"
+        ]
+
+        with pytest.raises(ValueError, match="does not match"):
+            service.list_memories_page("u1", cursor=cursor, sort_by="created_at")
+        with pytest.raises(ValueError, match="does not match"):
+            service.list_memories_page(
+                "u1", cursor=cursor, sort_by="importance", order="asc"
+            )
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            service.list_memories_page("u1", cursor="not-a-cursor")
@@ -0,0 +1,56 @@
+from memori.utils.llm_cache import LLMResponseCache, llm_cache_key
+from memori.utils.pydantic_models import MemorySearchQuery
+
+MESSAGES = [
+    {"role": "system", "content": "plan"},
+    {"role": "user", "content": "what's my name?"},
+]
+
+
+def test_key_covers_model_prompt_schema_and_temperature():
+    base = llm_cache_key("gpt-4o", MESSAGES, MemorySearchQuery, 0.1, "openai")
+
+    assert base == llm_cache_key("gpt-4o", MESSAGES, MemorySearchQuery, 0.1, "openai")
+    assert base != llm_cache_key("gpt-4o-mini", MESSAGES, MemorySearchQuery, 0.1)
+    assert base != llm_cache_key("gpt-4o", MESSAGES[:1], MemorySearchQuery, 0.1)
+    assert base != llm_cache_key("gpt-4o", MESSAGES, None, 0.1, "openai")
+    assert base != llm_cache_key("gpt-4o", MESSAGES, MemorySearchQuery, 0.7, "openai")
+
+
+def test_round_trip_is_shared_between_instances(tmp_path):
+    path = tmp_path / "llm.sqlite3"
+    plan = MemorySearchQuery(query_text="name", intent="recall the user's name")
+    key = llm_cache_key("gpt-4o", MESSAGES, MemorySearchQuery, 0.1)
+
+    writer = LLMResponseCache(path)
+    assert writer.get(key) is None
+    writer.set(key, "plan_search", "gpt-4o", plan.model_dump_json())
+
+    # A second process (here: instance) opening the same file sees the entry
+    reader = LLMResponseCache(path)
+    cached = MemorySearchQuery.model_validate_json(reader.get(key))
+    assert cached.intent == plan.intent
+
+    stats = reader.stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+    assert writer.stats()["misses"] == 1
+
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=1000)
+    for i in range(10):
+        cache.set(f"k{i}", "plan_search", "m", "x" * 200)
+    cache.get("k0")  # most recently used now
+
+    assert cache.evict() > 0
+    assert cache.stats()["size_bytes"] <= 1000
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_age_seconds=0)
+    cache.set("k", "plan_search", "m", "{}")
+
+    assert cache.get("k") is None
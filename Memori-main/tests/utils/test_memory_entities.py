@@ -0,0 +1,135 @@
+import pytest
+from sqlalchemy import select
+
+from memori.database.migrations import backfill_memory_entities as backfill_module
+from memori.database.models import (
+    ENTITY_BACKFILL_COMPONENT,
+    Base,
+    LongTermMemory,
+    MemoryEntity,
+)
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import EntityType, ProcessedLongTermMemory
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'entities.db'}")
+    # Tables only: the backfill tests decide when initialize_schema's steps run
+    Base.metadata.create_all(bind=manager.engine)
+    yield manager
+    manager.close()
+
+
+def _store(manager, entities, keywords, user_id="u1") -> str:
+    return manager.store_long_term_memory_enhanced(
+        ProcessedLongTermMemory(
+            content="User deploys Memori with Python on Kubernetes",
+            summary="Deploys Memori",
+            classification="essential",
+            importance="high",
+            session_id="s1",
+            classification_reason="test",
+            entities=entities,
+            keywords=keywords,
+        ),
+        chat_id="c0",
+        user_id=user_id,
+    )
+
+
+def _insert_unindexed(manager, memory_id, entities=None):
+    """A memory stored before memory_entities existed"""
+    with manager.SessionLocal() as session:
+        session.add(
+            LongTermMemory(
+                memory_id=memory_id,
+                processed_data={},
+                category_primary="essential",
+                classification="essential",
+                user_id="u1",
+                searchable_content=memory_id,
+                summary=memory_id,
+                entities_json=entities,
+            )
+        )
+        session.commit()
+
+
+def _entity_values(manager) -> set[str]:
+    with manager.engine.connect() as conn:
+        return set(conn.execute(select(MemoryEntity.normalized_value)).scalars())
+
+
+def _ids(results) -> list[str]:
+    return [result["memory_id"] for result in results]
+
+
+def test_lookup_is_normalized_and_scoped_to_the_user(manager):
+    memory_id = _store(manager, ["Memori", "  Python "], ["deploy"])
+    _store(manager, ["Memori"], [], user_id="u2")
+
+    assert _ids(manager.search_entity_memories(["MEMORI"], user_id="u1")) == [memory_id]
+    assert _ids(manager.search_entity_memories(["python"], user_id="u1")) == [memory_id]
+
+
+@pytest.mark.parametrize(
+    "entity_type, value, found",
+    [
+        (EntityType.person, "python", True),
+        (EntityType.technology, "python", True),
+        ("topic", "python", True),
+        (EntityType.keyword, "python", False),
+        (EntityType.keyword, "deploy", True),
+        (EntityType.skill, "deploy", False),
+        ("entity", "python", True),
+        ("not-a-type", "deploy", True),  # unknown types do not filter
+    ],
+)
+def test_entity_type_kinds_map_onto_indexed_types(manager, entity_type, value, found):
+    memory_id = _store(manager, ["Python"], ["deploy"])
+
+    results = manager.search_entity_memories(
+        [value], user_id="u1", entity_type=entity_type
+    )
+    assert _ids(results) == ([memory_id] if found else [])
+
+
+def test_backfill_indexes_memories_stored_before_the_table(manager):
+    _insert_unindexed(manager, "m1", ["Memori", "memori", "SQLite"])
+
+    assert manager._backfill_memory_entities_if_needed()
+    assert _entity_values(manager) == {"memori", "sqlite"}
+    assert manager._read_schema_stamp(ENTITY_BACKFILL_COMPONENT)
+
+
+def test_backfill_without_entities_runs_once(manager, monkeypatch):
+    _insert_unindexed(manager, "m1")
+    calls = []
+    real_backfill = backfill_module.backfill_memory_entities
+
+    def counting_backfill(engine):
+        calls.append(engine)
+        return real_backfill(engine)
+
+    monkeypatch.setattr(backfill_module, "backfill_memory_entities", counting_backfill)
+
+    assert manager._backfill_memory_entities_if_needed()
+    assert manager._backfill_memory_entities_if_needed()
+    assert len(calls) == 1
+    assert _entity_values(manager) == set()
+
+
+def test_failed_backfill_is_retried(manager, monkeypatch):
+    _insert_unindexed(manager, "m1", ["Memori"])
+
+    def failing_backfill(engine):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(backfill_module, "backfill_memory_entities", failing_backfill)
+    assert not manager._backfill_memory_entities_if_needed()
+    assert manager._read_schema_stamp(ENTITY_BACKFILL_COMPONENT) is None
+
+    monkeypatch.undo()
+    assert manager._backfill_memory_entities_if_needed()
+    assert _entity_values(manager) == {"memori"}
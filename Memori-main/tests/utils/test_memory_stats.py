@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'stats.db'}", stats_cache_ttl=60
+    )
+    manager.initialize_schema()
+    for n in range(2):
+        manager.store_chat_history(f"c{n}", "hi", "hello", "test", "s1", "u1")
+    manager.store_chat_history("other", "hi", "hello", "test", "s1", "u2")
+    _insert(manager, LongTermMemory, "l1", "essential", 0.9)
+    _insert(manager, LongTermMemory, "l2", "contextual", 0.5)
+    _insert(manager, ShortTermMemory, "s1", "essential", 0.4)
+    _insert(manager, LongTermMemory, "l3", "essential", 0.7, user_id="u2")
+    yield manager
+    manager.close()
+
+
+def _insert(manager, model, memory_id, category, importance, user_id="u1"):
+    """Bypass the manager's store path so its cache is not invalidated"""
+    extra = {"classification": category} if model is LongTermMemory else {}
+    with manager.SessionLocal() as session:
+        session.add(
+            model(
+                memory_id=memory_id,
+                processed_data={},
+                importance_score=importance,
+                category_primary=category,
+                user_id=user_id,
+                session_id="s1",
+                searchable_content=memory_id,
+                summary=memory_id,
+                **extra,
+            )
+        )
+        session.commit()
+
+
+def test_stats_aggregate_all_tables_per_user(manager):
+    stats = manager.get_memory_stats("u1")
+
+    assert stats["chat_history_count"] == 2
+    assert stats["long_term_count"] == 2
+    assert stats["short_term_count"] == 1
+    assert stats["memories_by_category"] == {"essential": 2, "contextual": 1}
+    assert stats["average_importance"] == pytest.approx((0.9 + 0.5 + 0.4) / 3)
+
+
+def test_stats_are_cached_until_invalidated(manager):
+    first = manager.get_memory_stats("u1")
+    first["long_term_count"] = -1  # callers get copies
+    _insert(manager, LongTermMemory, "l4", "essential", 0.5)
+
+    assert manager.get_memory_stats("u1")["long_term_count"] == 2
+    assert manager.get_memory_stats("u1", use_cache=False)["long_term_count"] == 3
+
+    _insert(manager, LongTermMemory, "l5", "essential", 0.5)
+    # A write through the manager drops that user's entry
+    manager.store_chat_history("c9", "hi", "hello", "test", "s1", "u1")
+    stats = manager.get_memory_stats("u1")
+    assert stats["long_term_count"] == 4
+    assert stats["chat_history_count"] == 3
+
+
+def test_stats_cache_expires(manager, monkeypatch):
+    manager.get_memory_stats("u1")
+    _insert(manager, LongTermMemory, "l4", "essential", 0.5)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert manager.get_memory_stats("u1")["long_term_count"] == 3
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from memori.utils import metrics
+from memori.utils.metrics import (
+    export_metrics_json,
+    export_prometheus,
+    increment,
+    observe,
+    span,
+    timed,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    saved = metrics._registry, metrics._enabled
+    metrics.configure_metrics(enabled=True, window=100, trace_history=5)
+    yield
+    metrics._registry, metrics._enabled = saved
+
+
+def test_nested_spans_build_a_trace_and_histograms():
+    with span("turn"):
+        with span("retrieve", mode="auto"):
+            pass
+        with span("llm"):
+            pass
+
+    snapshot = export_metrics_json()
+    (trace,) = snapshot["recent_traces"]
+    assert trace["name"] == "turn"
+    assert [c["name"] for c in trace["children"]] == ["retrieve", "llm"]
+    assert trace["children"][0]["labels"] == {"mode": "auto"}
+    assert snapshot["spans"]["retrieve"][0]["count"] == 1
+
+
+def test_percentiles_over_window():
+    for ms in range(1, 101):
+        observe("stage", ms / 1000)
+
+    (stats,) = export_metrics_json()["spans"]["stage"]
+    assert stats["p50"] == 50.0
+    assert stats["p95"] == 95.0
+    assert stats["p99"] == 99.0
+    assert stats["max"] == 100.0
+
+
+def test_errors_are_counted_and_reraised():
+    with pytest.raises(ValueError):
+        with span("store"):
+            raise ValueError("boom")
+
+    snapshot = export_metrics_json()
+    assert snapshot["recent_traces"][0]["error"] == "ValueError"
+    assert snapshot["counters"]["store.errors"][0]["value"] == 1
+
+
+def test_timed_supports_async_functions():
+    @timed("agent.llm", agent="memory_agent")
+    async def call():
+        return "ok"
+
+    assert asyncio.run(call()) == "ok"
+    assert export_metrics_json()["spans"]["agent.llm"][0]["count"] == 1
+
+
+def test_prometheus_exposition():
+    observe("search.strategy", 0.01, strategy="sqlite_fts5")
+    increment("llm_cache.hits")
+    increment("search.fallback", reason='say "hi"')
+
+    text = export_prometheus()
+    assert "# TYPE memori_search_strategy_seconds summary" in text
+    assert (
+        'memori_search_strategy_seconds{strategy="sqlite_fts5",quantile="0.5"} '
+        "0.010000" in text
+    )
+    assert 'memori_search_strategy_seconds_count{strategy="sqlite_fts5"} 1' in text
+    assert "memori_llm_cache_hits_total 1" in text
+    assert 'reason="say \\"hi\\""' in text
+
+
+def test_disabled_metrics_record_nothing():
+    metrics.configure_metrics(enabled=False)
+    with span("turn") as current:
+        increment("x")
+    assert current is None
+    assert export_metrics_json()["spans"] == {}
@@ -0,0 +1,164 @@
+import os
+import uuid
+
+import pytest
+
+from memori.database.search.mongodb_search_adapter import build_text_search_pipeline
+
+FIELDS = ["memory_id", "summary"]
+
+
+def _pipeline(limit=5):
+    return build_text_search_pipeline(
+        "python",
+        primary_type="short_term",
+        primary_filter={"user_id": "u1"},
+        union_collection="long_term_memory",
+        union_type="long_term",
+        union_filter={"user_id": "u1", "category_primary": {"$in": ["skill"]}},
+        projection_fields=FIELDS,
+        limit=limit,
+    )
+
+
+def test_pipeline_text_searches_both_collections_in_one_round_trip():
+    pipeline = _pipeline()
+    union = pipeline[4]["$unionWith"]
+
+    assert union["coll"] == "long_term_memory"
+    for branch, memory_type, extra in (
+        (pipeline[:4], "short_term", {}),
+        (union["pipeline"], "long_term", {"category_primary": {"$in": ["skill"]}}),
+    ):
+        match, project, sort, limit = branch
+        # $text must open each branch's pipeline
+        assert match == {
+            "$match": {"$text": {"$search": "python"}, "user_id": "u1", **extra}
+        }
+        assert project["$project"] == {
+            "memory_id": 1,
+            "summary": 1,
+            "importance_score": 1,
+            "created_at": 1,
+            "_id": 0,
+            "search_score": {"$meta": "textScore"},
+            "memory_type": {"$literal": memory_type},
+        }
+        assert list(sort["$sort"]) == ["search_score", "importance_score", "created_at"]
+        assert limit == {"$limit": 5}
+    assert pipeline[5:] == [pipeline[2], {"$limit": 5}]
+
+
+def test_search_fields_leave_processed_data_to_the_loader():
+    pytest.importorskip("pymongo")
+    from memori.database.mongodb_manager import MongoDBDatabaseManager
+
+    assert "processed_data" not in MongoDBDatabaseManager.SEARCH_RESULT_FIELDS
+
+
+@pytest.fixture
+def mongomock_manager():
+    mongomock = pytest.importorskip("mongomock")
+    pytest.importorskip("pymongo")
+    from memori.database.mongodb_manager import MongoDBDatabaseManager
+
+    manager = MongoDBDatabaseManager("mongodb://localhost:27017/memori_test")
+    database = mongomock.MongoClient().memori_test
+    manager._collections.update(
+        short_term_memory=database.short_term_memory,
+        long_term_memory=database.long_term_memory,
+    )
+    database.short_term_memory.insert_one(
+        {"memory_id": "st1", "processed_data": {"content": "short"}}
+    )
+    database.long_term_memory.insert_many(
+        [
+            {"memory_id": "lt1", "processed_data": '{"content": "long"}'},
+            {"memory_id": "lt2", "processed_data": {"content": "other"}},
+        ]
+    )
+    return manager, database
+
+
+def test_processed_data_is_loaded_for_the_result_set_on_first_use(
+    mongomock_manager, monkeypatch
+):
+    manager, database = mongomock_manager
+    results = manager._lazy_search_results(
+        [
+            {"memory_id": "st1", "memory_type": "short_term", "summary": "s"},
+            {"memory_id": "lt1", "memory_type": "long_term", "summary": "l"},
+        ]
+    )
+    queries = []
+    find = type(database.long_term_memory).find
+
+    def counting_find(collection, *args, **kwargs):
+        queries.append((collection.name, args[0]))
+        return find(collection, *args, **kwargs)
+
+    monkeypatch.setattr(type(database.long_term_memory), "find", counting_find)
+
+    assert [r["summary"] for r in results] == ["s", "l"]
+    assert queries == []
+
+    assert results[1]["processed_data"] == {"content": "long"}
+    assert results[0]["processed_data"] == {"content": "short"}
+    # One $in query per collection, for the whole result set
+    assert sorted(queries) == [
+        ("long_term_memory", {"memory_id": {"$in": ["lt1"]}}),
+        ("short_term_memory", {"memory_id": {"$in": ["st1"]}}),
+    ]
+
+
+@pytest.fixture
+def mongod_database():
+    """A live server for $text/$unionWith, which mongomock does not implement"""
+    uri = os.getenv("MEMORI_TEST_MONGODB_URI")
+    if not uri:
+        pytest.skip("MEMORI_TEST_MONGODB_URI not set")
+    pymongo = pytest.importorskip("pymongo")
+
+    client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=2000)
+    database = client[f"memori_test_{uuid.uuid4().hex[:8]}"]
+    try:
+        yield database
+    finally:
+        client.drop_database(database.name)
+        client.close()
+
+
+def test_pipeline_merges_and_ranks_both_collections_on_mongod(mongod_database):
+    for name in ("short_term_memory", "long_term_memory"):
+        mongod_database[name].create_index([("summary", "text")])
+    mongod_database.short_term_memory.insert_many(
+        [
+            {"memory_id": "st1", "user_id": "u1", "summary": "python python"},
+            {"memory_id": "st2", "user_id": "u2", "summary": "python python"},
+        ]
+    )
+    mongod_database.long_term_memory.insert_many(
+        [
+            {
+                "memory_id": "lt1",
+                "user_id": "u1",
+                "category_primary": "skill",
+                "summary": "python",
+                "processed_data": {"content": "large"},
+            },
+            {
+                "memory_id": "lt2",
+                "user_id": "u1",
+                "category_primary": "context",
+                "summary": "python",
+            },
+        ]
+    )
+
+    results = list(mongod_database.short_term_memory.aggregate(_pipeline()))
+
+    assert [(r["memory_id"], r["memory_type"]) for r in results] == [
+        ("st1", "short_term"),
+        ("lt1", "long_term"),
+    ]
+    assert all("processed_data" not in r for r in results)
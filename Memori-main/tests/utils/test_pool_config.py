@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from memori.config.pool_config import PoolConfig
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """No memori.json or MEMORI_* variables from the machine running the tests"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("MEMORI_ENV", raising=False)
+    monkeypatch.delenv("MEMORI_CONFIG_PATH", raising=False)
+
+
+def _write_config(path, **database):
+    path.write_text(json.dumps({"database": database}))
+    return path
+
+
+def test_default_environment_keeps_the_default_pool():
+    config = PoolConfig.resolve()
+
+    assert config["environment"] == "default"
+    assert config["pool_size"] == PoolConfig.DEFAULT_POOL_SIZE == 5
+    assert config["max_overflow"] == PoolConfig.DEFAULT_MAX_OVERFLOW == 10
+
+
+@pytest.mark.parametrize("environment", ["staging", "pool_keys", "DEFAULT_POOL_SIZE"])
+def test_unknown_environment_is_rejected(environment):
+    with pytest.raises(ValueError, match="Unknown pool environment"):
+        PoolConfig.get_config(environment)
+    with pytest.raises(ValueError, match="Unknown pool environment"):
+        PoolConfig.resolve(environment)
+
+
+def test_environment_name_is_case_insensitive():
+    assert PoolConfig.get_config("Production")["pool_size"] == 10
+
+
+def test_environment_precedence(tmp_path, monkeypatch):
+    _write_config(tmp_path / "memori.json", environment="testing")
+    assert PoolConfig.resolve()["environment"] == "testing"
+
+    monkeypatch.setenv("MEMORI_ENV", "production")
+    assert PoolConfig.resolve()["environment"] == "production"
+
+    assert PoolConfig.resolve("development")["environment"] == "development"
+
+
+def test_setting_precedence(tmp_path):
+    config_path = _write_config(
+        tmp_path / "custom.json", pool_size=7, pool_timeout=12, unknown_key=1
+    )
+
+    config = PoolConfig.resolve(
+        "production",
+        overrides={"pool_timeout": 3, "max_overflow": None, "echo": True},
+        config_path=config_path,
+    )
+
+    assert config["pool_size"] == 7  # file beats the profile
+    assert config["pool_timeout"] == 3  # explicit beats the file
+    assert config["max_overflow"] == 20  # None overrides are ignored
+    assert "unknown_key" not in config and "echo" not in config
+
+
+def test_config_file_locations(tmp_path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    _write_config(tmp_path / "config" / "memori.json", pool_size=3)
+    assert PoolConfig.resolve()["pool_size"] == 3
+
+    _write_config(tmp_path / "memori.json", pool_size=4)
+    assert PoolConfig.resolve()["pool_size"] == 4
+
+    monkeypatch.setenv(
+        "MEMORI_CONFIG_PATH", str(_write_config(tmp_path / "env.json", pool_size=6))
+    )
+    assert PoolConfig.resolve()["pool_size"] == 6
+
+
+def test_unreadable_config_file_is_ignored(tmp_path):
+    (tmp_path / "memori.json").write_text("{not json")
+
+    assert PoolConfig.resolve()["pool_size"] == PoolConfig.DEFAULT_POOL_SIZE
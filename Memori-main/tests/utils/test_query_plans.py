@@ -0,0 +1,143 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from memori.database.query_plans import (
+    QueryPlanCollector,
+    capture_query_plans,
+    explain,
+    table_aliases,
+)
+from memori.database.search_service import SearchService
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.database.statements import STATEMENTS
+from memori.utils.metrics import span
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE memories (id TEXT PRIMARY KEY, user_id TEXT, body TEXT)")
+        )
+        conn.execute(text("CREATE INDEX idx_memories_user ON memories (user_id)"))
+        conn.execute(
+            text(
+                "INSERT INTO memories VALUES "
+                "('a', 'u1', 'coffee'), ('b', 'u1', 'tea'), ('c', 'u2', 'coffee')"
+            )
+        )
+    yield engine
+    engine.dispose()
+
+
+def test_aliases_resolve_to_tables():
+    sql = (
+        "SELECT * FROM long_term_memory lt "
+        "LEFT JOIN short_term_memory AS st ON st.memory_id = lt.memory_id WHERE 1"
+    )
+    assert table_aliases(sql) == {
+        "long_term_memory": "long_term_memory",
+        "lt": "long_term_memory",
+        "short_term_memory": "short_term_memory",
+        "st": "short_term_memory",
+    }
+
+
+def test_explain_reports_index_and_scan(engine):
+    with engine.connect() as conn:
+        indexed = explain(
+            conn, "SELECT body FROM memories WHERE user_id = :u", {"u": "u1"}
+        )
+        scanned = explain(
+            conn, "SELECT m.body FROM memories m WHERE m.body LIKE :q", {"q": "%co%"}
+        )
+
+    assert indexed.indexes == ["idx_memories_user"] and not indexed.scans
+    assert [s.table for s in scanned.scans] == ["memories"]
+
+
+def test_collector_captures_each_statement_once_with_scope(engine):
+    by_user = text("SELECT body FROM memories WHERE user_id = :u")
+    with capture_query_plans(engine) as plans:
+        with engine.connect() as conn:
+            with span("search.strategy"):
+                for _ in range(3):
+                    conn.execute(by_user, {"u": "u1"})
+            conn.execute(text("SELECT body FROM memories WHERE body LIKE '%co%'"))
+
+    indexed, scanned = plans.plans()
+    assert indexed.scope == "search.strategy" and indexed.executions == 3
+    assert scanned.scope is None and scanned.scans[0].rows == 3
+    assert plans.flagged() == [scanned]
+
+    plans.assert_index_usage(scope="search.strategy")
+    with pytest.raises(AssertionError, match="memories"):
+        plans.assert_index_usage(tables={"memories"})
+
+
+def test_row_threshold_ignores_small_tables(engine):
+    collector = QueryPlanCollector(row_threshold=10).attach(engine)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT body FROM memories WHERE body LIKE '%co%'"))
+    finally:
+        collector.detach()
+
+    assert len(collector.plans()[0].scans) == 1
+    assert collector.flagged() == []
+    collector.assert_index_usage()
+
+
+def test_search_service_queries_use_indexes(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'plans.db'}")
+    manager.initialize_schema()
+    try:
+        with capture_query_plans(manager) as plans:
+            with manager.SessionLocal() as session:
+                service = SearchService(session, manager.database_type)
+                service.search_memories("coffee", user_id="u1", limit=5)
+                service.search_memories(
+                    "coffee", user_id="u1", category_filter=["essential"], limit=5
+                )
+
+        assert plans.plans()
+        plans.assert_index_usage(tables={"long_term_memory", "short_term_memory"})
+    finally:
+        manager.close()
+
+
+@pytest.mark.parametrize(
+    "name, params, variant",
+    [
+        ("memory.essential_conversations", {"user_id": "u1", "limit": 10}, {}),
+        (
+            "memory.dedup_candidates",
+            {
+                "user_id": "u1",
+                "processed_for_duplicates": False,
+                "time_threshold": datetime(2025, 1, 1),
+                "limit": 20,
+            },
+            {},
+        ),
+        (
+            "conscious.long_term_memories",
+            {"user_id": "u1", "conscious_processed": False},
+            {"unprocessed": True},
+        ),
+    ],
+)
+def test_hot_statements_read_in_index_order(tmp_path, name, params, variant):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'plans.db'}")
+    manager.initialize_schema()
+    try:
+        with manager.engine.connect() as conn:
+            statement = STATEMENTS.statement(name, "sqlite", **variant)
+            plan = explain(conn, statement.text, params)
+        assert plan.uses_index and not plan.scans
+        assert not plan.sorts, plan.plan
+    finally:
+        manager.close()
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from memori.utils import rate_limiter
+from memori.utils.exceptions import RateLimitError
+from memori.utils.rate_limiter import (
+    DEFAULT_RATE_LIMITS,
+    RateLimit,
+    RateLimiter,
+    TokenBucketLimiter,
+    acquire_rate_limit,
+    acquire_rate_limit_async,
+    configure_rate_limits,
+    provider_rate_limit_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_policies():
+    """Reset process-wide policies changed by a test."""
+    yield
+    configure_rate_limits(dict(DEFAULT_RATE_LIMITS))
+
+
+def test_token_bucket_allows_burst_then_reports_wait():
+    limiter = TokenBucketLimiter(stripes=4)
+    limit = RateLimit(capacity=3, refill_per_second=1.0)
+
+    assert [limiter.try_acquire("u1", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait = limiter.try_acquire("u1", limit)
+    assert 0.0 < wait <= 1.0
+
+    # Other keys have their own bucket
+    assert limiter.try_acquire("u2", limit) == 0.0
+
+
+def test_acquire_times_out_instead_of_waiting_forever():
+    limiter = TokenBucketLimiter()
+    limit = RateLimit(capacity=1, refill_per_second=0.1)
+
+    assert limiter.acquire("k", limit, timeout=0.01)
+    assert not limiter.acquire("k", limit, timeout=0.01)
+
+
+def test_acquire_queues_until_refill():
+    limiter = TokenBucketLimiter()
+    limit = RateLimit(capacity=1, refill_per_second=50.0)
+
+    assert limiter.acquire("k", limit)
+    assert limiter.acquire("k", limit, timeout=1.0)
+
+
+def test_rate_limiter_check_keeps_tuple_api():
+    limiter = RateLimiter()
+
+    assert limiter.check_rate_limit("u", "search", limit=2) == (True, None)
+    assert limiter.check_rate_limit("u", "search", limit=2) == (True, None)
+    allowed, error = limiter.check_rate_limit("u", "search", limit=2)
+    assert not allowed
+    assert "Rate limit exceeded for search" in error
+
+
+def test_named_policy_raises_rate_limit_error():
+    configure_rate_limits({"search": RateLimit(capacity=1, refill_per_second=0.01)})
+
+    acquire_rate_limit("search", "user-a", timeout=0)
+    with pytest.raises(RateLimitError):
+        acquire_rate_limit("search", "user-a", timeout=0)
+    # Per-key buckets: another user is unaffected
+    acquire_rate_limit("search", "user-b", timeout=0)
+
+
+def test_disabled_policy_never_limits():
+    configure_rate_limits({"llm": None})
+
+    for _ in range(100):
+        asyncio.run(acquire_rate_limit_async("llm", "openai", timeout=0))
+    assert rate_limiter._rate_limits["llm"] is None
+
+
+def test_provider_key_uses_endpoint_host():
+    class Config:
+        base_url = "http://localhost:11434/v1"
+        api_type = "custom"
+
+    assert provider_rate_limit_key(Config()) == "localhost:11434"
+    assert provider_rate_limit_key(None) == "openai"
+
+
+def test_record_conversation_is_unlimited_unless_configured():
+    assert DEFAULT_RATE_LIMITS["record_conversation"] is None
+    for _ in range(1000):
+        acquire_rate_limit("record_conversation", "bulk-import", timeout=0)
+
+    configure_rate_limits({"record_conversation": RateLimit(1, 0.01)})
+    acquire_rate_limit("record_conversation", "bulk-import", timeout=0)
+    with pytest.raises(RateLimitError):
+        acquire_rate_limit("record_conversation", "bulk-import", timeout=0)
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from memori.database.read_scope import current_read_scope, scoped_session
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'scope.db'}")
+    manager.initialize_schema()
+    manager.store_chat_history(
+        chat_id="c1",
+        user_input="I like coffee",
+        ai_output="Noted",
+        model="test",
+        session_id="s1",
+        user_id="u1",
+    )
+    yield manager
+    manager.close()
+
+
+def _checkouts(manager) -> int:
+    return manager.get_pool_status()["events"]["checkouts"]
+
+
+def test_reads_in_scope_share_one_checkout(manager):
+    before = _checkouts(manager)
+    with manager.read_scope() as scope:
+        history = manager.get_chat_history(user_id="u1", session_id="s1")
+        manager.search_memories("coffee", user_id="u1")
+        with manager._get_read_connection() as conn:
+            conn.execute(text("SELECT COUNT(*) FROM short_term_memory")).scalar()
+        with manager.read_scope() as nested:
+            assert nested is scope
+            manager.get_chat_history(user_id="u1")
+
+    assert [h["chat_id"] for h in history] == ["c1"]
+    assert scope.reads == 4
+    assert _checkouts(manager) - before == 1
+    assert current_read_scope(manager) is None
+
+
+def test_reads_outside_scope_check_out_their_own(manager):
+    before = _checkouts(manager)
+    manager.get_chat_history(user_id="u1")
+    manager.search_memories("coffee", user_id="u1")
+    assert _checkouts(manager) - before >= 2
+
+
+def test_other_threads_do_not_borrow_the_scope(manager):
+    import contextvars
+
+    seen = []
+    with manager.read_scope():
+        assert scoped_session(manager) is not None
+        context = contextvars.copy_context()
+        worker = threading.Thread(
+            target=context.run, args=(lambda: seen.append(scoped_session(manager)),)
+        )
+        worker.start()
+        worker.join()
+
+    assert seen == [None]
+
+
+def test_searches_leave_the_scope_transaction_open(manager):
+    with manager.read_scope() as scope:
+        manager.get_chat_history(user_id="u1")
+        assert scope.session.in_transaction()
+        manager.search_memories("coffee", user_id="u1")
+        manager.search_entity_memories(["coffee"], user_id="u1")
+        assert scope.session.in_transaction()
+        assert scope.reads == 3
+
+
+def test_scope_reads_the_primary_and_searches_the_replica(tmp_path):
+    # A separate database stands in for a replica that lags the primary
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replica = SQLAlchemyDatabaseManager(replica_url)
+    replica.initialize_schema()
+    replica.close()
+
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'primary.db'}", read_replica_connect=replica_url
+    )
+    manager.initialize_schema()
+    assert manager.has_read_replica
+    try:
+        manager.store_chat_history("c1", "hi", "hello", "test", "s1", "u1")
+        before = _checkouts(manager)
+        with manager.read_scope() as scope:
+            history = manager.get_chat_history(user_id="u1")
+            assert scope.search_session is None
+            manager.search_memories("coffee", user_id="u1")
+            manager.search_entity_memories(["coffee"], user_id="u1")
+
+            assert scope.session.get_bind().engine is manager.engine
+            assert scope.search_session.get_bind().engine is manager.read_engine
+            assert scope.session.in_transaction()
+            assert scope.search_session.in_transaction()
+
+        # The row written just before the turn is read from the primary
+        assert [h["chat_id"] for h in history] == ["c1"]
+        assert _checkouts(manager) - before == 1
+    finally:
+        manager.close()
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from memori.utils import resilience
+from memori.utils.exceptions import CircuitOpenError
+from memori.utils.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    RetryPolicy,
+    call_with_resilience,
+    call_with_resilience_async,
+    get_circuit_breaker,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.01)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+        class Response:
+            pass
+
+        self.response = Response()
+        self.response.headers = headers or {}
+
+
+@pytest.fixture(autouse=True)
+def isolated_breakers():
+    saved = dict(resilience._breakers)
+    resilience._breakers.clear()
+    yield
+    resilience._breakers.clear()
+    resilience._breakers.update(saved)
+
+
+def test_retryable_classification():
+    assert is_retryable_error(StatusError(429))
+    assert is_retryable_error(StatusError(503))
+    assert is_retryable_error(ConnectionError("reset"))
+    assert not is_retryable_error(StatusError(400))
+    assert not is_retryable_error(ValueError("bad json"))
+
+
+def test_retry_after_headers():
+    assert retry_after_seconds(StatusError(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(StatusError(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(StatusError(429)) is None
+
+
+def test_retries_transient_errors_then_succeeds():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise StatusError(503)
+        return "ok"
+
+    assert call_with_resilience(flaky, "endpoint", FAST) == "ok"
+    assert len(calls) == 3
+    assert get_circuit_breaker("endpoint").state == CIRCUIT_CLOSED
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def bad_request():
+        calls.append(1)
+        raise StatusError(400)
+
+    with pytest.raises(StatusError):
+        call_with_resilience(bad_request, "endpoint", FAST)
+    assert len(calls) == 1
+
+
+def test_long_retry_after_gives_up_instead_of_sleeping():
+    calls = []
+
+    def throttled():
+        calls.append(1)
+        raise StatusError(429, {"retry-after": "60"})
+
+    with pytest.raises(StatusError):
+        call_with_resilience(throttled, "endpoint", FAST)
+    assert len(calls) == 1
+
+
+def test_open_circuit_fails_fast_then_probes_once():
+    breaker = get_circuit_breaker("down", failure_threshold=2, recovery_timeout=60)
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise ConnectionError("refused")
+
+    with pytest.raises(ConnectionError):
+        call_with_resilience(down, "down", FAST)
+    assert breaker.state == CIRCUIT_OPEN
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        call_with_resilience(down, "down", FAST)
+    assert len(calls) == 2
+
+    # Cooldown elapsed: one probe goes out, concurrent callers still fail fast
+    breaker._opened_at -= 60
+    assert breaker.allow_request()
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker("probe", failure_threshold=3, recovery_timeout=0)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_async_variant_releases_probe_when_hook_fails():
+    breaker = get_circuit_breaker("hook", failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+
+    async def refuse():
+        raise RuntimeError("no token")
+
+    async def call():
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(call_with_resilience_async(call, "hook", FAST, refuse))
+    assert asyncio.run(call_with_resilience_async(call, "hook", FAST)) == "ok"
+    assert breaker.state == CIRCUIT_CLOSED
@@ -0,0 +1,64 @@
+import pytest
+
+from memori.database.models import schema_fingerprint
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+SETUP_STEPS = (
+    "_create_missing_indexes",
+    "_setup_database_features",
+    "_backfill_memory_entities_if_needed",
+)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'schema.db'}")
+    calls = []
+    for step in SETUP_STEPS:
+        # Record the step and report success, whatever this SQLite supports
+        monkeypatch.setattr(manager, step, lambda step=step: calls.append(step) or True)
+    manager.calls = calls
+    yield manager
+    manager.close()
+
+
+def test_stamped_schema_skips_setup(manager):
+    manager.initialize_schema()
+    assert manager._read_schema_stamp() == schema_fingerprint()
+    assert manager.calls == list(SETUP_STEPS)
+
+    manager.calls.clear()
+    manager.initialize_schema()
+    assert manager.calls == []
+
+
+def test_force_reruns_every_step(manager):
+    manager.initialize_schema()
+    manager.calls.clear()
+
+    manager.initialize_schema(force=True)
+    assert manager.calls == list(SETUP_STEPS)
+
+
+@pytest.mark.parametrize("failing", SETUP_STEPS)
+def test_failed_step_leaves_schema_unstamped(manager, monkeypatch, failing):
+    monkeypatch.setattr(manager, failing, lambda: False)
+    manager.initialize_schema()
+    assert manager._read_schema_stamp() is None
+
+    # The next startup runs the setup again, and stamps once it succeeds
+    monkeypatch.setattr(manager, failing, lambda: True)
+    manager.calls.clear()
+    manager.initialize_schema()
+    assert manager.calls == [step for step in SETUP_STEPS if step != failing]
+    assert manager._read_schema_stamp() == schema_fingerprint()
+
+
+def test_unsupported_full_text_search_is_not_stamped(tmp_path, monkeypatch):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'schema.db'}")
+    monkeypatch.setattr(manager, "_setup_sqlite_fts", lambda conn: False)
+    try:
+        manager.initialize_schema()
+        assert manager._read_schema_stamp() is None
+    finally:
+        manager.close()
@@ -0,0 +1,154 @@
+import asyncio
+import copy
+import json
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from memori.agents.memory_agent import MemoryAgent
+from memori.database.search_records import DedupCandidate
+from memori.database.search_service import SearchService
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+
+@pytest.fixture
+def rows():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        yield conn.execute(
+            text(
+                "SELECT 'm' || value AS memory_id, 'long_term' AS memory_type, "
+                "value / 10.0 AS search_score, 0.5 AS importance_score, "
+                "NULL AS created_at, 'text ' || value AS summary "
+                "FROM json_each('[1, 2, 3, 4, 5, 6, 7, 8, 9]')"
+            )
+        ).all()
+
+
+def test_ranking_turns_only_the_top_k_into_dicts(rows):
+    service = SearchService(session=None, database_type="sqlite")
+    ranked = service._rank_and_limit_results(list(rows), 3)
+
+    assert [r["memory_id"] for r in ranked] == ["m9", "m8", "m7"]
+    assert all(type(r) is dict for r in ranked)
+    assert ranked[0]["composite_score"] == pytest.approx(0.9 * 0.5 + 0.5 * 0.3)
+
+
+def test_ranking_accepts_dicts_and_keeps_ties_in_order():
+    service = SearchService(session=None, database_type="sqlite")
+    recent = datetime.now() - timedelta(days=1)
+    results = [
+        {"memory_id": "a", "search_score": 0.5, "created_at": recent},
+        {"memory_id": "b", "search_score": 0.5, "created_at": recent},
+        {"memory_id": "c", "search_score": 0.9, "created_at": recent},
+    ]
+    ranked = service._rank_and_limit_results(results, 10)
+    assert [r["memory_id"] for r in ranked] == ["c", "a", "b"]
+
+
+def test_dedup_candidates_report_their_memory_id():
+    agent = MemoryAgent.__new__(MemoryAgent)
+    new_memory = ProcessedLongTermMemory(
+        content="User prefers dark roast coffee",
+        summary="Prefers dark roast coffee",
+        classification="essential",
+        importance="medium",
+        session_id="s1",
+        classification_reason="test",
+    )
+    existing = [
+        DedupCandidate("m1", "Likes tea", "User likes green tea", "essential"),
+        DedupCandidate(
+            "m2",
+            "Prefers dark roast coffee",
+            "User prefers dark roast coffee",
+            "essential",
+        ),
+    ]
+
+    assert asyncio.run(agent.detect_duplicates(new_memory, existing)) == "m2"
+    assert not hasattr(existing[0], "__dict__")
+
+
+@pytest.fixture
+def lazy_records(tmp_path):
+    from sqlalchemy import event
+
+    from memori.database.models import Base, LongTermMemory, ShortTermMemory
+    from memori.database.search_records import attach_lazy_processed_data
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'records.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for model, memory_id in ((LongTermMemory, "l1"), (ShortTermMemory, "s1")):
+            conn.execute(
+                model.__table__.insert(),
+                {
+                    "memory_id": memory_id,
+                    "processed_data": {"content": memory_id},
+                    "category_primary": "essential",
+                    "searchable_content": memory_id,
+                    "summary": memory_id,
+                },
+            )
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    records = attach_lazy_processed_data(
+        [
+            {"memory_id": "l1", "memory_type": "long_term", "summary": "l1"},
+            {"memory_id": "s1", "memory_type": "short_term", "summary": "s1"},
+            {"memory_id": "gone", "memory_type": "long_term", "summary": "gone"},
+        ],
+        engine,
+    )
+    yield records, statements
+    engine.dispose()
+
+
+def test_processed_data_loads_once_for_the_result_set(lazy_records):
+    records, statements = lazy_records
+
+    assert records[0]["summary"] == "l1"
+    assert records[0].display_text == "l1"
+    assert all(records) and "processed_data" in records[0]
+    assert statements == []
+
+    assert records[1].get("processed_data") == {"content": "s1"}
+    assert len(statements) == 2  # one query per table, for every record
+    assert records[0]["processed_data"] == {"content": "l1"}
+    assert records[2]["processed_data"] is None  # deleted meanwhile
+    assert len(statements) == 2
+
+
+@pytest.mark.parametrize(
+    "materialize",
+    [
+        dict,
+        lambda record: record.copy(),
+        lambda record: {**record},
+        lambda record: dict(record.items()),
+        lambda record: json.loads(json.dumps(record)),
+        lambda record: pickle.loads(pickle.dumps(record)),
+        copy.deepcopy,
+    ],
+    ids=["dict", "copy", "unpack", "items", "json", "pickle", "deepcopy"],
+)
+def test_whole_record_access_includes_processed_data(lazy_records, materialize):
+    records, _ = lazy_records
+
+    result = materialize(records[0])
+
+    assert result["processed_data"] == {"content": "l1"}
+    assert result == {
+        "memory_id": "l1",
+        "memory_type": "long_term",
+        "summary": "l1",
+        "processed_data": {"content": "l1"},
+    }
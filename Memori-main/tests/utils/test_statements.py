@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import Boolean, Integer, create_engine, text
+
+from memori.database.statements import (
+    STATEMENTS,
+    StatementRegistry,
+    is_prepared_statement,
+)
+from memori.utils.exceptions import DatabaseError
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE items (id TEXT, user_id TEXT, done BOOLEAN, score REAL)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO items VALUES "
+                "('a', 'u1', 0, 0.9), ('b', 'u1', 1, 0.5), ('c', 'u2', 0, 0.1)"
+            )
+        )
+        yield connection
+
+
+def _registry():
+    registry = StatementRegistry()
+    registry.register(
+        "items.open",
+        lambda dialect, by_id=False: (
+            "SELECT id FROM items WHERE user_id = :user_id AND done = :done"
+            + (" AND id IN :ids" if by_id else "")
+            + " ORDER BY score DESC LIMIT :limit"
+        ),
+        param_types={"done": Boolean(), "limit": Integer()},
+        expanding=("ids",),
+    )
+    return registry
+
+
+def test_statements_are_built_once_per_dialect_and_variant(conn):
+    registry = _registry()
+    first = registry.statement("items.open", "sqlite")
+
+    assert registry.statement("items.open", "sqlite") is first
+    assert registry.statement("items.open", "sqlite", by_id=True) is not first
+    assert is_prepared_statement(first)
+    assert not is_prepared_statement(text("SELECT 1"))
+
+
+def test_typed_binds_and_expanding_variant(conn):
+    registry = _registry()
+    rows = registry.execute(
+        conn, "items.open", {"user_id": "u1", "done": False, "limit": 1}
+    ).fetchall()
+    assert [r[0] for r in rows] == ["a"]
+
+    rows = registry.execute(
+        conn,
+        "items.open",
+        {"user_id": "u1", "done": True, "ids": ["a", "b"], "limit": 5},
+        by_id=True,
+    ).fetchall()
+    assert [r[0] for r in rows] == ["b"]
+
+    stats = registry.stats()["items.open"]
+    assert stats["calls"] == 2
+    assert stats["variants"] == 2
+
+
+def test_unknown_name_and_dialect_restrictions_raise():
+    with pytest.raises(DatabaseError):
+        STATEMENTS.get("no.such.statement")
+    with pytest.raises(DatabaseError):
+        STATEMENTS.statement("search.sqlite_fts", "postgresql")
+
+
+def test_shared_statements_build_for_every_dialect():
+    for name in STATEMENTS.names():
+        prepared = STATEMENTS.get(name)
+        for dialect in prepared.dialects or ("sqlite", "postgresql", "mysql"):
+            assert prepared.statement(dialect) is not None
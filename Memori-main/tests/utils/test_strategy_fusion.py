@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+
+from memori.agents.retrieval_agent import MemorySearchEngine
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import MemorySearchQuery
+
+RRF_K = MemorySearchEngine.RRF_K
+
+
+@pytest.fixture
+def engine():
+    engine = MemorySearchEngine(api_key="test")
+    yield engine
+    if engine._strategy_executor is not None:
+        engine._strategy_executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'fusion.db'}")
+    manager.initialize_schema()
+    yield manager
+    manager.close()
+
+
+def _strategy(name):
+    return (name, None, f"{name}_label", f"{name} reasoning")
+
+
+def _rows(*memory_ids, importance=None):
+    return [
+        {"memory_id": memory_id, "importance_score": (importance or {}).get(memory_id)}
+        for memory_id in memory_ids
+    ]
+
+
+def test_memories_found_by_several_strategies_rank_first(engine):
+    strategies = [_strategy("primary"), _strategy("keyword"), _strategy("category")]
+    fused = engine._fuse_strategy_results(
+        strategies,
+        {
+            "primary": _rows("solo-top", "shared"),
+            "keyword": _rows("other", "shared"),
+            "category": _rows("shared"),
+        },
+    )
+
+    assert [r["memory_id"] for r in fused] == ["shared", "solo-top", "other"]
+    shared = fused[0]
+    assert shared["search_score"] == pytest.approx(2 / (RRF_K + 2) + 1 / (RRF_K + 1))
+    assert shared["matched_strategies"] == ["primary", "keyword", "category"]
+    # Labelled by the strategy that ranked it best
+    assert shared["search_strategy"] == "category_label"
+    assert shared["search_reasoning"] == "category reasoning"
+    assert fused[1]["search_strategy"] == "primary_label"
+
+
+def test_equal_scores_fall_back_to_importance(engine):
+    fused = engine._fuse_strategy_results(
+        [_strategy("primary"), _strategy("keyword")],
+        {
+            "primary": _rows("low", importance={"low": 0.2}),
+            "keyword": _rows("high", "no-id", importance={"high": 0.9}) + [{}],
+        },
+    )
+
+    assert [r["memory_id"] for r in fused] == ["high", "low", "no-id"]
+    assert fused[0]["search_score"] == fused[1]["search_score"]
+
+
+def test_missing_strategy_results_are_ignored(engine):
+    fused = engine._fuse_strategy_results(
+        [_strategy("primary"), _strategy("keyword")], {"primary": _rows("a")}
+    )
+
+    assert [r["memory_id"] for r in fused] == ["a"]
+
+
+def _recording_strategies(count, barrier=None):
+    """Strategies that record the session and thread each one ran on"""
+    seen = {}
+
+    def make(name):
+        def runner(plan, search_service, *args):
+            if barrier is not None:
+                barrier.wait()  # every strategy is in flight at once
+            seen[name] = (search_service.session, threading.get_ident())
+            return [{"memory_id": name}]
+
+        return (name, runner, name, name)
+
+    return [make(f"s{n}") for n in range(count)], seen
+
+
+def _run(engine, manager, strategies):
+    plan = MemorySearchQuery(query_text="coffee", intent="test")
+    return engine._run_strategies(
+        strategies, plan, manager, "sqlite", "u1", None, None, 5
+    )
+
+
+def test_parallel_strategies_each_get_their_own_session(engine, manager):
+    strategies, seen = _recording_strategies(3, barrier=threading.Barrier(3, timeout=5))
+
+    results = _run(engine, manager, strategies)
+
+    assert results == {name: [{"memory_id": name}] for name in ("s0", "s1", "s2")}
+    sessions = [session for session, _ in seen.values()]
+    assert len({id(session) for session in sessions}) == 3
+    assert threading.get_ident() not in {thread for _, thread in seen.values()}
+
+
+def test_workers_do_not_share_the_request_read_scope(engine, manager):
+    strategies, seen = _recording_strategies(3)
+
+    with manager.read_scope() as scope:
+        _run(engine, manager, strategies)
+        single, single_seen = _recording_strategies(1)
+        _run(engine, manager, single)
+
+    assert scope.session not in [session for session, _ in seen.values()]
+    # A lone strategy runs inline and reuses the scope's session
+    assert single_seen["s0"] == (scope.session, threading.get_ident())
+
+
+def test_static_pool_runs_strategies_inline(engine):
+    manager = SQLAlchemyDatabaseManager("sqlite:///:memory:")
+    manager.initialize_schema()
+    try:
+        strategies, seen = _recording_strategies(3)
+        _run(engine, manager, strategies)
+    finally:
+        manager.close()
+
+    assert {thread for _, thread in seen.values()} == {threading.get_ident()}
+    assert engine._strategy_executor is None
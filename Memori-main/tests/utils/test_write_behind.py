@@ -0,0 +1,169 @@
+import time
+
+import pytest
+
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.database.write_behind import MAX_ROW_ATTEMPTS
+from memori.utils.async_bridge import BackgroundEventLoop
+from memori.utils.exceptions import DatabaseError
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(f"sqlite:///{tmp_path / 'buffer.db'}")
+    manager.initialize_schema()
+    yield manager
+    manager.close()
+
+
+def _add(buffer, chat_id, session_id="s1"):
+    buffer.add(
+        chat_id=chat_id,
+        user_input=f"question {chat_id}",
+        ai_output="answer",
+        model="test",
+        session_id=session_id,
+        user_id="u1",
+    )
+
+
+def _stored(manager) -> list[str]:
+    with manager.SessionLocal() as session:
+        from memori.database.models import ChatHistory
+
+        return sorted(row.chat_id for row in session.query(ChatHistory))
+
+
+def test_buffered_rows_are_read_before_they_are_written(manager):
+    buffer = manager.enable_write_behind(flush_interval=60, flush_on_exit=False)
+    for i in range(3):
+        _add(buffer, f"c{i}")
+    _add(buffer, "other", session_id="s2")
+
+    assert _stored(manager) == []
+    history = manager.get_chat_history("u1", "s1", limit=2)
+    assert [h["chat_id"] for h in history] == ["c2", "c1"]
+
+    assert buffer.flush() == 4
+    assert _stored(manager) == ["c0", "c1", "c2", "other"]
+    # Same rows once stored, no duplicates
+    assert [h["chat_id"] for h in manager.get_chat_history("u1", "s1")] == [
+        "c2",
+        "c1",
+        "c0",
+    ]
+
+
+def test_full_batch_wakes_the_background_flush(manager):
+    buffer = manager.enable_write_behind(
+        flush_interval=60, max_batch=5, flush_on_exit=False
+    )
+    for i in range(5):
+        _add(buffer, f"c{i}")
+
+    deadline = time.monotonic() + 5
+    while len(buffer) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(_stored(manager)) == 5
+
+
+def _database_down(manager, monkeypatch):
+    def fail(*args, **kwargs):
+        raise DatabaseError("database unavailable")
+
+    monkeypatch.setattr(manager, "store_chat_history_batch", fail)
+    monkeypatch.setattr(manager, "store_chat_history", fail)
+    monkeypatch.setattr(manager, "test_connection_pool", lambda: False)
+
+
+def test_failed_flush_keeps_rows_and_close_writes_them(manager, monkeypatch):
+    buffer = manager.enable_write_behind(flush_interval=60, flush_on_exit=False)
+    _add(buffer, "c0")
+
+    _database_down(manager, monkeypatch)
+    assert buffer.flush() == 0
+    assert len(buffer) == 1
+
+    monkeypatch.undo()
+    manager.disable_write_behind()
+    assert manager.chat_buffer is None
+    assert _stored(manager) == ["c0"]
+
+
+def test_full_buffer_rejects_rows_while_the_database_is_down(manager, monkeypatch):
+    buffer = manager.enable_write_behind(
+        flush_interval=60, max_batch=2, max_pending=4, flush_on_exit=False
+    )
+    _database_down(manager, monkeypatch)
+    for i in range(4):
+        _add(buffer, f"c{i}")
+
+    for i in range(3):
+        with pytest.raises(DatabaseError, match="buffer is full"):
+            _add(buffer, f"late{i}")
+    assert len(buffer) == 4
+
+    monkeypatch.undo()
+    manager.disable_write_behind()
+    assert _stored(manager) == ["c0", "c1", "c2", "c3"]
+
+
+def test_poison_row_is_quarantined_without_blocking_others(manager, monkeypatch):
+    buffer = manager.enable_write_behind(flush_interval=60, flush_on_exit=False)
+    store = manager.store_chat_history
+
+    def store_unless_poison(**row):
+        if row["chat_id"] == "bad":
+            raise DatabaseError("value too long")
+        return store(**row)
+
+    def batch_fails_on_poison(rows):
+        raise DatabaseError("value too long")
+
+    monkeypatch.setattr(manager, "store_chat_history", store_unless_poison)
+    monkeypatch.setattr(manager, "store_chat_history_batch", batch_fails_on_poison)
+
+    _add(buffer, "bad")
+    _add(buffer, "c0")
+    assert buffer.flush() == 1
+    assert _stored(manager) == ["c0"]
+
+    for _ in range(MAX_ROW_ATTEMPTS - 1):
+        assert len(buffer) == 1
+        buffer.flush()
+    assert len(buffer) == 0
+    assert [row["chat_id"] for row in buffer.quarantined] == ["bad"]
+
+
+def test_rows_recorded_after_the_shared_loop_stops_are_written(manager):
+    buffer = manager.enable_write_behind(max_batch=10, flush_interval=60)
+    # Memori.disable() shuts the shared background loop down
+    background = BackgroundEventLoop()
+    background.start()
+    background.shutdown(timeout=5.0)
+
+    for i in range(100):
+        _add(buffer, f"c{i:03d}")
+
+    buffer.close()  # what the atexit hook runs
+    assert len(_stored(manager)) == 100
+
+
+def test_disable_record_exit_keeps_every_row(tmp_path):
+    from memori import Memori
+
+    memori = Memori(
+        database_connect=f"sqlite:///{tmp_path / 'memori.db'}",
+        write_behind={"flush_interval": 60},
+        api_key="test",
+    )
+    memori.memory_agent = None  # no LLM processing in this test
+    memori.enable()
+    memori.record_conversation("first", "reply", model="test")
+    memori.disable()  # flushes, and stops the shared background loop
+
+    memori.enable()
+    memori.record_conversation("second", "reply", model="test")
+    memori.db_manager.close()  # exit path: close flushes the buffer
+
+    assert len(_stored(memori.db_manager)) == 2
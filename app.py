@@ -10,6 +10,7 @@ import os
 import sys
 import threading
 import uuid
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -24,11 +25,13 @@ MEMORI_PATH = Path(__file__).parent / "Memori-main"
 sys.path.insert(0, str(MEMORI_PATH))
 
 import streamlit as st
+from loguru import logger
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
 # 延迟导入 Memori，确保路径已设置
 from memori import Memori
+from memori.utils.metrics import export_metrics_json, export_prometheus, reset_metrics, span
 
 # ============== 国际化文本 ==============
 I18N = {
@@ -67,6 +70,12 @@ I18N = {
         "memory_not_created": "记忆库未创建",
         "memory_will_create": "开始首次对话后将自动创建",
         "memory_tip": "💡 开始与 Remi 对话，她会自动记住你们的交流内容",
+        "diagnostics": "性能诊断",
+        "no_metrics": "暂无数据，发送一条消息后再查看",
+        "last_turn": "最近一轮耗时",
+        "stage_latency": "各阶段延迟 (ms)",
+        "event_counters": "事件计数",
+        "reset_metrics": "🔄 重置统计",
         "input_placeholder": "输入消息...",
         "api_key_warning": "⚠️ 请先点击右上角 ⚙️ 设置按钮配置 API Key",
         "thinking": "🤔 Thinking & Remembering...",
@@ -127,6 +136,12 @@ I18N = {
         "memory_not_created": "Memory database not created",
         "memory_will_create": "Will be created after first conversation",
         "memory_tip": "💡 Start chatting with Remi, she will remember your conversations",
+        "diagnostics": "Diagnostics",
+        "no_metrics": "No data yet, send a message first",
+        "last_turn": "Last turn",
+        "stage_latency": "Stage latency (ms)",
+        "event_counters": "Event counters",
+        "reset_metrics": "🔄 Reset stats",
         "input_placeholder": "Type a message...",
         "api_key_warning": "⚠️ Please click ⚙️ Settings button to configure API Key",
         "thinking": "🤔 Thinking & Remembering...",
@@ -748,8 +763,7 @@ def crop_circle_image(image_bytes: bytes, size: int = 128) -> str:
         
         return f"data:image/png;base64,{img_base64}"
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"头像裁剪失败: {e}")
         return ""
 
 
@@ -871,7 +885,7 @@ def init_memori(api_key: str, model: str, memori_mode: str = "auto") -> Memori:
         if config_file.exists():
             try:
                 config.load_from_file(config_file)
-                print(f"[MEMORY] 已从配置文件加载记忆设置: {config_file}")
+                logger.info(f"已从配置文件加载记忆设置: {config_file}")
             except:
                 pass
         
@@ -881,10 +895,10 @@ def init_memori(api_key: str, model: str, memori_mode: str = "auto") -> Memori:
         config.update_setting("memory.retention_policy", "permanent")
         config.update_setting("memory.auto_cleanup", False)
         
-        print("[MEMORY] 记忆配置已设置：短期记忆上限=10000，长期记忆上限=100000，保留策略=永久，自动清理=关闭")
+        logger.info("记忆配置已设置：短期记忆上限=10000，长期记忆上限=100000，保留策略=永久，自动清理=关闭")
     except Exception as config_e:
         # 即使 ConfigManager 失败，环境变量也会生效
-        print(f"[MEMORY] 配置管理器设置警告（已通过环境变量设置）: {config_e}")
+        logger.warning(f"配置管理器设置警告（已通过环境变量设置）: {config_e}")
     
     # 创建自定义的 ProviderConfig 来支持 Gemini
     # 确保所有配置都使用 Gemini，而不是 OpenAI
@@ -911,12 +925,14 @@ def init_memori(api_key: str, model: str, memori_mode: str = "auto") -> Memori:
             auto_ingest=auto_ingest,
             user_id="default_user",
             verbose=False,
+            lazy_init=True,  # 后台预热 conscious 上下文，不阻塞首次渲染
+            write_behind=True,  # 对话记录先进缓冲区，后台批量写库
         )
         
     except Exception as e:
         # 如果 ProviderConfig 不可用，回退到基本配置
         # 仍然确保使用 Gemini 配置，而不是 OpenAI
-        print(f"ProviderConfig 配置失败，使用基本配置: {e}")
+        logger.warning(f"ProviderConfig 配置失败，使用基本配置: {e}")
         supported_model = model or "gemini-2.5-flash"
         memori = Memori(
             database_connect=DATABASE_PATH,
@@ -925,6 +941,8 @@ def init_memori(api_key: str, model: str, memori_mode: str = "auto") -> Memori:
             auto_ingest=auto_ingest,
             user_id="default_user",
             verbose=False,
+            lazy_init=True,
+            write_behind=True,
             # 使用 Gemini 的 OpenAI 兼容接口配置
             api_key=api_key,
             api_type="openai_compatible",
@@ -1139,7 +1157,7 @@ def format_memory_context_narrative(memory_context: str) -> str:
                 if isinstance(parsed, list):
                     memory_items = [{'content': str(item).strip(), 'tag': None} for item in parsed if str(item).strip()]
                     if memory_items:
-                        print(f"[MEMORY] 检测到 JSON 列表格式，提取了 {len(memory_items)} 条记忆")
+                        logger.info(f"检测到 JSON 列表格式，提取了 {len(memory_items)} 条记忆")
             except json.JSONDecodeError:
                 # 尝试 Python 列表字符串格式（使用 ast.literal_eval）
                 try:
@@ -1148,7 +1166,7 @@ def format_memory_context_narrative(memory_context: str) -> str:
                     if isinstance(parsed, list):
                         memory_items = [{'content': str(item).strip(), 'tag': None} for item in parsed if str(item).strip()]
                         if memory_items:
-                            print(f"[MEMORY] 检测到 Python 列表格式，提取了 {len(memory_items)} 条记忆")
+                            logger.info(f"检测到 Python 列表格式，提取了 {len(memory_items)} 条记忆")
                 except:
                     pass
     except:
@@ -1198,7 +1216,7 @@ def format_memory_context_narrative(memory_context: str) -> str:
         if quoted_items:
             memory_items = [{'content': item.strip(), 'tag': None} for item in quoted_items if item.strip()]
             if memory_items:
-                print(f"[MEMORY] 从引号格式提取了 {len(memory_items)} 条记忆")
+                logger.info(f"从引号格式提取了 {len(memory_items)} 条记忆")
     
     # 如果没有提取到任何记忆，返回原始内容（但简化）
     if not memory_items:
@@ -1257,6 +1275,34 @@ def format_memory_context_narrative(memory_context: str) -> str:
 
 
 # ============== 记忆检索 ==============
+def extract_memory_text(item, fields=("summary", "searchable_content", "content")) -> str:
+    """从记忆条目中提取展示文本
+
+    先按 fields 顺序读取标量字段；只有都为空时才访问 processed_data
+    （搜索结果中的 processed_data 是按需批量加载的，避免无谓的加载和解析）。
+    """
+    if not isinstance(item, dict):
+        return ""
+
+    for field in fields:
+        if item.get(field):
+            return item[field]
+
+    processed_data = item.get('processed_data')
+    if isinstance(processed_data, str):
+        try:
+            processed_data = json.loads(processed_data)
+        except (ValueError, TypeError):
+            return ""
+
+    if isinstance(processed_data, dict):
+        return (processed_data.get('content') or
+                processed_data.get('summary') or
+                processed_data.get('user_input') or
+                processed_data.get('ai_output') or "")
+    return ""
+
+
 def retrieve_memories(memori: Memori, query: str) -> str:
     """从 Memori 检索相关记忆（优化auto ingest模式支持）"""
     try:
@@ -1265,38 +1311,16 @@ def retrieve_memories(memori: Memori, query: str) -> str:
         # === 第一优先级：使用 retrieve_context 获取短期和长期记忆 ===
         try:
             context_items = memori.retrieve_context(query=query, limit=10)
-            print(f"[MEMORY] retrieve_context 返回 {len(context_items)} 条记忆（包含短期和长期记忆）")
+            logger.info(f"retrieve_context 返回 {len(context_items)} 条记忆（包含短期和长期记忆）")
             
             for item in context_items:
-                content = ""
                 classification = item.get('classification', 'unknown')
                 memory_type = item.get('memory_type', '')
                 
-                # 尝试从不同的字段获取内容（按优先级）
-                # 1. 直接 content 字段
-                if 'content' in item and item['content']:
-                    content = item['content']
-                # 2. summary 字段
-                elif 'summary' in item and item['summary']:
-                    content = item['summary']
-                # 3. searchable_content 字段
-                elif 'searchable_content' in item and item['searchable_content']:
-                    content = item['searchable_content']
-                # 4. 从 processed_data 中提取
-                elif 'processed_data' in item and item['processed_data']:
-                    processed_data = item['processed_data']
-                    if isinstance(processed_data, str):
-                        try:
-                            import json
-                            processed_data = json.loads(processed_data)
-                        except:
-                            pass
-                    
-                    if isinstance(processed_data, dict):
-                        content = (processed_data.get('content') or 
-                                  processed_data.get('summary') or
-                                  processed_data.get('user_input') or
-                                  processed_data.get('ai_output'))
+                # 按优先级获取内容：content > summary > searchable_content > processed_data
+                content = extract_memory_text(
+                    item, fields=("content", "summary", "searchable_content")
+                )
                 
                 # 如果有内容，添加到记忆列表
                 if content and len(str(content).strip()) > 0:
@@ -1309,15 +1333,13 @@ def retrieve_memories(memori: Memori, query: str) -> str:
                     memory_texts.append(f"{type_info}[{classification}] {content}")
                         
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            print(f"[MEMORY] retrieve_context 失败: {e}")
+            logger.exception(f"retrieve_context 失败: {e}")
         
         # === 第二优先级：对话历史检索 ===
         if len(memory_texts) < 4:  # 如果长期记忆不够，补充对话历史
             try:
                 recent_conversations = memori.get_conversation_history(limit=15)
-                print(f"[MEMORY] 对话历史检索到 {len(recent_conversations)} 条记录")
+                logger.info(f"对话历史检索到 {len(recent_conversations)} 条记录")
                 
                 for conv in recent_conversations:
                     user_msg = conv.get('user_input', '')
@@ -1354,18 +1376,16 @@ def retrieve_memories(memori: Memori, query: str) -> str:
                         break
                             
             except Exception as e:
-                import traceback
-                traceback.print_exc()
-                print(f"[MEMORY] 对话历史检索失败: {e}")
+                logger.exception(f"对话历史检索失败: {e}")
         
         # === 第三优先级：直接数据库搜索 ===
         if len(memory_texts) < 2:
             try:
-                direct_memories = retrieve_memories_direct_sql(query)
-                print(f"[MEMORY] 直接数据库搜索返回 {len(direct_memories)} 条记忆")
+                direct_memories = retrieve_memories_direct_sql(memori, query)
+                logger.info(f"直接数据库搜索返回 {len(direct_memories)} 条记忆")
                 memory_texts.extend([f"[直接] {mem}" for mem in direct_memories[:3]])
             except Exception as e:
-                print(f"[MEMORY] 直接数据库搜索失败: {e}")
+                logger.warning(f"直接数据库搜索失败: {e}")
         
         # === 结果处理和格式化 ===
         if memory_texts:
@@ -1402,69 +1422,42 @@ def retrieve_memories(memori: Memori, query: str) -> str:
                 if len(unique_memories) >= 20:
                     break
             
-            print(f"[MEMORY] 最终返回 {len(unique_memories)} 条记忆")
+            logger.info(f"最终返回 {len(unique_memories)} 条记忆")
             return "\n".join([f"{i+1}. {text}" for i, text in enumerate(unique_memories)])
         
-        print("[MEMORY] 未找到相关记忆")
+        logger.info("未找到相关记忆")
         return ""
         
     except Exception as e:
-        import traceback
-        traceback.print_exc()
-        print(f"[MEMORY] 记忆检索过程中出错: {e}")
+        logger.exception(f"记忆检索过程中出错: {e}")
         return ""
 
 
-def retrieve_memories_direct_sql(query: str) -> list:
-    """直接从数据库检索记忆，绕过 FTS"""
+def retrieve_memories_direct_sql(memori: Memori, query: str) -> list:
+    """直接从数据库检索记忆，绕过 FTS（复用本轮请求的数据库连接）"""
     try:
-        import sqlite3
-        conn = sqlite3.connect("local_memory.db")
-        cursor = conn.cursor()
-        
+        from sqlalchemy import text
+
         # 分别查询短期和长期记忆，避免 UNION 的 ORDER BY 问题
-        memory_texts = []
-        
-        # 搜索短期记忆
-        cursor.execute("""
-            SELECT searchable_content, summary, processed_data, created_at
-            FROM short_term_memory 
-            WHERE user_id = 'default_user' 
-            AND (
-                searchable_content LIKE ? OR 
-                summary LIKE ? OR
-                processed_data LIKE ?
-            )
-            ORDER BY created_at DESC
-            LIMIT 5
-        """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-        
-        short_results = cursor.fetchall()
-        
-        # 搜索长期记忆
-        cursor.execute("""
-            SELECT searchable_content, summary, processed_data, created_at
-            FROM long_term_memory 
-            WHERE user_id = 'default_user' 
-            AND (
-                searchable_content LIKE ? OR 
-                summary LIKE ? OR
-                processed_data LIKE ?
-            )
-            ORDER BY created_at DESC
-            LIMIT 5
-        """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-        
-        long_results = cursor.fetchall()
-        
-        conn.close()
+        params = {"user_id": memori.user_id, "pattern": f"%{query}%"}
+        all_results = []
+        with memori.db_manager._get_read_connection() as conn:
+            for table in ("short_term_memory", "long_term_memory"):
+                all_results.extend(conn.execute(text(f"""
+                    SELECT searchable_content, summary, processed_data, created_at
+                    FROM {table}
+                    WHERE user_id = :user_id
+                    AND (
+                        searchable_content LIKE :pattern OR
+                        summary LIKE :pattern OR
+                        processed_data LIKE :pattern
+                    )
+                    ORDER BY created_at DESC
+                    LIMIT 5
+                """), params).fetchall())
         
         # 合并结果（按时间排序）
-        all_results = short_results + long_results
-        # 简单排序：短期记忆优先，然后按创建时间
-        all_results.sort(key=lambda x: (x[3] if x[3] else ''), reverse=True)
-        
-        conn.close()
+        all_results.sort(key=lambda x: str(x[3] or ''), reverse=True)
         
         memory_texts = []
         for i, (content, summary, processed_data, created_at) in enumerate(all_results):
@@ -1495,8 +1488,7 @@ def retrieve_memories_direct_sql(query: str) -> list:
         return memory_texts
         
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"直接 SQL 记忆检索失败: {e}")
         return []
 
 
@@ -1522,7 +1514,7 @@ def store_conversation(memori: Memori, user_input: str, ai_response: str):
             wait_interval = 1   # 每秒检查一次
             waited_time = 0
             
-            print(f"[MEMORY] 等待记忆处理完成 - ID: {chat_id[:8] if chat_id else 'N/A'}...")
+            logger.info(f"等待记忆处理完成 - ID: {chat_id[:8] if chat_id else 'N/A'}...")
             
             while waited_time < max_wait_time:
                 try:
@@ -1535,43 +1527,33 @@ def store_conversation(memori: Memori, user_input: str, ai_response: str):
                     )
                     
                     if chat_found:
-                        print(f"[MEMORY] 对话历史已记录")
+                        logger.info("对话历史已记录")
                         break
                     
                     time.sleep(wait_interval)
                     waited_time += wait_interval
                     
                 except Exception as e:
-                    print(f"[MEMORY] 检查对话历史时出错: {e}")
+                    logger.warning(f"检查对话历史时出错: {e}")
                     time.sleep(wait_interval)
                     waited_time += wait_interval
             
             if waited_time >= max_wait_time:
-                print(f"[MEMORY] 警告：记忆处理可能未完成，等待超时")
+                logger.warning("记忆处理可能未完成，等待超时")
             else:
-                print(f"[MEMORY] 记忆处理完成，等待时间: {waited_time}秒")
+                logger.info(f"记忆处理完成，等待时间: {waited_time}秒")
         
         return chat_id
         
     except Exception as e:
         # 打印错误以便调试
-        print(f"[MEMORY] 存储对话时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"存储对话时出错: {e}")
         pass
 
 
 # ============== AI 对话生成 ==============
-def generate_response(user_input: str) -> str:
-    """RAG 对话流程"""
-    api_key = st.session_state.api_key
-    model = st.session_state.model_name
-    persona = st.session_state.persona
-    temperature = st.session_state.temperature
-    
-    memori = get_memori_instance()
-    
-    # 检索相关记忆（在生成回复前）
+def _retrieve_memory_context(memori: Memori | None, user_input: str) -> str:
+    """按当前记忆模式（Conscious / Auto / Combined）检索本轮的记忆上下文"""
     memory_context = ""
     if memori:
         # 根据记忆模式选择不同的检索方式
@@ -1588,31 +1570,16 @@ def generate_response(user_input: str) -> str:
                     try:
                         # 获取关键记忆（essential conversations）
                         essential_conversations = memori.get_essential_conversations(limit=5)
-                        print(f"[MEMORY] Combined 模式 - Essential 关键记忆：{len(essential_conversations) if essential_conversations else 0} 条")
+                        logger.info(f"Combined 模式 - Essential 关键记忆：{len(essential_conversations) if essential_conversations else 0} 条")
                         
                         for item in essential_conversations:
                             content = ""
                             memory_id = item.get('memory_id', '') if isinstance(item, dict) else None
                             
                             # 提取内容
-                            if isinstance(item, dict):
-                                content = item.get('summary') or item.get('searchable_content')
-                                
-                                if not content:
-                                    processed_data = item.get('processed_data')
-                                    if processed_data:
-                                        if isinstance(processed_data, str):
-                                            try:
-                                                import json
-                                                processed_data = json.loads(processed_data)
-                                            except:
-                                                pass
-                                        
-                                        if isinstance(processed_data, dict):
-                                            content = (processed_data.get('content') or 
-                                                      processed_data.get('summary') or
-                                                      processed_data.get('user_input') or
-                                                      processed_data.get('ai_output'))
+                            content = extract_memory_text(
+                                item, fields=("summary", "searchable_content")
+                            )
                             
                             if content and memory_id not in seen_memory_ids:
                                 content = str(content).strip()
@@ -1622,7 +1589,7 @@ def generate_response(user_input: str) -> str:
                                 if memory_id:
                                     seen_memory_ids.add(memory_id)
                     except Exception as e:
-                        print(f"[MEMORY] Combined 模式 - Essential 关键记忆获取失败: {e}")
+                        logger.warning(f"Combined 模式 - Essential 关键记忆获取失败: {e}")
                 
                 # 2. 始终获取 Auto Ingest 模式的动态检索记忆（优先使用智能搜索引擎）
                 if memori.auto_ingest:
@@ -1632,7 +1599,7 @@ def generate_response(user_input: str) -> str:
                     # 优先尝试使用智能搜索引擎（Auto Ingest 的核心功能）
                     if memori.search_engine:
                         try:
-                            print(f"[MEMORY] Combined 模式 - 尝试使用智能搜索引擎进行 Auto Ingest 检索")
+                            logger.info("Combined 模式 - 尝试使用智能搜索引擎进行 Auto Ingest 检索")
                             auto_context = memori.search_engine.execute_search(
                                 query=user_input,
                                 db_manager=memori.db_manager,
@@ -1643,24 +1610,22 @@ def generate_response(user_input: str) -> str:
                             )
                             if auto_context:
                                 search_method = "智能搜索引擎"
-                                print(f"[MEMORY] Combined 模式 - 智能搜索引擎返回 {len(auto_context)} 条记忆")
+                                logger.info(f"Combined 模式 - 智能搜索引擎返回 {len(auto_context)} 条记忆")
                         except Exception as e:
-                            print(f"[MEMORY] Combined 模式 - 智能搜索引擎失败: {e}，回退到直接搜索")
+                            logger.warning(f"Combined 模式 - 智能搜索引擎失败: {e}，回退到直接搜索")
                     
                     # 如果智能搜索引擎失败或未启用，使用 _get_auto_ingest_context（包含直接数据库搜索和回退逻辑）
                     if not auto_context:
                         try:
-                            print(f"[MEMORY] Combined 模式 - 使用 _get_auto_ingest_context 进行检索")
+                            logger.info("Combined 模式 - 使用 _get_auto_ingest_context 进行检索")
                             auto_context = memori._get_auto_ingest_context(user_input)
                             if auto_context:
                                 # 检查检索方法
                                 first_item = auto_context[0] if auto_context else {}
                                 search_method = first_item.get('retrieval_method', '直接数据库搜索')
-                                print(f"[MEMORY] Combined 模式 - {search_method}返回 {len(auto_context)} 条记忆")
+                                logger.info(f"Combined 模式 - {search_method}返回 {len(auto_context)} 条记忆")
                         except Exception as e:
-                            import traceback
-                            traceback.print_exc()
-                            print(f"[MEMORY] Combined 模式 - Auto Ingest 上下文获取失败: {e}")
+                            logger.exception(f"Combined 模式 - Auto Ingest 上下文获取失败: {e}")
                     
                     # 处理检索到的记忆
                     if auto_context:
@@ -1674,25 +1639,9 @@ def generate_response(user_input: str) -> str:
                                 continue
                             
                             # 提取内容
-                            if isinstance(item, dict):
-                                content = item.get('summary') or item.get('searchable_content')
-                                
-                                # 如果没有，尝试从 processed_data 中提取
-                                if not content:
-                                    processed_data = item.get('processed_data')
-                                    if processed_data:
-                                        if isinstance(processed_data, str):
-                                            try:
-                                                import json
-                                                processed_data = json.loads(processed_data)
-                                            except:
-                                                pass
-                                        
-                                        if isinstance(processed_data, dict):
-                                            content = (processed_data.get('content') or 
-                                                      processed_data.get('summary') or
-                                                      processed_data.get('user_input') or
-                                                      processed_data.get('ai_output'))
+                            content = extract_memory_text(
+                                item, fields=("summary", "searchable_content")
+                            )
                             
                             if content:
                                 content = str(content).strip()
@@ -1704,19 +1653,17 @@ def generate_response(user_input: str) -> str:
                                 if memory_id:
                                     seen_memory_ids.add(memory_id)
                         
-                        print(f"[MEMORY] Combined 模式 - Auto Ingest 使用 {search_method or '默认方法'} 检索到 {len(context_items)} 条动态记忆")
+                        logger.info(f"Combined 模式 - Auto Ingest 使用 {search_method or '默认方法'} 检索到 {len(context_items)} 条动态记忆")
                 
                 if context_items:
                     memory_context = "\n".join([f"{i+1}. {item}" for i, item in enumerate(context_items[:8])])
-                    print(f"[MEMORY] Combined 模式 - 最终返回 {len(context_items)} 条记忆（关键记忆 + Auto Ingest 动态记忆）")
+                    logger.info(f"Combined 模式 - 最终返回 {len(context_items)} 条记忆（关键记忆 + Auto Ingest 动态记忆）")
                 else:
-                    print(f"[MEMORY] Combined 模式 - 未检索到任何记忆，回退到手动检索")
+                    logger.info("Combined 模式 - 未检索到任何记忆，回退到手动检索")
                     memory_context = retrieve_memories(memori, user_input)
                     
             except Exception as e:
-                import traceback
-                traceback.print_exc()
-                print(f"[MEMORY] Combined 模式检索失败，回退到手动检索: {e}")
+                logger.exception(f"Combined 模式检索失败，回退到手动检索: {e}")
                 memory_context = retrieve_memories(memori, user_input)
         
         elif memori_mode == "auto" and memori.auto_ingest:
@@ -1724,7 +1671,7 @@ def generate_response(user_input: str) -> str:
             try:
                 # 使用 _get_auto_ingest_context 获取长期记忆上下文
                 auto_context = memori._get_auto_ingest_context(user_input)
-                print(f"[MEMORY] Auto Ingest 检索到 {len(auto_context) if auto_context else 0} 条记忆")
+                logger.info(f"Auto Ingest 检索到 {len(auto_context) if auto_context else 0} 条记忆")
                 
                 if auto_context:
                     # 格式化自动检索的上下文
@@ -1738,30 +1685,10 @@ def generate_response(user_input: str) -> str:
                             # 获取记忆类型
                             memory_type = item.get('memory_type', '')
                             
-                            # 优先使用 summary 或 searchable_content
-                            content = item.get('summary') or item.get('searchable_content')
-                            
-                            # 如果没有，尝试从 processed_data 中提取
-                            if not content:
-                                processed_data = item.get('processed_data')
-                                if processed_data:
-                                    # processed_data 可能是字符串（JSON）或字典
-                                    if isinstance(processed_data, str):
-                                        try:
-                                            import json
-                                            processed_data = json.loads(processed_data)
-                                        except:
-                                            pass
-                                    
-                                    if isinstance(processed_data, dict):
-                                        content = (processed_data.get('content') or 
-                                                  processed_data.get('summary') or
-                                                  processed_data.get('user_input') or
-                                                  processed_data.get('ai_output'))
-                            
-                            # 最后尝试 content 字段
-                            if not content:
-                                content = item.get('content')
+                            # 优先使用 summary 或 searchable_content，其次 processed_data，最后 content 字段
+                            content = extract_memory_text(
+                                item, fields=("summary", "searchable_content")
+                            ) or item.get('content')
                             
                             # 如果还是没内容，尝试转换为字符串
                             if not content:
@@ -1781,24 +1708,47 @@ def generate_response(user_input: str) -> str:
                     
                     if context_items:
                         memory_context = "\n".join([f"{i+1}. {item}" for i, item in enumerate(context_items)])
-                        print(f"[MEMORY] Auto Ingest 格式化后返回 {len(context_items)} 条记忆")
+                        logger.info(f"Auto Ingest 格式化后返回 {len(context_items)} 条记忆")
                     else:
-                        print(f"[MEMORY] Auto Ingest 检索到 {len(auto_context)} 条记录，但无法提取有效内容")
+                        logger.info(f"Auto Ingest 检索到 {len(auto_context)} 条记录，但无法提取有效内容")
                 
             except Exception as e:
-                import traceback
-                traceback.print_exc()
-                print(f"[MEMORY] Auto Ingest 检索失败，回退到手动检索: {e}")
+                logger.exception(f"Auto Ingest 检索失败，回退到手动检索: {e}")
                 # 回退到手动检索
                 memory_context = retrieve_memories(memori, user_input)
         else:
             # 其他模式（Conscious 等）：使用手动检索
             memory_context = retrieve_memories(memori, user_input)
+
+    return memory_context
+
+
+def generate_response(user_input: str) -> str:
+    """RAG 对话流程（各阶段耗时记录在诊断面板中）"""
+    with span("app.generate_response"):
+        return _generate_response(user_input)
+
+
+def _generate_response(user_input: str) -> str:
+    """RAG 对话流程：检索记忆 -> 格式化 -> 调用 LLM -> 存储对话"""
+    api_key = st.session_state.api_key
+    model = st.session_state.model_name
+    persona = st.session_state.persona
+    temperature = st.session_state.temperature
+    
+    memori = get_memori_instance()
+    
+    # 检索相关记忆（在生成回复前）
+    # 本轮所有记忆读取共用一个数据库会话/连接
+    scope = memori.request_scope() if memori else nullcontext()
+    with span("app.retrieve_memories", mode=st.session_state.get("memori_mode", "auto")), scope:
+        memory_context = _retrieve_memory_context(memori, user_input)
     
     # 格式化记忆上下文：将生硬的列表转换为叙述性文本
     if memory_context:
-        formatted_memory_context = format_memory_context_narrative(memory_context)
-        print(f"[MEMORY] 记忆格式化：原始长度={len(memory_context)}，格式化后长度={len(formatted_memory_context)}")
+        with span("app.format_context"):
+            formatted_memory_context = format_memory_context_narrative(memory_context)
+        logger.info(f"记忆格式化：原始长度={len(memory_context)}，格式化后长度={len(formatted_memory_context)}")
     else:
         formatted_memory_context = "（暂无回忆）"
     
@@ -1817,24 +1767,26 @@ def generate_response(user_input: str) -> str:
     # 优化：使用缓存的LLM实例（如果可能）
     # 注意：由于api_key和temperature可能变化，这里每次创建新实例
     # 但ChatGoogleGenerativeAI内部可能有连接池优化
-    llm = ChatGoogleGenerativeAI(
-        model=model,
-        google_api_key=api_key,
-        temperature=temperature,
-        convert_system_message_to_human=True,
-    )
-    
-    messages = [
-        SystemMessage(content=system_content),
-        HumanMessage(content=user_input),
-    ]
-    
-    response = llm.invoke(messages)
-    ai_response = response.content
+    with span("app.llm_invoke", model=model):
+        llm = ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=api_key,
+            temperature=temperature,
+            convert_system_message_to_human=True,
+        )
+        
+        messages = [
+            SystemMessage(content=system_content),
+            HumanMessage(content=user_input),
+        ]
+        
+        response = llm.invoke(messages)
+        ai_response = response.content
     
     # 存储对话到记忆系统（生成回复后）
     if memori:
-        store_conversation(memori, user_input, ai_response)
+        with span("app.store_conversation"):
+            store_conversation(memori, user_input, ai_response)
     
     return ai_response
 
@@ -2046,8 +1998,7 @@ def render_memory_panel():
                     else:
                         st.info(t("no_memories"))
                 except Exception as e:
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception(f"记忆面板加载失败: {e}")
                     st.info(t("memory_ready"))
             else:
                 st.info(t("config_api_first"))
@@ -2062,6 +2013,78 @@ def render_memory_panel():
             st.info(t("memory_tip"))
 
 
+# ============== 诊断面板（侧边栏展开器） ==============
+def _flatten_trace(node: dict, depth: int = 0) -> list:
+    """将 span 树展开为表格行"""
+    rows = [{
+        "stage": "\u3000" * depth + node["name"],
+        "ms": node["duration_ms"],
+        "error": node["error"] or "",
+    }]
+    for child in node["children"]:
+        rows.extend(_flatten_trace(child, depth + 1))
+    return rows
+
+
+def render_diagnostics_panel():
+    """在侧边栏渲染性能诊断面板：最近一轮的阶段耗时、延迟分位数、计数器"""
+    with st.expander(f"⏱️ {t('diagnostics')}", expanded=False):
+        metrics = export_metrics_json()
+        turns = [tr for tr in metrics["recent_traces"] if tr["name"] == "app.generate_response"]
+        
+        if not metrics["spans"]:
+            st.info(t("no_metrics"))
+            return
+        
+        if turns:
+            st.markdown(f"**{t('last_turn')}**: {turns[0]['duration_ms']:.0f} ms")
+            st.dataframe(_flatten_trace(turns[0]), hide_index=True, use_container_width=True)
+        
+        st.markdown(f"**{t('stage_latency')}**")
+        latency_rows = []
+        for name, series in metrics["spans"].items():
+            for item in series:
+                labels = ", ".join(f"{k}={v}" for k, v in item["labels"].items())
+                latency_rows.append({
+                    "span": f"{name} [{labels}]" if labels else name,
+                    "count": item["count"],
+                    "p50": item.get("p50"),
+                    "p95": item.get("p95"),
+                    "p99": item.get("p99"),
+                })
+        st.dataframe(latency_rows, hide_index=True, use_container_width=True)
+        
+        if metrics["counters"]:
+            st.markdown(f"**{t('event_counters')}**")
+            counter_rows = []
+            for name, series in metrics["counters"].items():
+                for item in series:
+                    labels = ", ".join(f"{k}={v}" for k, v in item["labels"].items())
+                    counter_rows.append({"counter": f"{name} [{labels}]" if labels else name, "value": item["value"]})
+            st.dataframe(counter_rows, hide_index=True, use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "JSON",
+                data=json.dumps(metrics, ensure_ascii=False, indent=2, default=str),
+                file_name="memori_metrics.json",
+                mime="application/json",
+                use_container_width=True,
+            )
+        with col2:
+            st.download_button(
+                "Prometheus",
+                data=export_prometheus(),
+                file_name="memori_metrics.prom",
+                mime="text/plain",
+                use_container_width=True,
+            )
+        if st.button(t("reset_metrics"), key="reset_metrics_btn", use_container_width=True):
+            reset_metrics()
+            st.rerun()
+
+
 # ============== 侧边栏 ==============
 def render_sidebar():
     """渲染侧边栏"""
@@ -2072,6 +2095,9 @@ def render_sidebar():
         # ===== 记忆面板 =====
         render_memory_panel()
         
+        # ===== 诊断面板 =====
+        render_diagnostics_panel()
+        
         st.markdown("<div style='height: 10px;'></div>", unsafe_allow_html=True)
         
         # ===== 新对话按钮 =====